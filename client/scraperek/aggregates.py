@@ -0,0 +1,200 @@
+"""
+Előre kiszámolt elemzési összesítők a dashboard diagramjaihoz.
+
+Egy vektorizált menetben (NumPy) számolja:
+    RecipeCountCube              régió × év × kategória -> receptszám
+    IngredientFrequency          régió × hozzávaló -> receptszám
+    IngredientCountDistribution  régió × év × kategória × hozzávaló sorok száma -> receptszám
+
+A partíciókulcs a régió: az insert_recipes változáskészletéből (érintett
+települések) csak az érintett régiók sorai számolódnak újra.
+
+Használat (példa):
+    python aggregates.py --dsn postgresql://...                      # teljes újraszámolás
+    python aggregates.py --dsn postgresql://... --changes changes.json
+    python insert_recipes.py --jsonl receptek.jsonl --refresh-aggregates
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from changeset import ChangeSet
+
+# NULL régió / év / kategória kódolása a NumPy tömbökben
+NA = -1
+
+
+def touched_regions(cur, changes: ChangeSet) -> Set[Optional[int]]:
+    """Regions (None = no region) of every settlement the load touched."""
+    regions: Set[Optional[int]] = set()
+    sids = [s for s in changes.settlement_ids if s is not None]
+    if None in changes.settlement_ids:
+        regions.add(None)
+    if sids:
+        cur.execute('SELECT DISTINCT regionid FROM public."Settlement" WHERE id = ANY(%s)', (sids,))
+        regions.update(None if r[0] is None else int(r[0]) for r in cur.fetchall())
+    return regions
+
+
+def _partition_filter(regions: Optional[Set[Optional[int]]], column: str) -> Tuple[str, tuple]:
+    if regions is None:
+        return "TRUE", ()
+    ids = [r for r in regions if r is not None]
+    return f"({column} = ANY(%s) OR (%s AND {column} IS NULL))", (ids, None in regions)
+
+
+def fetch_arrays(cur, regions: Optional[Set[Optional[int]]]) -> Dict[str, np.ndarray]:
+    """Recipe dimensions and (recipe, ingredient) pairs from a single statement, i.e. one snapshot.
+
+    Two separate READ COMMITTED queries could see different recipes during a concurrent
+    (e.g. streaming) load, and pairs would then be attributed to the wrong recipe.
+    The ingredient line count is `len(split_ingredients_text(ingredients_text))`, the
+    same number the dashboard's min/max ingredient chart uses.
+    """
+    where, params = _partition_filter(regions, "s.regionid")
+    cur.execute(
+        'SELECT r.id, coalesce(s.regionid, -1), coalesce(r.year, -1), coalesce(r.category_id, -1), '
+        "(SELECT count(*) FROM unnest(string_to_array(r.ingredients_text, ' | ')) p WHERE btrim(p) <> ''), "
+        'coalesce(ri.ingredient_id, -1) '
+        'FROM public."Recipe" r LEFT JOIN public."Settlement" s ON s.id = r.settlement_id '
+        'LEFT JOIN public."RecipeIngredient" ri ON ri.recipe_id = r.id '
+        f"WHERE {where} ORDER BY r.id",
+        params,
+    )
+    rows = np.array(cur.fetchall(), dtype=np.int64).reshape(-1, 6)
+    # Receptenként egy sor (az első), a párok pedig a hozzávalóval rendelkező sorok
+    first = np.ones(len(rows), dtype=bool)
+    first[1:] = rows[1:, 0] != rows[:-1, 0]
+    recipes = rows[first, :5]
+    pairs = rows[rows[:, 5] >= 0][:, [0, 5]]
+    return {
+        "recipe_id": recipes[:, 0],
+        "region": recipes[:, 1],
+        "year": recipes[:, 2],
+        "category": recipes[:, 3],
+        "n_lines": recipes[:, 4],
+        "pairs": pairs,
+    }
+
+
+def _count_rows(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    if len(keys) == 0:
+        return keys.reshape(0, keys.shape[1] if keys.ndim == 2 else 0), np.zeros(0, dtype=np.int64)
+    uniq, counts = np.unique(keys, axis=0, return_counts=True)
+    return uniq, counts
+
+
+def compute_cubes(a: Dict[str, np.ndarray]) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    recipe_id, region, year, category = a["recipe_id"], a["region"], a["year"], a["category"]
+
+    cube = _count_rows(np.column_stack([region, year, category]))
+
+    # (recept, hozzávaló) párok egyszer számítanak, akkor is, ha egy recept kétszer sorolja fel
+    pairs = np.unique(a["pairs"], axis=0) if len(a["pairs"]) else a["pairs"]
+    pos = np.searchsorted(recipe_id, pairs[:, 0]) if len(pairs) else np.zeros(0, dtype=np.int64)
+    freq = _count_rows(np.column_stack([region[pos], pairs[:, 1]]) if len(pairs) else np.zeros((0, 2), dtype=np.int64))
+
+    # Hozzávaló sorok száma, ismétlésekkel és az értelmezhetetlen sorokkal együtt (mint a
+    # dashboard diagramja); hozzávaló nélküli recept nem kerül a 0-s vödörbe
+    n_lines = a["n_lines"]
+    has = n_lines > 0
+    dist = _count_rows(np.column_stack([region[has], year[has], category[has], n_lines[has]]))
+    return {"cube": cube, "freq": freq, "dist": dist}
+
+
+def _nullable(v: int) -> Optional[int]:
+    return None if v == NA else int(v)
+
+
+TABLES = {
+    "cube": ('public."RecipeCountCube"', "region_id, year, category_id, recipe_count"),
+    "freq": ('public."IngredientFrequency"', "region_id, ingredient_id, recipe_count"),
+    "dist": ('public."IngredientCountDistribution"', "region_id, year, category_id, ingredient_count, recipe_count"),
+}
+
+
+def _rows(name: str, keys: np.ndarray, counts: np.ndarray) -> List[tuple]:
+    out: List[tuple] = []
+    for k, c in zip(keys.tolist(), counts.tolist()):
+        if name == "cube":
+            out.append((_nullable(k[0]), _nullable(k[1]), _nullable(k[2]), c))
+        elif name == "freq":
+            out.append((_nullable(k[0]), k[1], c))
+        else:
+            out.append((_nullable(k[0]), _nullable(k[1]), _nullable(k[2]), k[3], c))
+    return out
+
+
+def write_cubes(cur, cubes: Dict[str, Tuple[np.ndarray, np.ndarray]], regions: Optional[Set[Optional[int]]]) -> Dict[str, int]:
+    import psycopg2.extras
+
+    where, params = _partition_filter(regions, "region_id")
+    written: Dict[str, int] = {}
+    for name, (table, columns) in TABLES.items():
+        cur.execute(f"DELETE FROM {table} WHERE {where}", params)
+        rows = _rows(name, *cubes[name])
+        if rows:
+            psycopg2.extras.execute_values(cur, f"INSERT INTO {table} ({columns}) VALUES %s", rows, page_size=5000)
+        written[table] = len(rows)
+    return written
+
+
+def refresh_aggregates(conn, changes: Optional[ChangeSet] = None) -> Dict[str, object]:
+    """Recompute the cubes for the regions in `changes` (all regions if None) in one transaction."""
+    t0 = time.perf_counter()
+    with conn.cursor() as cur:
+        regions = None if changes is None else touched_regions(cur, changes)
+        if regions is not None and not regions:
+            return {"regions": [], "written": {}, "seconds": 0.0}
+        arrays = fetch_arrays(cur, regions)
+        t1 = time.perf_counter()
+        cubes = compute_cubes(arrays)
+        t2 = time.perf_counter()
+        written = write_cubes(cur, cubes, regions)
+    conn.commit()
+    return {
+        "regions": "all" if regions is None else sorted(regions, key=lambda r: (r is not None, r or 0)),
+        "recipes": int(len(arrays["recipe_id"])),
+        "written": written,
+        "fetch_s": round(t1 - t0, 3),
+        "compute_s": round(t2 - t1, 3),
+        "seconds": round(time.perf_counter() - t0, 3),
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Refresh precomputed analytics aggregate tables")
+    p.add_argument("--dsn", type=str, default=None, help="Postgres DSN string")
+    p.add_argument("--host", type=str, default=None)
+    p.add_argument("--port", type=int, default=None)
+    p.add_argument("--db", type=str, default=None)
+    p.add_argument("--user", type=str, default=None)
+    p.add_argument("--password", type=str, default=None)
+    p.add_argument("--changes", type=str, default=None, help="Change set JSON from insert_recipes --changes-out (default: full refresh)")
+    args = p.parse_args(argv)
+
+    from insert_recipes import connect_pg
+
+    changes = ChangeSet.load(args.changes) if args.changes else None
+    conn = connect_pg(args.dsn, args.host, args.port, args.db, args.user, args.password)
+    conn.autocommit = False
+    try:
+        result = refresh_aggregates(conn, changes)
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    print(f"Összesítők frissítve ({result['seconds']} s), régiók: {result['regions']}")
+    for table, n in result["written"].items():  # type: ignore[union-attr]
+        print(f"  {table}: {n} sor")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
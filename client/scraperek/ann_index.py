@@ -0,0 +1,163 @@
+"""
+pgvector ANN indexek kezelése a RecipeEmbedding táblán.
+
+Az ivfflat a centroidokat az index építésekor tanítja, ezért üres táblán
+létrehozva használhatatlan. Az insert_recipes betöltés előtt eldobja az ANN
+indexeket, utána pedig a sorszámhoz méretezett `lists` értékkel (vagy HNSW-vel)
+újraépíti őket. Az itt épített indexek megjegyzése rögzíti a tanító sorok
+számát; megjegyzés nélküli ivfflat indexet (pl. a régi sémából, üres táblán
+létrehozva) tanítatlannak, a tanító sorszámnál jóval több (vagy kevesebb) sorra
+betöltött ivfflat indexet pedig elavultnak tekintünk, és mindkettőt újraépítjük.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+# oszlop -> (operátor osztály prefix, index név prefix)
+ANN_COLUMNS: Dict[str, Tuple[str, str]] = {
+    "embedding": ("vector", "recipe_embedding"),
+    "embedding_half": ("halfvec", "recipe_embedding_half"),
+}
+# A bináris előszűrő oszlop mindig HNSW (ivfflat-hoz nincs értelme k-means-t tanítani bitekre)
+BIT_INDEX = "recipe_embedding_bin_hnsw_idx"
+
+
+def ivfflat_lists(rows: int) -> int:
+    """pgvector guidance: rows / 1000 up to 1M rows, sqrt(rows) above."""
+    if rows <= 1_000_000:
+        return max(1, rows // 1000)
+    return int(math.sqrt(rows))
+
+
+def existing_ann_indexes(cur) -> List[Tuple[str, str, str]]:
+    """(index name, column, access method) of every ivfflat/hnsw index on RecipeEmbedding."""
+    cur.execute(
+        "SELECT i.relname, a.attname, am.amname "
+        "FROM pg_index x "
+        "JOIN pg_class i ON i.oid = x.indexrelid "
+        "JOIN pg_am am ON am.oid = i.relam "
+        "JOIN pg_attribute a ON a.attrelid = x.indrelid AND a.attnum = x.indkey[0] "
+        "WHERE x.indrelid = 'public.\"RecipeEmbedding\"'::regclass AND am.amname IN ('ivfflat', 'hnsw') "
+        "ORDER BY i.relname"
+    )
+    return [(r[0], r[1], r[2]) for r in cur.fetchall()]
+
+
+def previous_method(indexes: List[Tuple[str, str, str]]) -> Optional[str]:
+    """Access method of the existing embedding-column indexes (the binary prefilter is always HNSW)."""
+    methods = [method for name, _, method in indexes if name != BIT_INDEX]
+    return methods[0] if methods else None
+
+
+def untrained_ann_indexes(cur) -> List[str]:
+    """ivfflat indexes not built by build_ann_indexes (no row-count comment), e.g. created on an empty table."""
+    cur.execute(
+        "SELECT i.relname "
+        "FROM pg_index x "
+        "JOIN pg_class i ON i.oid = x.indexrelid "
+        "JOIN pg_am am ON am.oid = i.relam "
+        "WHERE x.indrelid = 'public.\"RecipeEmbedding\"'::regclass AND am.amname = 'ivfflat' "
+        "AND obj_description(i.oid, 'pg_class') IS NULL "
+        "ORDER BY i.relname"
+    )
+    return [r[0] for r in cur.fetchall()]
+
+
+def outgrown_ann_indexes(cur, rows: int, growth: float = 2.0) -> List[str]:
+    """ivfflat indexes whose training row count (from the build comment) does not fit `rows`.
+
+    An index is outgrown when the table has `growth` times the training rows (or the
+    training rows are `growth` times the table), or when the `lists` sized for `rows`
+    is `growth` times off from the one sized for the training rows.
+    """
+    cur.execute(
+        "SELECT i.relname, obj_description(i.oid, 'pg_class') "
+        "FROM pg_index x "
+        "JOIN pg_class i ON i.oid = x.indexrelid "
+        "JOIN pg_am am ON am.oid = i.relam "
+        "WHERE x.indrelid = 'public.\"RecipeEmbedding\"'::regclass AND am.amname = 'ivfflat' "
+        "AND obj_description(i.oid, 'pg_class') IS NOT NULL "
+        "ORDER BY i.relname"
+    )
+    out: List[str] = []
+    for name, comment in cur.fetchall():
+        m = re.match(r"ann_index: (\d+) rows", comment or "")
+        if m is None:
+            continue
+        trained = max(int(m.group(1)), 1)
+        lists_ratio = ivfflat_lists(rows) / ivfflat_lists(trained)
+        if not (1 / growth < rows / trained < growth) or not (1 / growth < lists_ratio < growth):
+            out.append(name)
+    return out
+
+
+def rebuild_plan(mode: str, indexes: List[Tuple[str, str, str]], untrained: List[str]) -> Optional[str]:
+    """Access method to rebuild with after a load in --ann-index `mode`, or None to leave the indexes alone.
+
+    `keep` still builds (ivfflat, unless an existing index says otherwise) when the embedding
+    columns have no ANN index or only untrained / outgrown ones (`untrained` lists both);
+    `same` falls back to ivfflat.
+    """
+    if mode in ("ivfflat", "hnsw"):
+        return mode
+    method = previous_method(indexes) or "ivfflat"
+    if mode == "same":
+        return method
+    embedding = [name for name, _, _ in indexes if name != BIT_INDEX]
+    if not embedding or untrained:
+        return method
+    return None
+
+
+def drop_ann_indexes(cur) -> List[str]:
+    names = [name for name, _, _ in existing_ann_indexes(cur)]
+    for name in names:
+        cur.execute(f'DROP INDEX IF EXISTS public."{name}"')
+    return names
+
+
+def build_ann_indexes(
+    cur,
+    method: str = "ivfflat",
+    lists: Optional[int] = None,
+    m: int = 16,
+    ef_construction: int = 64,
+    maintenance_work_mem: Optional[str] = None,
+) -> Dict[str, float]:
+    """(Re)build ANN indexes on every embedding column that has data. Returns build seconds per index."""
+    if maintenance_work_mem:
+        cur.execute("SET maintenance_work_mem = %s", (maintenance_work_mem,))
+    drop_ann_indexes(cur)
+    times: Dict[str, float] = {}
+    for column, (ops, prefix) in ANN_COLUMNS.items():
+        cur.execute(f'SELECT count({column}) FROM public."RecipeEmbedding"')
+        rows = int(cur.fetchone()[0])
+        if rows == 0:
+            continue
+        name = f"{prefix}_{method}_idx"
+        if method == "hnsw":
+            with_clause = f"m = {int(m)}, ef_construction = {int(ef_construction)}"
+        else:
+            with_clause = f"lists = {int(lists or ivfflat_lists(rows))}"
+        t0 = time.perf_counter()
+        cur.execute(
+            f'CREATE INDEX {name} ON public."RecipeEmbedding" '
+            f"USING {method} ({column} {ops}_l2_ops) WITH ({with_clause})"
+        )
+        times[name] = time.perf_counter() - t0
+        cur.execute(f"COMMENT ON INDEX public.{name} IS %s", (f"ann_index: {rows} rows",))
+
+    cur.execute('SELECT count(embedding_bin) FROM public."RecipeEmbedding"')
+    if int(cur.fetchone()[0]) > 0:
+        t0 = time.perf_counter()
+        cur.execute(
+            f'CREATE INDEX {BIT_INDEX} ON public."RecipeEmbedding" '
+            f"USING hnsw (embedding_bin bit_hamming_ops) WITH (m = {int(m)}, ef_construction = {int(ef_construction)})"
+        )
+        times[BIT_INDEX] = time.perf_counter() - t0
+    cur.execute("ANALYZE public.\"RecipeEmbedding\"")
+    return times
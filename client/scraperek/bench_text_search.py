@@ -0,0 +1,150 @@
+"""
+Hozzávaló-szűrés benchmark: a szerver szűrőkombinációi (több pozitív kifejezés,
+illetve a `reverse` NOT ILIKE mód) különböző lekérdezési formákkal.
+
+Változatok:
+    ilike       r.ingredients_text ILIKE '%t%'           (régi szerver, index nélkül)
+    trgm        r.search_text LIKE '%folded%'            (pg_trgm GIN index)
+    fts         r.search_tsv @@ plainto_tsquery('hungarian', t)  (GIN index)
+    dictionary  r.id IN (RecipeIngredient JOIN Ingredient ...)   (jelenlegi szerver)
+
+Minden kombinációra EXPLAIN (ANALYZE, FORMAT JSON)-t futtat, és kiírja a
+terv csomóponttípusait, az eredménysorok számát és a medián végrehajtási időt.
+
+Használat (példa):
+    python bench_text_search.py --dsn postgresql://... --terms hagyma tejföl paprika --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+from itertools import combinations
+from typing import Dict, List, Optional, Tuple
+
+from insert_recipes import connect_pg
+from textnorm import normalize_text
+
+
+def condition(variant: str, idx: int, reverse: bool) -> str:
+    key = f"%(t{idx})s"
+    if variant == "ilike":
+        return f"r.ingredients_text {'NOT ILIKE' if reverse else 'ILIKE'} {key}"
+    if variant == "trgm":
+        return f"r.search_text {'NOT LIKE' if reverse else 'LIKE'} {key}"
+    if variant == "fts":
+        expr = f"r.search_tsv @@ plainto_tsquery('hungarian', {key})"
+        return f"NOT ({expr})" if reverse else expr
+    # Ugyanaz a feltétel, mint a RecipeController ingredientCondition-je
+    return (
+        f"r.id {'NOT IN' if reverse else 'IN'} ("
+        'SELECT ri.recipe_id FROM public."RecipeIngredient" ri '
+        'JOIN public."Ingredient" i ON i.id = ri.ingredient_id '
+        f"WHERE i.name_norm LIKE {key})"
+    )
+
+
+def term_param(variant: str, term: str) -> str:
+    if variant == "ilike":
+        return f"%{term}%"
+    if variant == "fts":
+        return term
+    return f"%{normalize_text(term)}%"
+
+
+VARIANTS = ("ilike", "trgm", "fts", "dictionary")
+
+
+def build_query(variant: str, terms: Tuple[str, ...], reverse: bool) -> Tuple[str, Dict[str, str]]:
+    where = " AND ".join(condition(variant, i, reverse) for i in range(len(terms)))
+    sql = f'SELECT r.url, r.title, r.year, r.category_id, r.settlement_id FROM public."Recipe" r WHERE {where}'
+    return sql, {f"t{i}": term_param(variant, t) for i, t in enumerate(terms)}
+
+
+def plan_nodes(plan: dict) -> List[str]:
+    """Node types of a JSON plan, with the relation/index name where there is one."""
+    out: List[str] = []
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        label = node["Node Type"]
+        if "Index Name" in node:
+            label += f" [{node['Index Name']}]"
+        elif "Relation Name" in node:
+            label += f" [{node['Relation Name']}]"
+        out.append(label)
+        stack.extend(reversed(node.get("Plans", [])))
+    return out
+
+
+def explain(cur, sql: str, params: Dict[str, str], repeat: int) -> Tuple[List[str], int, float]:
+    times: List[float] = []
+    nodes: List[str] = []
+    rows = 0
+    for _ in range(repeat):
+        cur.execute("EXPLAIN (ANALYZE, FORMAT JSON) " + sql, params)
+        raw = cur.fetchone()[0]
+        doc = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+        times.append(float(doc["Execution Time"]))
+        nodes = plan_nodes(doc["Plan"])
+        rows = int(doc["Plan"].get("Actual Rows", 0))
+    return nodes, rows, statistics.median(times)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Benchmark ingredient filter query shapes (ILIKE vs trigram vs FTS vs dictionary join)")
+    p.add_argument("--dsn", type=str, default=None, help="Postgres DSN string")
+    p.add_argument("--host", type=str, default=None)
+    p.add_argument("--port", type=int, default=None)
+    p.add_argument("--db", type=str, default=None)
+    p.add_argument("--user", type=str, default=None)
+    p.add_argument("--password", type=str, default=None)
+    p.add_argument("--terms", nargs="+", default=["hagyma", "tejföl", "paprika", "túró"])
+    p.add_argument("--max-terms", type=int, default=3, help="Largest combination size of positive terms")
+    p.add_argument("--variants", nargs="+", choices=VARIANTS, default=list(VARIANTS))
+    p.add_argument("--repeat", type=int, default=5)
+    p.add_argument("--json", type=str, default=None, help="Write the results as JSON")
+    args = p.parse_args(argv)
+
+    combos: List[Tuple[Tuple[str, ...], bool]] = []
+    for n in range(1, min(args.max_terms, len(args.terms)) + 1):
+        combos.extend((c, False) for c in combinations(args.terms, n))
+    # reverse mód: a szerver ugyanazokat a kifejezéseket tagadja
+    combos.extend((c, True) for c in combinations(args.terms, 1))
+    combos.append((tuple(args.terms[:2]), True))
+
+    results: List[dict] = []
+    conn = connect_pg(args.dsn, args.host, args.port, args.db, args.user, args.password)
+    try:
+        with conn.cursor() as cur:
+            cur.execute('ANALYZE public."Recipe"')
+            for terms, reverse in combos:
+                label = ("NOT " if reverse else "") + " & ".join(terms)
+                print(f"\n{label}")
+                for variant in args.variants:
+                    sql, params = build_query(variant, terms, reverse)
+                    nodes, rows, ms = explain(cur, sql, params, args.repeat)
+                    scan = ", ".join(n for n in nodes if "Scan" in n) or nodes[0]
+                    print(f"  {variant:<11} {ms:>9.3f} ms  {rows:>6} sor  {scan}")
+                    results.append({
+                        "terms": list(terms),
+                        "reverse": reverse,
+                        "variant": variant,
+                        "median_ms": round(ms, 3),
+                        "rows": rows,
+                        "plan": nodes,
+                    })
+        conn.rollback()
+    finally:
+        conn.close()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\nJSON mentve: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,51 @@
+"""
+A betöltő változáskészlete: mely receptek és települések érintettek egy
+futásban. Az utólagos lépések (összesítő táblák, offline pillanatkép) ebből
+tudják, mely partíciókat kell frissíteni a teljes újraszámolás helyett.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Set
+
+
+@dataclass
+class ChangeSet:
+    recipe_ids: Set[int] = field(default_factory=set)
+    # Régi és új settlement_id is (áthelyezett recept mindkét partíciót érinti); None = település nélkül
+    settlement_ids: Set[Optional[int]] = field(default_factory=set)
+
+    def add(self, recipe_ids: Iterable[int] = (), settlement_ids: Iterable[Optional[int]] = ()) -> None:
+        self.recipe_ids.update(int(r) for r in recipe_ids)
+        self.settlement_ids.update(None if s is None else int(s) for s in settlement_ids)
+
+    def merge(self, other: "ChangeSet") -> None:
+        self.recipe_ids |= other.recipe_ids
+        self.settlement_ids |= other.settlement_ids
+
+    def __bool__(self) -> bool:
+        return bool(self.recipe_ids or self.settlement_ids)
+
+    def to_dict(self) -> dict:
+        return {
+            "recipe_ids": sorted(self.recipe_ids),
+            # JSON-ban a None null lesz; a rendezéshez előre tesszük
+            "settlement_ids": sorted(self.settlement_ids, key=lambda s: (s is not None, s or 0)),
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "ChangeSet":
+        cs = cls()
+        cs.add(d.get("recipe_ids", []), d.get("settlement_ids", []))
+        return cs
+
+    def save(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> "ChangeSet":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
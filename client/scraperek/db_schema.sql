@@ -1,5 +1,7 @@
 -- Enable pgvector
 CREATE EXTENSION IF NOT EXISTS vector;
+-- Trigram indexes for substring search
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
 
 -- Core recipes table
 CREATE TABLE IF NOT EXISTS public."Recipe" (
@@ -10,23 +12,116 @@ CREATE TABLE IF NOT EXISTS public."Recipe" (
   settlement_id     BIGINT REFERENCES public."Settlement"(id),
   settlement_name   TEXT,
   ingredients_text  TEXT NOT NULL,
+  search_text       TEXT,
+  search_tsv        TSVECTOR,
   created_at        TIMESTAMPTZ NOT NULL DEFAULT now()
 );
 
+-- Search columns, filled by insert_recipes (rows loaded earlier: backfilled by insert_recipes --init-schema):
+--   search_text  accent-folded, lowercased "title | ingredients" (textnorm.normalize_text)
+--   search_tsv   Hungarian full-text vector, title weighted A, ingredients B
+ALTER TABLE public."Recipe" ADD COLUMN IF NOT EXISTS search_text TEXT;
+ALTER TABLE public."Recipe" ADD COLUMN IF NOT EXISTS search_tsv TSVECTOR;
+
 -- Embedding table: choose 384 dims (all-MiniLM-L6-v2)
 -- If you want a different model later, create another table/column with its dim.
+-- Storage (insert_recipes --vector-storage):
+--   embedding       float32, 1.5 KB/row
+--   embedding_half  float16 (pgvector >= 0.7), half the size
+--   embedding_bin   sign bits of the same vector, 48 B/row, Hamming prefilter before re-ranking
 CREATE TABLE IF NOT EXISTS public."RecipeEmbedding" (
-  recipe_id  BIGINT PRIMARY KEY REFERENCES public."Recipe"(id) ON DELETE CASCADE,
-  model      TEXT NOT NULL,
-  dim        INT NOT NULL CHECK (dim = 384),
-  embedding  VECTOR(384) NOT NULL
+  recipe_id       BIGINT PRIMARY KEY REFERENCES public."Recipe"(id) ON DELETE CASCADE,
+  model           TEXT NOT NULL,
+  dim             INT NOT NULL CHECK (dim = 384),
+  embedding       VECTOR(384),
+  embedding_half  HALFVEC(384),
+  embedding_bin   BIT(384)
+);
+
+-- Upgrade tables created before halfvec/bit support
+ALTER TABLE public."RecipeEmbedding" ADD COLUMN IF NOT EXISTS embedding_half HALFVEC(384);
+ALTER TABLE public."RecipeEmbedding" ADD COLUMN IF NOT EXISTS embedding_bin BIT(384);
+ALTER TABLE public."RecipeEmbedding" ALTER COLUMN embedding DROP NOT NULL;
+
+-- Ingredient dictionary + parsed ingredient lines (ingredients.py, filled by insert_recipes)
+-- name_norm is the accent-folded, lowercased name (textnorm.normalize_text)
+CREATE TABLE IF NOT EXISTS public."Ingredient" (
+  id         BIGSERIAL PRIMARY KEY,
+  name       TEXT NOT NULL,
+  name_norm  TEXT UNIQUE NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS public."RecipeIngredient" (
+  recipe_id      BIGINT NOT NULL REFERENCES public."Recipe"(id) ON DELETE CASCADE,
+  position       INT NOT NULL,
+  ingredient_id  BIGINT NOT NULL REFERENCES public."Ingredient"(id),
+  qty            REAL,
+  unit           TEXT,
+  raw            TEXT NOT NULL,
+  PRIMARY KEY (recipe_id, position)
+);
+
+-- Precomputed analytics cubes (aggregates.py), partitioned by region_id (NULL = no region)
+CREATE TABLE IF NOT EXISTS public."RecipeCountCube" (
+  region_id     INT,
+  year          INT,
+  category_id   INT,
+  recipe_count  INT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS public."IngredientFrequency" (
+  region_id      INT,
+  ingredient_id  BIGINT NOT NULL REFERENCES public."Ingredient"(id) ON DELETE CASCADE,
+  recipe_count   INT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS public."IngredientCountDistribution" (
+  region_id         INT,
+  year              INT,
+  category_id       INT,
+  ingredient_count  INT NOT NULL,
+  recipe_count      INT NOT NULL
+);
+
+-- Top-k ingredient pairings (ingredient_pairs.py): co-occurrence count, PMI, Jaccard
+CREATE TABLE IF NOT EXISTS public."IngredientPairing" (
+  ingredient_id  BIGINT NOT NULL REFERENCES public."Ingredient"(id) ON DELETE CASCADE,
+  partner_id     BIGINT NOT NULL REFERENCES public."Ingredient"(id) ON DELETE CASCADE,
+  co_count       INT NOT NULL,
+  pmi            REAL NOT NULL,
+  jaccard        REAL NOT NULL,
+  PRIMARY KEY (ingredient_id, partner_id)
+);
+
+-- Simplified map geometry per Leaflet zoom level (geometry_levels.py);
+-- geojson is the quantized, ready-to-send text of geom
+CREATE TABLE IF NOT EXISTS public."RegionGeometryLevel" (
+  region_id  INT NOT NULL REFERENCES public."Region"(id) ON DELETE CASCADE,
+  zoom       INT NOT NULL,
+  geom       GEOMETRY NOT NULL,
+  geojson    TEXT NOT NULL,
+  PRIMARY KEY (region_id, zoom)
+);
+
+CREATE TABLE IF NOT EXISTS public."SettlementGeometryLevel" (
+  settlement_id  INT NOT NULL REFERENCES public."Settlement"(id) ON DELETE CASCADE,
+  zoom           INT NOT NULL,
+  geom           GEOMETRY NOT NULL,
+  geojson        TEXT NOT NULL,
+  PRIMARY KEY (settlement_id, zoom)
 );
 
 -- Helpful indexes
 CREATE INDEX IF NOT EXISTS recipe_year_idx ON public."Recipe"(year);
+CREATE INDEX IF NOT EXISTS recipe_search_text_trgm_idx ON public."Recipe" USING gin (search_text gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS recipe_search_tsv_idx ON public."Recipe" USING gin (search_tsv);
+CREATE INDEX IF NOT EXISTS recipe_ingredient_ingredient_idx ON public."RecipeIngredient"(ingredient_id, recipe_id);
+CREATE INDEX IF NOT EXISTS recipe_count_cube_region_idx ON public."RecipeCountCube"(region_id, year, category_id);
+CREATE INDEX IF NOT EXISTS ingredient_frequency_region_idx ON public."IngredientFrequency"(region_id, recipe_count DESC);
+CREATE INDEX IF NOT EXISTS ingredient_count_distribution_region_idx ON public."IngredientCountDistribution"(region_id, year, category_id);
 
--- pgvector ANN index (requires setting ivfflat lists at session or here)
-CREATE INDEX IF NOT EXISTS recipe_embedding_ivfflat_idx
-  ON public."RecipeEmbedding" USING ivfflat (embedding vector_l2_ops)
-  WITH (lists = 100);
-
+-- pgvector ANN indexes are NOT created here: ivfflat trains its centroids at build
+-- time, so an index created on an empty table is useless. insert_recipes builds them
+-- after loading (ivfflat by default when none exists; an uncommented ivfflat index,
+-- such as the one older schemas created here, is treated as untrained and rebuilt).
+-- See ann_index.py and --ann-index.
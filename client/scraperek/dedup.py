@@ -0,0 +1,197 @@
+"""
+Közel-duplikátum keresés a scrapelt receptek között MinHash + LSH sávozással.
+
+Minden rekordból shingle-halmaz készül (a normalizált cím karakter 3-gramjai
+és a normalizált hozzávalónevek), ebből MinHash aláírás, az aláírást sávokra
+bontva a közös vödörbe eső párok lesznek a jelöltek (közel lineáris idő), a
+jelölteket becsült Jaccard-hasonlósággal szűrjük, majd union-find-dal
+klaszterezünk.
+
+A minőségi jelentés azokat a rekordokat jelöli, amelyek hozzávalólistája
+gyanúsan rövid a közel-duplikátumaihoz képest (pl. a receptek_fix.jsonl-ben
+javított `["3 petrezse"]` eset).
+
+Használat (példa):
+    python dedup.py --jsonl receptek.jsonl --out out/dedup.json
+    python dedup.py --jsonl receptek.jsonl --threshold 0.6 --bands 32 --rows 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from ingredients import parse_ingredients
+from jsonl_io import iter_jsonl_records
+from textnorm import normalize_text
+
+# Legkisebb prím 2^32 felett: a, x < 2^32 mellett a*x + b még belefér uint64-be
+_PRIME = np.uint64(4294967311)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+def shingles(title: str, ingredients: List[str], k: int = 3) -> Set[str]:
+    t = re.sub(r"[^a-z0-9 ]+", " ", normalize_text(title))
+    t = re.sub(r"\s+", " ", t).strip()
+    out = {"t:" + t[i:i + k] for i in range(max(1, len(t) - k + 1))} if t else set()
+    out.update("i:" + p.name_norm for p in parse_ingredients(ingredients))
+    return out
+
+
+def _hash32(s: str) -> int:
+    return int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+class MinHasher:
+    def __init__(self, num_perm: int = 128, seed: int = 1) -> None:
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.a = rng.integers(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    def signature(self, items: Set[str]) -> np.ndarray:
+        if not items:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        x = np.fromiter((_hash32(s) for s in items), dtype=np.uint64, count=len(items))
+        # (a*x + b) mod p egyszerre minden permutációra (perm × shingle mátrix)
+        h = (self.a[:, None] * x[None, :] + self.b[:, None]) % _PRIME
+        return (h & _MAX_HASH).min(axis=1)
+
+
+def lsh_candidates(sigs: np.ndarray, bands: int, rows: int) -> Set[Tuple[int, int]]:
+    """Pairs that share at least one band bucket."""
+    pairs: Set[Tuple[int, int]] = set()
+    for b in range(bands):
+        buckets: Dict[bytes, List[int]] = defaultdict(list)
+        band = np.ascontiguousarray(sigs[:, b * rows:(b + 1) * rows])
+        for i in range(len(band)):
+            buckets[band[i].tobytes()].append(i)
+        for members in buckets.values():
+            if 1 < len(members) <= 200:  # óriás vödör (pl. üres rekordok) nem ad értelmes jelöltet
+                for x in range(len(members)):
+                    for y in range(x + 1, len(members)):
+                        pairs.add((members[x], members[y]))
+    return pairs
+
+
+def clusters_from_pairs(n: int, pairs: List[Tuple[int, int]]) -> List[List[int]]:
+    parent = list(range(n))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a, b in pairs:
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[rb] = ra
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for i in range(n):
+        groups[find(i)].append(i)
+    return [sorted(g) for g in groups.values() if len(g) > 1]
+
+
+def quality_report(records: List[dict], clusters: List[List[int]], short_ratio: float) -> List[dict]:
+    """Records whose ingredient list is much shorter than the median of their near-duplicates."""
+    flagged: List[dict] = []
+    for cluster in clusters:
+        lengths = {i: len(records[i].get("ingredients") or []) for i in cluster}
+        for i in cluster:
+            others = [lengths[j] for j in cluster if j != i]
+            ref = float(np.median(others))
+            if ref > 0 and lengths[i] < short_ratio * ref:
+                flagged.append({
+                    "url": records[i].get("url"),
+                    "title": records[i].get("title"),
+                    "ingredients": lengths[i],
+                    "duplicates_median": ref,
+                    "duplicates": [records[j].get("url") for j in cluster if j != i],
+                })
+    return flagged
+
+
+def find_duplicates(
+    records: List[dict],
+    num_perm: int = 128,
+    bands: int = 32,
+    rows: int = 4,
+    threshold: float = 0.5,
+) -> Tuple[List[List[int]], List[Tuple[int, int, float]], Dict[str, float]]:
+    if bands * rows > num_perm:
+        raise ValueError("bands * rows must not exceed num_perm")
+    t0 = time.perf_counter()
+    hasher = MinHasher(num_perm)
+    sigs = np.vstack([
+        hasher.signature(shingles(r.get("title", ""), r.get("ingredients") or [])) for r in records
+    ]) if records else np.zeros((0, num_perm), dtype=np.uint64)
+    t1 = time.perf_counter()
+    cand = lsh_candidates(sigs, bands, rows)
+    t2 = time.perf_counter()
+    scored: List[Tuple[int, int, float]] = []
+    for a, b in cand:
+        est = float((sigs[a] == sigs[b]).mean())
+        if est >= threshold:
+            scored.append((a, b, est))
+    clusters = clusters_from_pairs(len(records), [(a, b) for a, b, _ in scored])
+    t3 = time.perf_counter()
+    timings = {
+        "signatures_s": round(t1 - t0, 3),
+        "lsh_s": round(t2 - t1, 3),
+        "verify_cluster_s": round(t3 - t2, 3),
+        "candidates": len(cand),
+    }
+    return clusters, sorted(scored, key=lambda x: -x[2]), timings
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="MinHash-LSH near-duplicate detection for scraped recipes")
+    p.add_argument("--jsonl", type=str, required=True, help="Path to receptek.jsonl")
+    p.add_argument("--num-perm", type=int, default=128)
+    p.add_argument("--bands", type=int, default=32)
+    p.add_argument("--rows", type=int, default=4, help="Rows per band (bands * rows <= num-perm)")
+    p.add_argument("--threshold", type=float, default=0.5, help="Minimum estimated Jaccard for a duplicate pair")
+    p.add_argument("--short-ratio", type=float, default=0.5, help="Flag records shorter than ratio * duplicates' median")
+    p.add_argument("--out", type=str, default=None, help="Write clusters + quality report as JSON")
+    args = p.parse_args(argv)
+
+    records = list(iter_jsonl_records(args.jsonl))
+
+    clusters, pairs, timings = find_duplicates(records, args.num_perm, args.bands, args.rows, args.threshold)
+    flagged = quality_report(records, clusters, args.short_ratio)
+
+    print(f"{len(records)} rekord, {timings['candidates']} LSH jelölt, {len(pairs)} pár >= {args.threshold}, {len(clusters)} klaszter")
+    print(f"Idő: aláírás {timings['signatures_s']} s, LSH {timings['lsh_s']} s, ellenőrzés {timings['verify_cluster_s']} s")
+    for cluster in clusters[:20]:
+        print("  - " + " | ".join(f"{records[i].get('title')} ({len(records[i].get('ingredients') or [])})" for i in cluster))
+    if len(clusters) > 20:
+        print(f"  ... (+{len(clusters) - 20})")
+    if flagged:
+        print(f"Gyanúsan rövid hozzávalólista ({len(flagged)}):")
+        for fl in flagged:
+            print(f"  ! {fl['url']}: {fl['ingredients']} hozzávaló (duplikátumok mediánja {fl['duplicates_median']:g})")
+
+    if args.out:
+        doc = {
+            "params": {k: getattr(args, k) for k in ("num_perm", "bands", "rows", "threshold", "short_ratio")},
+            "timings": timings,
+            "clusters": [[records[i].get("url") for i in c] for c in clusters],
+            "pairs": [{"a": records[a].get("url"), "b": records[b].get("url"), "jaccard_est": round(s, 4)} for a, b, s in pairs],
+            "flagged": flagged,
+        }
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(doc, f, ensure_ascii=False, indent=2)
+        print(f"JSON mentve: {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
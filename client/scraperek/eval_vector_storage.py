@@ -0,0 +1,222 @@
+"""
+RecipeEmbedding tárolási formák összehasonlítása: float32 vector, halfvec és
+bináris előszűrés + újrarangsorolás.
+
+Jelentés: oszlop- és indexméret, index építési idő (REINDEX), lekérdezési
+késleltetés (p50/p95) és recall@k a pontos float32 eredményhez képest.
+
+Előfeltétel: a táblát `insert_recipes.py --vector-storage both` töltötte, így
+mindhárom oszlop ugyanabból a vektorból származik.
+
+Használat (példa):
+    python eval_vector_storage.py --dsn postgresql://... --queries 200 --k 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ann_index import existing_ann_indexes
+from insert_recipes import connect_pg, to_pgvector_literal
+
+
+# oszlop -> jelentésben használt név
+KINDS = {"embedding": "vector", "embedding_half": "halfvec", "embedding_bin": "bit"}
+
+
+def index_names(cur) -> Dict[str, str]:
+    """Current ANN index per storage kind (the loader names them after the method)."""
+    return {KINDS[column]: name for name, column, _ in existing_ann_indexes(cur) if column in KINDS}
+
+
+def parse_vector(text: str) -> np.ndarray:
+    # pgvector szöveges formátuma JSON-kompatibilis: [0.1,0.2,...]
+    return np.asarray(json.loads(text), dtype=np.float32)
+
+
+def storage_report(cur) -> Dict[str, Dict[str, float]]:
+    cur.execute(
+        'SELECT count(*), '
+        'coalesce(sum(pg_column_size(embedding)), 0), '
+        'coalesce(sum(pg_column_size(embedding_half)), 0), '
+        'coalesce(sum(pg_column_size(embedding_bin)), 0) '
+        'FROM public."RecipeEmbedding"'
+    )
+    n, vec_b, half_b, bin_b = cur.fetchone()
+    indexes = index_names(cur)
+    report: Dict[str, Dict[str, float]] = {}
+    for kind, col_bytes in (("vector", vec_b), ("halfvec", half_b), ("bit", bin_b)):
+        idx_bytes = 0
+        if kind in indexes:
+            cur.execute("SELECT pg_relation_size(to_regclass(%s))", (f'public."{indexes[kind]}"',))
+            idx_bytes = cur.fetchone()[0] or 0
+        report[kind] = {
+            "rows": int(n),
+            "column_mb": round(int(col_bytes) / 2**20, 3),
+            "bytes_per_row": round(int(col_bytes) / n, 1) if n else 0.0,
+            "index_mb": round(int(idx_bytes) / 2**20, 3),
+        }
+    return report
+
+
+def index_build_times(conn) -> Dict[str, float]:
+    times: Dict[str, float] = {}
+    old = conn.autocommit
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            for kind, name in index_names(cur).items():
+                t0 = time.perf_counter()
+                cur.execute(f'REINDEX INDEX public."{name}"')
+                times[kind] = round(time.perf_counter() - t0, 3)
+    finally:
+        conn.autocommit = old
+    return times
+
+
+def load_baseline(cur) -> Tuple[np.ndarray, np.ndarray]:
+    cur.execute('SELECT recipe_id, embedding::text FROM public."RecipeEmbedding" WHERE embedding IS NOT NULL ORDER BY recipe_id')
+    rows = cur.fetchall()
+    if not rows:
+        raise SystemExit("Nincs float32 embedding; töltsd újra --vector-storage both beállítással.")
+    ids = np.array([r[0] for r in rows], dtype=np.int64)
+    mat = np.vstack([parse_vector(r[1]) for r in rows])
+    return ids, mat
+
+
+def exact_topk(ids: np.ndarray, mat: np.ndarray, q_idx: int, k: int) -> List[int]:
+    d = ((mat - mat[q_idx]) ** 2).sum(axis=1)
+    d[q_idx] = np.inf  # a lekérdezés saját magát nem számítjuk
+    top = np.argpartition(d, k)[:k]
+    return ids[top[np.argsort(d[top])]].tolist()
+
+
+QUERIES: Dict[str, str] = {
+    "vector": (
+        'SELECT recipe_id FROM public."RecipeEmbedding" WHERE recipe_id <> %(id)s '
+        'ORDER BY embedding <-> %(q)s::vector LIMIT %(k)s'
+    ),
+    "halfvec": (
+        'SELECT recipe_id FROM public."RecipeEmbedding" WHERE recipe_id <> %(id)s '
+        'ORDER BY embedding_half <-> %(q)s::halfvec LIMIT %(k)s'
+    ),
+    "bit+rerank": (
+        'SELECT recipe_id FROM ('
+        '  SELECT recipe_id, embedding_half FROM public."RecipeEmbedding" WHERE recipe_id <> %(id)s '
+        '  ORDER BY embedding_bin <~> binary_quantize(%(q)s::vector)::bit(384) LIMIT %(candidates)s'
+        ') c ORDER BY embedding_half <-> %(q)s::halfvec LIMIT %(k)s'
+    ),
+}
+
+
+def run_queries(cur, sql: str, params: List[dict]) -> Tuple[List[List[int]], List[float]]:
+    results: List[List[int]] = []
+    lat: List[float] = []
+    for prm in params:
+        t0 = time.perf_counter()
+        cur.execute(sql, prm)
+        rows = cur.fetchall()
+        lat.append((time.perf_counter() - t0) * 1000.0)
+        results.append([int(r[0]) for r in rows])
+    return results, lat
+
+
+def recall_at_k(truth: List[List[int]], got: List[List[int]], k: int) -> float:
+    hits = sum(len(set(t[:k]) & set(g[:k])) for t, g in zip(truth, got))
+    return hits / float(k * len(truth)) if truth else 0.0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Evaluate float32 vs halfvec vs binary-prefilter embedding storage")
+    p.add_argument("--dsn", type=str, default=None, help="Postgres DSN string")
+    p.add_argument("--host", type=str, default=None)
+    p.add_argument("--port", type=int, default=None)
+    p.add_argument("--db", type=str, default=None)
+    p.add_argument("--user", type=str, default=None)
+    p.add_argument("--password", type=str, default=None)
+    p.add_argument("--queries", type=int, default=200, help="Number of query vectors sampled from the table")
+    p.add_argument("--k", type=int, default=10)
+    p.add_argument("--probes", type=int, default=10, help="ivfflat.probes for the ANN queries")
+    p.add_argument(
+        "--ef-search",
+        type=int,
+        default=40,
+        help="hnsw.ef_search for the ANN queries; raised to k * rerank-factor for the binary prefilter",
+    )
+    p.add_argument("--rerank-factor", type=int, default=10, help="Binary prefilter keeps k * factor candidates")
+    p.add_argument("--skip-reindex", action="store_true", help="Do not measure index build time")
+    p.add_argument("--seed", type=int, default=42)
+    p.add_argument("--json", type=str, default=None, help="Write the report as JSON")
+    args = p.parse_args(argv)
+
+    conn = connect_pg(args.dsn, args.host, args.port, args.db, args.user, args.password)
+    try:
+        report: Dict[str, object] = {}
+        with conn.cursor() as cur:
+            report["storage"] = storage_report(cur)
+        if not args.skip_reindex:
+            report["index_build_s"] = index_build_times(conn)
+
+        with conn.cursor() as cur:
+            ids, mat = load_baseline(cur)
+            rng = random.Random(args.seed)
+            sample = rng.sample(range(len(ids)), min(args.queries, len(ids)))
+            truth = [exact_topk(ids, mat, i, args.k) for i in sample]
+            params = [
+                {
+                    "id": int(ids[i]),
+                    "q": to_pgvector_literal(mat[i].tolist()),
+                    "k": args.k,
+                    "candidates": args.k * args.rerank_factor,
+                }
+                for i in sample
+            ]
+            cur.execute("SET ivfflat.probes = %s", (args.probes,))
+            measured: Dict[str, Dict[str, float]] = {}
+            for name, sql in QUERIES.items():
+                # HNSW scan legfeljebb ef_search sort ad vissza: a LIMIT-nél ne legyen kisebb
+                limit = args.k * args.rerank_factor if name == "bit+rerank" else args.k
+                ef_search = max(args.ef_search, limit)
+                cur.execute("SET hnsw.ef_search = %s", (ef_search,))
+                run_queries(cur, sql, params[:5])  # bemelegítés
+                got, lat = run_queries(cur, sql, params)
+                measured[name] = {
+                    "recall_at_k": round(recall_at_k(truth, got, args.k), 4),
+                    "p50_ms": round(float(np.percentile(lat, 50)), 3),
+                    "p95_ms": round(float(np.percentile(lat, 95)), 3),
+                    "ef_search": ef_search,
+                }
+            report["queries"] = measured
+            conn.rollback()
+    finally:
+        conn.close()
+
+    print("Tárolás:")
+    for kind, r in report["storage"].items():  # type: ignore[union-attr]
+        print(f"  {kind:<8} {r['bytes_per_row']:>8} B/sor  oszlop {r['column_mb']:>8} MB  index {r['index_mb']:>8} MB")
+    if "index_build_s" in report:
+        print("Index építés (REINDEX):")
+        for kind, s in report["index_build_s"].items():  # type: ignore[union-attr]
+            print(f"  {kind:<8} {s:>8} s")
+    print(f"Lekérdezések (k={args.k}, probes={args.probes}, ef_search={args.ef_search}):")
+    for name, r in report["queries"].items():  # type: ignore[union-attr]
+        print(
+            f"  {name:<11} recall@{args.k}={r['recall_at_k']:.4f}  p50={r['p50_ms']} ms  p95={r['p95_ms']} ms  "
+            f"ef_search={r['ef_search']}"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"JSON mentve: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,142 @@
+"""
+Tartós (SQLite) geokódolási gyorsítótár a településlista-generáláshoz.
+
+A kulcs a normalizált lekérdezés (ékezet- és kisbetű-független), így az
+"Abasár, Hungary" és az "abasar, hungary" ugyanazt a sort találja. A
+"nincs találat" válaszok is tárolódnak, hogy egy újrafuttatás ne kérdezze
+le újra őket (--retry-misses felülírja).
+
+Az eddig generált settlement_inserts.sql-ből előtölthető, így a meglévő
+koordinátákért egyáltalán nem kell a hálózathoz fordulni.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional, Tuple
+
+from textnorm import normalize_text
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS geocode (
+    key        TEXT PRIMARY KEY,
+    query      TEXT NOT NULL,
+    lat        REAL,
+    lon        REAL,
+    county     TEXT,
+    region_id  INTEGER,
+    source     TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+)
+"""
+
+# INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (1, 'Abasár', 10, ST_SetSRID(ST_MakePoint(20.0063, 47.7956), 4326));
+_INSERT_RE = re.compile(
+    r"VALUES\s*\(\s*(-?\d+)\s*,\s*'((?:[^']|'')*)'\s*,\s*(NULL|\d+)\s*,\s*"
+    r"(?:ST_SetSRID\(ST_MakePoint\(\s*(-?[\d.]+)\s*,\s*(-?[\d.]+)\s*\)\s*,\s*4326\)|NULL)\s*\)"
+)
+
+
+def cache_key(query: str) -> str:
+    return re.sub(r"\s+", " ", normalize_text(query)).strip()
+
+
+@dataclass
+class GeocodeHit:
+    lat: Optional[float]
+    lon: Optional[float]
+    county: Optional[str]
+    region_id: Optional[int]
+    source: str
+
+    @property
+    def found(self) -> bool:
+        return self.lat is not None and self.lon is not None
+
+
+class GeocodeCache:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(SCHEMA)
+        self.conn.commit()
+
+    def get(self, query: str) -> Optional[GeocodeHit]:
+        row = self.conn.execute(
+            "SELECT lat, lon, county, region_id, source FROM geocode WHERE key = ?", (cache_key(query),)
+        ).fetchone()
+        return GeocodeHit(*row) if row else None
+
+    def put(
+        self,
+        query: str,
+        lat: Optional[float],
+        lon: Optional[float],
+        county: Optional[str] = None,
+        region_id: Optional[int] = None,
+        source: str = "nominatim",
+        commit: bool = True,
+    ) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO geocode (key, query, lat, lon, county, region_id, source, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (cache_key(query), query, lat, lon, county, region_id, source, time.time()),
+        )
+        if commit:
+            self.conn.commit()
+
+    def seed_from_sql(self, sql_path: str, country: str = "Hungary", overwrite: bool = False) -> int:
+        """Load coordinates and region ids from a generated settlement_inserts.sql; returns rows added."""
+        added = 0
+        for name, region_id, lon, lat in parse_settlement_inserts(sql_path):
+            if lat is None:
+                continue  # a NULL geometriájú sorokat inkább újra lekérdezzük
+            query = f"{name}, {country}"
+            if not overwrite and self.get(query) is not None:
+                continue
+            self.put(query, lat, lon, None, region_id, source="seed", commit=False)
+            added += 1
+        self.conn.commit()
+        return added
+
+    def stats(self) -> Dict[str, int]:
+        rows = self.conn.execute(
+            "SELECT source, lat IS NOT NULL, count(*) FROM geocode GROUP BY 1, 2"
+        ).fetchall()
+        out: Dict[str, int] = {}
+        for source, found, n in rows:
+            out[f"{source}{'' if found else '_miss'}"] = n
+        return out
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def parse_settlement_rows(
+    sql_path: str,
+) -> Iterator[Tuple[int, str, Optional[int], Optional[float], Optional[float]]]:
+    """(id, name, region_id, lon, lat) for every Settlement INSERT line of the file, with the id as written."""
+    with open(sql_path, "r", encoding="utf-8") as f:
+        for line in f:
+            m = _INSERT_RE.search(line)
+            if not m:
+                continue
+            sid, name, region, lon, lat = m.groups()
+            yield (
+                int(sid),
+                name.replace("''", "'"),
+                None if region == "NULL" else int(region),
+                None if lon is None else float(lon),
+                None if lat is None else float(lat),
+            )
+
+
+def parse_settlement_inserts(
+    sql_path: str,
+) -> Iterator[Tuple[str, Optional[int], Optional[float], Optional[float]]]:
+    """(name, region_id, lon, lat) for every Settlement INSERT line of the file."""
+    for _, name, region, lon, lat in parse_settlement_rows(sql_path):
+        yield name, region, lon, lat
@@ -0,0 +1,279 @@
+"""
+Cserélhető geokódolók a településlista-generáláshoz.
+
+    GazetteerGeocoder  offline: helyi gazetteer TSV (GeoNames HU.txt vagy
+                       fejléces name/lat/lon[/county] TSV) ékezetfüggetlen
+                       memóriabeli indexbe töltve, pontos és prefix kereséssel;
+                       GeoNames sorban a vármegye az admin1 kódból jön
+    NominatimGeocoder  online: geopy Nominatim, 1 kérés/s korláttal
+    ChainGeocoder      sorban próbálja a geokódolókat (pl. gazetteer, majd Nominatim)
+
+Használat (példa):
+    python geocoders.py lookup --gazetteer HU.txt Abasár Kisgyőr "Zala"
+    python geocoders.py bench --gazetteer HU.txt
+    python telepules_insertek.py --gazetteer HU.txt            # Nominatim csak a hiányzókra
+    python telepules_insertek.py --gazetteer HU.txt --offline  # hálózat nélkül
+    python -m pytest tests/test_geocoders.py                   # tests/fixtures/gazetteer_hu.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import csv
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from geocode_cache import cache_key
+
+# GeoNames "geoname" tábla oszlopai (tabulátorral tagolt, fejléc nélkül)
+_GN_NAME, _GN_ASCII, _GN_ALT, _GN_LAT, _GN_LON, _GN_CLASS, _GN_ADMIN1, _GN_POP = 1, 2, 3, 4, 5, 6, 10, 14
+
+# GeoNames admin1 kódok (admin1CodesASCII.txt, HU.xx) -> vármegye a REGION_MAPPING írásmódjával
+GEONAMES_HU_ADMIN1 = {
+    "01": "Bács-Kiskun vármegye",
+    "02": "Baranya vármegye",
+    "03": "Békés vármegye",
+    "04": "Borsod-Abaúj-Zemplén vármegye",
+    "05": "Budapest",
+    "06": "Csongrád-Csanád vármegye",
+    "08": "Fejér vármegye",
+    "09": "Győr-Moson-Sopron vármegye",
+    "10": "Hajdú-Bihar vármegye",
+    "11": "Heves vármegye",
+    "12": "Komárom-Esztergom vármegye",
+    "14": "Nógrád vármegye",
+    "16": "Pest vármegye",
+    "17": "Somogy vármegye",
+    "18": "Szabolcs-Szatmár-Bereg vármegye",
+    "20": "Jász-Nagykun-Szolnok vármegye",
+    "21": "Tolna vármegye",
+    "22": "Vas vármegye",
+    "23": "Veszprém vármegye",
+    "24": "Zala vármegye",
+}
+
+
+@dataclass
+class GeocodeResult:
+    lat: float
+    lon: float
+    county: Optional[str]
+    source: str
+    name: Optional[str] = None
+
+
+class Geocoder(ABC):
+    name = "geocoder"
+    network = False
+
+    @abstractmethod
+    def geocode(self, settlement_name: str, country: str = "Hungary") -> Optional[GeocodeResult]:
+        """Coordinates and county of a settlement, or None when it is not found."""
+
+
+@dataclass
+class _Place:
+    name: str
+    lat: float
+    lon: float
+    county: Optional[str]
+    rank: int  # nagyobb nyer azonos kulcsnál (GeoNames: népesség)
+
+
+class GazetteerGeocoder(Geocoder):
+    name = "gazetteer"
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.exact: Dict[str, _Place] = {}
+        t0 = time.perf_counter()
+        places, alternates = _read_gazetteer(path)
+        # Elsődleges nevek előbb, az alternatív nevek csak üres kulcsot töltenek ki
+        for keyed in (places, alternates):
+            for key, place in keyed:
+                cur = self.exact.get(key)
+                if cur is None or (keyed is places and place.rank > cur.rank):
+                    self.exact[key] = place
+        self.keys = sorted(self.exact)
+        self.load_seconds = time.perf_counter() - t0
+
+    def __len__(self) -> int:
+        return len(self.exact)
+
+    def lookup(self, settlement_name: str) -> Optional[_Place]:
+        return self.exact.get(cache_key(settlement_name))
+
+    def prefix(self, text: str, limit: int = 10) -> List[_Place]:
+        """Places whose folded name starts with the folded text, in name order."""
+        key = cache_key(text)
+        out: List[_Place] = []
+        seen = set()
+        i = bisect.bisect_left(self.keys, key)
+        while i < len(self.keys) and self.keys[i].startswith(key) and len(out) < limit:
+            place = self.exact[self.keys[i]]
+            if id(place) not in seen:  # egy hely több (alternatív) kulccsal is szerepelhet
+                seen.add(id(place))
+                out.append(place)
+            i += 1
+        return out
+
+    def geocode(self, settlement_name: str, country: str = "Hungary") -> Optional[GeocodeResult]:
+        place = self.lookup(settlement_name)
+        if place is None:
+            return None
+        return GeocodeResult(place.lat, place.lon, place.county, self.name, place.name)
+
+
+def _read_gazetteer(path: str) -> Tuple[List[Tuple[str, _Place]], List[Tuple[str, _Place]]]:
+    with open(path, "r", encoding="utf-8") as f:
+        first = f.readline()
+        f.seek(0)
+        if first.rstrip("\n").split("\t")[0].lower() == "name":
+            return _read_simple(f), []
+        return _read_geonames(f)
+
+
+def _read_simple(f) -> List[Tuple[str, _Place]]:
+    """Headed TSV: name, lat, lon and optionally county and population."""
+    out: List[Tuple[str, _Place]] = []
+    for row in csv.DictReader(f, delimiter="\t"):
+        name = (row.get("name") or "").strip()
+        if not name or not row.get("lat") or not row.get("lon"):
+            continue
+        place = _Place(name, float(row["lat"]), float(row["lon"]), row.get("county") or None, int(row.get("population") or 0))
+        out.append((cache_key(name), place))
+    return out
+
+
+def _read_geonames(f) -> Tuple[List[Tuple[str, _Place]], List[Tuple[str, _Place]]]:
+    """GeoNames dump rows; only populated places (feature class P), county from the admin1 code."""
+    places: List[Tuple[str, _Place]] = []
+    alternates: List[Tuple[str, _Place]] = []
+    for line in f:
+        cols = line.rstrip("\n").split("\t")
+        if len(cols) <= _GN_POP or cols[_GN_CLASS] != "P":
+            continue
+        county = GEONAMES_HU_ADMIN1.get(cols[_GN_ADMIN1])
+        place = _Place(cols[_GN_NAME], float(cols[_GN_LAT]), float(cols[_GN_LON]), county, int(cols[_GN_POP] or 0))
+        places.append((cache_key(place.name), place))
+        for alt in {cols[_GN_ASCII], *cols[_GN_ALT].split(",")}:
+            if alt and not alt.startswith("http"):
+                alternates.append((cache_key(alt), place))
+    return places, alternates
+
+
+class NominatimGeocoder(Geocoder):
+    name = "nominatim"
+    network = True
+
+    def __init__(self, user_agent: str = "izorzok_settlement_scraper_v1", min_interval_s: float = 1.0, timeout: float = 10) -> None:
+        self.user_agent = user_agent
+        self.min_interval_s = min_interval_s
+        self.timeout = timeout
+        self.calls = 0
+        self._geolocator = None
+        self._last_call = 0.0
+
+    def _throttle(self) -> None:
+        # Nominatim használati szabály: legfeljebb 1 kérés másodpercenként
+        wait = self._last_call + self.min_interval_s - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._last_call = time.monotonic()
+
+    def geocode(self, settlement_name: str, country: str = "Hungary") -> Optional[GeocodeResult]:
+        from geopy.exc import GeocoderServiceError, GeocoderTimedOut
+
+        if self._geolocator is None:
+            from geopy.geocoders import Nominatim
+
+            self._geolocator = Nominatim(user_agent=self.user_agent)
+        query = f"{settlement_name}, {country}"
+        self._throttle()
+        self.calls += 1
+        try:
+            location = self._geolocator.geocode(query, addressdetails=True, timeout=self.timeout)
+        except GeocoderTimedOut:
+            print(f"  ❌ Hiba: Időtúllépés a(z) {settlement_name} geokódolásánál.")
+            return None
+        except GeocoderServiceError as e:
+            print(f"  ❌ Hiba: Szolgáltatási hiba a(z) {settlement_name} geokódolásánál: {e}")
+            return None
+        if not location:
+            return None
+        # A vármegye neve a Nominatim címblokkjában county vagy state mezőben jön
+        address = (location.raw or {}).get("address", {})
+        county = address.get("county") or address.get("state")
+        return GeocodeResult(location.latitude, location.longitude, county, self.name)
+
+
+class ChainGeocoder(Geocoder):
+    def __init__(self, geocoders: Sequence[Geocoder]) -> None:
+        self.geocoders = list(geocoders)
+        self.name = "+".join(g.name for g in self.geocoders)
+        self.network = any(g.network for g in self.geocoders)
+
+    def geocode(self, settlement_name: str, country: str = "Hungary") -> Optional[GeocodeResult]:
+        for g in self.geocoders:
+            result = g.geocode(settlement_name, country)
+            if result is not None:
+                return result
+        return None
+
+
+def build_geocoder(gazetteer: Optional[str] = None, offline: bool = False) -> Geocoder:
+    chain: List[Geocoder] = []
+    if gazetteer:
+        chain.append(GazetteerGeocoder(gazetteer))
+    if not offline:
+        chain.append(NominatimGeocoder())
+    if not chain:
+        raise ValueError("offline geocoding needs a gazetteer")
+    return chain[0] if len(chain) == 1 else ChainGeocoder(chain)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Offline gazetteer geocoder (lookup / benchmark)")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    pl = sub.add_parser("lookup", help="Exact lookup, with prefix suggestions on a miss")
+    pl.add_argument("names", nargs="+")
+    pb = sub.add_parser("bench", help="Time exact lookups over every name of the gazetteer")
+    pb.add_argument("--repeat", type=int, default=5)
+    for sp_ in (pl, pb):
+        sp_.add_argument("--gazetteer", type=str, required=True, help="GeoNames dump or headed name/lat/lon TSV")
+    args = p.parse_args(argv)
+
+    g = GazetteerGeocoder(args.gazetteer)
+    print(f"{len(g)} kulcs betöltve ({g.load_seconds * 1000:.1f} ms): {args.gazetteer}")
+
+    if args.cmd == "lookup":
+        for name in args.names:
+            r = g.geocode(name)
+            if r is not None:
+                print(f"  {name}: {r.lat:.4f}, {r.lon:.4f} ({r.name}{', ' + r.county if r.county else ''})")
+            else:
+                hints = ", ".join(pl_.name for pl_ in g.prefix(name, 5))
+                print(f"  {name}: nincs pontos találat{' – ' + hints if hints else ''}")
+        return 0
+
+    names = [g.exact[k].name for k in g.keys]
+    best = float("inf")
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        for n in names:
+            g.geocode(n)
+        best = min(best, time.perf_counter() - t0)
+    print(f"Pontos keresés: {len(names)} név, {best / max(1, len(names)) * 1e6:.2f} µs/név")
+    t0 = time.perf_counter()
+    for n in names:
+        g.prefix(n[:3], 10)
+    dt = time.perf_counter() - t0
+    print(f"Prefix keresés (3 betű, top 10): {dt / max(1, len(names)) * 1e6:.2f} µs/név")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
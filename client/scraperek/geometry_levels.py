@@ -0,0 +1,337 @@
+"""
+Többfelbontású, egyszerűsített régió- és településgeometria a térképhez.
+
+A /maps/regions és /maps/settlements végpont a teljes felbontású PostGIS
+geometriát küldi, bármilyen nagyításon áll a Leaflet térkép. Ez a job a
+geometriát egyszer olvassa be, és zoomszintenként előre elkészíti:
+
+    tolerancia   a zoomszint képpontmérete fokban × --px-tolerance
+    régiók       lefedettség-megőrző egyszerűsítés (shapely.coverage_simplify):
+                 a szomszédos vármegyék közös határa egyszer, azonosan
+                 egyszerűsödik, így nem keletkezik rés vagy átfedés
+    kvantálás    a koordináták a zoomszint képpontméretének --quantize-px
+                 részére kerekítve; a régióknál a közös határvonalak egyszer,
+                 csomópontosítva illeszkednek a rácsra (snap rounding), így a
+                 lefedettség a kerekítés után is hézag- és átfedésmentes
+    települések  pontok: csak kvantálás
+
+Kimenet zoomszintenként a végpontokkal azonos alakú GeoJSON fájl
+(regions_z{z}.json, settlements_z{z}.json), és opcionálisan a
+RegionGeometryLevel / SettlementGeometryLevel tábla. A jelentés
+szintenként a csúcsszámot, a méretet (nyers és gzip), az egyszerűsítés
+idejét és a lefedettség érvényességét mutatja.
+
+Használat (példa):
+    python geometry_levels.py --dsn postgresql://... --out-dir out/geometry
+    python geometry_levels.py --dsn postgresql://... --zooms 6 8 10 12 --write-pg
+    python geometry_levels.py --regions-geojson regions.json --settlements-geojson settlements.json --out-dir out/geometry
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import shapely
+
+DEFAULT_ZOOMS = (6, 8, 10, 12)
+
+# Web Mercator csempe: 256 képpont a teljes 360 fokra z = 0-n
+TILE_PX = 256
+
+
+@dataclass
+class Layer:
+    ids: List[int]
+    names: List[Optional[str]]
+    geoms: list
+    region_ids: Optional[List[Optional[int]]] = None  # csak településeknél
+
+
+def pixel_deg(zoom: int) -> float:
+    """Width of one screen pixel in degrees of longitude at a Web Mercator zoom level."""
+    return 360.0 / (TILE_PX * 2 ** zoom)
+
+
+def _decimals(grid: float) -> int:
+    return max(0, math.ceil(-math.log10(grid)))
+
+
+def _geom_4326(column: str = "geom") -> str:
+    return f"ST_AsBinary(CASE WHEN ST_SRID({column}) IN (0, 4326) THEN {column} ELSE ST_Transform({column}, 4326) END)"
+
+
+def load_layers_pg(cur) -> Dict[str, Layer]:
+    cur.execute(f'SELECT id, name, {_geom_4326()} FROM public."Region" WHERE geom IS NOT NULL ORDER BY id')
+    rows = cur.fetchall()
+    regions = Layer([int(r[0]) for r in rows], [r[1] for r in rows], list(shapely.from_wkb([bytes(r[2]) for r in rows])))
+    cur.execute(f'SELECT id, name, {_geom_4326()}, regionid FROM public."Settlement" WHERE geom IS NOT NULL ORDER BY id')
+    rows = cur.fetchall()
+    settlements = Layer(
+        [int(r[0]) for r in rows],
+        [r[1] for r in rows],
+        list(shapely.from_wkb([bytes(r[2]) for r in rows])),
+        [None if r[3] is None else int(r[3]) for r in rows],
+    )
+    return {"regions": regions, "settlements": settlements}
+
+
+def load_layer_geojson(path: str) -> Layer:
+    """A FeatureCollection, or the /maps/regions or /maps/settlements JSON list ({id, name, [regionid,] geom})."""
+    with open(path, "r", encoding="utf-8") as f:
+        doc = json.load(f)
+    if isinstance(doc, dict) and doc.get("type") == "FeatureCollection":
+        items = [dict(f.get("properties") or {}, id=f.get("id", (f.get("properties") or {}).get("id")), geom=f.get("geometry")) for f in doc["features"]]
+    else:
+        items = list(doc.get("data", doc) if isinstance(doc, dict) else doc)
+    items = [it for it in items if it.get("id") is not None and it.get("geom")]
+    return Layer(
+        [int(it["id"]) for it in items],
+        [it.get("name") for it in items],
+        [shapely.from_geojson(json.dumps(it["geom"])) for it in items],
+        [it.get("regionid") for it in items] if any("regionid" in it for it in items) else None,
+    )
+
+
+def simplify_regions(geoms: Sequence, tolerance: float) -> list:
+    """Simplify a polygon coverage keeping shared borders identical (GEOS >= 3.12 coverage simplifier)."""
+    if hasattr(shapely, "coverage_simplify"):
+        return list(shapely.coverage_simplify(list(geoms), tolerance))
+    # Régebbi shapely/GEOS: geometriánként, a közös határok itt eltérhetnek
+    return list(shapely.simplify(list(geoms), tolerance, preserve_topology=True))
+
+
+def quantize(geoms: Sequence, grid: float) -> list:
+    return list(shapely.set_precision(list(geoms), grid))
+
+
+def snap_coverage(geoms: Sequence, grid: float) -> list:
+    """Snap a polygon coverage to a grid without opening gaps or overlaps between neighbours.
+
+    Rounding each polygon on its own can make neighbours overlap where a border meets the
+    outer boundary; instead the shared linework is snap-rounded and noded once, polygonized,
+    and every face goes back to the input polygon it overlaps most.
+    """
+    geoms = np.asarray(list(geoms), dtype=object)
+    lines = shapely.union_all(shapely.boundary(geoms), grid_size=grid)
+    faces = shapely.get_parts(shapely.polygonize(shapely.get_parts(lines)))
+    f_idx, g_idx = shapely.STRtree(geoms).query(faces, predicate="intersects")
+    overlap = shapely.area(shapely.intersection(faces[f_idx], geoms[g_idx]))
+    owner: Dict[int, Tuple[int, float]] = {}
+    for f, g, a in zip(f_idx.tolist(), g_idx.tolist(), overlap.tolist()):
+        if a > 0 and (f not in owner or a > owner[f][1]):
+            owner[f] = (g, a)
+    parts: Dict[int, list] = {}
+    for f, (g, _) in owner.items():
+        parts.setdefault(g, []).append(faces[f])
+    # Gazdátlan lap: a bemenet hézaga vagy külső lyuk, kimarad
+    return [shapely.coverage_union_all(parts[g]) if g in parts else shapely.Polygon() for g in range(len(geoms))]
+
+
+def _round_coords(obj, ndigits: int):
+    if isinstance(obj, float):
+        return round(obj, ndigits)
+    if isinstance(obj, (list, tuple)):
+        return [_round_coords(v, ndigits) for v in obj]
+    return obj
+
+
+def layer_json(layer: Layer, geoms: Sequence, ndigits: int) -> List[dict]:
+    """Items shaped like the /maps endpoints' responses, coordinates rounded to the grid."""
+    out: List[dict] = []
+    for i, (gid, name, geom) in enumerate(zip(layer.ids, layer.names, geoms)):
+        if geom is None or geom.is_empty:
+            gj = None
+        else:
+            gj = json.loads(shapely.to_geojson(geom))
+            gj["coordinates"] = _round_coords(gj["coordinates"], ndigits)
+        item: Dict[str, object] = {"id": gid, "name": name}
+        if layer.region_ids is not None:
+            item["regionid"] = layer.region_ids[i]
+        item["geom"] = gj
+        out.append(item)
+    return out
+
+
+def _coverage_valid(geoms: Sequence) -> Optional[bool]:
+    if not hasattr(shapely, "coverage_is_valid"):
+        return None
+    return bool(shapely.coverage_is_valid(list(geoms)))
+
+
+def build_levels(
+    layers: Dict[str, Layer],
+    zooms: Sequence[int],
+    px_tolerance: float = 1.0,
+    quantize_px: float = 0.25,
+) -> Dict[str, Dict[int, dict]]:
+    """Per layer and zoom: the simplified, quantized geometries plus size/time statistics."""
+    out: Dict[str, Dict[int, dict]] = {}
+    for name, layer in layers.items():
+        polygonal = name == "regions"
+        levels: Dict[int, dict] = {}
+        full = layer_json(layer, layer.geoms, 15)
+        full_bytes = json.dumps(full, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        levels[-1] = {
+            "tolerance": 0.0,
+            "vertices": int(shapely.get_num_coordinates(layer.geoms).sum()),
+            "bytes": len(full_bytes),
+            "gzip_bytes": len(gzip.compress(full_bytes)),
+            "seconds": 0.0,
+        }
+        for z in zooms:
+            px = pixel_deg(z)
+            grid = px * quantize_px
+            t0 = time.perf_counter()
+            if polygonal:
+                geoms = snap_coverage(simplify_regions(layer.geoms, px * px_tolerance), grid)
+            else:
+                geoms = quantize(layer.geoms, grid)
+            seconds = time.perf_counter() - t0
+            items = layer_json(layer, geoms, _decimals(grid))
+            data = json.dumps(items, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            levels[z] = {
+                "tolerance": round(px * px_tolerance, 8),
+                "grid": grid,
+                "vertices": int(shapely.get_num_coordinates(geoms).sum()),
+                "bytes": len(data),
+                "gzip_bytes": len(gzip.compress(data)),
+                "seconds": round(seconds, 4),
+                "valid": bool(shapely.is_valid(geoms).all()),
+                "coverage_valid": _coverage_valid(geoms) if polygonal else None,
+                "items": items,
+                "geoms": geoms,
+                "data": data,
+            }
+        out[name] = levels
+    return out
+
+
+def write_files(levels: Dict[str, Dict[int, dict]], out_dir: str) -> List[str]:
+    os.makedirs(out_dir, exist_ok=True)
+    written: List[str] = []
+    for name, per_zoom in levels.items():
+        for z, lv in per_zoom.items():
+            if z < 0:
+                continue
+            path = os.path.join(out_dir, f"{name}_z{z}.json")
+            with open(path, "wb") as f:
+                f.write(lv["data"])
+            written.append(path)
+    return written
+
+
+LEVEL_TABLES = {
+    "regions": ('public."RegionGeometryLevel"', "region_id"),
+    "settlements": ('public."SettlementGeometryLevel"', "settlement_id"),
+}
+
+
+def write_pg(cur, levels: Dict[str, Dict[int, dict]], layers: Dict[str, Layer]) -> Dict[str, int]:
+    """Replace the per-zoom geometry tables (geom + ready-to-send GeoJSON text)."""
+    import psycopg2.extras
+
+    written: Dict[str, int] = {}
+    for name, per_zoom in levels.items():
+        table, key = LEVEL_TABLES[name]
+        rows = []
+        for z, lv in per_zoom.items():
+            if z < 0:
+                continue
+            for gid, geom, item in zip(layers[name].ids, lv["geoms"], lv["items"]):
+                if item["geom"] is None:
+                    continue
+                rows.append((gid, z, shapely.to_wkb(geom), json.dumps(item["geom"], separators=(",", ":"))))
+        cur.execute(f"DELETE FROM {table}")
+        psycopg2.extras.execute_values(
+            cur,
+            f"INSERT INTO {table} ({key}, zoom, geom, geojson) VALUES %s",
+            rows,
+            template="(%s, %s, ST_SetSRID(ST_GeomFromWKB(%s), 4326), %s)",
+            page_size=1000,
+        )
+        written[table] = len(rows)
+    return written
+
+
+def report(levels: Dict[str, Dict[int, dict]]) -> Dict[str, List[dict]]:
+    skip = ("items", "geoms", "data")
+    return {name: [dict({"zoom": "full" if z < 0 else z}, **{k: v for k, v in lv.items() if k not in skip}) for z, lv in per_zoom.items()] for name, per_zoom in levels.items()}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Precompute simplified, quantized map geometry per zoom level")
+    p.add_argument("--dsn", type=str, default=None, help="Postgres DSN string")
+    p.add_argument("--host", type=str, default=None)
+    p.add_argument("--port", type=int, default=None)
+    p.add_argument("--db", type=str, default=None)
+    p.add_argument("--user", type=str, default=None)
+    p.add_argument("--password", type=str, default=None)
+    p.add_argument("--regions-geojson", type=str, default=None, help="Regions from a file (FeatureCollection or /maps/regions output)")
+    p.add_argument("--settlements-geojson", type=str, default=None, help="Settlements from a file (FeatureCollection or /maps/settlements output)")
+    p.add_argument("--zooms", type=int, nargs="+", default=list(DEFAULT_ZOOMS))
+    p.add_argument("--px-tolerance", type=float, default=1.0, help="Simplification tolerance in screen pixels of each zoom")
+    p.add_argument("--quantize-px", type=float, default=0.25, help="Coordinate grid in screen pixels of each zoom")
+    p.add_argument("--out-dir", type=str, default=None, help="Write <layer>_z<zoom>.json files here")
+    p.add_argument("--write-pg", action="store_true", help="Replace RegionGeometryLevel / SettlementGeometryLevel")
+    p.add_argument("--report", type=str, default=None, help="Write the per-level statistics as JSON")
+    args = p.parse_args(argv)
+
+    from_files = args.regions_geojson or args.settlements_geojson
+    if from_files and args.write_pg:
+        p.error("--write-pg reads from and writes to the database; drop the *-geojson inputs")
+    conn = None
+    if not from_files:
+        from insert_recipes import connect_pg
+
+        conn = connect_pg(args.dsn, args.host, args.port, args.db, args.user, args.password)
+    try:
+        t0 = time.perf_counter()
+        if conn is not None:
+            with conn.cursor() as cur:
+                layers = load_layers_pg(cur)
+        else:
+            layers = {}
+            if args.regions_geojson:
+                layers["regions"] = load_layer_geojson(args.regions_geojson)
+            if args.settlements_geojson:
+                layers["settlements"] = load_layer_geojson(args.settlements_geojson)
+        print(", ".join(f"{len(l.ids)} {n}" for n, l in layers.items()) + f" betöltve ({time.perf_counter() - t0:.2f} s)")
+
+        levels = build_levels(layers, sorted(set(args.zooms)), args.px_tolerance, args.quantize_px)
+        for name, rows in report(levels).items():
+            print(f"{name}:")
+            for r in rows:
+                extra = "" if r["zoom"] == "full" else f"  tolerancia {r['tolerance']:.6f}°  {r['seconds'] * 1000:7.1f} ms"
+                check = "" if r.get("coverage_valid") in (None, True) else "  LEFEDETTSÉG HIBÁS"
+                print(
+                    f"  z{r['zoom']!s:<4} {r['vertices']:>8} csúcs  {r['bytes'] / 1024:9.1f} KB  gzip {r['gzip_bytes'] / 1024:8.1f} KB{extra}"
+                    + ("" if r.get("valid", True) else "  ÉRVÉNYTELEN") + check
+                )
+        if args.out_dir:
+            files = write_files(levels, args.out_dir)
+            print(f"{len(files)} fájl írva: {args.out_dir}")
+        if args.write_pg and conn is not None:
+            with conn.cursor() as cur:
+                written = write_pg(cur, levels, layers)
+            conn.commit()
+            for table, n in written.items():
+                print(f"  {table}: {n} sor")
+        if args.report:
+            with open(args.report, "w", encoding="utf-8") as f:
+                json.dump(report(levels), f, ensure_ascii=False, indent=2)
+    finally:
+        if conn is not None:
+            conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
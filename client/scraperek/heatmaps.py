@@ -0,0 +1,340 @@
+"""
+Előre kiszámolt receptsűrűség-hőtérképek szűrőszeletenként.
+
+A kliens hőtérkép-kapcsolója eddig az aktuális szűrő receptlistájából
+számolt sűrűséget. Ez a job offline, minden év × kategória szeletre (és az
+"all" összesítőkre) elkészíti a Gauss-kernelsűrűséget Magyarország
+befoglaló téglalapján:
+
+    1. a települések pontjai a receptszámokkal súlyozva rácscellákba
+       kerülnek (egy np.add.at az összes szeletre egyszerre)
+    2. szeparálható Gauss-szűrés: soronként, majd oszloponként eltolt
+       szeletek súlyozott összege, vektorizáltan a teljes
+       (szelet × sor × oszlop) tömbön
+    3. szeletenként a maximumra normált, gamma-kódolt uint8 rács
+
+Kimenet: egyetlen tömörített heatmaps.npz (minden szelet egy uint8
+tömbben) és/vagy szeletenként egy szürkeárnyalatos PNG, valamint egy
+index.json a szeletkulcsokkal (y{év|all}_c{kategória|all}), a
+maximumokkal és a Leaflet imageOverlay-hez szükséges határokkal.
+
+Használat (példa):
+    python heatmaps.py --snapshot snapshot.sqlite --out-dir out/heatmaps
+    python heatmaps.py --dsn postgresql://... --out-dir out/heatmaps --png
+    python heatmaps.py --jsonl receptek.jsonl --settlements-sql settlement_inserts.sql --out-dir out/heatmaps
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import struct
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Magyarország befoglaló téglalapja (nyugat, dél, kelet, észak), kis ráhagyással
+HU_BOUNDS = (16.05, 45.70, 22.95, 48.62)
+
+KM_PER_DEG_LAT = 111.32
+
+# Hiányzó év / kategória kódolása, és az összesítő szelet jelölése
+NA = -1
+ALL = "all"
+
+
+@dataclass
+class Points:
+    lon: np.ndarray
+    lat: np.ndarray
+    year: np.ndarray        # NA, ha ismeretlen
+    category: np.ndarray    # NA, ha ismeretlen
+    weight: np.ndarray      # receptszám
+    skipped: int = 0        # koordináta nélküli település receptjei
+
+
+@dataclass
+class Grid:
+    west: float
+    south: float
+    dlon: float
+    dlat: float
+    width: int
+    height: int
+
+    @classmethod
+    def for_bounds(cls, bounds: Sequence[float], cell_km: float) -> "Grid":
+        west, south, east, north = bounds
+        dlat = cell_km / KM_PER_DEG_LAT
+        # Közel négyzetes cellák: a hosszúsági lépés a középső szélességen korrigálva
+        dlon = cell_km / (KM_PER_DEG_LAT * math.cos(math.radians((south + north) / 2)))
+        return cls(west, south, dlon, dlat, math.ceil((east - west) / dlon), math.ceil((north - south) / dlat))
+
+    @property
+    def bounds(self) -> List[List[float]]:
+        """Leaflet LatLngBounds: [[south, west], [north, east]]."""
+        return [[self.south, self.west], [self.south + self.height * self.dlat, self.west + self.width * self.dlon]]
+
+    def cell(self, lon: np.ndarray, lat: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Row (0 = north, like an image), column and an inside-the-grid mask."""
+        col = np.floor((lon - self.west) / self.dlon).astype(np.int64)
+        row = self.height - 1 - np.floor((lat - self.south) / self.dlat).astype(np.int64)
+        inside = (col >= 0) & (col < self.width) & (row >= 0) & (row < self.height)
+        return row, col, inside
+
+
+# -----------------------------
+# Bemenet
+# -----------------------------
+
+def _points(rows: Sequence[tuple], skipped: int = 0) -> Points:
+    a = np.array([(r[0], r[1], NA if r[2] is None else r[2], NA if r[3] is None else r[3], r[4]) for r in rows], dtype=np.float64).reshape(-1, 5)
+    return Points(a[:, 0], a[:, 1], a[:, 2].astype(np.int64), a[:, 3].astype(np.int64), a[:, 4], skipped)
+
+
+def load_points_snapshot(path: str) -> Points:
+    from snapshot import Snapshot
+
+    with Snapshot(path) as snap:
+        rows = snap.sql(
+            "SELECT s.lon, s.lat, r.year, r.category_id, count(*) AS n FROM recipe r "
+            "JOIN settlement s ON s.id = r.settlement_id WHERE s.lon IS NOT NULL "
+            "GROUP BY r.settlement_id, r.year, r.category_id"
+        )
+        total = snap.count()
+    pts = _points([(r["lon"], r["lat"], r["year"], r["category_id"], r["n"]) for r in rows])
+    pts.skipped = total - int(pts.weight.sum())
+    return pts
+
+
+def load_points_pg(cur) -> Points:
+    cur.execute(
+        'SELECT ST_X(s.geom), ST_Y(s.geom), r.year, r.category_id, count(*) FROM public."Recipe" r '
+        'JOIN public."Settlement" s ON s.id = r.settlement_id WHERE s.geom IS NOT NULL '
+        "GROUP BY r.settlement_id, ST_X(s.geom), ST_Y(s.geom), r.year, r.category_id"
+    )
+    rows = cur.fetchall()
+    cur.execute('SELECT count(*) FROM public."Recipe"')
+    total = cur.fetchone()[0]
+    pts = _points(rows)
+    pts.skipped = total - int(pts.weight.sum())
+    return pts
+
+
+def load_points_jsonl(jsonl_path: str, settlements_sql: str) -> Points:
+    """Offline input: scraped recipes joined by folded settlement name to settlement_inserts.sql."""
+    from geocode_cache import cache_key, parse_settlement_inserts
+    from jsonl_io import iter_jsonl_records
+
+    coords = {cache_key(name): (lon, lat) for name, _, lon, lat in parse_settlement_inserts(settlements_sql) if lon is not None}
+    counts: Counter = Counter()
+    skipped = 0
+    for obj in iter_jsonl_records(jsonl_path):
+        xy = coords.get(cache_key(obj.get("settlement") or ""))
+        if xy is None:
+            skipped += 1
+            continue
+        counts[(xy, obj.get("year"), obj.get("category_id"))] += 1
+    return _points([(xy[0], xy[1], y, c, n) for (xy, y, c), n in counts.items()], skipped)
+
+
+# -----------------------------
+# Szeletek és sűrűség
+# -----------------------------
+
+def slice_keys(pts: Points, per_year: bool = True, per_category: bool = True) -> List[Tuple[object, object]]:
+    """(year, category) slices; ALL marks a marginal. Unknown years/categories only feed the marginals."""
+    years: List[object] = [ALL] + (sorted(int(y) for y in set(pts.year.tolist()) if y != NA) if per_year else [])
+    cats: List[object] = [ALL] + (sorted(int(c) for c in set(pts.category.tolist()) if c != NA) if per_category else [])
+    return [(y, c) for y in years for c in cats]
+
+
+def slice_name(year: object, category: object) -> str:
+    return f"y{year}_c{category}"
+
+
+def bin_counts(pts: Points, grid: Grid, keys: Sequence[Tuple[object, object]]) -> np.ndarray:
+    """Weighted point counts per cell for every slice at once: float32 (slices, height, width)."""
+    row, col, inside = grid.cell(pts.lon, pts.lat)
+    out = np.zeros((len(keys), grid.height, grid.width), dtype=np.float32)
+    for s, (y, c) in enumerate(keys):
+        m = inside.copy()
+        if y != ALL:
+            m &= pts.year == y
+        if c != ALL:
+            m &= pts.category == c
+        np.add.at(out[s], (row[m], col[m]), pts.weight[m])
+    return out
+
+
+def gaussian_kernel(sigma_cells: float) -> np.ndarray:
+    radius = max(1, int(math.ceil(3 * sigma_cells)))
+    x = np.arange(-radius, radius + 1, dtype=np.float64)
+    k = np.exp(-0.5 * (x / sigma_cells) ** 2)
+    return (k / k.sum()).astype(np.float32)
+
+
+def _convolve_axis(a: np.ndarray, kernel: np.ndarray, axis: int) -> np.ndarray:
+    # Nullával kitöltött tömb eltolt szeleteinek súlyozott összege: K vektorművelet az egész tömbön
+    r = len(kernel) // 2
+    pad = [(0, 0)] * a.ndim
+    pad[axis] = (r, r)
+    p = np.pad(a, pad)
+    n = a.shape[axis]
+    out = np.zeros_like(a)
+    for i, w in enumerate(kernel):
+        out += w * np.take(p, np.arange(i, i + n), axis=axis)
+    return out
+
+
+def gaussian_density(counts: np.ndarray, sigma_cells: float, batch: int = 64) -> np.ndarray:
+    """Separable Gaussian smoothing of (slices, height, width), in slice batches to bound memory."""
+    kernel = gaussian_kernel(sigma_cells)
+    out = np.empty_like(counts)
+    for s in range(0, len(counts), batch):
+        part = _convolve_axis(counts[s:s + batch], kernel, axis=2)
+        out[s:s + batch] = _convolve_axis(part, kernel, axis=1)
+    return out
+
+
+def encode_uint8(density: np.ndarray, gamma: float = 0.5) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-slice max-normalized, gamma-encoded bytes; value ~ (byte / 255) ** (1 / gamma) * max."""
+    peak = density.reshape(len(density), -1).max(axis=1)
+    scaled = density / np.where(peak > 0, peak, 1)[:, None, None]
+    return np.round(np.clip(scaled, 0, 1) ** gamma * 255).astype(np.uint8), peak
+
+
+def write_png(path: str, img: np.ndarray) -> None:
+    """8-bit grayscale PNG (no imaging library needed)."""
+    h, w = img.shape
+    raw = b"".join(b"\x00" + img[r].tobytes() for r in range(h))
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 0, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(raw, 9)))
+        f.write(chunk(b"IEND", b""))
+
+
+def build_heatmaps(pts: Points, grid: Grid, bandwidth_km: float, cell_km: float, gamma: float) -> Dict[str, object]:
+    timings: Dict[str, float] = {}
+    t0 = time.perf_counter()
+    keys = slice_keys(pts)
+    counts = bin_counts(pts, grid, keys)
+    totals = counts.reshape(len(keys), -1).sum(axis=1)
+    nonempty = totals > 0
+    keys = [k for k, keep in zip(keys, nonempty.tolist()) if keep]
+    counts, totals = counts[nonempty], totals[nonempty]
+    timings["bin_s"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    density = gaussian_density(counts, bandwidth_km / cell_km)
+    timings["kde_s"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    tiles, peak = encode_uint8(density, gamma)
+    timings["encode_s"] = time.perf_counter() - t0
+    return {"keys": keys, "tiles": tiles, "peak": peak, "recipes": totals, "timings": timings}
+
+
+def write_outputs(result: Dict[str, object], grid: Grid, out_dir: str, meta: Dict[str, object], npz: bool, png: bool) -> Dict[str, object]:
+    os.makedirs(out_dir, exist_ok=True)
+    keys: List[Tuple[object, object]] = result["keys"]  # type: ignore[assignment]
+    tiles: np.ndarray = result["tiles"]  # type: ignore[assignment]
+    names = [slice_name(y, c) for y, c in keys]
+    index = dict(meta)
+    index.update({"bounds": grid.bounds, "shape": [grid.height, grid.width], "slices": {}})
+    for i, (name, (y, c)) in enumerate(zip(names, keys)):
+        entry: Dict[str, object] = {
+            "year": y,
+            "category_id": c,
+            "recipes": int(result["recipes"][i]),  # type: ignore[index]
+            "max_per_cell": round(float(result["peak"][i]), 6),  # type: ignore[index]
+        }
+        if png:
+            entry["png"] = f"{name}.png"
+        index["slices"][name] = entry  # type: ignore[index]
+    t0 = time.perf_counter()
+    if npz:
+        np.savez_compressed(os.path.join(out_dir, "heatmaps.npz"), tiles=tiles, keys=np.array(names))
+    if png:
+        for name, img in zip(names, tiles):
+            write_png(os.path.join(out_dir, f"{name}.png"), img)
+    with open(os.path.join(out_dir, "index.json"), "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=1)
+    size = sum(os.path.getsize(os.path.join(out_dir, fn)) for fn in os.listdir(out_dir))
+    return {"write_s": time.perf_counter() - t0, "bytes": size}
+
+
+def load_heatmap(out_dir: str, name: str) -> Tuple[np.ndarray, dict]:
+    """Decoded density grid (recipes per cell) of one slice from heatmaps.npz."""
+    with open(os.path.join(out_dir, "index.json"), "r", encoding="utf-8") as f:
+        index = json.load(f)
+    entry = index["slices"][name]
+    with np.load(os.path.join(out_dir, "heatmaps.npz")) as z:
+        i = int(np.flatnonzero(z["keys"] == name)[0])
+        tile = z["tiles"][i]
+    density = (tile.astype(np.float32) / 255) ** (1 / index["gamma"]) * entry["max_per_cell"]
+    return density, entry
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Precompute recipe-density heatmaps per year x category slice")
+    src = p.add_mutually_exclusive_group(required=True)
+    src.add_argument("--snapshot", type=str, help="Offline SQLite snapshot (snapshot.py)")
+    src.add_argument("--dsn", type=str, help="Postgres DSN string")
+    src.add_argument("--jsonl", type=str, help="Scraped recipes; needs --settlements-sql for coordinates")
+    p.add_argument("--settlements-sql", type=str, default=os.path.join(os.path.dirname(__file__), "settlement_inserts.sql"))
+    p.add_argument("--cell-km", type=float, default=2.0, help="Grid cell size")
+    p.add_argument("--bandwidth-km", type=float, default=8.0, help="Gaussian kernel sigma")
+    p.add_argument("--gamma", type=float, default=0.5, help="uint8 encoding curve (0.5 keeps low densities visible)")
+    p.add_argument("--bounds", type=float, nargs=4, default=list(HU_BOUNDS), metavar=("WEST", "SOUTH", "EAST", "NORTH"))
+    p.add_argument("--out-dir", type=str, default="heatmaps")
+    p.add_argument("--png", action="store_true", help="Also write one grayscale PNG per slice")
+    p.add_argument("--no-npz", action="store_true", help="Skip the single heatmaps.npz stack")
+    args = p.parse_args(argv)
+
+    t_start = time.perf_counter()
+    if args.snapshot:
+        pts = load_points_snapshot(args.snapshot)
+    elif args.jsonl:
+        pts = load_points_jsonl(args.jsonl, args.settlements_sql)
+    else:
+        from insert_recipes import connect_pg
+
+        conn = connect_pg(args.dsn, None, None, None, None, None)
+        try:
+            with conn.cursor() as cur:
+                pts = load_points_pg(cur)
+        finally:
+            conn.close()
+    load_s = time.perf_counter() - t_start
+    print(f"{int(pts.weight.sum())} recept {len(pts.weight)} (település, év, kategória) pontban, {pts.skipped} koordináta nélkül ({load_s:.2f} s)")
+
+    grid = Grid.for_bounds(args.bounds, args.cell_km)
+    result = build_heatmaps(pts, grid, args.bandwidth_km, args.cell_km, args.gamma)
+    meta = {"cell_km": args.cell_km, "bandwidth_km": args.bandwidth_km, "gamma": args.gamma, "encoding": "uint8 = 255 * (density / max_per_cell) ** gamma"}
+    written = write_outputs(result, grid, args.out_dir, meta, npz=not args.no_npz, png=args.png)
+
+    t = result["timings"]  # type: ignore[assignment]
+    n = len(result["keys"])  # type: ignore[arg-type]
+    print(f"{n} szelet, rács {grid.height} x {grid.width} ({args.cell_km} km), kernel sigma {args.bandwidth_km} km")
+    print(
+        f"  binning {t['bin_s']:.2f} s, KDE {t['kde_s']:.2f} s, uint8 {t['encode_s']:.2f} s, írás {written['write_s']:.2f} s, "
+        f"összesen {time.perf_counter() - t_start:.2f} s"
+    )
+    print(f"  {written['bytes'] / 1e6:.2f} MB -> {args.out_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,225 @@
+"""
+Hozzávaló-párosítások előszámítása ("mi illik X-hez").
+
+A scrapelt receptekből recept × hozzávaló ritka (CSR) mátrixot épít, ebből
+egyetlen ritka mátrixszorzással (XᵀX) kapja a közös előfordulásokat, majd
+PMI és Jaccard pontszámot számol, és hozzávalónként csak a top-k partnert
+tartja meg egy kompakt táblában (IngredientPairing) vagy TSV fájlban.
+
+Használat (példa):
+    python ingredient_pairs.py build --jsonl receptek.jsonl --top-k 20 --out out/pairings.tsv
+    python ingredient_pairs.py build --jsonl receptek.jsonl --dsn postgresql://...
+    python ingredient_pairs.py bench --recipes 100000 --vocab 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+from ingredients import parse_ingredients
+from jsonl_io import iter_jsonl_records
+
+
+def recipes_from_jsonl(path: str) -> List[List[str]]:
+    """Normalized ingredient names (accent-folded) of every recipe in a scraped JSONL file."""
+    out: List[List[str]] = []
+    for obj in iter_jsonl_records(path):
+        out.append([p.name_norm for p in parse_ingredients(obj.get("ingredients", []))])
+    return out
+
+
+def build_matrix(recipes: Sequence[Sequence[str]]) -> Tuple[sp.csr_matrix, List[str]]:
+    """Binary recipes x ingredients CSR matrix and the column vocabulary."""
+    vocab: Dict[str, int] = {}
+    indptr = [0]
+    indices: List[int] = []
+    for names in recipes:
+        cols = {vocab.setdefault(n, len(vocab)) for n in names}
+        indices.extend(sorted(cols))
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.float32)
+    X = sp.csr_matrix((data, np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)), shape=(len(recipes), len(vocab)))
+    names = [""] * len(vocab)
+    for n, i in vocab.items():
+        names[i] = n
+    return X, names
+
+
+def cooccurrence(X: sp.csr_matrix) -> sp.csr_matrix:
+    """Ingredient x ingredient co-occurrence counts (diagonal removed)."""
+    C = (X.T @ X).tocsr()
+    C.setdiag(0)
+    C.eliminate_zeros()
+    return C
+
+
+def top_k_pairs(
+    X: sp.csr_matrix,
+    C: sp.csr_matrix,
+    k: int = 20,
+    min_count: int = 2,
+    score: str = "pmi",
+) -> List[Tuple[int, int, int, float, float]]:
+    """(ingredient, partner, co_count, pmi, jaccard) for the top-k partners of every ingredient."""
+    n = X.shape[0]
+    df = np.asarray(X.sum(axis=0)).ravel()
+    C = C.tocoo()
+    keep = C.data >= min_count
+    rows, cols, co = C.row[keep], C.col[keep], C.data[keep].astype(np.float64)
+    pmi = np.log(co * n / (df[rows] * df[cols]))
+    jaccard = co / (df[rows] + df[cols] - co)
+    key = pmi if score == "pmi" else jaccard if score == "jaccard" else co
+
+    # Soronkénti top-k rendezéssel: (sor növekvő, pontszám csökkenő), majd soron belüli rang
+    order = np.lexsort((-key, rows))
+    rows, cols, co, pmi, jaccard = rows[order], cols[order], co[order], pmi[order], jaccard[order]
+    starts = np.searchsorted(rows, rows, side="left")
+    rank = np.arange(len(rows)) - starts
+    sel = rank < k
+    return list(zip(
+        rows[sel].tolist(),
+        cols[sel].tolist(),
+        co[sel].astype(np.int64).tolist(),
+        np.round(pmi[sel], 4).tolist(),
+        np.round(jaccard[sel], 4).tolist(),
+    ))
+
+
+def compute_pairings(recipes: Sequence[Sequence[str]], k: int, min_count: int, score: str) -> Tuple[List[str], list, Dict[str, float]]:
+    t0 = time.perf_counter()
+    X, names = build_matrix(recipes)
+    t1 = time.perf_counter()
+    C = cooccurrence(X)
+    t2 = time.perf_counter()
+    pairs = top_k_pairs(X, C, k=k, min_count=min_count, score=score)
+    t3 = time.perf_counter()
+    timings = {
+        "matrix_s": round(t1 - t0, 3),
+        "cooccurrence_s": round(t2 - t1, 3),
+        "top_k_s": round(t3 - t2, 3),
+        "nnz_X": int(X.nnz),
+        "nnz_C": int(C.nnz),
+    }
+    return names, pairs, timings
+
+
+def write_tsv(path: str, names: List[str], pairs: list) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        w = csv.writer(f, delimiter="\t")
+        w.writerow(["ingredient", "partner", "co_count", "pmi", "jaccard"])
+        for i, j, co, pmi, jac in pairs:
+            w.writerow([names[i], names[j], co, pmi, jac])
+
+
+def write_db(conn, names: List[str], pairs: list) -> int:
+    """Replace IngredientPairing, keyed by Ingredient.id (matched on name_norm)."""
+    import psycopg2.extras
+
+    with conn.cursor() as cur:
+        cur.execute('SELECT name_norm, id FROM public."Ingredient"')
+        ids = {n: int(i) for n, i in cur.fetchall()}
+        rows = []
+        for i, j, co, pmi, jac in pairs:
+            a, b = ids.get(names[i]), ids.get(names[j])
+            if a is not None and b is not None:
+                rows.append((a, b, co, pmi, jac))
+        cur.execute('TRUNCATE public."IngredientPairing"')
+        psycopg2.extras.execute_values(
+            cur,
+            'INSERT INTO public."IngredientPairing" (ingredient_id, partner_id, co_count, pmi, jaccard) VALUES %s',
+            rows,
+            page_size=5000,
+        )
+    conn.commit()
+    return len(rows)
+
+
+def synthetic_recipes(n_recipes: int, vocab: int, mean_len: int, seed: int = 42) -> List[List[str]]:
+    """Zipf-like ingredient popularity, like real recipes (salt and flour everywhere, rarities rare)."""
+    rng = np.random.default_rng(seed)
+    weights = 1.0 / np.arange(1, vocab + 1) ** 1.1
+    weights /= weights.sum()
+    lengths = np.clip(rng.poisson(mean_len, size=n_recipes), 1, None)
+    draws = rng.choice(vocab, size=int(lengths.sum()), p=weights)
+    names = [f"ing{i}" for i in range(vocab)]
+    out: List[List[str]] = []
+    pos = 0
+    for ln in lengths.tolist():
+        out.append([names[i] for i in draws[pos:pos + ln]])
+        pos += ln
+    return out
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Ingredient co-occurrence / PMI / Jaccard top-k pairings")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    pb = sub.add_parser("build", help="Compute pairings from a scraped JSONL file")
+    pb.add_argument("--jsonl", type=str, required=True)
+    pb.add_argument("--out", type=str, default=None, help="Write a TSV (ingredient, partner, co_count, pmi, jaccard)")
+    pb.add_argument("--dsn", type=str, default=None, help="Postgres DSN string (writes IngredientPairing)")
+    pb.add_argument("--host", type=str, default=None)
+    pb.add_argument("--port", type=int, default=None)
+    pb.add_argument("--db", type=str, default=None)
+    pb.add_argument("--user", type=str, default=None)
+    pb.add_argument("--password", type=str, default=None)
+
+    pbe = sub.add_parser("bench", help="Time the job on synthetic recipes")
+    pbe.add_argument("--recipes", type=int, default=100_000)
+    pbe.add_argument("--vocab", type=int, default=5000)
+    pbe.add_argument("--mean-len", type=int, default=12)
+
+    for sp_ in (pb, pbe):
+        sp_.add_argument("--top-k", type=int, default=20)
+        sp_.add_argument("--min-count", type=int, default=2, help="Ignore pairs seen together fewer times")
+        sp_.add_argument("--score", choices=["pmi", "jaccard", "count"], default="pmi", help="Ranking for top-k")
+    args = p.parse_args(argv)
+
+    if args.cmd == "bench":
+        t0 = time.perf_counter()
+        recipes = synthetic_recipes(args.recipes, args.vocab, args.mean_len)
+        gen_s = time.perf_counter() - t0
+        names, pairs, timings = compute_pairings(recipes, args.top_k, args.min_count, args.score)
+        total = timings["matrix_s"] + timings["cooccurrence_s"] + timings["top_k_s"]
+        print(f"Szintetikus adat: {args.recipes} recept, {args.vocab} hozzávaló ({gen_s:.2f} s generálás)")
+        print(f"  CSR mátrix:       {timings['matrix_s']:.3f} s  (nnz={timings['nnz_X']})")
+        print(f"  XᵀX:              {timings['cooccurrence_s']:.3f} s  (nnz={timings['nnz_C']})")
+        print(f"  PMI/Jaccard top-k: {timings['top_k_s']:.3f} s  ({len(pairs)} pár)")
+        print(f"  Összesen:         {total:.3f} s")
+        return 0
+
+    recipes = recipes_from_jsonl(args.jsonl)
+    names, pairs, timings = compute_pairings(recipes, args.top_k, args.min_count, args.score)
+    print(f"{len(recipes)} recept, {len(names)} hozzávaló, {len(pairs)} pár (top-{args.top_k}), {timings}")
+    if args.out:
+        write_tsv(args.out, names, pairs)
+        print(f"TSV mentve: {args.out}")
+    if args.dsn or args.host or args.db:
+        from insert_recipes import connect_pg
+
+        conn = connect_pg(args.dsn, args.host, args.port, args.db, args.user, args.password)
+        try:
+            n = write_db(conn, names, pairs)
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        print(f"IngredientPairing: {n} sor")
+    if not args.out and not (args.dsn or args.host or args.db):
+        index = {n: i for i, n in enumerate(names)}
+        for probe in ("voroshagyma", "turo", "mak"):
+            if probe in index:
+                partners = [names[j] for i, j, *_ in pairs if i == index[probe]][:8]
+                print(f"  {probe}: {', '.join(partners)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
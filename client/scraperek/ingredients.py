@@ -0,0 +1,397 @@
+"""
+Hozzávaló-normalizálás: a receptek hozzávaló sorait mennyiségre, mértékegységre
+és normalizált hozzávalónévre bontja, és a RecipeIngredient / Ingredient
+táblákba tölti, hogy a szerver hozzávaló-szűrése indexelt join legyen az
+`ingredients_text ILIKE '%...%'` szekvenciális keresés helyett.
+
+Példák:
+    "5 dkg élesztő"          -> (5.0, "dkg", "élesztő")
+    "1 nagy fej vöröshagyma" -> (1.0, "fej", "vöröshagyma")
+    "fél teáskanál só"       -> (0.5, "teáskanál", "só")
+    "2 ½ dl tej"             -> (2.5, "dl", "tej")
+    "csipetnyi só"           -> (None, "csipet", "só")
+    "só és bors"             -> két hozzávaló: "só", "bors"
+
+A szerver szűrése csak a RecipeIngredient táblát nézi, ezért a parser előtt
+betöltött receptek sorait pótolni kell (insert_recipes --init-schema megteszi).
+
+Használat (példa):
+    python ingredients.py --jsonl receptek.jsonl --stats          # csak elemzés
+    python ingredients.py --jsonl receptek.jsonl --dsn postgresql://...   # meglévő receptek feltöltése
+    python ingredients.py --dsn postgresql://...   # hozzávaló sor nélküli receptek pótlása az ingredients_text-ből
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import unicodedata
+from collections import Counter
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from jsonl_io import iter_jsonl_records
+from textnorm import normalize_text
+
+
+# Ékezet nélküli, kisbetűs alak -> kanonikus mértékegység
+UNIT_ALIASES: Dict[str, str] = {
+    normalize_text(alias): unit
+    for unit, aliases in {
+        "kg": ["kg", "kiló", "kilogramm"],
+        "dkg": ["dkg", "deka", "dekagramm"],
+        "g": ["g", "gr", "gramm"],
+        "l": ["l", "liter"],
+        "dl": ["dl", "deciliter", "deci"],
+        "cl": ["cl", "centiliter"],
+        "ml": ["ml", "milliliter"],
+        "evőkanál": ["evőkanál", "ek", "evokanal"],
+        "teáskanál": ["teáskanál", "tk", "kiskanál"],
+        "kávéskanál": ["kávéskanál", "kk"],
+        "mokkáskanál": ["mokkáskanál"],
+        "fakanál": ["fakanál"],
+        "merőkanál": ["merőkanál"],
+        "gerezd": ["gerezd"],
+        "fej": ["fej"],
+        "csipet": ["csipet"],
+        "csokor": ["csokor"],
+        "db": ["db", "darab"],
+        "szál": ["szál"],
+        "ág": ["ág"],
+        "marék": ["marék"],
+        "bögre": ["bögre"],
+        "csésze": ["csésze"],
+        "pohár": ["pohár"],
+        "rúd": ["rúd"],
+        "szelet": ["szelet"],
+        "cikk": ["cikk"],
+        "doboz": ["doboz"],
+        "csomag": ["csomag"],
+        "tasak": ["tasak"],
+        "zacskó": ["zacskó"],
+        "üveg": ["üveg"],
+        "tábla": ["tábla"],
+        "kocka": ["kocka"],
+        "karika": ["karika"],
+        "tojásnyi": ["tojásnyi"],
+    }.items()
+    for alias in aliases
+}
+
+NUMBER_WORDS: Dict[str, float] = {
+    "fel": 0.5,
+    "negyed": 0.25,
+    "haromnegyed": 0.75,
+    "masfel": 1.5,
+    "egy": 1.0,
+    "ket": 2.0,
+    "ketto": 2.0,
+    "harom": 3.0,
+    "negy": 4.0,
+    "ot": 5.0,
+    "hat": 6.0,
+    "het": 7.0,
+    "nyolc": 8.0,
+    "kilenc": 9.0,
+    "tiz": 10.0,
+}
+
+# Méret/mennyiség jelzők, amelyek nem részei a hozzávaló nevének
+MODIFIERS = {
+    normalize_text(w)
+    for w in [
+        "nagy", "nagyobb", "kis", "kisebb", "kicsi", "közepes", "középnagy", "méretű", "púpos", "csapott",
+        "bő", "teli", "kb", "kb.", "kevés", "néhány", "pár",
+    ]
+}
+
+_NUM = r"\d+(?:[.,]\d+)?"
+# Egykarakteres törtek: ¼ ½ ¾ és a U+2150–U+215E tartomány (⅓, ⅛, ...); értéküket a unicodedata adja
+_VULGAR = "".join(chr(c) for c in (0xBC, 0xBD, 0xBE, *range(0x2150, 0x215F)))
+# Tört: "1/2", "1⁄2" (U+2044) vagy "½"; elöl egész rész is lehet: "1 1/2", "2 ½", "2½"
+_FRAC = rf"(?P<num>{_NUM})\s*[/\u2044]\s*(?P<den>\d+)|(?P<vulgar>[{_VULGAR}])"
+_QTY_RE = re.compile(
+    rf"^(?:(?:(?P<whole>\d+)(?:\s+|(?=[{_VULGAR}])))?(?:{_FRAC})|(?P<a>{_NUM}))"
+    rf"(?:\s*[-–]\s*(?P<b>{_NUM}))?\s*"
+)
+_PHRASES = r"ízlés szerint|tetszés szerint|(?:a\s+)?(?:sütéshez|tálaláshoz|díszítéshez)"
+# Elöl csak a címke megy le ("A tálaláshoz tejföl" -> "tejföl"), a végén a megjegyzés ("zsír a sütéshez" -> "zsír")
+_LEADING_PHRASES = re.compile(rf"(?i)^(?:\s*(?:{_PHRASES})\b[\s:,]*)+")
+_TRAILING_PHRASES = re.compile(rf"(?i)\s+(?:{_PHRASES})\b.*$")
+# Felsorolás egy sorban: "só, bors", "só és bors"; a "2,5" tizedesvessző és a "kapor- és petrezselyem"
+# típusú kötőjeles összetétel nem választ el
+_LIST_SEP = re.compile(r"((?<!\d),(?!\d)\s*|(?<![-\s])\s+és\s+)")
+# Önálló célhatározó címke ("A tepsihez", "a kenéshez"): nem hozzávaló, a szomszédjához tartozik
+_LABEL = re.compile(r"(?i)^(?:a\s+)?\S+(?:hoz|hez|höz)[.:]?$")
+
+
+@dataclass
+class ParsedIngredient:
+    raw: str
+    qty: Optional[float]
+    unit: Optional[str]
+    name: str
+
+    @property
+    def name_norm(self) -> str:
+        return normalize_text(self.name)
+
+
+def _to_float(s: str) -> float:
+    return float(s.replace(",", "."))
+
+
+def _qty_of(m: re.Match) -> Optional[float]:
+    if m.group("a"):
+        return _to_float(m.group("a"))
+    whole = float(m.group("whole") or 0)
+    if m.group("vulgar"):
+        return whole + unicodedata.numeric(m.group("vulgar"))
+    den = int(m.group("den"))
+    return whole + _to_float(m.group("num")) / den if den else None
+
+
+def _unit_of(token: str) -> Optional[str]:
+    key = normalize_text(token).rstrip(".")
+    if key in UNIT_ALIASES:
+        return UNIT_ALIASES[key]
+    # "evőkanálnyi", "csipetnyi", "maréknyi"
+    if key.endswith("nyi") and key[:-3] in UNIT_ALIASES:
+        return UNIT_ALIASES[key[:-3]]
+    return None
+
+
+def parse_ingredient(raw: str) -> Optional[ParsedIngredient]:
+    """Split one ingredient line into quantity, unit and name. None if there is no name left."""
+    text = re.sub(r"\([^()]*\)", " ", raw or "")
+    # Kettévágott zárójeles megjegyzés maradéka, pl. "(1 tepsi"
+    text = re.sub(r"[()]", " ", text)
+    text = _TRAILING_PHRASES.sub("", _LEADING_PHRASES.sub("", text))
+    text = re.sub(r"\s+", " ", text).strip(" .,;:-–")
+    while text and normalize_text(text.split(" ", 1)[0]).rstrip(".") in MODIFIERS:
+        text = text.split(" ", 1)[1] if " " in text else ""
+    if not text:
+        return None
+
+    qty: Optional[float] = None
+    m = _QTY_RE.match(text)
+    if m:
+        qty = _qty_of(m)
+        text = text[m.end():]
+    tokens = text.split(" ")
+
+    if qty is None and tokens and normalize_text(tokens[0]) in NUMBER_WORDS:
+        qty = NUMBER_WORDS[normalize_text(tokens[0])]
+        tokens = tokens[1:]
+
+    unit: Optional[str] = None
+    # Jelzők a mértékegység előtt is lehetnek: "1 nagy fej", "2 púpos evőkanál"
+    i = 0
+    while i < len(tokens) and normalize_text(tokens[i]).rstrip(".") in MODIFIERS:
+        i += 1
+    if i < len(tokens):
+        unit = _unit_of(tokens[i])
+        if unit is not None:
+            tokens = tokens[i + 1:]
+    while tokens and normalize_text(tokens[0]).rstrip(".") in MODIFIERS:
+        tokens = tokens[1:]
+
+    name = " ".join(tokens).strip(" .,;:-–").lower()
+    # Csak számból álló töredék (pl. a "2,5 dl" vesszőnél kettévágott "2" része)
+    if not name or re.fullmatch(r"[\d.,/\s-]*", name):
+        return None
+    return ParsedIngredient(raw=raw, qty=qty, unit=unit, name=name)
+
+
+def split_ingredient_line(raw: str) -> List[str]:
+    """Split a line listing several ingredients on `,` and ` és ` ("só, bors" -> ["só", "bors"]).
+
+    Parts without an ingredient name of their own (a bare number such as "két" in
+    "két és fél dl tej", or a label such as "A tepsihez") stay joined to their neighbour.
+    """
+    text = re.sub(r"\([^()]*\)", " ", raw or "")
+    pieces = _LIST_SEP.split(text)
+    if len(pieces) == 1:
+        return [raw]
+    out: List[str] = []
+    carry = last_sep = ""
+    for part, sep in zip(pieces[::2], pieces[1::2] + [""]):
+        carry += part
+        if _LABEL.match(carry.strip()) or parse_ingredient(carry) is None:
+            carry += sep
+            continue
+        out.append(carry.strip())
+        carry, last_sep = "", sep
+    if carry.strip():
+        if out:
+            out[-1] = (out[-1] + last_sep + carry).strip()
+        else:
+            out.append(carry.strip())
+    return out
+
+
+def parse_ingredients(items: Iterable[str]) -> List[ParsedIngredient]:
+    out: List[ParsedIngredient] = []
+    for item in items:
+        for part in split_ingredient_line(item):
+            parsed = parse_ingredient(part)
+            if parsed is not None:
+                out.append(parsed)
+    return out
+
+
+def split_ingredients_text(ingredients_text: str) -> List[str]:
+    """Inverse of the loader's `" | ".join(...)`."""
+    return [p for p in (ingredients_text or "").split(" | ") if p.strip()]
+
+
+# -----------------------------
+# Adatbázis
+# -----------------------------
+
+
+def _statement(stats, stage: str):
+    """One DB round trip timed in `stats` (a LoadStats), or untimed without one."""
+    return stats.statement(stage) if stats is not None else nullcontext()
+
+
+def ensure_ingredient_ids(cur, parsed: Sequence[ParsedIngredient], stats=None) -> Dict[str, int]:
+    """Insert missing dictionary entries and return name_norm -> Ingredient.id."""
+    import psycopg2.extras
+
+    names: Dict[str, str] = {}
+    for p in parsed:
+        names.setdefault(p.name_norm, p.name)
+    if not names:
+        return {}
+    # Rendezett sorrend: párhuzamos betöltők ugyanabban a sorrendben zárolják a kulcsokat (nincs deadlock)
+    with _statement(stats, "write"):
+        psycopg2.extras.execute_values(
+            cur,
+            'INSERT INTO public."Ingredient" (name, name_norm) VALUES %s ON CONFLICT (name_norm) DO NOTHING',
+            [(names[norm], norm) for norm in sorted(names)],
+            page_size=len(names),
+        )
+    with _statement(stats, "resolve"):
+        cur.execute('SELECT name_norm, id FROM public."Ingredient" WHERE name_norm = ANY(%s)', (list(names),))
+    return {norm: int(iid) for norm, iid in cur.fetchall()}
+
+
+def write_recipe_ingredients(cur, recipes: Sequence[Tuple[int, str]], stats=None) -> int:
+    """Replace RecipeIngredient rows for (recipe_id, ingredients_text) pairs. Returns rows written.
+
+    With a LoadStats in `stats`, every statement is a separate latency sample.
+    """
+    import psycopg2.extras
+
+    if not recipes:
+        return 0
+    per_recipe = [(rid, parse_ingredients(split_ingredients_text(text))) for rid, text in recipes]
+    ids = ensure_ingredient_ids(cur, [p for _, ps in per_recipe for p in ps], stats)
+    with _statement(stats, "write"):
+        cur.execute('DELETE FROM public."RecipeIngredient" WHERE recipe_id = ANY(%s)', ([rid for rid, _ in per_recipe],))
+    rows = [
+        (rid, pos, ids[p.name_norm], p.qty, p.unit, p.raw)
+        for rid, ps in per_recipe
+        for pos, p in enumerate(ps)
+    ]
+    if rows:
+        with _statement(stats, "write"):
+            psycopg2.extras.execute_values(
+                cur,
+                'INSERT INTO public."RecipeIngredient" (recipe_id, position, ingredient_id, qty, unit, raw) VALUES %s',
+                rows,
+                page_size=1000,
+            )
+    return len(rows)
+
+
+def backfill_recipe_ingredients(conn, batch_size: int = 500) -> int:
+    """One-off RecipeIngredient fill for recipes loaded before the parser existed. Returns recipes processed.
+
+    Recipes whose lines all fail to parse stay without rows; the id cursor keeps them
+    from being picked up again within one run.
+    """
+    done = 0
+    last_id = 0
+    while True:
+        with conn.cursor() as cur:
+            cur.execute(
+                'SELECT r.id, r.ingredients_text FROM public."Recipe" r '
+                'WHERE r.id > %s AND NOT EXISTS (SELECT 1 FROM public."RecipeIngredient" ri WHERE ri.recipe_id = r.id) '
+                "ORDER BY r.id LIMIT %s",
+                (last_id, batch_size),
+            )
+            recipes = [(int(rid), text or "") for rid, text in cur.fetchall()]
+            if not recipes:
+                return done
+            write_recipe_ingredients(cur, recipes)
+        conn.commit()
+        done += len(recipes)
+        last_id = recipes[-1][0]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Parse recipe ingredients into quantity/unit/name and load RecipeIngredient")
+    p.add_argument("--jsonl", type=str, default=None, help="Path to receptek.jsonl (default: backfill recipes without rows from the database)")
+    p.add_argument("--stats", action="store_true", help="Only print parse statistics, do not touch the database")
+    p.add_argument("--dsn", type=str, default=None, help="Postgres DSN string")
+    p.add_argument("--host", type=str, default=None)
+    p.add_argument("--port", type=int, default=None)
+    p.add_argument("--db", type=str, default=None)
+    p.add_argument("--user", type=str, default=None)
+    p.add_argument("--password", type=str, default=None)
+    args = p.parse_args(argv)
+    if args.stats and not args.jsonl:
+        p.error("--stats requires --jsonl")
+
+    by_url: Dict[str, str] = {}
+    for obj in iter_jsonl_records(args.jsonl) if args.jsonl else ():
+        url = re.sub(r"\s+", " ", (obj.get("url") or "").strip())
+        # Ugyanaz a formátum, mint az insert_recipes ingredients_text oszlopa
+        by_url[url] = re.sub(r"\s+", " ", " | ".join(obj.get("ingredients", [])).strip())
+
+    if args.stats:
+        units: Counter = Counter()
+        names: Counter = Counter()
+        total = parsed_n = with_qty = 0
+        for text in by_url.values():
+            items = split_ingredients_text(text)
+            total += len(items)
+            for ing in parse_ingredients(items):
+                parsed_n += 1
+                with_qty += ing.qty is not None
+                units[ing.unit or "-"] += 1
+                names[ing.name_norm] += 1
+        print(f"Receptek: {len(by_url)}, hozzávaló sorok: {total}, értelmezve: {parsed_n}, mennyiséggel: {with_qty}")
+        print(f"Különböző hozzávalók: {len(names)}")
+        print("Mértékegységek: " + ", ".join(f"{u} ({c})" for u, c in units.most_common(15)))
+        print("Leggyakoribb: " + ", ".join(f"{n} ({c})" for n, c in names.most_common(15)))
+        return 0
+
+    from insert_recipes import connect_pg
+
+    conn = connect_pg(args.dsn, args.host, args.port, args.db, args.user, args.password)
+    conn.autocommit = False
+    try:
+        if not args.jsonl:
+            n = backfill_recipe_ingredients(conn)
+            print(f"{n} hozzávaló sor nélküli recept feldolgozva.")
+            return 0
+        with conn.cursor() as cur:
+            cur.execute('SELECT id, url FROM public."Recipe" WHERE url = ANY(%s)', (list(by_url),))
+            recipes = [(int(rid), by_url[url]) for rid, url in cur.fetchall()]
+            n = write_recipe_ingredients(cur, recipes)
+        conn.commit()
+        print(f"{len(recipes)} recept, {n} RecipeIngredient sor betöltve.")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,19 +1,42 @@
 import argparse
 import csv
 import json
+import multiprocessing
 import os
-from typing import Iterable, List, Optional, Tuple
+import sys
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import psycopg2
 import psycopg2.extras
 
+from ann_index import (
+    build_ann_indexes,
+    drop_ann_indexes,
+    existing_ann_indexes,
+    outgrown_ann_indexes,
+    rebuild_plan,
+    untrained_ann_indexes,
+)
+from changeset import ChangeSet
+from ingredients import backfill_recipe_ingredients, write_recipe_ingredients
+from jsonl_io import count_lines, iter_jsonl_lines, jsonl_shards
+from load_stats import LoadStats
+from settlement_resolver import Match, SettlementResolver
+from textnorm import normalize_text
+
+
+RecipeRow = Tuple[str, str, Optional[int], Optional[str], str, Optional[int]]
+
+DEFAULT_ST_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_ONNX_DIR = os.path.join(os.path.dirname(__file__), "models", "all-MiniLM-L6-v2-onnx")
+
 
 def normalize_spaces(s: str) -> str:
     import re
     return re.sub(r"\s+", " ", (s or "").strip())
 
 
-def read_csv(path: str) -> Iterable[Tuple[str, str, Optional[int], Optional[str], str, Optional[int]]]:
+def read_csv(path: str) -> Iterable[RecipeRow]:
     with open(path, "r", encoding="utf-8") as f:
         r = csv.DictReader(f)
         for row in r:
@@ -28,21 +51,65 @@ def read_csv(path: str) -> Iterable[Tuple[str, str, Optional[int], Optional[str]
             yield url, title, year, settlement or None, ingredients, category_id
 
 
-def read_jsonl(path: str) -> Iterable[Tuple[str, str, Optional[int], Optional[str], str, Optional[int]]]:
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            if not line.strip():
-                continue
-            obj = json.loads(line)
-            url = normalize_spaces(obj.get("url", ""))
-            title = normalize_spaces(obj.get("title", ""))
-            year = obj.get("year")
-            year = int(year) if year is not None else None
-            settlement = normalize_spaces(obj.get("settlement", "") or "") or None
-            ingredients = normalize_spaces(" | ".join(obj.get("ingredients", [])))
-            category_id = obj.get("category_id")
-            category_id = int(category_id) if category_id is not None else None
-            yield url, title, year, settlement, ingredients, category_id
+def parse_jsonl_line(line: str) -> Optional[RecipeRow]:
+    if not line.strip():
+        return None
+    return row_from_record(json.loads(line))
+
+
+def row_from_record(obj: dict) -> RecipeRow:
+    """One scraped recipe (JSONL object or `asdict(Recipe)`) as a loader row."""
+    url = normalize_spaces(obj.get("url", ""))
+    title = normalize_spaces(obj.get("title", ""))
+    year = obj.get("year")
+    year = int(year) if year is not None else None
+    settlement = normalize_spaces(obj.get("settlement", "") or "") or None
+    ingredients = normalize_spaces(" | ".join(obj.get("ingredients", [])))
+    category_id = obj.get("category_id")
+    category_id = int(category_id) if category_id is not None else None
+    return url, title, year, settlement, ingredients, category_id
+
+
+def read_jsonl(path: str, start: int = 0, end: Optional[int] = None) -> Iterable[RecipeRow]:
+    """Read recipes from a JSONL file (plain, .gz or framed .zst), optionally only the byte range [start, end).
+
+    `start` must point at the beginning of a line, or of a zstd frame (see `jsonl_shards`).
+    """
+    for raw in iter_jsonl_lines(path, start, end):
+        row = parse_jsonl_line(raw.decode("utf-8"))
+        if row is not None:
+            yield row
+
+
+def read_source(args: argparse.Namespace, start: int = 0, end: Optional[int] = None) -> Iterable[RecipeRow]:
+    """Rows of the --csv / --jsonl / --parquet input; start/end are byte offsets or Parquet row groups."""
+    if args.parquet:
+        from recipe_parquet import read_parquet
+
+        return read_parquet(args.parquet, start, end)
+    if args.csv:
+        return read_csv(args.csv)
+    return read_jsonl(args.jsonl, start, end)
+
+
+def count_source_rows(args: argparse.Namespace, start: int = 0, end: Optional[int] = None) -> int:
+    if args.parquet:
+        from recipe_parquet import count_rows
+
+        return count_rows(args.parquet, start, end)
+    if args.csv:
+        # Idézett mezőben sortörés lehet: rekordokat számolunk, nem sorokat (a fejléc nem sor)
+        with open(args.csv, "r", encoding="utf-8", newline="") as f:
+            return max(sum(1 for _ in csv.reader(f)) - 1, 0)
+    return count_lines(args.jsonl, start, end)
+
+
+def source_shards(args: argparse.Namespace, n: int) -> List[Tuple[int, int]]:
+    if args.parquet:
+        from recipe_parquet import parquet_shards
+
+        return parquet_shards(args.parquet, n)
+    return jsonl_shards(args.jsonl, n)
 
 
 def connect_pg(dsn: Optional[str], host: Optional[str], port: Optional[int], db: Optional[str], user: Optional[str], password: Optional[str]):
@@ -62,106 +129,538 @@ def ensure_schema(cur, schema_sql_path: str):
         cur.execute(f.read())
 
 
-def lookup_settlement_id(cur, name: Optional[str]) -> Optional[int]:
+def lookup_settlement(
+    cur,
+    name: Optional[str],
+    resolver: Optional[SettlementResolver] = None,
+    min_confidence: float = 0.85,
+) -> Tuple[Optional[int], Optional[Match]]:
+    """Settlement id for a name: exact, then ILIKE, then the typo-tolerant resolver (with its match)."""
     if not name:
-        return None
+        return None, None
     cur.execute('SELECT id FROM public."Settlement" WHERE name = %s LIMIT 1', (name,))
     row = cur.fetchone()
     if row:
-        return int(row[0])
+        return int(row[0]), None
     # Fallback: ILIKE exact
     cur.execute('SELECT id FROM public."Settlement" WHERE name ILIKE %s LIMIT 1', (name,))
     row = cur.fetchone()
-    return int(row[0]) if row else None
+    if row or resolver is None:
+        return (int(row[0]) if row else None), None
+    # Fallback: fuzzy (accent-folded, edit distance)
+    match = resolver.resolve(name, min_confidence)
+    if match is None:
+        return None, None
+    cur.execute('SELECT id FROM public."Settlement" WHERE name = %s ORDER BY id LIMIT 1', (match.name,))
+    row = cur.fetchone()
+    return (int(row[0]), match) if row else (None, None)
 
 
-def load_st_model(model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+def lookup_settlement_id(
+    cur,
+    name: Optional[str],
+    resolver: Optional[SettlementResolver] = None,
+    min_confidence: float = 0.85,
+) -> Optional[int]:
+    return lookup_settlement(cur, name, resolver, min_confidence)[0]
+
+
+def load_settlement_ids(cur) -> Dict[str, int]:
+    """Exact name -> id map of the whole Settlement table (a few hundred rows)."""
+    cur.execute('SELECT name, id FROM public."Settlement" ORDER BY id')
+    ids: Dict[str, int] = {}
+    for name, sid in cur.fetchall():
+        if name is not None:
+            ids.setdefault(name, int(sid))
+    return ids
+
+
+def load_st_model(model_name: str = DEFAULT_ST_MODEL):
     from sentence_transformers import SentenceTransformer
     return SentenceTransformer(model_name)
 
 
+def load_embedder(args: argparse.Namespace):
+    """Model for --embed: sentence-transformers (PyTorch) or the ONNX Runtime backend."""
+    if args.embed == "st":
+        return load_st_model(args.st_model)
+    if args.embed == "onnx":
+        from onnx_embed import load_onnx_model
+        return load_onnx_model(args.onnx_dir, quantized=args.onnx_quantized)
+    return None
+
+
+def embedding_model_name(args: argparse.Namespace) -> str:
+    """Value stored in RecipeEmbedding.model: the model plus the backend, so int8 ONNX vectors stay distinguishable."""
+    if args.embed == "onnx":
+        return f"{args.st_model}@onnx-int8" if args.onnx_quantized else f"{args.st_model}@onnx"
+    return args.st_model
+
+
 def embed_st(model, text: str) -> List[float]:
-    import numpy as np
-    vec = model.encode([text], normalize_embeddings=True)[0]
-    return vec.astype(float).tolist()
+    return embed_st_batch(model, [text])[0]
+
+
+def embed_st_batch(model, texts: List[str]) -> List[List[float]]:
+    vecs = model.encode(texts, normalize_embeddings=True, batch_size=64)
+    return [v.astype(float).tolist() for v in vecs]
 
 
 def to_pgvector_literal(vec: List[float]) -> str:
     return "[" + ",".join(f"{x:.6f}" for x in vec) + "]"
 
 
+def to_bit_literal(vec: List[float]) -> str:
+    """Sign bits of the vector, same as pgvector's binary_quantize()."""
+    return "".join("1" if x > 0 else "0" for x in vec)
+
+
+# --vector-storage -> which RecipeEmbedding columns are filled (the others are set to NULL)
+VECTOR_STORAGE_COLUMNS = {
+    "vector": ("embedding",),
+    "halfvec": ("embedding_half", "embedding_bin"),
+    "both": ("embedding", "embedding_half", "embedding_bin"),
+}
+
+
+def embedding_row(recipe_id: int, model_name: Optional[str], vec: List[float], vector_storage: str) -> Tuple:
+    columns = VECTOR_STORAGE_COLUMNS[vector_storage]
+    literal = to_pgvector_literal(vec)
+    return (
+        recipe_id,
+        model_name,
+        384,
+        literal if "embedding" in columns else None,
+        literal if "embedding_half" in columns else None,
+        to_bit_literal(vec) if "embedding_bin" in columns else None,
+    )
+
+
+RECIPE_UPSERT_SQL = (
+    'INSERT INTO public."Recipe" (url, title, year, settlement_id, settlement_name, ingredients_text, category_id,\n'
+    '                             search_text, search_tsv)\n'
+    'VALUES %s\n'
+    'ON CONFLICT (url) DO UPDATE SET\n'
+    '  title = EXCLUDED.title,\n'
+    '  year = EXCLUDED.year,\n'
+    '  settlement_id = EXCLUDED.settlement_id,\n'
+    '  settlement_name = EXCLUDED.settlement_name,\n'
+    '  ingredients_text = EXCLUDED.ingredients_text,\n'
+    '  category_id = EXCLUDED.category_id,\n'
+    '  search_text = EXCLUDED.search_text,\n'
+    '  search_tsv = EXCLUDED.search_tsv\n'
+    'RETURNING id, url'
+)
+RECIPE_TEMPLATE = (
+    "(%s, %s, %s, %s, %s, %s, %s, %s, "
+    "setweight(to_tsvector('hungarian', %s), 'A') || setweight(to_tsvector('hungarian', %s), 'B'))"
+)
+
+
+def search_text(title: str, ingredients_text: str) -> str:
+    """Accent-folded, lowercased text for the pg_trgm index (same folding as the scraper)."""
+    return normalize_text(f"{title} | {ingredients_text}")
+
+
+SEARCH_BACKFILL_SQL = (
+    'UPDATE public."Recipe" r SET\n'
+    '  search_text = v.search_text,\n'
+    "  search_tsv = setweight(to_tsvector('hungarian', v.title), 'A') || setweight(to_tsvector('hungarian', v.ingredients_text), 'B')\n"
+    'FROM (VALUES %s) AS v(id, search_text, title, ingredients_text)\n'
+    'WHERE r.id = v.id'
+)
+
+
+def backfill_search_columns(conn, batch_size: int = 500) -> int:
+    """One-off fill of search_text / search_tsv for rows loaded before those columns existed."""
+    done = 0
+    while True:
+        with conn.cursor() as cur:
+            cur.execute(
+                'SELECT id, title, ingredients_text FROM public."Recipe" '
+                "WHERE search_text IS NULL OR search_tsv IS NULL ORDER BY id LIMIT %s",
+                (batch_size,),
+            )
+            rows = cur.fetchall()
+            if not rows:
+                return done
+            values = [(rid, search_text(title or "", text or ""), title or "", text or "") for rid, title, text in rows]
+            psycopg2.extras.execute_values(
+                cur, SEARCH_BACKFILL_SQL, values, template="(%s::bigint, %s, %s, %s)", page_size=len(values)
+            )
+        conn.commit()
+        done += len(rows)
+
+
+EMBEDDING_UPSERT_SQL = (
+    'INSERT INTO public."RecipeEmbedding" (recipe_id, model, dim, embedding, embedding_half, embedding_bin)\n'
+    'VALUES %s\n'
+    'ON CONFLICT (recipe_id) DO UPDATE SET\n'
+    '  model = EXCLUDED.model,\n'
+    '  dim = EXCLUDED.dim,\n'
+    '  embedding = EXCLUDED.embedding,\n'
+    '  embedding_half = EXCLUDED.embedding_half,\n'
+    '  embedding_bin = EXCLUDED.embedding_bin'
+)
+EMBEDDING_TEMPLATE = "(%s, %s, %s, %s::vector, %s::halfvec, %s::bit(384))"
+
+
+def write_batch(
+    cur,
+    batch: List[RecipeRow],
+    settlement_ids: Dict[str, int],
+    st_model=None,
+    model_name: Optional[str] = None,
+    stats: Optional[LoadStats] = None,
+    vector_storage: str = "vector",
+    changes: Optional[ChangeSet] = None,
+    recipe_ids: Optional[Set[int]] = None,
+) -> Set[str]:
+    """Upsert one batch of recipes (parsed ingredients, embeddings) with multi-row statements.
+
+    Settlement names are resolved against the preloaded exact-match map; names that
+    do not match are returned so the caller can resolve them later. The ids of the
+    upserted recipes are added to `recipe_ids` when given.
+    """
+    stats = stats or LoadStats(report_every=0)
+    # ON CONFLICT cannot touch the same row twice in one statement: keep the last row per url
+    by_url: Dict[str, RecipeRow] = {}
+    for row in batch:
+        by_url[row[0]] = row
+    rows = list(by_url.values())
+
+    unresolved: Set[str] = set()
+    values = []
+    with stats.stage("resolve"):
+        for (url, title, year, settlement_name, ingredients_text, category_id) in rows:
+            settlement_id = settlement_ids.get(settlement_name) if settlement_name else None
+            if settlement_name and settlement_id is None:
+                unresolved.add(settlement_name)
+            values.append((
+                url, title, year, settlement_id, settlement_name, ingredients_text, category_id,
+                search_text(title, ingredients_text), title, ingredients_text,
+            ))
+
+    if changes is not None:
+        # A régi település is érintett, ha egy recept áthelyeződik
+        with stats.statement("resolve"):
+            cur.execute('SELECT settlement_id FROM public."Recipe" WHERE url = ANY(%s)', ([v[0] for v in values],))
+            changes.add(settlement_ids=[r[0] for r in cur.fetchall()])
+            changes.add(settlement_ids=[v[3] for v in values])
+
+    with stats.statement("write"):
+        returned = psycopg2.extras.execute_values(
+            cur, RECIPE_UPSERT_SQL, values, template=RECIPE_TEMPLATE, page_size=len(values), fetch=True
+        )
+    id_by_url = {url: rid for rid, url in returned}
+    if changes is not None:
+        changes.add(recipe_ids=id_by_url.values())
+    if recipe_ids is not None:
+        recipe_ids.update(id_by_url.values())
+
+    write_recipe_ingredients(cur, [(id_by_url[row[0]], row[4]) for row in rows], stats)
+
+    if st_model is not None:
+        with stats.stage("embed"):
+            texts = [normalize_spaces(f"{title}. {ingredients_text}") for (_, title, _, _, ingredients_text, _) in rows]
+            vecs = embed_st_batch(st_model, texts)
+            emb_values = [
+                embedding_row(id_by_url[row[0]], model_name, vec, vector_storage)
+                for row, vec in zip(rows, vecs)
+            ]
+        with stats.statement("write"):
+            psycopg2.extras.execute_values(
+                cur,
+                EMBEDDING_UPSERT_SQL,
+                emb_values,
+                template=EMBEDDING_TEMPLATE,
+                page_size=len(emb_values),
+            )
+    return unresolved
+
+
+def load_rows(
+    conn,
+    rows_iter: Iterable[RecipeRow],
+    st_model,
+    model_name: str,
+    batch_size: int,
+    stats: Optional[LoadStats] = None,
+    vector_storage: str = "vector",
+    changes: Optional[ChangeSet] = None,
+) -> Tuple[Set[int], Set[str]]:
+    """Load rows in batches, committing after every batch.
+
+    Returns (ids of the upserted recipes, unresolved names). A url repeated in the
+    input is one recipe; the progress counter in `stats` counts input rows.
+    """
+    stats = stats or LoadStats(report_every=0)
+    recipe_ids: Set[int] = set()
+    unresolved: Set[str] = set()
+
+    def flush(batch: List[RecipeRow]) -> None:
+        nonlocal unresolved
+        unresolved |= write_batch(
+            cur, batch, settlement_ids, st_model, model_name, stats, vector_storage, changes, recipe_ids
+        )
+        with stats.statement("commit"):
+            conn.commit()
+        stats.add_rows(len(batch))
+
+    with conn.cursor() as cur:
+        with stats.statement("resolve"):
+            settlement_ids = load_settlement_ids(cur)
+        batch: List[RecipeRow] = []
+        for row in stats.timed(rows_iter, "read"):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                flush(batch)
+                batch = []
+        if batch:
+            flush(batch)
+    return recipe_ids, unresolved
+
+
+def resolve_deferred_settlements(
+    conn,
+    names: Iterable[str],
+    changes: Optional[ChangeSet] = None,
+    fuzzy_min_confidence: float = 0.85,
+) -> Tuple[int, List[str], List[dict]]:
+    """Resolve settlement names that had no exact match, using the ILIKE and fuzzy fallbacks.
+
+    Runs once after all batches/workers finished, so every name is looked up once and
+    the Recipe rows are patched with a single UPDATE per name.
+    Returns (number of updated recipes, names that are still unknown, fuzzy matches).
+    """
+    updated = 0
+    missing: List[str] = []
+    fuzzy: List[dict] = []
+    names = sorted(set(names))
+    with conn.cursor() as cur:
+        resolver = None
+        if names and fuzzy_min_confidence <= 1:
+            resolver = SettlementResolver(load_settlement_ids(cur))
+        for name in names:
+            sid, match = lookup_settlement(cur, name, resolver, fuzzy_min_confidence)
+            if sid is None:
+                missing.append(name)
+                continue
+            if match is not None:
+                fuzzy.append({"name": name, "match": match.name, "distance": match.distance, "confidence": match.confidence})
+            cur.execute(
+                'UPDATE public."Recipe" SET settlement_id = %s WHERE settlement_name = %s AND settlement_id IS NULL',
+                (sid, name),
+            )
+            updated += cur.rowcount
+            if changes is not None and cur.rowcount:
+                changes.add(settlement_ids=[None, sid])
+    conn.commit()
+    return updated, missing, fuzzy
+
+
+def rebuild_ann_indexes(conn, args: argparse.Namespace, method: str) -> None:
+    with conn.cursor() as cur:
+        built = build_ann_indexes(
+            cur,
+            method,
+            lists=args.ivf_lists,
+            m=args.hnsw_m,
+            ef_construction=args.hnsw_ef_construction,
+            maintenance_work_mem=args.maintenance_work_mem,
+        )
+    conn.commit()
+    for name, secs in built.items():
+        print(f"Index építve: {name} ({secs:.2f} s)")
+
+
+def _load_shard(job: Tuple[argparse.Namespace, int, int, int]) -> Tuple[List[int], List[str], dict, dict]:
+    """Worker process: own connection, own model, batched commits over one byte (or row-group) range."""
+    args, shard_no, start, end = job
+    stats = LoadStats(count_source_rows(args, start, end), args.progress_every, label=f"worker {shard_no}")
+    changes = ChangeSet()
+    conn = connect_pg(args.dsn, args.host, args.port, args.db, args.user, args.password)
+    conn.autocommit = False
+    try:
+        with stats.stage("embed"):
+            st_model = load_embedder(args)
+        recipe_ids, unresolved = load_rows(
+            conn, read_source(args, start, end), st_model, embedding_model_name(args), args.batch_size, stats,
+            args.vector_storage, changes,
+        )
+        return sorted(recipe_ids), sorted(unresolved), stats.to_dict(), changes.to_dict()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     p = argparse.ArgumentParser(description="Load scraped recipes into Postgres + pgvector")
     src = p.add_mutually_exclusive_group(required=True)
     src.add_argument("--csv", type=str, help="Path to receptek.csv")
-    src.add_argument("--jsonl", type=str, help="Path to receptek.jsonl")
-    p.add_argument("--init-schema", action="store_true", help="Create/ensure schema (uses scraperek/db_schema.sql)")
+    src.add_argument("--jsonl", type=str, help="Path to receptek.jsonl (.gz / framed .zst also read)")
+    src.add_argument("--parquet", type=str, help="Path to receptek.parquet (see recipe_parquet.py)")
+    p.add_argument("--init-schema", action="store_true", help="Create/ensure schema (uses scraperek/db_schema.sql) and backfill search columns and parsed ingredients of older rows")
     p.add_argument("--dsn", type=str, default=None, help="Postgres DSN string")
     p.add_argument("--host", type=str, default=None)
     p.add_argument("--port", type=int, default=None)
     p.add_argument("--db", type=str, default=None)
     p.add_argument("--user", type=str, default=None)
     p.add_argument("--password", type=str, default=None)
-    p.add_argument("--embed", choices=["none", "st"], default="st", help="Embedding method: none or sentence-transformers")
-    p.add_argument("--st-model", type=str, default="sentence-transformers/all-MiniLM-L6-v2")
+    p.add_argument(
+        "--embed",
+        choices=["none", "st", "onnx"],
+        default="st",
+        help="Embedding method: none, sentence-transformers or ONNX Runtime (same model, see onnx_embed.py)",
+    )
+    p.add_argument("--st-model", type=str, default=DEFAULT_ST_MODEL)
+    p.add_argument("--onnx-dir", type=str, default=DEFAULT_ONNX_DIR)
+    p.add_argument("--onnx-quantized", action="store_true", help="Use the int8 quantized ONNX model")
+    p.add_argument(
+        "--ann-index",
+        choices=["keep", "same", "ivfflat", "hnsw"],
+        default="keep",
+        help="keep: leave trained ANN indexes alone (ivfflat is built if there is none, or only an untrained one "
+        "or one trained on far fewer rows than the table will have); "
+        "otherwise drop them before loading and rebuild afterwards "
+        "(same: with the method they had, ivfflat if none; ivfflat/hnsw: with this method)",
+    )
+    p.add_argument("--ivf-lists", type=int, default=None, help="ivfflat lists (default: sized from the row count)")
+    p.add_argument("--hnsw-m", type=int, default=16)
+    p.add_argument("--hnsw-ef-construction", type=int, default=64)
+    p.add_argument("--maintenance-work-mem", type=str, default=None, help="e.g. 1GB, for the index build")
+    p.add_argument(
+        "--vector-storage",
+        choices=sorted(VECTOR_STORAGE_COLUMNS),
+        default="vector",
+        help="vector: float32 only; halfvec: float16 + binary prefilter column; both: all three",
+    )
+    p.add_argument("--batch-size", type=int, default=500, help="Rows per multi-row INSERT and per commit")
+    p.add_argument("--workers", type=int, default=1, help="Parallel loader processes (JSONL / Parquet only, split by byte offsets, zstd frames or row groups)")
+    p.add_argument("--progress-every", type=float, default=10.0, help="Seconds between progress lines (0 = off)")
+    p.add_argument("--stats-json", type=str, default=None, help="Write a JSON summary of the load (timings, latency histogram)")
+    p.add_argument("--changes-out", type=str, default=None, help="Write the load's change set (recipe/settlement ids) as JSON")
+    p.add_argument("--fuzzy-min-confidence", type=float, default=0.85, help="Minimum confidence for typo-tolerant settlement matches (> 1 disables)")
+    p.add_argument("--refresh-aggregates", action="store_true", help="Refresh the analytics cubes for the touched regions")
+    p.add_argument("--snapshot", type=str, default=None, help="Refresh this offline SQLite snapshot from the load's change set (see snapshot.py)")
     args = p.parse_args(argv)
 
-    rows_iter = read_csv(args.csv) if args.csv else read_jsonl(args.jsonl)
+    if args.workers > 1 and args.csv:
+        p.error("--workers > 1 requires --jsonl or --parquet")
 
     conn = connect_pg(args.dsn, args.host, args.port, args.db, args.user, args.password)
     conn.autocommit = False
+    # Az ANN indexek újraépítésének módja; None, ha nincs mit újraépíteni
+    rebuild_method: Optional[str] = None
     try:
-        with conn.cursor() as cur:
-            if args.init_schema:
+        if args.init_schema:
+            with conn.cursor() as cur:
                 schema_sql = os.path.join(os.path.dirname(__file__), "db_schema.sql")
                 ensure_schema(cur, schema_sql)
+            conn.commit()
+            filled = backfill_search_columns(conn, args.batch_size)
+            if filled:
+                print(f"Keresőoszlopok kitöltve a korábban betöltött receptekre: {filled}")
+            parsed = backfill_recipe_ingredients(conn, args.batch_size)
+            if parsed:
+                print(f"Hozzávalók feldolgozva a korábban betöltött receptekre: {parsed}")
+        source_rows = count_source_rows(args)
+        with conn.cursor() as cur:
+            # Betöltés utáni sorszám felső becslése: a kis táblán tanított ivfflat ne maradjon meg örökre
+            cur.execute('SELECT count(*) FROM public."RecipeEmbedding"')
+            expected_rows = int(cur.fetchone()[0]) + (source_rows if args.embed != "none" else 0)
+            stale = untrained_ann_indexes(cur) + outgrown_ann_indexes(cur, expected_rows)
+            rebuild_method = rebuild_plan(args.ann_index, existing_ann_indexes(cur), stale)
+            if rebuild_method is not None:
+                dropped = drop_ann_indexes(cur)
                 conn.commit()
+                if dropped:
+                    print(f"ANN indexek eldobva a betöltés idejére: {', '.join(dropped)}")
 
-        st_model = None
-        if args.embed == "st":
-            st_model = load_st_model(args.st_model)
+        source = args.jsonl or args.parquet or args.csv
+        changes = ChangeSet()
+        if args.workers > 1:
+            stats = LoadStats(source_rows, args.progress_every)
+            shards = source_shards(args, args.workers)
+            print(f"{len(shards)} shard, {args.workers} worker")
+            jobs = [(args, i, start, end) for i, (start, end) in enumerate(shards, 1)]
+            # Ugyanaz az url több shardban is előfordulhat: a receptazonosítók unióját számoljuk
+            recipe_ids: Set[int] = set()
+            unresolved: Set[str] = set()
+            with multiprocessing.Pool(processes=len(shards)) as pool:
+                for ids, names, worker_stats, worker_changes in pool.imap_unordered(_load_shard, jobs):
+                    recipe_ids.update(ids)
+                    unresolved.update(names)
+                    stats.merge(worker_stats)
+                    changes.merge(ChangeSet.from_dict(worker_changes))
+        else:
+            stats = LoadStats(source_rows, args.progress_every)
+            rows_iter = read_source(args)
+            with stats.stage("embed"):
+                st_model = load_embedder(args)
+            recipe_ids, unresolved = load_rows(
+                conn, rows_iter, st_model, embedding_model_name(args), args.batch_size, stats, args.vector_storage, changes
+            )
 
-        with conn.cursor() as cur:
-            for (url, title, year, settlement_name, ingredients_text, category_id) in rows_iter:
-                # Lookup settlement_id by name
-                settlement_id = lookup_settlement_id(cur, settlement_name)
-
-                cur.execute(
-                    'INSERT INTO public."Recipe" (url, title, year, settlement_id, settlement_name, ingredients_text, category_id)\n'
-                    'VALUES (%s, %s, %s, %s, %s, %s, %s)\n'
-                    'ON CONFLICT (url) DO UPDATE SET\n'
-                    '  title = EXCLUDED.title,\n'
-                    '  year = EXCLUDED.year,\n'
-                    '  settlement_id = EXCLUDED.settlement_id,\n'
-                    '  settlement_name = EXCLUDED.settlement_name,\n'
-                    '  ingredients_text = EXCLUDED.ingredients_text,\n'
-                    '  category_id = EXCLUDED.category_id\n'
-                    'RETURNING id',
-                    (url, title, year, settlement_id, settlement_name, ingredients_text, category_id),
-                )
-                recipe_id = cur.fetchone()[0]
-
-                if args.embed != "none":
-                    text_for_embed = normalize_spaces(f"{title}. {ingredients_text}")
-                    vec = embed_st(st_model, text_for_embed)
-                    literal = to_pgvector_literal(vec)
-                    cur.execute(
-                        'INSERT INTO public."RecipeEmbedding" (recipe_id, model, dim, embedding)\n'
-                        'VALUES (%s, %s, %s, %s::vector)\n'
-                        'ON CONFLICT (recipe_id) DO UPDATE SET\n'
-                        '  model = EXCLUDED.model,\n'
-                        '  dim = EXCLUDED.dim,\n'
-                        '  embedding = EXCLUDED.embedding',
-                        (recipe_id, args.st_model, 384, literal),
-                    )
+        # Coordinator step: names without an exact match are resolved once, here
+        with stats.stage("resolve"):
+            updated, missing, fuzzy = resolve_deferred_settlements(conn, unresolved, changes, args.fuzzy_min_confidence)
+        print(f"Bemeneti sorok: {stats.rows}, betöltött receptek: {len(recipe_ids)}, utólag feloldott településű receptek: {updated}")
+        for f in fuzzy:
+            print(f"  ~ {f['name']!r} -> {f['match']!r} (távolság {f['distance']}, bizalom {f['confidence']:.2f})")
+        if missing:
+            print(f"Ismeretlen települések ({len(missing)}): {', '.join(missing)}")
+        if rebuild_method is not None:
+            with stats.stage("index"):
+                rebuild_ann_indexes(conn, args, rebuild_method)
+            rebuild_method = None
+        if args.changes_out:
+            changes.save(args.changes_out)
+            print(f"Változáskészlet mentve: {args.changes_out}")
+        if args.refresh_aggregates:
+            from aggregates import refresh_aggregates
 
-        conn.commit()
+            with stats.stage("aggregate"):
+                agg = refresh_aggregates(conn, changes)
+            print(f"Összesítők frissítve ({agg['seconds']} s), régiók: {agg['regions']}")
+        if args.snapshot:
+            from snapshot import update_snapshot
+
+            with stats.stage("snapshot"):
+                snap = update_snapshot(conn, args.snapshot, changes)
+            print(f"Pillanatkép frissítve: {args.snapshot} ({snap['seconds']} s)")
+        for line in stats.summary_lines():
+            print(line)
+        if args.stats_json:
+            stats.write_json(args.stats_json, {
+                "source": source,
+                "workers": args.workers,
+                "batch_size": args.batch_size,
+                "embed": args.embed,
+                "vector_storage": args.vector_storage,
+                "ann_index": args.ann_index,
+                "unresolved_settlements": missing,
+                "fuzzy_settlements": fuzzy,
+            })
+            print(f"Statisztika mentve: {args.stats_json}")
         print("Insert kész.")
-    except Exception:
+    except BaseException:
         conn.rollback()
         raise
     finally:
-        conn.close()
+        try:
+            if rebuild_method is not None:
+                # Hibás betöltés után is: az eldobott indexek nélkül maradna a tábla
+                print("Betöltés megszakadt, ANN indexek újraépítése...", file=sys.stderr)
+                try:
+                    rebuild_ann_indexes(conn, args, rebuild_method)
+                except Exception as e:  # ne takarja el a betöltés eredeti hibáját
+                    conn.rollback()
+                    print(f"ANN index újraépítés sikertelen: {e}; futtasd újra --ann-index {rebuild_method} beállítással.", file=sys.stderr)
+        finally:
+            conn.close()
     return 0
 
 
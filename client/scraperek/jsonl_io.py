@@ -0,0 +1,426 @@
+"""
+JSONL olvasás/írás sima, gzip és keretezett zstd formátumban.
+
+A .jsonl.zst fájl egymástól függetlenül kitömöríthető zstd keretek sora;
+minden keret egész sorokat tartalmaz (kb. --frame-bytes tömörítetlen
+bájtnyit). A fájl végén egy zstd "skippable" keret tárolja a keretindexet
+(eltolás, tömörített méret, sorszám), amit a szabványos zstd/zstdcat
+átugrik, így a fájl bármely zstd eszközzel olvasható marad. Az index
+alapján a betöltő bármelyik kerethez ugorhat, és a fájlt keret-határokon
+oszthatja szét a workerek között (insert_recipes --workers).
+
+Ha az index hiányzik (pl. megszakadt írás), a keretek egy lineáris
+átolvasással visszanyerhetők; a hozzáfűzés ezt automatikusan megteszi.
+
+Használat (példa):
+    python receptek_scraper.py --out-json receptek.jsonl.zst
+    python insert_recipes.py --jsonl receptek.jsonl.zst --workers 4
+    python jsonl_io.py pack receptek.jsonl receptek.jsonl.zst
+    python jsonl_io.py info receptek.jsonl.zst
+    python jsonl_io.py bench --jsonl receptek.jsonl --scale 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import multiprocessing
+import os
+import struct
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from load_stats import count_lines as count_plain_lines
+
+DEFAULT_LEVEL = 3
+DEFAULT_FRAME_BYTES = 256 * 1024
+
+# zstd skippable keret (0x184D2A50-0x184D2A5F); a tartalom végén saját lábléc
+_SKIPPABLE_MAGIC = 0x184D2A5E
+_INDEX_TAG = b"JXIX"
+_FOOTER = struct.Struct("<I4s")  # index JSON hossza, _INDEX_TAG
+_SKIP_HEADER = struct.Struct("<II")  # magic, tartalom hossza
+
+
+def _zstd():
+    import zstandard
+
+    return zstandard
+
+
+def is_zstd(path: str) -> bool:
+    return path.endswith(".zst")
+
+
+def is_gzip(path: str) -> bool:
+    return path.endswith(".gz")
+
+
+@dataclass
+class Frame:
+    offset: int
+    size: int       # tömörített bájtok
+    lines: int
+    raw_size: int   # tömörítetlen bájtok
+
+    @property
+    def end(self) -> int:
+        return self.offset + self.size
+
+
+# -----------------------------
+# Keretindex
+# -----------------------------
+
+def read_frame_index(path: str) -> Optional[List[Frame]]:
+    """Frame index from the trailing skippable frame, or None if the file has none."""
+    size = os.path.getsize(path)
+    if size < _SKIP_HEADER.size + _FOOTER.size:
+        return None
+    with open(path, "rb") as f:
+        f.seek(size - _FOOTER.size)
+        n, tag = _FOOTER.unpack(f.read(_FOOTER.size))
+        start = size - _FOOTER.size - n - _SKIP_HEADER.size
+        if tag != _INDEX_TAG or start < 0:
+            return None
+        f.seek(start)
+        magic, length = _SKIP_HEADER.unpack(f.read(_SKIP_HEADER.size))
+        if magic != _SKIPPABLE_MAGIC or length != n + _FOOTER.size:
+            return None
+        doc = json.loads(f.read(n).decode("utf-8"))
+    return [Frame(*fr) for fr in doc["frames"]]
+
+
+def scan_frames(path: str) -> List[Frame]:
+    """Rebuild the frame list by decompressing the file frame by frame (recovery path).
+
+    Skippable frames (an old index) are skipped; a truncated last frame is dropped.
+    """
+    zstd = _zstd()
+    with open(path, "rb") as f:
+        data = f.read()
+    frames: List[Frame] = []
+    pos = 0
+    while pos + _SKIP_HEADER.size <= len(data):
+        magic, length = _SKIP_HEADER.unpack_from(data, pos)
+        if magic & 0xFFFFFFF0 == 0x184D2A50:
+            pos += _SKIP_HEADER.size + length
+            continue
+        dobj = zstd.ZstdDecompressor().decompressobj()
+        try:
+            raw = dobj.decompress(data[pos:])
+        except zstd.ZstdError:
+            break
+        if not dobj.eof:
+            break  # csonka keret a fájl végén
+        size = len(data) - pos - len(dobj.unused_data)
+        frames.append(Frame(pos, size, raw.count(b"\n"), len(raw)))
+        pos += size
+    return frames
+
+
+def frame_index(path: str) -> List[Frame]:
+    frames = read_frame_index(path)
+    return frames if frames is not None else scan_frames(path)
+
+
+def _index_frame(frames: Sequence[Frame]) -> bytes:
+    doc = json.dumps({"version": 1, "frames": [[f.offset, f.size, f.lines, f.raw_size] for f in frames]}).encode("utf-8")
+    return _SKIP_HEADER.pack(_SKIPPABLE_MAGIC, len(doc) + _FOOTER.size) + doc + _FOOTER.pack(len(doc), _INDEX_TAG)
+
+
+# -----------------------------
+# Írás
+# -----------------------------
+
+class ZstdJsonlWriter:
+    """Text-file-like writer emitting one independent zstd frame per ~frame_bytes of whole lines.
+
+    flush() only flushes completed frames to disk; the open frame stays in memory until it
+    is full or the writer is closed (closing also writes the frame index).
+    """
+
+    def __init__(self, path: str, append: bool = False, level: int = DEFAULT_LEVEL, frame_bytes: int = DEFAULT_FRAME_BYTES) -> None:
+        self.path = path
+        self.frame_bytes = frame_bytes
+        self.compressor = _zstd().ZstdCompressor(level=level, write_content_size=True)
+        self.frames: List[Frame] = []
+        self._buf: List[bytes] = []
+        self._buf_bytes = 0
+        if append and os.path.exists(path) and os.path.getsize(path) > 0:
+            self.frames = frame_index(path)
+            self.f = open(path, "r+b")
+            # A régi indexet (és egy esetleges csonka keretet) felülírjuk
+            self.f.truncate(self.frames[-1].end if self.frames else 0)
+            self.f.seek(0, os.SEEK_END)
+        else:
+            self.f = open(path, "wb")
+
+    def write(self, text: str) -> int:
+        data = text.encode("utf-8")
+        self._buf.append(data)
+        self._buf_bytes += len(data)
+        if self._buf_bytes >= self.frame_bytes and data.endswith(b"\n"):
+            self._emit()
+        return len(text)
+
+    def _emit(self) -> None:
+        if not self._buf:
+            return
+        raw = b"".join(self._buf)
+        comp = self.compressor.compress(raw)
+        self.frames.append(Frame(self.f.tell(), len(comp), raw.count(b"\n"), len(raw)))
+        self.f.write(comp)
+        self._buf, self._buf_bytes = [], 0
+
+    def flush(self) -> None:
+        self.f.flush()
+
+    def close(self) -> None:
+        if self.f.closed:
+            return
+        self._emit()
+        self.f.write(_index_frame(self.frames))
+        self.f.close()
+
+    def __enter__(self) -> "ZstdJsonlWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def open_jsonl_writer(path: str, append: bool = False, level: Optional[int] = None, frame_bytes: int = DEFAULT_FRAME_BYTES):
+    """Text writer chosen by extension: .zst (framed + indexed), .gz, or plain."""
+    mode = "a" if append else "w"
+    if is_zstd(path):
+        return ZstdJsonlWriter(path, append, DEFAULT_LEVEL if level is None else level, frame_bytes)
+    if is_gzip(path):
+        return gzip.open(path, mode + "t", encoding="utf-8", compresslevel=6 if level is None else level)
+    return open(path, mode, encoding="utf-8")
+
+
+# -----------------------------
+# Olvasás
+# -----------------------------
+
+def iter_jsonl_lines(path: str, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+    """Raw lines of a JSONL file, optionally only the byte range [start, end).
+
+    Plain files: `start` must be a line start. .zst: offsets are compressed-file offsets of
+    frame starts (see `jsonl_shards`), each frame is decompressed on its own. .gz files are
+    read whole.
+    """
+    if is_zstd(path):
+        dctx = _zstd().ZstdDecompressor()
+        with open(path, "rb") as f:
+            for fr in frame_index(path):
+                if fr.offset < start or (end is not None and fr.offset >= end):
+                    continue
+                f.seek(fr.offset)
+                yield from dctx.decompress(f.read(fr.size), max_output_size=fr.raw_size).splitlines(keepends=True)
+        return
+    if is_gzip(path):
+        if start:
+            raise ValueError("gzip JSONL cannot be read from an offset")
+        with gzip.open(path, "rb") as f:
+            yield from f
+        return
+    with open(path, "rb") as f:
+        f.seek(start)
+        pos = start
+        for raw in f:
+            if end is not None and pos >= end:
+                break
+            pos += len(raw)
+            yield raw
+
+
+def iter_jsonl_records(path: str) -> Iterator[dict]:
+    for raw in iter_jsonl_lines(path):
+        if raw.strip():
+            yield json.loads(raw)
+
+
+def count_lines(path: str, start: int = 0, end: Optional[int] = None) -> int:
+    """Line count of a byte range; .zst uses the frame index, .gz is decompressed once."""
+    if is_zstd(path):
+        return sum(fr.lines for fr in frame_index(path) if fr.offset >= start and (end is None or fr.offset < end))
+    if is_gzip(path):
+        return sum(1 for _ in iter_jsonl_lines(path))
+    return count_plain_lines(path, start, end)
+
+
+def jsonl_shards(path: str, n: int) -> List[Tuple[int, int]]:
+    """Split a JSONL file into at most `n` byte ranges aligned to line (or zstd frame) boundaries."""
+    size = os.path.getsize(path)
+    if is_gzip(path):
+        return [(0, size)]
+    if is_zstd(path):
+        frames = frame_index(path)
+        if not frames:
+            return [(0, size)]
+        total = sum(fr.lines for fr in frames)
+        bounds = [frames[0].offset]
+        seen = 0
+        for fr in frames:
+            # Új shard, ha az eddigi sorok elérték a következő n-ed részt
+            if seen >= total * len(bounds) / n and fr.offset > bounds[-1]:
+                bounds.append(fr.offset)
+            seen += fr.lines
+        bounds.append(frames[-1].end)
+        return list(zip(bounds, bounds[1:]))
+    if n <= 1 or size == 0:
+        return [(0, size)]
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, n):
+            target = max(bounds[-1], size * i // n)
+            f.seek(target)
+            if target > 0:
+                # Move to the start of the next line
+                f.seek(target - 1)
+                f.readline()
+            pos = f.tell()
+            if pos >= size:
+                break
+            if pos > bounds[-1]:
+                bounds.append(pos)
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+
+# -----------------------------
+# CLI: pack / info / bench
+# -----------------------------
+
+def pack(src: str, dst: str, level: int = DEFAULT_LEVEL, frame_bytes: int = DEFAULT_FRAME_BYTES) -> int:
+    n = 0
+    with open_jsonl_writer(dst, level=level, frame_bytes=frame_bytes) as w:
+        for raw in iter_jsonl_lines(src):
+            w.write(raw.decode("utf-8"))
+            n += 1
+    return n
+
+
+def _read_all(path: str, parse: bool) -> Tuple[int, int]:
+    n = nbytes = 0
+    for raw in iter_jsonl_lines(path):
+        nbytes += len(raw)
+        if parse and raw.strip():
+            json.loads(raw)
+        n += 1
+    return n, nbytes
+
+
+def _read_shard(job: Tuple[str, int, int]) -> int:
+    path, start, end = job
+    return sum(1 for raw in iter_jsonl_lines(path, start, end) if raw.strip() and json.loads(raw))
+
+
+def bench(src: str, scale: int, level: int, gzip_level: int, frame_bytes: int, workers: int, repeat: int) -> List[Dict[str, object]]:
+    lines = [raw for raw in iter_jsonl_lines(src) if raw.strip()]
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {
+            "plain": os.path.join(tmp, "bench.jsonl"),
+            f"gzip -{gzip_level}": os.path.join(tmp, "bench.jsonl.gz"),
+            f"zstd -{level}": os.path.join(tmp, "bench.jsonl.zst"),
+        }
+        results: List[Dict[str, object]] = []
+        raw_size = 0
+        for label, path in paths.items():
+            t0 = time.perf_counter()
+            with open_jsonl_writer(path, level=gzip_level if is_gzip(path) else level, frame_bytes=frame_bytes) as w:
+                for _ in range(scale):
+                    for raw in lines:
+                        w.write(raw.decode("utf-8"))
+            write_s = time.perf_counter() - t0
+            size = os.path.getsize(path)
+            raw_size = raw_size or size
+            read_s = parse_s = float("inf")
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                n, nbytes = _read_all(path, parse=False)
+                read_s = min(read_s, time.perf_counter() - t0)
+                t0 = time.perf_counter()
+                _read_all(path, parse=True)
+                parse_s = min(parse_s, time.perf_counter() - t0)
+            row: Dict[str, object] = {
+                "format": label,
+                "bytes": size,
+                "ratio": round(raw_size / size, 2),
+                "write_s": round(write_s, 3),
+                "read_mb_s": round(nbytes / read_s / 1e6, 1),
+                "parse_lines_s": round(n / parse_s),
+            }
+            if is_zstd(path):
+                frames = frame_index(path)
+                mid = frames[len(frames) // 2]
+                t0 = time.perf_counter()
+                sum(1 for _ in iter_jsonl_lines(path, mid.offset, mid.end))
+                row["frames"] = len(frames)
+                row["seek_one_frame_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+                shards = jsonl_shards(path, workers)
+                t0 = time.perf_counter()
+                with multiprocessing.Pool(processes=len(shards)) as pool:
+                    parsed = sum(pool.map(_read_shard, [(path, a, b) for a, b in shards]))
+                row[f"parse_lines_s_{len(shards)}_workers"] = round(parsed / (time.perf_counter() - t0))
+            results.append(row)
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Framed zstd JSONL tools (pack / info / bench)")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    pp = sub.add_parser("pack", help="Recompress a JSONL (plain, .gz or .zst) into the target format")
+    pp.add_argument("src")
+    pp.add_argument("dst")
+    pi = sub.add_parser("info", help="Print the frame index of a .jsonl.zst file")
+    pi.add_argument("path")
+    pb = sub.add_parser("bench", help="Size and read throughput: plain vs gzip vs framed zstd")
+    pb.add_argument("--jsonl", type=str, default=os.path.join(os.path.dirname(__file__), "receptek.jsonl"))
+    pb.add_argument("--scale", type=int, default=100, help="Repeat the input this many times")
+    pb.add_argument("--gzip-level", type=int, default=6)
+    pb.add_argument("--workers", type=int, default=4, help="Processes for the parallel frame-sharded read")
+    pb.add_argument("--repeat", type=int, default=3)
+    pb.add_argument("--json", type=str, default=None, help="Write the results as JSON")
+    for sp_ in (pp, pb):
+        sp_.add_argument("--level", type=int, default=DEFAULT_LEVEL)
+        sp_.add_argument("--frame-bytes", type=int, default=DEFAULT_FRAME_BYTES, help="Uncompressed bytes per zstd frame")
+    args = p.parse_args(argv)
+
+    if args.cmd == "pack":
+        t0 = time.perf_counter()
+        n = pack(args.src, args.dst, args.level, args.frame_bytes)
+        print(f"{n} sor: {args.src} ({os.path.getsize(args.src):,} B) -> {args.dst} ({os.path.getsize(args.dst):,} B), {time.perf_counter() - t0:.2f} s")
+        return 0
+
+    if args.cmd == "info":
+        frames = read_frame_index(args.path)
+        if frames is None:
+            print("Nincs keretindex, keretek átolvasással:")
+            frames = scan_frames(args.path)
+        for i, fr in enumerate(frames):
+            print(f"  #{i}: eltolás {fr.offset}, {fr.size:,} B -> {fr.raw_size:,} B, {fr.lines} sor")
+        print(f"{len(frames)} keret, {sum(fr.lines for fr in frames)} sor")
+        return 0
+
+    results = bench(args.jsonl, args.scale, args.level, args.gzip_level, args.frame_bytes, args.workers, args.repeat)
+    for r in results:
+        extra = ", ".join(f"{k}={v}" for k, v in r.items() if k not in ("format", "bytes", "ratio", "write_s", "read_mb_s", "parse_lines_s"))
+        print(
+            f"  {r['format']:<9} {r['bytes'] / 1e6:8.2f} MB  x{r['ratio']:<5}  írás {r['write_s']:.2f} s  "
+            f"olvasás {r['read_mb_s']} MB/s  feldolgozás {r['parse_lines_s']:,} sor/s"
+            + (f"  ({extra})" if extra else "")
+        )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
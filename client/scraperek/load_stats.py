@@ -0,0 +1,190 @@
+"""
+Betöltési statisztikák az insert_recipes számára.
+
+Mér: szakaszonkénti időket (read, resolve, embed, write, commit), DB utasítás
+késleltetés-hisztogramot, időszakos haladásjelzést (sor/s, ETA), és a végén
+JSON összefoglalót ír, hogy a betöltések összehasonlíthatók legyenek.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+STAGES = ("read", "resolve", "embed", "write", "commit")
+
+# Felső határok ms-ban; az utolsó vödör a "+inf"
+LATENCY_BUCKETS_MS: List[float] = [1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+
+def count_lines(path: str, start: int = 0, end: Optional[int] = None) -> int:
+    """Count newline-terminated lines in a byte range (cheap ETA denominator)."""
+    n = 0
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = None if end is None else end - start
+        while remaining is None or remaining > 0:
+            chunk = f.read(1 << 20 if remaining is None else min(1 << 20, remaining))
+            if not chunk:
+                break
+            n += chunk.count(b"\n")
+            if remaining is not None:
+                remaining -= len(chunk)
+    return n
+
+
+class LoadStats:
+    def __init__(self, total_rows: Optional[int] = None, report_every: float = 10.0, label: str = "") -> None:
+        self.total_rows = total_rows
+        self.report_every = report_every
+        self.label = label
+        self.rows = 0
+        self.stages: Dict[str, float] = {s: 0.0 for s in STAGES}
+        self.statements = 0
+        self.statement_seconds = 0.0
+        self.statement_max_ms = 0.0
+        self.latency_counts: List[int] = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.started = time.perf_counter()
+        self._last_report = self.started
+
+    # -----------------------------
+    # Mérés
+    # -----------------------------
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - t0
+
+    @contextmanager
+    def statement(self, stage: str = "write") -> Iterator[None]:
+        """Time one DB round trip: counted in the stage and in the latency histogram."""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            dt = time.perf_counter() - t0
+            self.stages[stage] = self.stages.get(stage, 0.0) + dt
+            self.record_latency(dt * 1000.0)
+
+    def record_latency(self, ms: float) -> None:
+        self.statements += 1
+        self.statement_seconds += ms / 1000.0
+        self.statement_max_ms = max(self.statement_max_ms, ms)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if ms <= bound:
+                self.latency_counts[i] += 1
+                return
+        self.latency_counts[-1] += 1
+
+    def timed(self, it: Iterable[T], stage: str = "read") -> Iterator[T]:
+        """Wrap an iterator so the time spent producing items lands in `stage`."""
+        it = iter(it)
+        while True:
+            t0 = time.perf_counter()
+            try:
+                item = next(it)
+            except StopIteration:
+                self.stages[stage] += time.perf_counter() - t0
+                return
+            self.stages[stage] += time.perf_counter() - t0
+            yield item
+
+    # -----------------------------
+    # Haladás
+    # -----------------------------
+
+    def add_rows(self, n: int) -> None:
+        self.rows += n
+        now = time.perf_counter()
+        if self.report_every > 0 and now - self._last_report >= self.report_every:
+            self._last_report = now
+            self.report()
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def report(self, file=sys.stdout) -> None:
+        elapsed = self.elapsed()
+        rate = self.rows / elapsed if elapsed > 0 else 0.0
+        prefix = f"[{self.label}] " if self.label else ""
+        msg = f"{prefix}{self.rows} sor, {rate:.1f} sor/s"
+        if self.total_rows:
+            pct = 100.0 * self.rows / self.total_rows
+            eta = (self.total_rows - self.rows) / rate if rate > 0 else float("inf")
+            msg += f", {pct:.1f}%, ETA {_fmt_seconds(eta)}"
+        print(msg, file=file, flush=True)
+
+    # -----------------------------
+    # Összesítés
+    # -----------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = self.elapsed()
+        return {
+            "label": self.label,
+            "rows": self.rows,
+            "elapsed_s": round(elapsed, 3),
+            "rows_per_s": round(self.rows / elapsed, 2) if elapsed > 0 else None,
+            "stages_s": {k: round(v, 3) for k, v in self.stages.items()},
+            "statements": self.statements,
+            "statement_total_s": round(self.statement_seconds, 3),
+            "statement_max_ms": round(self.statement_max_ms, 3),
+            "statement_latency_ms": {
+                "buckets_le": LATENCY_BUCKETS_MS + ["+inf"],
+                "counts": list(self.latency_counts),
+            },
+        }
+
+    def merge(self, other: Dict[str, Any]) -> None:
+        """Add a worker's `to_dict()` into this (coordinator) instance."""
+        self.rows += other["rows"]
+        for k, v in other["stages_s"].items():
+            self.stages[k] = self.stages.get(k, 0.0) + v
+        self.statements += other["statements"]
+        self.statement_seconds += other["statement_total_s"]
+        self.statement_max_ms = max(self.statement_max_ms, other["statement_max_ms"])
+        for i, c in enumerate(other["statement_latency_ms"]["counts"]):
+            self.latency_counts[i] += c
+
+    def summary_lines(self) -> List[str]:
+        d = self.to_dict()
+        lines = [f"Összesen: {d['rows']} bemeneti sor {d['elapsed_s']} s alatt ({d['rows_per_s']} sor/s)"]
+        stage_total = sum(self.stages.values()) or 1.0
+        for k, v in self.stages.items():
+            lines.append(f"  {k:<8} {v:9.3f} s  {100.0 * v / stage_total:5.1f}%")
+        lines.append(f"  DB utasítások: {self.statements}, max {d['statement_max_ms']} ms")
+        bounds = [f"<={b:g}ms" for b in LATENCY_BUCKETS_MS] + [">5000ms"]
+        for b, c in zip(bounds, self.latency_counts):
+            if c:
+                lines.append(f"    {b:>9}: {c}")
+        return lines
+
+    def write_json(self, path: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        d = self.to_dict()
+        d["finished_at"] = time.strftime("%Y-%m-%dT%H:%M:%S%z")
+        if extra:
+            d.update(extra)
+        dirname = os.path.dirname(path)
+        if dirname:
+            os.makedirs(dirname, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(d, f, ensure_ascii=False, indent=2)
+
+
+def _fmt_seconds(s: float) -> str:
+    if s == float("inf"):
+        return "?"
+    s = int(s)
+    h, rem = divmod(s, 3600)
+    m, sec = divmod(rem, 60)
+    return f"{h:d}:{m:02d}:{sec:02d}" if h else f"{m:d}:{sec:02d}"
@@ -0,0 +1,493 @@
+"""
+Terheléses teszt a recept- és térkép-API-ra (asyncio).
+
+A kérés-sablonok a server/docs/openapi.yaml-ből jönnek: minden GET végpont
+query paramétereiből (típus, tömb, explode) épül a sablon, a paraméterek
+értékkészlete (régió-, település-, kategória-azonosítók, évek, hozzávalók)
+vagy egy offline pillanatképből (snapshot.py), vagy magától a futó
+szervertől (térkép- és kategória-végpontok) származik. A /api/recipes
+kérései véletlen szűrőkombinációk (év, település, régió, kategória,
+hozzávalók, a hozzávalók mellett esetenként reverse).
+
+A kérések nyílt hurokban, a cél RPS szerinti ütemezéssel indulnak; a
+késleltetés a tervezett indulási időtől számít, így a sorban állás is benne
+van (nincs "coordinated omission"). Végpontonként: átviteli sebesség,
+p50/p95/p99 késleltetés, hibaarány, átlagos válaszméret.
+
+A HTTP/1.1 kliens a standard könyvtár asyncio streamjeire épül, keep-alive
+kapcsolatkészlettel, így nincs szükség külön HTTP csomagra.
+
+Használat (példa):
+    python loadgen.py synth --jsonl receptek.jsonl --scale 50 --out synthetic.jsonl.zst
+    python insert_recipes.py --jsonl synthetic.jsonl.zst --dsn postgresql://... --workers 4
+    python loadgen.py run --base-url http://localhost:3000 --rps 200 --duration 60
+    python loadgen.py run --snapshot snapshot.sqlite --rps 500 --concurrency 64 --json load.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode, urlsplit
+
+import numpy as np
+
+DEFAULT_SPEC = os.path.join(os.path.dirname(__file__), "..", "..", "server", "docs", "openapi.yaml")
+
+# Végpontok alapértelmezett aránya a kérésmixben (a specben nem szereplők kimaradnak)
+DEFAULT_MIX = {
+    "/api/recipes": 70.0,
+    "/api/maps/settlements": 15.0,
+    "/api/maps/regions": 10.0,
+    "/api/recipes/categories": 5.0,
+}
+
+# Egy szűrő megjelenésének valószínűsége egy kérésben (kisbetűs paraméternév)
+PARAM_PROBABILITY = {
+    "regionid": 0.35,
+    "year": 0.30,
+    "settlementid": 0.15,
+    "settlementid_maps": 0.10,
+    "categoryid": 0.30,
+    "ingredients": 0.25,
+    "reverse": 0.30,   # csak ingredients mellett
+}
+
+DEFAULT_TERMS = ["hagyma", "tejföl", "paprika", "túró", "liszt", "tojás", "zsír", "cukor", "dió", "mák"]
+
+
+@dataclass
+class Param:
+    name: str
+    kind: str           # int | str | bool
+    array: bool
+    explode: bool
+
+
+@dataclass
+class Endpoint:
+    path: str
+    params: List[Param]
+
+
+def load_spec(path: str) -> Tuple[Optional[str], List[Endpoint]]:
+    """(first server url, GET endpoints with their query parameters) from an OpenAPI 3 document."""
+    import yaml
+
+    with open(path, "r", encoding="utf-8") as f:
+        spec = yaml.safe_load(f)
+    endpoints = []
+    for route, ops in (spec.get("paths") or {}).items():
+        op = (ops or {}).get("get")
+        if not op:
+            continue
+        params = []
+        for prm in op.get("parameters") or []:
+            if prm.get("in") != "query":
+                continue
+            schema = prm.get("schema") or {}
+            array = schema.get("type") == "array"
+            item = (schema.get("items") or {}) if array else schema
+            kind = {"integer": "int", "boolean": "bool"}.get(item.get("type"), "str")
+            params.append(Param(prm["name"], kind, array, prm.get("explode", prm.get("style", "form") == "form")))
+        endpoints.append(Endpoint(route, params))
+    servers = spec.get("servers") or []
+    return (servers[0].get("url") if servers else None), endpoints
+
+
+@dataclass
+class ValuePools:
+    region_ids: List[int] = field(default_factory=list)
+    settlement_ids: List[int] = field(default_factory=list)
+    category_ids: List[int] = field(default_factory=list)
+    years: List[int] = field(default_factory=list)
+    ingredients: List[str] = field(default_factory=list)
+
+    def for_param(self, name: str) -> list:
+        return {
+            "regionid": self.region_ids,
+            "settlementid": self.settlement_ids,
+            "categoryid": self.category_ids,
+            "year": self.years,
+            "ingredients": self.ingredients,
+        }.get(name.lower(), [])
+
+
+def pools_from_snapshot(path: str, terms: int = 40) -> ValuePools:
+    from snapshot import Snapshot
+
+    with Snapshot(path) as snap:
+        return ValuePools(
+            region_ids=[r["id"] for r in snap.regions()],
+            # Gyakoriság szerint súlyozva: a népes településekre több kérés jut, mint a valóságban is
+            settlement_ids=[r["settlement_id"] for r in snap.sql("SELECT settlement_id FROM recipe WHERE settlement_id IS NOT NULL")],
+            category_ids=[r["id"] for r in snap.sql("SELECT id FROM category ORDER BY id")],
+            years=[r["year"] for r in snap.sql("SELECT DISTINCT year FROM recipe WHERE year IS NOT NULL ORDER BY year")],
+            ingredients=[r["name"] for r in snap.top_ingredients(terms)],
+        )
+
+
+async def pools_from_api(client: "HttpClient", terms: Sequence[str]) -> ValuePools:
+    """Discover ids from the list endpoints of the server under test (one bootstrap request each)."""
+    async def get_json(target: str):
+        status, body = await client.get(target)
+        if status != 200:
+            raise RuntimeError(f"{target}: HTTP {status}")
+        return json.loads(body)
+
+    regions = await get_json("/api/maps/regions")
+    settlements = await get_json("/api/maps/settlements")
+    categories = await get_json("/api/recipes/categories")
+    recipes = await get_json("/api/recipes")
+    items = recipes.get("items", []) if isinstance(recipes, dict) else []
+    return ValuePools(
+        region_ids=[r["id"] for r in regions],
+        settlement_ids=[r["settlement_id"] for r in items if r.get("settlement_id") is not None] or [s["id"] for s in settlements],
+        category_ids=[c["id"] for c in categories],
+        years=sorted({r["year"] for r in items if r.get("year") is not None}),
+        ingredients=list(terms),
+    )
+
+
+# -----------------------------
+# Kérésgenerálás
+# -----------------------------
+
+class RequestMix:
+    """Random requests for the spec's endpoints: weighted endpoint choice, random filter combinations."""
+
+    def __init__(self, endpoints: Sequence[Endpoint], pools: ValuePools, mix: Dict[str, float], max_values: int = 3, seed: int = 1) -> None:
+        self.endpoints = [e for e in endpoints if mix.get(e.path, 0) > 0]
+        if not self.endpoints:
+            raise ValueError("no endpoint of the spec has a positive weight in the mix")
+        self.weights = [mix[e.path] for e in self.endpoints]
+        self.pools = pools
+        self.max_values = max_values
+        self.rng = random.Random(seed)
+
+    def _probability(self, endpoint: Endpoint, name: str) -> float:
+        key = name.lower()
+        if key == "settlementid" and endpoint.path.startswith("/api/maps"):
+            key = "settlementid_maps"
+        return PARAM_PROBABILITY.get(key, 0.25)
+
+    def next(self) -> Tuple[str, str, str]:
+        """(endpoint path, request target, filter combination label)."""
+        rng = self.rng
+        endpoint = rng.choices(self.endpoints, self.weights)[0]
+        query: List[Tuple[str, str]] = []
+        used: List[str] = []
+        for prm in endpoint.params:
+            if prm.kind == "bool":
+                continue
+            pool = self.pools.for_param(prm.name)
+            if not pool or rng.random() >= self._probability(endpoint, prm.name):
+                continue
+            n = min(len(pool), rng.randint(1, self.max_values)) if prm.array else 1
+            values = [str(v) for v in dict.fromkeys(rng.choice(pool) for _ in range(n))]
+            if prm.explode:
+                query.extend((prm.name, v) for v in values)
+            else:
+                query.append((prm.name, ",".join(values)))
+            used.append(prm.name)
+        # A bool kapcsolók (reverse) csak a hozzávaló-szűrő mellett értelmesek
+        for prm in endpoint.params:
+            if prm.kind == "bool" and "ingredients" in used and rng.random() < self._probability(endpoint, prm.name):
+                query.append((prm.name, "true"))
+                used.append(prm.name)
+        target = endpoint.path + ("?" + urlencode(query) if query else "")
+        return endpoint.path, target, ",".join(used) or "-"
+
+
+# -----------------------------
+# HTTP/1.1 kliens (keep-alive)
+# -----------------------------
+
+class HttpConnection:
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def _ensure(self) -> None:
+        if self.writer is None or self.writer.is_closing():
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+    async def get(self, target: str) -> Tuple[int, bytes]:
+        await self._ensure()
+        assert self.reader is not None and self.writer is not None
+        self.writer.write(f"GET {target} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\nAccept: application/json\r\n\r\n".encode("ascii"))
+        await self.writer.drain()
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed by server")
+        status = int(status_line.split()[1])
+        headers: Dict[str, str] = {}
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            k, _, v = line.decode("latin-1").partition(":")
+            headers[k.strip().lower()] = v.strip()
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            parts = []
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await self.reader.readline()
+                    break
+                parts.append(await self.reader.readexactly(size))
+                await self.reader.readexactly(2)
+            body = b"".join(parts)
+        elif "content-length" in headers:
+            body = await self.reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await self.reader.read()
+            self.close()
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return status, body
+
+
+class HttpClient:
+    """Fixed-size keep-alive connection pool; a failed connection is dropped and reopened on next use."""
+
+    def __init__(self, base_url: str, connections: int) -> None:
+        u = urlsplit(base_url)
+        if u.scheme != "http":
+            raise ValueError("only plain http:// targets are supported (local server)")
+        self.prefix = u.path.rstrip("/")
+        self.pool: asyncio.Queue = asyncio.Queue()
+        for _ in range(connections):
+            self.pool.put_nowait(HttpConnection(u.hostname or "localhost", u.port or 80))
+
+    async def get(self, target: str) -> Tuple[int, bytes]:
+        conn = await self.pool.get()
+        try:
+            return await conn.get(self.prefix + target)
+        except BaseException:
+            conn.close()
+            raise
+        finally:
+            self.pool.put_nowait(conn)
+
+    def close(self) -> None:
+        while not self.pool.empty():
+            self.pool.get_nowait().close()
+
+
+# -----------------------------
+# Futtatás és kiértékelés
+# -----------------------------
+
+@dataclass
+class Sample:
+    endpoint: str
+    combo: str
+    latency_ms: float
+    status: int
+    size: int
+
+
+async def run_load(
+    client: HttpClient,
+    mix: RequestMix,
+    rps: float,
+    duration: float,
+    warmup: float = 0.0,
+    poisson: bool = False,
+    timeout: float = 30.0,
+    seed: int = 1,
+) -> Tuple[List[Sample], float]:
+    """Open-loop load: request i starts at its scheduled time; latency is measured from that time."""
+    rng = random.Random(seed)
+    samples: List[Sample] = []
+    tasks = []
+    loop = asyncio.get_running_loop()
+
+    async def one(endpoint: str, target: str, combo: str, scheduled: float, record: bool) -> None:
+        try:
+            status, body = await asyncio.wait_for(client.get(target), timeout)
+            size = len(body)
+        except Exception:
+            status, size = 0, 0
+        if record:
+            samples.append(Sample(endpoint, combo, (loop.time() - scheduled) * 1000.0, status, size))
+
+    start = loop.time()
+    at = start
+    end = start + warmup + duration
+    while at < end:
+        delay = at - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        endpoint, target, combo = mix.next()
+        tasks.append(asyncio.ensure_future(one(endpoint, target, combo, at, at >= start + warmup)))
+        at += rng.expovariate(rps) if poisson else 1.0 / rps
+    await asyncio.gather(*tasks)
+    return samples, loop.time() - start - warmup
+
+
+def summarize(samples: Sequence[Sample], elapsed: float, key: str = "endpoint") -> List[Dict[str, object]]:
+    groups: Dict[str, List[Sample]] = defaultdict(list)
+    for s in samples:
+        groups[getattr(s, key)].append(s)
+    groups["ALL"] = list(samples)
+    out = []
+    for name, group in groups.items():
+        lat = np.array([s.latency_ms for s in group]) if group else np.zeros(1)
+        ok = [s for s in group if 200 <= s.status < 300]
+        p50, p95, p99 = np.percentile(lat, [50, 95, 99])
+        out.append({
+            key: name,
+            "requests": len(group),
+            "throughput_rps": round(len(ok) / elapsed, 1) if elapsed > 0 else 0.0,
+            "error_rate": round(1 - len(ok) / len(group), 4) if group else 0.0,
+            "p50_ms": round(float(p50), 2),
+            "p95_ms": round(float(p95), 2),
+            "p99_ms": round(float(p99), 2),
+            "max_ms": round(float(lat.max()), 2),
+            "avg_bytes": round(sum(s.size for s in ok) / len(ok)) if ok else 0,
+        })
+    return sorted(out, key=lambda r: (r[key] == "ALL", -int(r["requests"])))
+
+
+# -----------------------------
+# Szintetikus adat
+# -----------------------------
+
+def write_synthetic(jsonl_path: str, out_path: str, scale: int, seed: int = 7) -> int:
+    """Scale the scraped recipes `scale` times with unique urls, shuffled settlements/categories and jittered years."""
+    from jsonl_io import iter_jsonl_records, open_jsonl_writer
+
+    base = list(iter_jsonl_records(jsonl_path))
+    settlements = [o.get("settlement") for o in base if o.get("settlement")]
+    categories = [o.get("category_id") for o in base if o.get("category_id") is not None]
+    rng = random.Random(seed)
+    n = 0
+    with open_jsonl_writer(out_path) as w:
+        for i in range(scale):
+            for obj in base:
+                if i:
+                    year = obj.get("year")
+                    obj = dict(
+                        obj,
+                        url=f"{obj.get('url')}#synthetic-{i}",
+                        settlement=rng.choice(settlements) if settlements else obj.get("settlement"),
+                        category_id=rng.choice(categories) if categories else obj.get("category_id"),
+                        year=None if year is None else year + rng.randint(-3, 3),
+                    )
+                w.write(json.dumps(obj, ensure_ascii=False) + "\n")
+                n += 1
+    return n
+
+
+def _parse_mix(items: Optional[Sequence[str]]) -> Dict[str, float]:
+    if not items:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for item in items:
+        path, _, weight = item.rpartition("=")
+        if not path:
+            raise SystemExit(f"--mix expects PATH=WEIGHT, got {item!r}")
+        mix[path] = float(weight)
+    return mix
+
+
+def _print_table(rows: Sequence[Dict[str, object]], key: str) -> None:
+    width = max(len(str(r[key])) for r in rows)
+    print(f"  {'':<{width}}  {'kérés':>7} {'req/s':>8} {'hiba':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'átl. B':>9}")
+    for r in rows:
+        print(
+            f"  {str(r[key]):<{width}}  {r['requests']:>7} {r['throughput_rps']:>8} {float(r['error_rate']) * 100:>5.1f}% "
+            f"{r['p50_ms']:>8} {r['p95_ms']:>8} {r['p99_ms']:>8} {r['avg_bytes']:>9,}"
+        )
+
+
+async def _run(args: argparse.Namespace) -> int:
+    server_url, endpoints = load_spec(args.spec)
+    base_url = args.base_url or server_url or "http://localhost:3000"
+    client = HttpClient(base_url, args.concurrency)
+    try:
+        if args.snapshot:
+            pools = pools_from_snapshot(args.snapshot)
+            pools.ingredients = list(args.terms) if args.terms else pools.ingredients
+        else:
+            pools = await pools_from_api(client, args.terms or DEFAULT_TERMS)
+        print(
+            f"{base_url}: {len(endpoints)} GET végpont a specből; értékkészlet: {len(set(pools.region_ids))} régió, "
+            f"{len(set(pools.settlement_ids))} település, {len(pools.category_ids)} kategória, {len(pools.years)} év, {len(pools.ingredients)} hozzávaló"
+        )
+        mix = RequestMix(endpoints, pools, _parse_mix(args.mix), max_values=args.max_values, seed=args.seed)
+        print(f"cél {args.rps} req/s, {args.duration} s (+{args.warmup} s bemelegítés), {args.concurrency} kapcsolat")
+        samples, elapsed = await run_load(client, mix, args.rps, args.duration, args.warmup, args.poisson, args.timeout, args.seed)
+    finally:
+        client.close()
+
+    by_endpoint = summarize(samples, elapsed)
+    _print_table(by_endpoint, "endpoint")
+    by_combo = summarize([s for s in samples if s.endpoint == "/api/recipes"], elapsed, key="combo")
+    if args.by_filters:
+        print("/api/recipes szűrőkombinációnként:")
+        _print_table(by_combo, "combo")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "base_url": base_url,
+                "target_rps": args.rps,
+                "duration_s": round(elapsed, 3),
+                "concurrency": args.concurrency,
+                "endpoints": by_endpoint,
+                "recipe_filters": by_combo,
+            }, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Load generator for the recipe and map API (driven by the OpenAPI spec)")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    pr = sub.add_parser("run", help="Replay a random filter mix at a target request rate")
+    pr.add_argument("--spec", type=str, default=DEFAULT_SPEC, help="OpenAPI document (server/docs/openapi.yaml)")
+    pr.add_argument("--base-url", type=str, default=None, help="Default: the spec's first server url")
+    pr.add_argument("--snapshot", type=str, default=None, help="Take parameter values from this SQLite snapshot instead of the server")
+    pr.add_argument("--terms", nargs="+", default=None, help="Ingredient filter terms")
+    pr.add_argument("--rps", type=float, default=100.0, help="Target request rate")
+    pr.add_argument("--duration", type=float, default=30.0, help="Measured seconds")
+    pr.add_argument("--warmup", type=float, default=5.0, help="Unmeasured seconds before the measurement")
+    pr.add_argument("--concurrency", type=int, default=32, help="Keep-alive connections")
+    pr.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout (counts as an error)")
+    pr.add_argument("--poisson", action="store_true", help="Exponential inter-arrival times instead of a fixed interval")
+    pr.add_argument("--mix", nargs="+", default=None, metavar="PATH=WEIGHT", help="Endpoint weights (default: recipes 70, settlements 15, regions 10, categories 5)")
+    pr.add_argument("--max-values", type=int, default=3, help="Most values per array filter")
+    pr.add_argument("--by-filters", action="store_true", help="Also print /api/recipes per filter combination")
+    pr.add_argument("--seed", type=int, default=1)
+    pr.add_argument("--json", type=str, default=None, help="Write the results as JSON")
+    ps = sub.add_parser("synth", help="Synthetic recipe JSONL for loading a local Postgres (insert_recipes --jsonl)")
+    ps.add_argument("--jsonl", type=str, default=os.path.join(os.path.dirname(__file__), "receptek.jsonl"))
+    ps.add_argument("--scale", type=int, default=50, help="Copies of the scraped recipes")
+    ps.add_argument("--out", type=str, default="synthetic.jsonl.zst")
+    args = p.parse_args(argv)
+
+    if args.cmd == "synth":
+        t0 = time.perf_counter()
+        n = write_synthetic(args.jsonl, args.out, args.scale)
+        print(f"{n} szintetikus recept -> {args.out} ({os.path.getsize(args.out):,} B, {time.perf_counter() - t0:.2f} s)")
+        return 0
+    return asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,255 @@
+"""
+ONNX Runtime alapú embedding backend az insert_recipes számára.
+
+Ugyanazt a modellt (sentence-transformers/all-MiniLM-L6-v2) futtatja ONNX-ba
+exportálva, opcionálisan int8 kvantálva, PyTorch nélkül. Mean pooling + L2
+normalizálás után 384 dimenziós vektorokat ad, így a RecipeEmbedding sorok
+kompatibilisek maradnak a sentence-transformers kimenetével.
+
+Használat (példa):
+    python onnx_embed.py export --out models/all-MiniLM-L6-v2-onnx --quantize
+    python onnx_embed.py parity --onnx-dir models/all-MiniLM-L6-v2-onnx --jsonl receptek.jsonl
+    python onnx_embed.py bench --onnx-dir models/all-MiniLM-L6-v2-onnx --jsonl receptek.jsonl
+    python insert_recipes.py --jsonl receptek.jsonl --embed onnx --onnx-dir models/all-MiniLM-L6-v2-onnx
+
+Az export lépéshez torch + transformers kell, a futtatáshoz csak
+onnxruntime + tokenizers + numpy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from typing import List, Optional
+
+import numpy as np
+
+
+DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_ONNX_DIR = os.path.join(os.path.dirname(__file__), "models", "all-MiniLM-L6-v2-onnx")
+MODEL_FILE = "model.onnx"
+QUANTIZED_MODEL_FILE = "model.int8.onnx"
+# all-MiniLM-L6-v2 max_seq_length
+MAX_LENGTH = 256
+# parity: legkisebb elfogadott koszinusz a sentence-transformers vektorokhoz
+MIN_COS_FP32 = 0.9999
+MIN_COS_INT8 = 0.98
+
+
+# -----------------------------
+# Futtatás
+# -----------------------------
+
+
+class OnnxEmbedder:
+    """Drop-in for the subset of SentenceTransformer used by insert_recipes (`encode`)."""
+
+    def __init__(self, onnx_dir: str, quantized: bool = False, threads: Optional[int] = None) -> None:
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        model_path = os.path.join(onnx_dir, QUANTIZED_MODEL_FILE if quantized else MODEL_FILE)
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"{model_path} nem található; futtasd: python onnx_embed.py export --out {onnx_dir}"
+                + (" --quantize" if quantized else "")
+            )
+        self.tokenizer = Tokenizer.from_file(os.path.join(onnx_dir, "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=MAX_LENGTH)
+        self.tokenizer.enable_padding()
+
+        opts = ort.SessionOptions()
+        if threads:
+            opts.intra_op_num_threads = threads
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(model_path, opts, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+    def encode(self, texts: List[str], normalize_embeddings: bool = True, batch_size: int = 64) -> np.ndarray:
+        out = np.empty((len(texts), 384), dtype=np.float32)
+        for i in range(0, len(texts), batch_size):
+            out[i:i + batch_size] = self._encode_batch(texts[i:i + batch_size], normalize_embeddings)
+        return out
+
+    def _encode_batch(self, texts: List[str], normalize: bool) -> np.ndarray:
+        enc = self.tokenizer.encode_batch(texts)
+        input_ids = np.array([e.ids for e in enc], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in enc], dtype=np.int64)
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.array([e.type_ids for e in enc], dtype=np.int64)
+        token_emb = self.session.run(None, feeds)[0]
+        # Mean pooling a nem-padding tokenek felett (mint a sentence-transformers Pooling rétege)
+        mask = attention_mask[:, :, None].astype(np.float32)
+        summed = (token_emb * mask).sum(axis=1)
+        pooled = summed / np.clip(mask.sum(axis=1), 1e-9, None)
+        if normalize:
+            pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+        return pooled
+
+
+def load_onnx_model(onnx_dir: str = DEFAULT_ONNX_DIR, quantized: bool = False) -> OnnxEmbedder:
+    return OnnxEmbedder(onnx_dir, quantized=quantized)
+
+
+# -----------------------------
+# Export
+# -----------------------------
+
+
+def export_onnx(model_name: str, out_dir: str, quantize: bool = False, opset: int = 14) -> None:
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+
+    os.makedirs(out_dir, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModel.from_pretrained(model_name)
+    model.eval()
+    tokenizer.save_pretrained(out_dir)
+
+    dummy = tokenizer(["Bableves füstölt csülökkel"], return_tensors="pt")
+    names = ["input_ids", "attention_mask", "token_type_ids"]
+    dynamic = {n: {0: "batch", 1: "seq"} for n in names}
+    dynamic["last_hidden_state"] = {0: "batch", 1: "seq"}
+    model_path = os.path.join(out_dir, MODEL_FILE)
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (dummy["input_ids"], dummy["attention_mask"], dummy["token_type_ids"]),
+            model_path,
+            input_names=names,
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic,
+            opset_version=opset,
+        )
+    print(f"ONNX modell mentve: {model_path}")
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        q_path = os.path.join(out_dir, QUANTIZED_MODEL_FILE)
+        quantize_dynamic(model_path, q_path, weight_type=QuantType.QInt8)
+        print(f"int8 modell mentve: {q_path}")
+
+
+# -----------------------------
+# Paritás és benchmark
+# -----------------------------
+
+
+def _sample_texts(jsonl_path: str, limit: int) -> List[str]:
+    from insert_recipes import normalize_spaces, read_jsonl
+
+    texts: List[str] = []
+    for (_, title, _, _, ingredients_text, _) in read_jsonl(jsonl_path):
+        texts.append(normalize_spaces(f"{title}. {ingredients_text}"))
+        if len(texts) >= limit:
+            break
+    return texts
+
+
+def parity(model_name: str, onnx_dir: str, quantized: bool, jsonl_path: str, limit: int, min_cos: float) -> bool:
+    """Compare ONNX vectors against sentence-transformers on real recipe texts."""
+    from insert_recipes import load_st_model
+
+    texts = _sample_texts(jsonl_path, limit)
+    ref = load_st_model(model_name).encode(texts, normalize_embeddings=True, batch_size=64)
+    got = load_onnx_model(onnx_dir, quantized).encode(texts, normalize_embeddings=True, batch_size=64)
+    cos = (ref * got).sum(axis=1)
+    norms = np.linalg.norm(got, axis=1)
+    # Ugyanaz-e a legközelebbi szomszéd a mintán belül
+    nn_ref = np.argsort(-(ref @ ref.T), axis=1)[:, 1]
+    nn_got = np.argsort(-(got @ got.T), axis=1)[:, 1]
+    ok = bool(got.shape == ref.shape and cos.min() >= min_cos and np.allclose(norms, 1.0, atol=1e-4))
+    print(f"Minta: {len(texts)} szöveg, dim={got.shape[1]}")
+    print(f"Koszinusz ST vs ONNX: min={cos.min():.5f} átlag={cos.mean():.5f}")
+    print(f"Normák: min={norms.min():.5f} max={norms.max():.5f}")
+    print(f"Azonos legközelebbi szomszéd: {100.0 * (nn_ref == nn_got).mean():.1f}%")
+    print("OK" if ok else f"HIBA: min koszinusz < {min_cos}")
+    return ok
+
+
+def _bench_one(backend: str, model_name: str, onnx_dir: str, jsonl_path: str, limit: int) -> dict:
+    t0 = time.perf_counter()
+    if backend == "st":
+        from insert_recipes import load_st_model
+        model = load_st_model(model_name)
+    else:
+        model = load_onnx_model(onnx_dir, quantized=(backend == "onnx-int8"))
+    startup = time.perf_counter() - t0
+    texts = _sample_texts(jsonl_path, limit)
+    model.encode(texts[:64], normalize_embeddings=True, batch_size=64)  # bemelegítés
+    t1 = time.perf_counter()
+    model.encode(texts, normalize_embeddings=True, batch_size=64)
+    dt = time.perf_counter() - t1
+    return {
+        "backend": backend,
+        "startup_s": round(startup, 3),
+        "texts": len(texts),
+        "texts_per_s": round(len(texts) / dt, 1) if dt > 0 else None,
+        # Linuxon ru_maxrss KB-ban
+        "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0, 1),
+    }
+
+
+def bench(model_name: str, onnx_dir: str, jsonl_path: str, limit: int, backends: List[str]) -> List[dict]:
+    """Run every backend in a fresh process so startup time and peak RSS are not shared."""
+    results = []
+    for backend in backends:
+        cmd = [
+            sys.executable, os.path.abspath(__file__), "_bench-one",
+            "--backend", backend, "--st-model", model_name, "--onnx-dir", onnx_dir,
+            "--jsonl", jsonl_path, "--limit", str(limit),
+        ]
+        out = subprocess.run(cmd, check=True, capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    print(f"{'backend':<10} {'indulás s':>10} {'szöveg/s':>10} {'max RSS MB':>11}")
+    for r in results:
+        print(f"{r['backend']:<10} {r['startup_s']:>10} {r['texts_per_s']:>10} {r['max_rss_mb']:>11}")
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="ONNX embedding backend (export / parity / bench)")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    pe = sub.add_parser("export", help="Export the model to ONNX (needs torch + transformers)")
+    pe.add_argument("--st-model", type=str, default=DEFAULT_MODEL)
+    pe.add_argument("--out", type=str, default=DEFAULT_ONNX_DIR)
+    pe.add_argument("--quantize", action="store_true", help="Also write a dynamic int8 quantized model")
+
+    for name in ("parity", "bench", "_bench-one"):
+        sp = sub.add_parser(name)
+        sp.add_argument("--st-model", type=str, default=DEFAULT_MODEL)
+        sp.add_argument("--onnx-dir", type=str, default=DEFAULT_ONNX_DIR)
+        sp.add_argument("--jsonl", type=str, default=os.path.join(os.path.dirname(__file__), "receptek.jsonl"))
+        sp.add_argument("--limit", type=int, default=500 if name == "parity" else 2000)
+        if name == "parity":
+            sp.add_argument("--quantized", action="store_true")
+            sp.add_argument("--min-cos", type=float, default=None, help="Default: 0.9999 fp32, 0.98 int8")
+        elif name == "bench":
+            sp.add_argument("--backends", nargs="+", default=["st", "onnx", "onnx-int8"])
+        else:
+            sp.add_argument("--backend", choices=["st", "onnx", "onnx-int8"], required=True)
+    args = p.parse_args(argv)
+
+    if args.cmd == "export":
+        export_onnx(args.st_model, args.out, quantize=args.quantize)
+        return 0
+    if args.cmd == "parity":
+        min_cos = args.min_cos if args.min_cos is not None else (MIN_COS_INT8 if args.quantized else MIN_COS_FP32)
+        return 0 if parity(args.st_model, args.onnx_dir, args.quantized, args.jsonl, args.limit, min_cos) else 1
+    if args.cmd == "bench":
+        bench(args.st_model, args.onnx_dir, args.jsonl, args.limit, args.backends)
+        return 0
+    print(json.dumps(_bench_one(args.backend, args.st_model, args.onnx_dir, args.jsonl, args.limit)))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,13 +6,16 @@ import os
 import re
 import sys
 import time
-import unicodedata
 from dataclasses import dataclass, asdict
 from typing import Iterable, List, Optional, Tuple, Dict, Set
 
 import requests
 from bs4 import BeautifulSoup, Tag
 
+from jsonl_io import iter_jsonl_records, open_jsonl_writer
+from settlement_resolver import SettlementResolver
+from textnorm import normalize_text
+
 
 BASE_URL = "https://www.izorzok.hu"
 LISTING_URL = f"{BASE_URL}/kategoria/receptek/"
@@ -23,18 +26,6 @@ LISTING_URL = f"{BASE_URL}/kategoria/receptek/"
 # -----------------------------
 
 
-def strip_accents(s: str) -> str:
-    """Remove accents for accent-insensitive matching."""
-    if not s:
-        return s
-    nfkd_form = unicodedata.normalize("NFKD", s)
-    return "".join([c for c in nfkd_form if not unicodedata.combining(c)])
-
-
-def normalize_text(s: str) -> str:
-    return strip_accents(s or "").lower().strip()
-
-
 def clean_text(s: str) -> str:
     return re.sub(r"\s+", " ", (s or "").strip())
 
@@ -445,6 +436,8 @@ def extract_settlement(
     soup: BeautifulSoup,
     content_root: Optional[Tag],
     settlements: List[str],
+    resolver: Optional[SettlementResolver] = None,
+    fuzzy_min_confidence: float = 0.85,
 ) -> Optional[str]:
     if not settlements:
         return None
@@ -474,6 +467,15 @@ def extract_settlement(
     for norm_name, orig in norm_map.items():
         if norm_name in blob:
             return orig
+    # Fallback: typo-tolerant match of capitalized words (title/taxonomies first, then content)
+    if resolver is not None:
+        head = texts[:-1] if content_root is not None else texts
+        body = texts[-1:] if content_root is not None else []
+        for part in (head, body):
+            m = resolver.find_in_text(" \n ".join(part), min_confidence=fuzzy_min_confidence)
+            if m is not None:
+                print(f"  ~ Település (közelítő): {m.query!r} -> {m.name!r} (bizalom {m.confidence:.2f})")
+                return m.name
     return None
 
 
@@ -551,7 +553,14 @@ def extract_category_id(soup: BeautifulSoup) -> Optional[int]:
     return None
 
 
-def parse_recipe(session: requests.Session, url: str, settlements: List[str], delay: float = 0.5) -> Optional[Recipe]:
+def parse_recipe(
+    session: requests.Session,
+    url: str,
+    settlements: List[str],
+    delay: float = 0.5,
+    resolver: Optional[SettlementResolver] = None,
+    fuzzy_min_confidence: float = 0.85,
+) -> Optional[Recipe]:
     html = fetch_html(session, url)
     if not html:
         return None
@@ -575,7 +584,7 @@ def parse_recipe(session: requests.Session, url: str, settlements: List[str], de
     year = extract_year(soup, content_root)
 
     # Settlement
-    settlement = extract_settlement(soup, content_root, settlements)
+    settlement = extract_settlement(soup, content_root, settlements, resolver, fuzzy_min_confidence)
     # Category
     category_id = extract_category_id(soup)
 
@@ -583,9 +592,16 @@ def parse_recipe(session: requests.Session, url: str, settlements: List[str], de
     return Recipe(url=url, title=title, year=year, settlement=settlement, ingredients=ingredients, category_id=category_id)
 
 
-def iter_listing_pages(session: requests.Session, start_page: int, end_page: Optional[int]) -> Iterable[Tuple[int, str]]:
+def iter_listing_pages(
+    session: requests.Session,
+    start_page: int,
+    end_page: Optional[int],
+    listing_url: str = LISTING_URL,
+) -> Iterable[Tuple[int, str]]:
+    """Pages of a paginated listing: the recipe listing, or a settlement's archive."""
+    listing_url = listing_url if listing_url.endswith("/") else listing_url + "/"
     # Fetch first page to detect max if needed
-    first_url = LISTING_URL if start_page <= 1 else f"{LISTING_URL}page/{start_page}/"
+    first_url = listing_url if start_page <= 1 else f"{listing_url}page/{start_page}/"
     first_html = fetch_html(session, first_url)
     if not first_html:
         return
@@ -600,24 +616,77 @@ def iter_listing_pages(session: requests.Session, start_page: int, end_page: Opt
 
     # Remaining pages
     for p in range(start_page + 1, (end_page or 1) + 1):
-        url = f"{LISTING_URL}page/{p}/"
+        url = f"{listing_url}page/{p}/"
         html = fetch_html(session, url)
         if html:
             yield (p, html)
 
 
-def save_jsonl(path: str, rows: Iterable[Recipe]) -> None:
-    with open(path, "w", encoding="utf-8") as f:
+def read_known_urls(path: str) -> Set[str]:
+    """URLs already present in a previously written JSONL file."""
+    known: Set[str] = set()
+    try:
+        for obj in iter_jsonl_records(path):
+            known.add(obj.get("url"))
+    except FileNotFoundError:
+        pass
+    return known
+
+
+def collect_changed_settlement_links(
+    session: requests.Session,
+    counts_path: str,
+    known: Set[str],
+    delay: float,
+) -> Tuple[List[str], Dict[str, str], Dict[str, dict]]:
+    """Recipe links from the archives of settlements whose /helyszinek/ count changed.
+
+    Returns (new links, link -> settlement name, current counts). Archive pages are
+    newest first, so paging stops at the first page without unknown links.
+    """
+    from telepulesek import HELYSZINEK_URL, changed_settlements, load_counts, scrape_telepules_counts
+
+    counts = scrape_telepules_counts(HELYSZINEK_URL, session)
+    changed = changed_settlements(load_counts(counts_path), counts) if counts else []
+    print(f"Helyszínek: {len(counts)} település, {len(changed)} változott szám")
+    links: List[str] = []
+    hints: Dict[str, str] = {}
+    for name, old, new, url in changed:
+        found = pages = 0
+        for _, html in iter_listing_pages(session, 1, None, url):
+            pages += 1
+            fresh = [l for l in parse_listing_links(html) if l not in known and l not in hints]
+            time.sleep(delay)
+            if not fresh:
+                break
+            for link in fresh:
+                hints[link] = name
+            links.extend(fresh)
+            found += len(fresh)
+        if not pages:
+            # Az archívum nem tölthető le: a következő frissítés újrapróbálja
+            counts[name]["count"] = None
+        print(f"- {name}: {old} -> {new}, {found} új recept link")
+    return links, hints, counts
+
+
+def recipe_json_line(r: Recipe) -> str:
+    return json.dumps(asdict(r), ensure_ascii=False) + "\n"
+
+
+def save_jsonl(path: str, rows: Iterable[Recipe], append: bool = False) -> None:
+    with open_jsonl_writer(path, append) as f:
         for r in rows:
-            obj = asdict(r)
-            f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+            f.write(recipe_json_line(r))
 
 
-def save_csv(path: str, rows: Iterable[Recipe]) -> None:
+def save_csv(path: str, rows: Iterable[Recipe], append: bool = False) -> None:
     rows = list(rows)
-    with open(path, "w", encoding="utf-8", newline="") as f:
+    header = not (append and os.path.exists(path) and os.path.getsize(path) > 0)
+    with open(path, "a" if append else "w", encoding="utf-8", newline="") as f:
         w = csv.writer(f)
-        w.writerow(["url", "title", "year", "settlement", "ingredients", "category_id"])
+        if header:
+            w.writerow(["url", "title", "year", "settlement", "ingredients", "category_id"])
         for r in rows:
             ingredients_str = normalize_spaces(" | ".join((r.ingredients or [])))
             w.writerow([
@@ -630,14 +699,22 @@ def save_csv(path: str, rows: Iterable[Recipe]) -> None:
             ])
 
 
+def save_parquet(path: str, rows: Iterable[Recipe], append: bool = False) -> None:
+    # pyarrow csak Parquet kimenetnél kell
+    from recipe_parquet import save_parquet as write_parquet
+
+    write_parquet(path, rows, append=append)
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser(description="Ízőrző receptek scraper")
     parser.add_argument("--start-page", type=int, default=1, help="Kezdő oldalszám")
     parser.add_argument("--end-page", type=int, default=None, help="Utolsó oldalszám (auto, ha nincs megadva)")
     parser.add_argument("--delay", type=float, default=0.8, help="Késleltetés kérdések között (másodperc)")
     parser.add_argument("--retries", type=int, default=3, help="Újrapróbálkozások száma")
-    parser.add_argument("--out-json", type=str, default="receptek.jsonl", help="JSONL kimeneti fájl")
+    parser.add_argument("--out-json", type=str, default="receptek.jsonl", help="JSONL kimeneti fájl (.gz / .zst kiterjesztéssel tömörítve)")
     parser.add_argument("--out-csv", type=str, default="receptek.csv", help="CSV kimeneti fájl")
+    parser.add_argument("--out-parquet", type=str, default=None, help="Parquet kimeneti fájl (oszlopos, lásd recipe_parquet.py)")
     parser.add_argument("--single-url", type=str, default=None, help="Csak egy megadott recept URL feldolgozása")
     parser.add_argument(
         "--settlement-list",
@@ -645,16 +722,59 @@ def main(argv: Optional[List[str]] = None) -> int:
         default=os.path.join(os.path.dirname(__file__), "telepulesek_lista.txt"),
         help="Településnév-lista (egyezéshez)",
     )
+    parser.add_argument(
+        "--refresh-counts",
+        type=str,
+        default=None,
+        help="Állapotfájl (pl. telepules_counts.json): csak a változott számú települések archívumát járja be, "
+        "és a kimenetekhez hozzáfűz",
+    )
+    parser.add_argument(
+        "--counts-out",
+        type=str,
+        default="telepules_counts.json",
+        help="Teljes scrape után ide kerülnek a /helyszinek/ számai, a későbbi --refresh-counts kiindulópontja "
+        "(üres szöveg: nem menti)",
+    )
+    parser.add_argument("--stream-dsn", type=str, default=None, help="Scrape közben közvetlen betöltés ebbe a Postgres DSN-be")
+    parser.add_argument("--stream-embed", choices=["none", "st", "onnx"], default="none", help="Embedding a stream betöltésben")
+    parser.add_argument("--stream-batch-size", type=int, default=50, help="Receptek kötegenként (és commitonként)")
+    parser.add_argument("--stream-max-wait", type=float, default=2.0, help="Ennyi másodperc után a félig teli köteg is commitolódik")
+    parser.add_argument("--stream-queue", type=int, default=200, help="A sor mérete; tele sor lassítja a crawlert")
+    parser.add_argument("--stream-changes-out", type=str, default=None, help="A stream betöltés változáskészlete JSON-ként (hiba esetén is)")
+    parser.add_argument("--stream-refresh-aggregates", action="store_true", help="A végén az érintett régiók összesítőinek frissítése")
+    parser.add_argument("--stream-snapshot", type=str, default=None, help="A végén ennek az offline SQLite pillanatképnek a frissítése")
+    parser.add_argument(
+        "--fuzzy-min-confidence",
+        type=float,
+        default=0.85,
+        help="Elírás-tűrő településegyezés minimális bizalma (1 felett kikapcsolva)",
+    )
     args = parser.parse_args(argv)
 
     settlements = read_settlements(args.settlement_list)
+    resolver = SettlementResolver(settlements) if args.fuzzy_min_confidence <= 1 else None
     session = make_session()
 
     all_links: List[str] = []
-    if args.single_url:
+    settlement_hints: Dict[str, str] = {}
+    counts: Dict[str, dict] = {}
+    if args.refresh_counts:
+        known = read_known_urls(args.out_json) if args.out_json else set()
+        all_links, settlement_hints, counts = collect_changed_settlement_links(session, args.refresh_counts, known, args.delay)
+        if not counts:
+            print("A helyszínek oldal nem tölthető le, nincs frissítés.")
+            return 1
+        print(f"Új recept linkek: {len(all_links)}")
+    elif args.single_url:
         all_links = [args.single_url]
         print(f"Egyetlen recept feldolgozása: {args.single_url}")
     else:
+        # Teljes bejárásnál a számok a listázás előttiek: ami közben jelenik meg, azt a következő frissítés hozza
+        if args.counts_out and args.start_page <= 1 and args.end_page is None:
+            from telepulesek import HELYSZINEK_URL, scrape_telepules_counts
+
+            counts = scrape_telepules_counts(HELYSZINEK_URL, session)
         print(f"Listing beolvasása: {LISTING_URL}")
         # fasz
         for page_num, html in iter_listing_pages(session, args.start_page, args.end_page):
@@ -668,20 +788,94 @@ def main(argv: Optional[List[str]] = None) -> int:
         all_links = unique(all_links)
         print(f"Összes egyedi recept link: {len(all_links)}")
 
+    # Stream mód: a receptek egyenként mennek a betöltőbe, a JSONL menet közben íródik
+    # Megszakításnál és hibánál is lezárjuk a betöltőt (félkész köteg) és a JSONL-t (zstd keretindex)
+    loader = None
+    jsonl_out = None
     recipes: List[Recipe] = []
-    for i, url in enumerate(all_links, 1):
-        print(f"[{i}/{len(all_links)}] Recept: {url}")
-        recipe = parse_recipe(session, url, settlements, delay=args.delay)
-        if recipe:
-            recipes.append(recipe)
+    failed = 0
+    crawl_ok = False
+    try:
+        if args.stream_dsn:
+            from stream_load import open_stream_loader
+
+            loader = open_stream_loader(args)
+            if args.out_json:
+                jsonl_out = open_jsonl_writer(args.out_json, append=bool(args.refresh_counts))
+
+        for i, url in enumerate(all_links, 1):
+            print(f"[{i}/{len(all_links)}] Recept: {url}")
+            recipe = parse_recipe(session, url, settlements, delay=args.delay, resolver=resolver, fuzzy_min_confidence=args.fuzzy_min_confidence)
+            if recipe:
+                # Az archívumból tudjuk a települést, ha az oldalból nem sikerült kinyerni
+                if recipe.settlement is None and url in settlement_hints:
+                    recipe.settlement = settlement_hints[url]
+                recipes.append(recipe)
+                if loader is not None:
+                    loader.put(recipe)
+                if jsonl_out is not None:
+                    jsonl_out.write(recipe_json_line(recipe))
+                    jsonl_out.flush()
+            elif url in settlement_hints and settlement_hints[url] in counts:
+                # Sikertelen letöltés: a következő frissítés újra bejárja ezt a települést
+                counts[settlement_hints[url]]["count"] = None
+            else:
+                failed += 1
+        crawl_ok = True
+    finally:
+        if jsonl_out is not None:
+            jsonl_out.close()
+        if loader is not None:
+            from stream_load import finish_stream_loader
+
+            # Megszakadt bejárás után csak a köteg és a változáskészlet mentése; a lezárás hibája
+            # ilyenkor csak naplózva, hogy ne takarja el az eredeti kivételt
+            try:
+                result = finish_stream_loader(loader, args, post_load=crawl_ok)
+            except Exception as e:
+                if crawl_ok:
+                    raise
+                print(f"Stream betöltő lezárása sikertelen: {e}", file=sys.stderr)
+            else:
+                print(
+                    f"Stream betöltés: {result['rows']} sor, {result['recipes']} recept, {result['batches']} köteg, "
+                    f"késleltetés átlag {result['lag_avg_s']} s / max {result['lag_max_s']} s, "
+                    f"visszanyomás {result['backpressure_s']} s"
+                )
+                if result.get("unresolved_settlements"):
+                    print(f"Ismeretlen települések: {', '.join(result['unresolved_settlements'])}")
+                if args.stream_changes_out:
+                    print(f"Változáskészlet mentve: {args.stream_changes_out}")
+                if "aggregates" in result:
+                    print(f"Összesítők frissítve ({result['aggregates']['seconds']} s), régiók: {result['aggregates']['regions']}")
+                if "snapshot" in result:
+                    print(f"Pillanatkép frissítve: {args.stream_snapshot} ({result['snapshot']['seconds']} s)")
 
     # MentĂ©s
-    if args.out_json:
-        save_jsonl(args.out_json, recipes)
+    if args.out_json and jsonl_out is None:
+        save_jsonl(args.out_json, recipes, append=bool(args.refresh_counts))
         print(f"JSONL mentve: {args.out_json}")
     if args.out_csv:
-        save_csv(args.out_csv, recipes)
+        save_csv(args.out_csv, recipes, append=bool(args.refresh_counts))
         print(f"CSV mentve: {args.out_csv}")
+    if args.out_parquet:
+        save_parquet(args.out_parquet, recipes, append=bool(args.refresh_counts))
+        print(f"Parquet mentve: {args.out_parquet}")
+    # Az új számok csak a sikeres mentés után kerülnek az állapotfájlba
+    if args.refresh_counts:
+        from telepulesek import save_counts
+
+        save_counts(counts, args.refresh_counts)
+        print(f"Településszámok mentve: {args.refresh_counts}")
+    elif counts:
+        # Kiindulópont a --refresh-counts-hoz; hiányzó recept mellett nem tudnánk, melyik településé
+        if failed:
+            print(f"{failed} recept nem tölthető le, a településszámok nem kerülnek mentésre.")
+        else:
+            from telepulesek import save_counts
+
+            save_counts(counts, args.counts_out)
+            print(f"Településszámok mentve: {args.counts_out}")
 
     print("Kész.")
     return 0
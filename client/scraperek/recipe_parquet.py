@@ -0,0 +1,269 @@
+"""
+Oszlopos (Arrow / Parquet) receptkimenet és -bemenet.
+
+A JSONL soronként tárolja a recepteket, a CSV pedig egyetlen szövegbe
+lapítja a hozzávalókat, így minden elemzés mindent újra feldolgoz. A
+Parquet fájlban a hozzávalók natív list<string> oszlop, a település és a
+kategória szótárkódolt (kevés különböző érték, sok ismétlés), a tömörítés
+zstd. Az oszlopok külön olvashatók (pl. csak settlement + year), az
+olvasás memory-mappel történik, így a pufferek másolás nélkül kerülnek az
+Arrow táblába.
+
+A betöltő (insert_recipes --parquet) sorcsoportonként olvas, a normalizálást
+(szóközök, " | " összefűzés) Arrow compute függvényekkel, vektorosan végzi;
+a --workers sorcsoport-tartományokra osztja a fájlt.
+
+Használat (példa):
+    python receptek_scraper.py --out-parquet receptek.parquet
+    python recipe_parquet.py convert receptek.jsonl receptek.parquet
+    python insert_recipes.py --parquet receptek.parquet --workers 4
+    python recipe_parquet.py bench --jsonl receptek.jsonl --scale 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict, is_dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+ROW_GROUP_ROWS = 5000
+
+COLUMNS = ("url", "title", "year", "settlement", "ingredients", "category_id")
+
+# Python str.split()/re \s szerinti szóközök RE2 alakban (az NBSP is ide tartozik)
+_WS_RE2 = r"[\s\x{0B}\x{1C}-\x{1F}\x{85}\p{Z}]+"
+
+
+def recipe_schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ("url", pa.string()),
+        ("title", pa.string()),
+        ("year", pa.int16()),
+        ("settlement", pa.dictionary(pa.int32(), pa.string())),
+        ("ingredients", pa.list_(pa.string())),
+        ("category_id", pa.dictionary(pa.int16(), pa.int32())),
+    ])
+
+
+def recipes_to_table(recipes: Iterable[object]):
+    """Arrow table from Recipe dataclasses or JSONL dicts."""
+    import pyarrow as pa
+
+    cols: Dict[str, list] = {c: [] for c in COLUMNS}
+    for r in recipes:
+        obj = asdict(r) if is_dataclass(r) else r
+        for c in COLUMNS:
+            cols[c].append(obj.get(c))
+    schema = recipe_schema()
+    arrays = []
+    for field in schema:
+        if pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(cols[field.name], field.type.value_type).dictionary_encode().cast(field.type))
+        else:
+            arrays.append(pa.array(cols[field.name], field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def save_parquet(path: str, recipes: Iterable[object], append: bool = False, row_group_size: int = ROW_GROUP_ROWS) -> int:
+    """Write recipes as zstd Parquet; append rewrites the file with the old rows first."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = recipes_to_table(recipes)
+    if append and os.path.exists(path):
+        # A Parquetnek nincs hozzáfűzés művelete: régi sorok + új sorok egy új fájlba
+        table = pa.concat_tables([_conform(pq.read_table(path, memory_map=True), table.schema), table])
+    pq.write_table(table, path, compression="zstd", row_group_size=row_group_size)
+    return table.num_rows
+
+
+def _conform(table, schema):
+    # Parquetből a szótárkódolt egész oszlop sima int32-ként jön vissza
+    import pyarrow as pa
+
+    cols = []
+    for field in schema:
+        col = table[field.name]
+        if pa.types.is_dictionary(field.type) and not pa.types.is_dictionary(col.type):
+            col = col.dictionary_encode()
+        cols.append(col.cast(field.type))
+    return pa.Table.from_arrays(cols, schema=schema)
+
+
+def read_recipe_table(path: str, columns: Optional[Sequence[str]] = None):
+    """Memory-mapped read of the selected columns (analytics entry point)."""
+    import pyarrow.parquet as pq
+
+    return pq.read_table(path, columns=list(columns) if columns else None, memory_map=True)
+
+
+def count_rows(path: str, start: int = 0, end: Optional[int] = None) -> int:
+    import pyarrow.parquet as pq
+
+    md = pq.ParquetFile(path).metadata
+    end = md.num_row_groups if end is None else end
+    return sum(md.row_group(i).num_rows for i in range(start, end))
+
+
+def parquet_shards(path: str, n: int) -> List[Tuple[int, int]]:
+    """Split a Parquet file into at most `n` contiguous row-group ranges of similar row counts."""
+    import pyarrow.parquet as pq
+
+    md = pq.ParquetFile(path).metadata
+    groups = md.num_row_groups
+    if groups == 0:
+        return [(0, 0)]
+    total = md.num_rows
+    bounds = [0]
+    seen = 0
+    for i in range(groups):
+        # Határ ott, ahol a sorcsoport közepe átlépi a következő n-ed részt
+        if seen + md.row_group(i).num_rows / 2 >= total * len(bounds) / n and i > bounds[-1]:
+            bounds.append(i)
+        seen += md.row_group(i).num_rows
+    bounds.append(groups)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _normalize(arr):
+    """Vectorized normalize_spaces(): collapse whitespace runs, trim."""
+    import pyarrow.compute as pc
+
+    return pc.utf8_trim(pc.replace_substring_regex(arr, _WS_RE2, " "), " ")
+
+
+def _normalize_dict(arr):
+    # Szótárkódolt oszlopnál csak a (kicsi) szótárat normalizáljuk, az indexek maradnak
+    import pyarrow as pa
+
+    arr = arr.combine_chunks() if isinstance(arr, pa.ChunkedArray) else arr
+    return pa.DictionaryArray.from_arrays(arr.indices, _normalize(arr.dictionary))
+
+
+def read_parquet(path: str, start: int = 0, end: Optional[int] = None) -> Iterator[tuple]:
+    """Loader rows (insert_recipes.RecipeRow) from the row groups [start, end), one group at a time."""
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    pf = pq.ParquetFile(path, memory_map=True)
+    end = pf.metadata.num_row_groups if end is None else end
+    for g in range(start, end):
+        t = pf.read_row_group(g, columns=list(COLUMNS))
+        if not t.num_rows:
+            continue  # save_parquet(path, []) egyetlen üres sorcsoportot ír
+        ingredients = pc.binary_join(pc.fill_null(t["ingredients"], []), " | ")
+        cols = (
+            _normalize(t["url"]).to_pylist(),
+            _normalize(t["title"]).to_pylist(),
+            t["year"].to_pylist(),
+            _normalize_dict(t["settlement"]).to_pylist(),
+            _normalize(ingredients).to_pylist(),
+            t["category_id"].to_pylist(),
+        )
+        for url, title, year, settlement, ingredients_text, category_id in zip(*cols):
+            yield url or "", title or "", year, settlement or None, ingredients_text or "", category_id
+
+
+# -----------------------------
+# CLI: convert / bench
+# -----------------------------
+
+def _scaled_records(jsonl_path: str, scale: int) -> List[dict]:
+    from jsonl_io import iter_jsonl_records
+
+    base = list(iter_jsonl_records(jsonl_path))
+    out: List[dict] = []
+    for i in range(scale):
+        for obj in base:
+            out.append(dict(obj, url=f"{obj.get('url')}#{i}") if i else obj)
+    return out
+
+
+def _best_of(repeat: int, fn) -> Tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def bench(jsonl_path: str, scale: int, repeat: int) -> List[Dict[str, object]]:
+    from collections import Counter
+
+    from insert_recipes import read_jsonl
+    from jsonl_io import iter_jsonl_records, open_jsonl_writer
+
+    records = _scaled_records(jsonl_path, scale)
+    results: List[Dict[str, object]] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {"jsonl": os.path.join(tmp, "bench.jsonl"), "jsonl.zst": os.path.join(tmp, "bench.jsonl.zst"), "parquet": os.path.join(tmp, "bench.parquet")}
+        for fmt, path in paths.items():
+            t0 = time.perf_counter()
+            if fmt == "parquet":
+                save_parquet(path, records)
+            else:
+                with open_jsonl_writer(path) as w:
+                    for obj in records:
+                        w.write(json.dumps(obj, ensure_ascii=False) + "\n")
+            write_s = time.perf_counter() - t0
+
+            if fmt == "parquet":
+                load_s, n = _best_of(repeat, lambda: sum(1 for _ in read_parquet(path)))
+                cols_s, by_settlement = _best_of(repeat, lambda: read_recipe_table(path, ["settlement", "year"])["settlement"].combine_chunks().value_counts())
+            else:
+                load_s, n = _best_of(repeat, lambda: sum(1 for _ in read_jsonl(path)))
+                cols_s, by_settlement = _best_of(repeat, lambda: Counter((o.get("settlement"), o.get("year")) for o in iter_jsonl_records(path)))
+            results.append({
+                "format": fmt,
+                "rows": n,
+                "bytes": os.path.getsize(path),
+                "write_s": round(write_s, 3),
+                "load_rows_s": round(n / load_s),
+                "settlement_year_s": round(cols_s, 4),
+            })
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Recipe datasets as Arrow/Parquet (convert / bench)")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    pc_ = sub.add_parser("convert", help="JSONL (plain, .gz, .zst) -> Parquet")
+    pc_.add_argument("src")
+    pc_.add_argument("dst")
+    pc_.add_argument("--row-group-size", type=int, default=ROW_GROUP_ROWS)
+    pb = sub.add_parser("bench", help="Size, loader throughput and a two-column query: JSONL vs Parquet")
+    pb.add_argument("--jsonl", type=str, default=os.path.join(os.path.dirname(__file__), "receptek.jsonl"))
+    pb.add_argument("--scale", type=int, default=50, help="Repeat the input this many times")
+    pb.add_argument("--repeat", type=int, default=3)
+    pb.add_argument("--json", type=str, default=None, help="Write the results as JSON")
+    args = p.parse_args(argv)
+
+    if args.cmd == "convert":
+        from jsonl_io import iter_jsonl_records
+
+        t0 = time.perf_counter()
+        n = save_parquet(args.dst, iter_jsonl_records(args.src), row_group_size=args.row_group_size)
+        print(f"{n} recept: {args.src} ({os.path.getsize(args.src):,} B) -> {args.dst} ({os.path.getsize(args.dst):,} B), {time.perf_counter() - t0:.2f} s")
+        return 0
+
+    results = bench(args.jsonl, args.scale, args.repeat)
+    for r in results:
+        print(
+            f"  {r['format']:<10} {r['rows']} sor  {r['bytes'] / 1e6:7.2f} MB  írás {r['write_s']:.2f} s  "
+            f"betöltő olvasás {r['load_rows_s']:,} sor/s  település+év lekérdezés {r['settlement_year_s'] * 1000:.1f} ms"
+        )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
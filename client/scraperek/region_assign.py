@@ -0,0 +1,217 @@
+"""
+Offline régió-hozzárendelés: a települések pontjait a Region táblában tárolt
+vármegye-poligonokkal metszi (point-in-polygon), a Nominatim címblokkjának
+vármegyeneve helyett.
+
+A régiógeometriák egyszer töltődnek be (Postgresből vagy a /map/regions
+végpont GeoJSON kimenetéből), ezekből STR-fa épül, és minden pont egyetlen
+vektorizált lekérdezéssel kapja meg a régióját. Amelyik pont egyik
+poligonba sem esik, az a jelentésbe kerül a legközelebbi régióval együtt.
+
+Használat (példa):
+    python region_assign.py --dsn postgresql://...                  # Settlement.regionid frissítése
+    python region_assign.py --dsn postgresql://... --dry-run
+    python region_assign.py --regions-geojson regions.json --sql settlement_inserts.sql
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import shapely
+from shapely.strtree import STRtree
+
+NO_REGION = -1
+
+
+@dataclass
+class Assignment:
+    region_ids: np.ndarray      # NO_REGION, ha a pont egyik poligonba sem esik
+    nearest_ids: np.ndarray     # legközelebbi régió (a kívül eső pontokhoz)
+    nearest_deg: np.ndarray     # távolság a legközelebbi régiótól (fokban, 0 ha benne van)
+    ambiguous: int              # több poligonba eső pontok (határvonal)
+    seconds: float
+
+    @property
+    def outside(self) -> np.ndarray:
+        return np.flatnonzero(self.region_ids == NO_REGION)
+
+
+class RegionIndex:
+    def __init__(self, ids: Sequence[int], geoms: Sequence) -> None:
+        if len(ids) != len(geoms):
+            raise ValueError("ids and geoms must have the same length")
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.geoms = np.asarray(geoms, dtype=object)
+        shapely.prepare(self.geoms)
+        self.tree = STRtree(self.geoms)
+
+    def assign(self, lon: Sequence[float], lat: Sequence[float]) -> Assignment:
+        t0 = time.perf_counter()
+        points = shapely.points(np.asarray(lon, dtype=np.float64), np.asarray(lat, dtype=np.float64))
+        n = len(points)
+        region_ids = np.full(n, NO_REGION, dtype=np.int64)
+
+        # (pont index, poligon index) párok; "intersects": a határra eső pont is számít
+        pt_idx, geom_idx = self.tree.query(points, predicate="intersects")
+        ambiguous = int(len(pt_idx) - len(np.unique(pt_idx)))
+        # Több találatnál (közös határ) a kisebb régió id nyer, hogy a kimenet determinisztikus legyen
+        order = np.lexsort((self.ids[geom_idx], pt_idx))
+        pt_idx, geom_idx = pt_idx[order], geom_idx[order]
+        first = np.ones(len(pt_idx), dtype=bool)
+        first[1:] = pt_idx[1:] != pt_idx[:-1]
+        region_ids[pt_idx[first]] = self.ids[geom_idx[first]]
+
+        nearest_ids = region_ids.copy()
+        nearest_deg = np.zeros(n, dtype=np.float64)
+        out = np.flatnonzero(region_ids == NO_REGION)
+        if len(out) and len(self.ids):
+            (q_idx, g_idx), dist = self.tree.query_nearest(points[out], return_distance=True, all_matches=False)
+            nearest_ids[out[q_idx]] = self.ids[g_idx]
+            nearest_deg[out[q_idx]] = dist
+        return Assignment(region_ids, nearest_ids, nearest_deg, ambiguous, time.perf_counter() - t0)
+
+
+def load_regions_pg(cur) -> Tuple[List[int], list]:
+    """Region geometries in EPSG:4326 (transformed if stored in another SRID)."""
+    cur.execute(
+        'SELECT id, ST_AsBinary(CASE WHEN ST_SRID(geom) IN (0, 4326) THEN geom ELSE ST_Transform(geom, 4326) END) '
+        'FROM public."Region" WHERE geom IS NOT NULL ORDER BY id'
+    )
+    rows = cur.fetchall()
+    return [int(r[0]) for r in rows], list(shapely.from_wkb([bytes(r[1]) for r in rows]))
+
+
+def load_regions_geojson(path: str) -> Tuple[List[int], list]:
+    """Regions from a GeoJSON FeatureCollection or the /map/regions JSON list ({id, name, geom})."""
+    with open(path, "r", encoding="utf-8") as f:
+        doc = json.load(f)
+    if isinstance(doc, dict) and doc.get("type") == "FeatureCollection":
+        items = [(f.get("id", (f.get("properties") or {}).get("id")), f.get("geometry")) for f in doc["features"]]
+    else:
+        items = [(r.get("id"), r.get("geom")) for r in (doc.get("data", doc) if isinstance(doc, dict) else doc)]
+    ids: List[int] = []
+    geoms: list = []
+    for rid, geom in items:
+        if rid is None or not geom:
+            continue
+        ids.append(int(rid))
+        geoms.append(shapely.from_geojson(json.dumps(geom)))
+    return ids, geoms
+
+
+def load_settlements_pg(cur) -> Tuple[List[int], List[str], np.ndarray, np.ndarray, List[Optional[int]]]:
+    cur.execute(
+        'SELECT id, name, ST_X(geom), ST_Y(geom), regionid FROM public."Settlement" '
+        "WHERE geom IS NOT NULL ORDER BY id"
+    )
+    rows = cur.fetchall()
+    return (
+        [int(r[0]) for r in rows],
+        [r[1] for r in rows],
+        np.array([r[2] for r in rows], dtype=np.float64),
+        np.array([r[3] for r in rows], dtype=np.float64),
+        [None if r[4] is None else int(r[4]) for r in rows],
+    )
+
+
+def report_outside(names: Sequence[str], lon: np.ndarray, lat: np.ndarray, a: Assignment) -> List[dict]:
+    out: List[dict] = []
+    for i in a.outside.tolist():
+        out.append({
+            "name": names[i],
+            "lon": float(lon[i]),
+            "lat": float(lat[i]),
+            "nearest_region": None if a.nearest_ids[i] == NO_REGION else int(a.nearest_ids[i]),
+            "distance_deg": round(float(a.nearest_deg[i]), 5),
+        })
+    return out
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Assign Settlement.regionid by point-in-polygon against Region geometries")
+    p.add_argument("--dsn", type=str, default=None, help="Postgres DSN string")
+    p.add_argument("--host", type=str, default=None)
+    p.add_argument("--port", type=int, default=None)
+    p.add_argument("--db", type=str, default=None)
+    p.add_argument("--user", type=str, default=None)
+    p.add_argument("--password", type=str, default=None)
+    p.add_argument("--regions-geojson", type=str, default=None, help="Region polygons from a file instead of the database")
+    p.add_argument("--sql", type=str, default=None, help="Read settlement points from a settlement_inserts.sql file")
+    p.add_argument("--dry-run", action="store_true", help="Report only, do not UPDATE Settlement")
+    p.add_argument("--report", type=str, default=None, help="Write points outside every region as JSON")
+    args = p.parse_args(argv)
+
+    use_db = bool(args.dsn or args.host or args.db)
+    if not use_db and not (args.regions_geojson and args.sql):
+        p.error("either a database connection or both --regions-geojson and --sql are required")
+
+    conn = None
+    if use_db:
+        from insert_recipes import connect_pg
+
+        conn = connect_pg(args.dsn, args.host, args.port, args.db, args.user, args.password)
+    try:
+        t0 = time.perf_counter()
+        if args.regions_geojson:
+            region_ids, geoms = load_regions_geojson(args.regions_geojson)
+        else:
+            with conn.cursor() as cur:
+                region_ids, geoms = load_regions_pg(cur)
+        index = RegionIndex(region_ids, geoms)
+        t_index = time.perf_counter() - t0
+
+        if args.sql:
+            from geocode_cache import parse_settlement_rows
+
+            # Az INSERT-ben szereplő azonosító (a NULL geometriájú sorok kihagyása nem tolja el)
+            rows = [r for r in parse_settlement_rows(args.sql) if r[3] is not None]
+            ids = [r[0] for r in rows]
+            names = [r[1] for r in rows]
+            lon = np.array([r[3] for r in rows], dtype=np.float64)
+            lat = np.array([r[4] for r in rows], dtype=np.float64)
+            current = [r[2] for r in rows]
+        else:
+            with conn.cursor() as cur:
+                ids, names, lon, lat, current = load_settlements_pg(cur)
+
+        a = index.assign(lon, lat)
+        new = [None if r == NO_REGION else int(r) for r in a.region_ids.tolist()]
+        changed = [(sid, rid) for sid, rid, old in zip(ids, new, current) if rid is not None and rid != old]
+
+        print(f"{len(region_ids)} régió (STR-fa: {t_index * 1000:.1f} ms), {len(ids)} település, "
+              f"hozzárendelés: {a.seconds * 1000:.2f} ms")
+        print(f"  eltér a jelenlegitől: {len(changed)}, határon (több találat): {a.ambiguous}, kívül: {len(a.outside)}")
+        outside = report_outside(names, lon, lat, a)
+        for o in outside:
+            print(f"  ! {o['name']} ({o['lon']:.4f}, {o['lat']:.4f}): legközelebbi régió {o['nearest_region']} "
+                  f"({o['distance_deg']:.4f}°)")
+        if args.report:
+            with open(args.report, "w", encoding="utf-8") as f:
+                json.dump({"outside": outside, "changed": [{"id": s, "regionid": r} for s, r in changed]}, f, ensure_ascii=False, indent=2)
+            print(f"Jelentés mentve: {args.report}")
+
+        if conn is not None and not args.sql and not args.dry_run and changed:
+            import psycopg2.extras
+
+            with conn.cursor() as cur:
+                psycopg2.extras.execute_values(
+                    cur,
+                    'UPDATE public."Settlement" s SET regionid = v.regionid FROM (VALUES %s) AS v(id, regionid) WHERE s.id = v.id',
+                    changed,
+                )
+            conn.commit()
+            print(f"Settlement.regionid frissítve: {len(changed)} sor")
+    finally:
+        if conn is not None:
+            conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,334 +1,365 @@
 --- Ízőrzők települések adatai (generálva Python szkripttel) ---
 
 --- MEGJEGYZÉS: Ellenőrizze a regionid oszlopokat (NULL értékek) és a vármegyeneveket!
+--- Futtatás: psql -f settlement_inserts.sql (átmeneti tábla, régi id-k átszámozása, upsert)
 
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (1, 'Abasár', 10, ST_SetSRID(ST_MakePoint(20.0063, 47.7956), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (2, 'Ajak', 14, ST_SetSRID(ST_MakePoint(22.0522, 48.1779), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (3, 'Aldebrő', 10, ST_SetSRID(ST_MakePoint(20.2284, 47.7892), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (4, 'Algyő', 7, ST_SetSRID(ST_MakePoint(20.2084, 46.3354), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (5, 'Almásfüzitő', 4, ST_SetSRID(ST_MakePoint(18.2620, 47.7272), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (6, 'Álmosd', 11, ST_SetSRID(ST_MakePoint(21.9838, 47.4154), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (7, 'Alsógalla', 4, ST_SetSRID(ST_MakePoint(18.4157, 47.5681), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (8, 'Alsómocsolád', 16, ST_SetSRID(ST_MakePoint(18.2450, 46.3131), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (9, 'Andocs', 18, ST_SetSRID(ST_MakePoint(17.9243, 46.6488), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (10, 'Apátfalva', 7, ST_SetSRID(ST_MakePoint(20.5746, 46.1768), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (11, 'Ásotthalom', 7, ST_SetSRID(ST_MakePoint(19.7841, 46.2001), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (12, 'Átány', 10, ST_SetSRID(ST_MakePoint(20.3620, 47.6175), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (13, 'Badacsonytomaj', 20, ST_SetSRID(ST_MakePoint(17.5147, 46.8058), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (14, 'Bajna', 4, ST_SetSRID(ST_MakePoint(18.5986, 47.6553), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (15, 'Bakonynána', 20, ST_SetSRID(ST_MakePoint(17.9692, 47.2820), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (16, 'Balatonakali', 20, ST_SetSRID(ST_MakePoint(17.7527, 46.8837), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (17, 'Balatonberény', 18, ST_SetSRID(ST_MakePoint(17.3193, 46.7108), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (18, 'Balatonboglár', 18, ST_SetSRID(ST_MakePoint(17.6553, 46.7785), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (19, 'Balatonendréd', 18, ST_SetSRID(ST_MakePoint(17.9766, 46.8362), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (20, 'Balatonkiliti', 18, ST_SetSRID(ST_MakePoint(18.0703, 46.8791), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (21, 'Balatonlelle', 18, ST_SetSRID(ST_MakePoint(17.6965, 46.7868), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (22, 'Balatonudvari', 20, ST_SetSRID(ST_MakePoint(17.8048, 46.9054), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (23, 'Bálványos', 18, ST_SetSRID(ST_MakePoint(17.9521, 46.7817), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (24, 'Bár', 16, ST_SetSRID(ST_MakePoint(18.7172, 46.0518), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (25, 'Bárdudvarnok', 18, ST_SetSRID(ST_MakePoint(17.6851, 46.3268), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (26, 'Báta', 1, ST_SetSRID(ST_MakePoint(18.7749, 46.1287), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (27, 'Bátor', 10, ST_SetSRID(ST_MakePoint(20.2657, 47.9918), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (28, 'Bátya', 2, ST_SetSRID(ST_MakePoint(18.9545, 46.4874), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (29, 'Békésszentandrás', 8, ST_SetSRID(ST_MakePoint(20.4851, 46.8717), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (30, 'Bercel', 12, ST_SetSRID(ST_MakePoint(19.4035, 47.8698), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (31, 'Berente', 13, ST_SetSRID(ST_MakePoint(20.6645, 48.2319), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (32, 'Berettyóújfalu', 11, ST_SetSRID(ST_MakePoint(21.5355, 47.2247), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (33, 'Bezenye', 19, ST_SetSRID(ST_MakePoint(17.2162, 47.9621), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (34, 'Bölcske', 1, ST_SetSRID(ST_MakePoint(18.9695, 46.7403), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (35, 'Boldog', 10, ST_SetSRID(ST_MakePoint(19.6954, 47.6012), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (36, 'Bucsuta', 17, ST_SetSRID(ST_MakePoint(16.8341, 46.5645), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (37, 'Budajenő', 6, ST_SetSRID(ST_MakePoint(18.8039, 47.5555), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (38, 'Bugyi', 6, ST_SetSRID(ST_MakePoint(19.1490, 47.2220), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (39, 'Buzsák', 18, ST_SetSRID(ST_MakePoint(17.5775, 46.6487), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (40, 'Ceglédbercel', 6, ST_SetSRID(ST_MakePoint(19.6786, 47.2150), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (41, 'Csajág', 20, ST_SetSRID(ST_MakePoint(18.1859, 47.0447), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (42, 'Csákvár', 3, ST_SetSRID(ST_MakePoint(18.4641, 47.3918), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (43, 'Csanádpalota', 7, ST_SetSRID(ST_MakePoint(20.7234, 46.2440), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (44, 'Császártöltés', 2, ST_SetSRID(ST_MakePoint(19.1785, 46.4230), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (45, 'Csemő', 6, ST_SetSRID(ST_MakePoint(19.6977, 47.1184), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (46, 'Cserépfalu', 13, ST_SetSRID(ST_MakePoint(20.5360, 47.9430), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (47, 'Csernely', 13, ST_SetSRID(ST_MakePoint(20.3421, 48.1443), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (48, 'Csókakő', 3, ST_SetSRID(ST_MakePoint(18.2758, 47.3564), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (49, 'Csolnok', 4, ST_SetSRID(ST_MakePoint(18.7176, 47.6946), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (50, 'Csólyospálos', 2, ST_SetSRID(ST_MakePoint(19.8388, 46.4186), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (51, 'Csömör', 6, ST_SetSRID(ST_MakePoint(19.2242, 47.5489), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (52, 'Csór', 3, ST_SetSRID(ST_MakePoint(18.2569, 47.2050), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (53, 'Csurgó', 18, ST_SetSRID(ST_MakePoint(17.0951, 46.2643), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (54, 'Dánszentmiklós', 6, ST_SetSRID(ST_MakePoint(19.5561, 47.2077), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (55, 'Darnózseli', 19, ST_SetSRID(ST_MakePoint(17.4269, 47.8505), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (56, 'Darnózseli', 19, ST_SetSRID(ST_MakePoint(17.4269, 47.8505), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (57, 'Deszk', 7, ST_SetSRID(ST_MakePoint(20.2389, 46.2179), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (58, 'Domoszló', 10, ST_SetSRID(ST_MakePoint(20.1163, 47.8263), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (59, 'Dozmat', 15, ST_SetSRID(ST_MakePoint(16.5144, 47.2338), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (60, 'Drávaszabolcs', 16, ST_SetSRID(ST_MakePoint(18.2129, 45.8046), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (61, 'Dunabogdány', 6, ST_SetSRID(ST_MakePoint(19.0352, 47.7938), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (62, 'Dunaegyháza', 2, ST_SetSRID(ST_MakePoint(18.9565, 46.8399), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (63, 'Dunakömlőd', 1, ST_SetSRID(ST_MakePoint(18.8807, 46.6686), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (64, 'Dunavecse', 2, ST_SetSRID(ST_MakePoint(18.9717, 46.9164), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (65, 'Dusnok', 2, ST_SetSRID(ST_MakePoint(18.9590, 46.3900), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (66, 'Ecseny', 18, ST_SetSRID(ST_MakePoint(17.8524, 46.5511), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (67, 'Egerszalók', 10, ST_SetSRID(ST_MakePoint(20.3238, 47.8702), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (68, 'Egervár', 17, ST_SetSRID(ST_MakePoint(16.8522, 46.9336), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (69, 'Erdőtarcsa', 12, ST_SetSRID(ST_MakePoint(19.5428, 47.7618), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (70, 'Érsekcsanád', 2, ST_SetSRID(ST_MakePoint(18.9823, 46.2520), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (71, 'Erzsébet', 16, ST_SetSRID(ST_MakePoint(18.4586, 46.1007), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (72, 'Farkasdomb', 6, ST_SetSRID(ST_MakePoint(18.9523, 47.2385), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (73, 'Farmos', 6, ST_SetSRID(ST_MakePoint(19.8490, 47.3616), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (74, 'Fegyvernek', 9, ST_SetSRID(ST_MakePoint(20.5259, 47.2527), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (75, 'Fehérvárcsurgó', 3, ST_SetSRID(ST_MakePoint(18.2658, 47.2906), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (76, 'Feked', 16, ST_SetSRID(ST_MakePoint(18.5599, 46.1610), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (77, 'Felsőnyék', 1, ST_SetSRID(ST_MakePoint(18.2915, 46.7892), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (78, 'Foktő', 2, ST_SetSRID(ST_MakePoint(18.9193, 46.5290), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (79, 'Füle', 3, ST_SetSRID(ST_MakePoint(18.2459, 47.0527), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (80, 'Fülöp', 11, ST_SetSRID(ST_MakePoint(22.0563, 47.5991), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (81, 'Galgahévíz', 6, ST_SetSRID(ST_MakePoint(19.5558, 47.6223), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (82, 'Gara', 2, ST_SetSRID(ST_MakePoint(19.0387, 46.0342), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (83, 'Gátér', 2, ST_SetSRID(ST_MakePoint(19.9577, 46.6835), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (84, 'Gávavencsellő', 14, ST_SetSRID(ST_MakePoint(21.5934, 48.1610), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (85, 'Geresdlak', 16, ST_SetSRID(ST_MakePoint(18.5270, 46.1083), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (86, 'Gesztely-Újharangod', NULL, NULL);
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (87, 'Gölle', 18, ST_SetSRID(ST_MakePoint(18.0122, 46.4388), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (88, 'Gomba', 6, ST_SetSRID(ST_MakePoint(19.5312, 47.3704), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (89, 'Görgeteg', 18, ST_SetSRID(ST_MakePoint(17.4364, 46.1466), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (90, 'Gyenesdiás', 17, ST_SetSRID(ST_MakePoint(17.2860, 46.7725), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (91, 'Gyomaendrőd', 8, ST_SetSRID(ST_MakePoint(20.8261, 46.9358), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (92, 'Gyöngyöspata', 10, ST_SetSRID(ST_MakePoint(19.7903, 47.8147), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (93, 'Gyöngyössolymos', 10, ST_SetSRID(ST_MakePoint(19.9332, 47.8169), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (94, 'Gyöngyöstarján', 10, ST_SetSRID(ST_MakePoint(19.8668, 47.8117), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (95, 'Györköny', 1, ST_SetSRID(ST_MakePoint(18.6946, 46.6345), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (96, 'Győrújfalu', 19, ST_SetSRID(ST_MakePoint(17.6082, 47.7212), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (97, 'Győrzámoly', 19, ST_SetSRID(ST_MakePoint(17.5788, 47.7404), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (98, 'Gyulafirátót', 20, ST_SetSRID(ST_MakePoint(17.9490, 47.1444), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (99, 'Hajdúhadház', 11, ST_SetSRID(ST_MakePoint(21.6692, 47.6845), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (100, 'Hajós', 2, ST_SetSRID(ST_MakePoint(19.1172, 46.3983), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (101, 'Halimba', 20, ST_SetSRID(ST_MakePoint(17.5356, 47.0333), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (102, 'Háromfa', 18, ST_SetSRID(ST_MakePoint(17.3295, 46.1046), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (103, 'Harta', 2, ST_SetSRID(ST_MakePoint(19.0277, 46.6947), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (104, 'Hedrehely', 18, ST_SetSRID(ST_MakePoint(17.6522, 46.1962), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (105, 'Hegykő', 19, ST_SetSRID(ST_MakePoint(16.7941, 47.6217), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (106, 'Herencsény', 12, ST_SetSRID(ST_MakePoint(19.4726, 47.9746), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (107, 'Herend', 20, ST_SetSRID(ST_MakePoint(17.7523, 47.1328), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (108, 'Hévíz', 17, ST_SetSRID(ST_MakePoint(17.1834, 46.7906), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (109, 'Hidas', 16, ST_SetSRID(ST_MakePoint(18.4977, 46.2595), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (110, 'Homokmégy', 2, ST_SetSRID(ST_MakePoint(19.0737, 46.4880), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (111, 'Hosszúhetény', 16, ST_SetSRID(ST_MakePoint(18.3528, 46.1613), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (112, 'Igal', 18, ST_SetSRID(ST_MakePoint(17.9387, 46.5345), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (113, 'Iharosberény', 18, ST_SetSRID(ST_MakePoint(17.1114, 46.3635), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (114, 'Iszkaszentgyörgy', 3, ST_SetSRID(ST_MakePoint(18.2950, 47.2382), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (115, 'Jakabszállás', 2, ST_SetSRID(ST_MakePoint(19.6008, 46.7615), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (116, 'Jenő', 3, ST_SetSRID(ST_MakePoint(18.2499, 47.1058), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (117, 'Kács', 13, ST_SetSRID(ST_MakePoint(20.6086, 47.9586), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (118, 'Kadarkút', 18, ST_SetSRID(ST_MakePoint(17.6179, 46.2286), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (119, 'Kakasd', 1, ST_SetSRID(ST_MakePoint(18.5927, 46.3463), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (120, 'Kakucs', 6, ST_SetSRID(ST_MakePoint(19.3667, 47.2416), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (121, 'Kalaznó', 1, ST_SetSRID(ST_MakePoint(18.4745, 46.5015), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (122, 'Kállósemjén', 14, ST_SetSRID(ST_MakePoint(21.9249, 47.8603), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (123, 'Kaposújlak', 18, ST_SetSRID(ST_MakePoint(17.7259, 46.3668), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (124, 'Karád', 18, ST_SetSRID(ST_MakePoint(17.8386, 46.6935), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (125, 'Karád', 18, ST_SetSRID(ST_MakePoint(17.8386, 46.6935), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (126, 'Karancslapujtő', 12, ST_SetSRID(ST_MakePoint(19.7361, 48.1527), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (127, 'Karcag', 9, ST_SetSRID(ST_MakePoint(20.9241, 47.3146), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (128, 'Kátoly', 16, ST_SetSRID(ST_MakePoint(18.4510, 46.0611), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (129, 'Káva', 6, ST_SetSRID(ST_MakePoint(19.5879, 47.3557), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (130, 'Kávás', 17, ST_SetSRID(ST_MakePoint(16.7087, 46.8620), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (131, 'Kékesd', 16, ST_SetSRID(ST_MakePoint(18.4727, 46.1010), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (132, 'Kelebia', 2, ST_SetSRID(ST_MakePoint(19.6072, 46.1971), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (133, 'Kerekegyháza', 2, ST_SetSRID(ST_MakePoint(19.4825, 46.9359), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (134, 'Kesztölc', 4, ST_SetSRID(ST_MakePoint(18.7971, 47.7131), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (135, 'Kétbodony', 12, ST_SetSRID(ST_MakePoint(19.2849, 47.9354), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (136, 'Kéthely', 18, ST_SetSRID(ST_MakePoint(17.3933, 46.6469), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (137, 'Kisapáti', 20, ST_SetSRID(ST_MakePoint(17.4672, 46.8426), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (138, 'Kisbajom', 18, ST_SetSRID(ST_MakePoint(17.4866, 46.3053), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (139, 'Kisgyalán', 18, ST_SetSRID(ST_MakePoint(17.9762, 46.4235), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (140, 'Kisgyőr', 13, ST_SetSRID(ST_MakePoint(20.6887, 48.0103), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (141, 'Kisgyőr', 13, ST_SetSRID(ST_MakePoint(20.6887, 48.0103), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (142, 'Kiskunfélegyháza', 2, ST_SetSRID(ST_MakePoint(19.8502, 46.7114), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (143, 'Kiskunhalas', 2, ST_SetSRID(ST_MakePoint(19.4833, 46.4278), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (144, 'Kisnána', 10, ST_SetSRID(ST_MakePoint(20.1461, 47.8531), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (145, 'Kisszékely', 1, ST_SetSRID(ST_MakePoint(18.5390, 46.6794), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (146, 'Kocs', 4, ST_SetSRID(ST_MakePoint(18.2132, 47.6055), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (147, 'Kóka', 6, ST_SetSRID(ST_MakePoint(19.5806, 47.4892), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (148, 'Kölesd-Borjád', 1, ST_SetSRID(ST_MakePoint(18.5903, 46.5576), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (149, 'Komlóska', 13, ST_SetSRID(ST_MakePoint(21.4629, 48.3408), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (150, 'Kőröshegy', 18, ST_SetSRID(ST_MakePoint(17.9005, 46.8313), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (151, 'Körösszakál', 11, ST_SetSRID(ST_MakePoint(21.5873, 47.0211), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (152, 'Kőszegszerdahely', 15, ST_SetSRID(ST_MakePoint(16.5157, 47.3406), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (153, 'Kunfehértó', 2, ST_SetSRID(ST_MakePoint(19.4133, 46.3624), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (154, 'Kunhegyes', 9, ST_SetSRID(ST_MakePoint(20.6318, 47.3699), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (155, 'Kustánszeg', 17, ST_SetSRID(ST_MakePoint(16.6799, 46.7853), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (156, 'Lajoskomárom', 3, ST_SetSRID(ST_MakePoint(18.3372, 46.8418), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (157, 'Látrány', 18, ST_SetSRID(ST_MakePoint(17.7446, 46.7485), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (158, 'Legénd', 12, ST_SetSRID(ST_MakePoint(19.3110, 47.8780), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (159, 'Lenti', 17, ST_SetSRID(ST_MakePoint(16.5367, 46.6246), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (160, 'Létavértes', 11, ST_SetSRID(ST_MakePoint(21.8764, 47.3853), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (161, 'Lipót', 19, ST_SetSRID(ST_MakePoint(17.4616, 47.8613), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (162, 'Liptód', 16, ST_SetSRID(ST_MakePoint(18.5157, 46.0462), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (163, 'Lónya', 14, ST_SetSRID(ST_MakePoint(22.2704, 48.3182), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (164, 'Lovasberény', 3, ST_SetSRID(ST_MakePoint(18.5527, 47.3100), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (165, 'Lulla', 18, ST_SetSRID(ST_MakePoint(18.0238, 46.7893), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (166, 'Madocsa', 1, ST_SetSRID(ST_MakePoint(18.9567, 46.6881), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (167, 'Maglód', 6, ST_SetSRID(ST_MakePoint(19.3593, 47.4450), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (168, 'Mágocs', 16, ST_SetSRID(ST_MakePoint(18.2286, 46.3498), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (169, 'Magyaregregy', 16, ST_SetSRID(ST_MakePoint(18.3083, 46.2510), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (170, 'Magyarpolány', 20, ST_SetSRID(ST_MakePoint(17.5501, 47.1685), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (171, 'Magyarszék', 16, ST_SetSRID(ST_MakePoint(18.1964, 46.1957), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (172, 'Mátraderecske', 10, ST_SetSRID(ST_MakePoint(20.0828, 47.9497), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (173, 'Mátranovák', 12, ST_SetSRID(ST_MakePoint(19.9814, 48.0388), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (174, 'Mecseknádasd', 16, ST_SetSRID(ST_MakePoint(18.4645, 46.2244), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (175, 'Medina', 1, ST_SetSRID(ST_MakePoint(18.6434, 46.4739), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (176, 'Méhkerék', 8, ST_SetSRID(ST_MakePoint(21.4492, 46.7748), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (177, 'Mencshely', 20, ST_SetSRID(ST_MakePoint(17.6999, 46.9455), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (178, 'Mesztegnyő', 18, ST_SetSRID(ST_MakePoint(17.4239, 46.5045), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (179, 'Mezőberény', 8, ST_SetSRID(ST_MakePoint(21.0291, 46.8240), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (180, 'Mezőberény', 8, ST_SetSRID(ST_MakePoint(21.0291, 46.8240), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (181, 'Mezőfalva', 3, ST_SetSRID(ST_MakePoint(18.7790, 46.9325), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (182, 'Mezőkomárom', 3, ST_SetSRID(ST_MakePoint(18.2898, 46.8288), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (183, 'Mezőkovácsháza', 8, ST_SetSRID(ST_MakePoint(20.9236, 46.4073), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (184, 'Mezőszentgyörgy', 3, ST_SetSRID(ST_MakePoint(18.2738, 46.9940), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (185, 'Mezőszilas', 3, ST_SetSRID(ST_MakePoint(18.4750, 46.8158), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (186, 'Mezőtárkány', 10, ST_SetSRID(ST_MakePoint(20.4761, 47.7219), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (187, 'Miklósi', 18, ST_SetSRID(ST_MakePoint(17.9963, 46.6473), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (188, 'Mikóháza', 13, ST_SetSRID(ST_MakePoint(21.5933, 48.4635), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (189, 'Milota', 14, ST_SetSRID(ST_MakePoint(22.7803, 48.1036), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (190, 'Miske', 2, ST_SetSRID(ST_MakePoint(19.0321, 46.4424), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (191, 'Monostorapáti', 20, ST_SetSRID(ST_MakePoint(17.5554, 46.9250), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (192, 'Mosdós', 18, ST_SetSRID(ST_MakePoint(17.9869, 46.3535), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (193, 'Mözs', 1, ST_SetSRID(ST_MakePoint(18.7554, 46.4105), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (194, 'Nádasd', 15, ST_SetSRID(ST_MakePoint(16.6129, 46.9651), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (195, 'Nagybajom', 18, ST_SetSRID(ST_MakePoint(17.5119, 46.3937), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (196, 'Nagybörzsöny', 6, ST_SetSRID(ST_MakePoint(18.8244, 47.9360), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (197, 'Nagydobos', 14, ST_SetSRID(ST_MakePoint(22.3034, 48.0536), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (198, 'Nagydorog', 1, ST_SetSRID(ST_MakePoint(18.6579, 46.6231), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (199, 'Nagyhajmás', 16, ST_SetSRID(ST_MakePoint(18.2892, 46.3743), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (200, 'Nagyhegyes', 11, ST_SetSRID(ST_MakePoint(21.3466, 47.5385), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (201, 'Nagykörű', 9, ST_SetSRID(ST_MakePoint(20.4484, 47.2743), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (202, 'Nagymágocs', 7, ST_SetSRID(ST_MakePoint(20.4812, 46.5835), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (203, 'Nagymányok', 1, ST_SetSRID(ST_MakePoint(18.4592, 46.2825), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (204, 'Nagyrábé', 11, ST_SetSRID(ST_MakePoint(21.3192, 47.2046), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (205, 'Nagyrada', 17, ST_SetSRID(ST_MakePoint(17.1183, 46.6195), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (206, 'Nagyrécse', 17, ST_SetSRID(ST_MakePoint(17.0516, 46.4887), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (207, 'Nagyszakácsi', 18, ST_SetSRID(ST_MakePoint(17.3216, 46.4875), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (208, 'Nagytevel', 20, ST_SetSRID(ST_MakePoint(17.5655, 47.2964), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (209, 'Nagyvázsony', 20, ST_SetSRID(ST_MakePoint(17.6985, 46.9835), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (210, 'Nekézseny', 13, ST_SetSRID(ST_MakePoint(20.4295, 48.1675), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (211, 'Nekézseny', 13, ST_SetSRID(ST_MakePoint(20.4295, 48.1675), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (212, 'Nemescsó', 15, ST_SetSRID(ST_MakePoint(16.6166, 47.3506), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (213, 'Nemesnádudvar', 2, ST_SetSRID(ST_MakePoint(19.0522, 46.3392), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (214, 'Németkér', 1, ST_SetSRID(ST_MakePoint(18.7644, 46.7175), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (215, 'Nézsa', 12, ST_SetSRID(ST_MakePoint(19.2976, 47.8449), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (216, 'Nikla', 18, ST_SetSRID(ST_MakePoint(17.5173, 46.5783), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (217, 'Noszvaj', 10, ST_SetSRID(ST_MakePoint(20.4754, 47.9370), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (218, 'Nyárlőrinc', 2, ST_SetSRID(ST_MakePoint(19.8741, 46.8605), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (219, 'Nyíregyháza', 14, ST_SetSRID(ST_MakePoint(21.7168, 47.9558), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (220, 'Nyírmártonfalva', 11, ST_SetSRID(ST_MakePoint(21.8984, 47.5849), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (221, 'Óbánya', 16, ST_SetSRID(ST_MakePoint(18.4114, 46.2205), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (222, 'Ócsa', 6, ST_SetSRID(ST_MakePoint(19.2314, 47.3012), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (223, 'Őcsény', 1, ST_SetSRID(ST_MakePoint(18.7589, 46.3119), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (224, 'Olaszfalu', 20, ST_SetSRID(ST_MakePoint(17.9079, 47.2437), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (225, 'Orfű', 16, ST_SetSRID(ST_MakePoint(18.1552, 46.1381), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (226, 'Örményes', 9, ST_SetSRID(ST_MakePoint(20.5676, 47.1909), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (227, 'Őrség', 15, ST_SetSRID(ST_MakePoint(16.4060, 46.8327), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (228, 'Öskü', 20, ST_SetSRID(ST_MakePoint(18.0731, 47.1601), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (229, 'Ostffyasszonyfa', 15, ST_SetSRID(ST_MakePoint(17.0428, 47.3275), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (230, 'Oszkó', 15, ST_SetSRID(ST_MakePoint(16.8745, 47.0465), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (231, 'Öttömös', 7, ST_SetSRID(ST_MakePoint(19.6799, 46.2842), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (232, 'Ozora', 1, ST_SetSRID(ST_MakePoint(18.3997, 46.7527), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (233, 'Palotabozsok', 16, ST_SetSRID(ST_MakePoint(18.6410, 46.1288), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (234, 'Pánd', 6, ST_SetSRID(ST_MakePoint(19.6327, 47.3507), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (235, 'Pátka', 3, ST_SetSRID(ST_MakePoint(18.4871, 47.2771), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (236, 'Páty', 6, ST_SetSRID(ST_MakePoint(18.8272, 47.5155), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (237, 'Pázmánd', 3, ST_SetSRID(ST_MakePoint(18.6566, 47.2836), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (238, 'Penyige', 14, ST_SetSRID(ST_MakePoint(22.5685, 47.9974), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (239, 'Péteri', 6, ST_SetSRID(ST_MakePoint(19.4108, 47.3881), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (240, 'Petőmihályfa', 15, ST_SetSRID(ST_MakePoint(16.7864, 46.9808), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (241, 'Pincehely', 1, ST_SetSRID(ST_MakePoint(18.4398, 46.6820), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (242, 'Pócsmegyer', 6, ST_SetSRID(ST_MakePoint(19.0956, 47.7158), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (243, 'Porrogszentkirály', 18, ST_SetSRID(ST_MakePoint(17.0407, 46.2728), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (244, 'Porva', 20, ST_SetSRID(ST_MakePoint(17.8126, 47.3069), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (245, 'Pusztamérges', 7, ST_SetSRID(ST_MakePoint(19.6857, 46.3284), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (246, 'Pusztavám', 3, ST_SetSRID(ST_MakePoint(18.2280, 47.4293), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (247, 'Rácalmás', 3, ST_SetSRID(ST_MakePoint(18.9393, 47.0259), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (248, 'Rátka', 13, ST_SetSRID(ST_MakePoint(21.2264, 48.2135), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (249, 'Regöly', 1, ST_SetSRID(ST_MakePoint(18.3905, 46.5787), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (250, 'Révfülöp', 20, ST_SetSRID(ST_MakePoint(17.6304, 46.8283), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (251, 'Rezi', 17, ST_SetSRID(ST_MakePoint(17.2196, 46.8418), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (252, 'Rimóc', 12, ST_SetSRID(ST_MakePoint(19.5304, 48.0374), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (253, 'Ságvár', 18, ST_SetSRID(ST_MakePoint(18.1020, 46.8373), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (254, 'Sándorfalva', 7, ST_SetSRID(ST_MakePoint(20.1042, 46.3657), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (255, 'Sáregres', 3, ST_SetSRID(ST_MakePoint(18.5970, 46.7813), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (256, 'Sárpilis', 1, ST_SetSRID(ST_MakePoint(18.7372, 46.2471), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (257, 'Sárszentlőrinc', 1, ST_SetSRID(ST_MakePoint(18.6066, 46.6261), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (258, 'Seregélyes', 3, ST_SetSRID(ST_MakePoint(18.5786, 47.1116), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (259, 'Siklós', 16, ST_SetSRID(ST_MakePoint(18.2984, 45.8521), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (260, 'Simontornya', 1, ST_SetSRID(ST_MakePoint(18.5435, 46.7570), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (261, 'Sióagárd', 1, ST_SetSRID(ST_MakePoint(18.6536, 46.3908), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (262, 'Siófok', 18, ST_SetSRID(ST_MakePoint(18.0542, 46.9072), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (263, 'Siójut', 18, ST_SetSRID(ST_MakePoint(18.1388, 46.8794), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (264, 'Soltvadkert', 2, ST_SetSRID(ST_MakePoint(19.3943, 46.5820), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (265, 'Somberek', 16, ST_SetSRID(ST_MakePoint(18.6605, 46.0810), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (266, 'Somodor', 18, ST_SetSRID(ST_MakePoint(17.8418, 46.4763), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (267, 'Somogyszentpál', 18, ST_SetSRID(ST_MakePoint(17.4739, 46.6416), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (268, 'Somogyszob', 18, ST_SetSRID(ST_MakePoint(17.2968, 46.2930), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (269, 'Somogytúr', 18, ST_SetSRID(ST_MakePoint(17.7654, 46.7072), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (270, 'Somogyvár', 18, ST_SetSRID(ST_MakePoint(17.6510, 46.5812), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (271, 'Sülysáp', 6, ST_SetSRID(ST_MakePoint(19.5215, 47.4543), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (272, 'Súr', 4, ST_SetSRID(ST_MakePoint(18.0297, 47.3724), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (273, 'Szalafő', 15, ST_SetSRID(ST_MakePoint(16.3636, 46.8655), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (274, 'Szany', 19, ST_SetSRID(ST_MakePoint(17.3048, 47.4618), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (275, 'Szászvár', 16, ST_SetSRID(ST_MakePoint(18.3783, 46.2744), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (276, 'Szatmárcseke', 14, ST_SetSRID(ST_MakePoint(22.6297, 48.0852), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (277, 'Szatta', 15, ST_SetSRID(ST_MakePoint(16.4804, 46.7989), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (278, 'Szenna', 18, ST_SetSRID(ST_MakePoint(17.7319, 46.3084), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (279, 'Szentendre', 6, ST_SetSRID(ST_MakePoint(19.0760, 47.6678), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (280, 'Szentgál', 20, ST_SetSRID(ST_MakePoint(17.7351, 47.1126), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (281, 'Szentkirály', 2, ST_SetSRID(ST_MakePoint(19.9181, 46.9188), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (282, 'Szepetnek', 17, ST_SetSRID(ST_MakePoint(16.8995, 46.4335), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (283, 'Szigetbecse', 6, ST_SetSRID(ST_MakePoint(18.9492, 47.1306), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (284, 'Szigliget', 20, ST_SetSRID(ST_MakePoint(17.4332, 46.8014), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (285, 'Sződliget', 6, ST_SetSRID(ST_MakePoint(19.1473, 47.7300), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (286, 'Szólád', 18, ST_SetSRID(ST_MakePoint(17.8395, 46.7865), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (287, 'Szomolya', 13, ST_SetSRID(ST_MakePoint(20.4939, 47.8923), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (288, 'Szulok', 18, ST_SetSRID(ST_MakePoint(17.5508, 46.0505), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (289, 'Szurdokpüspöki', 12, ST_SetSRID(ST_MakePoint(19.6956, 47.8525), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (290, 'Táborfalva', 6, ST_SetSRID(ST_MakePoint(19.4829, 47.1043), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (291, 'Tác', 3, ST_SetSRID(ST_MakePoint(18.4058, 47.0830), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (292, 'Taktaszada', 13, ST_SetSRID(ST_MakePoint(21.1760, 48.1108), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (293, 'Tápióbicske', 6, ST_SetSRID(ST_MakePoint(19.6867, 47.3622), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (294, 'Tápióság', 6, ST_SetSRID(ST_MakePoint(19.6303, 47.3992), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (295, 'Tápiószentmárton', 6, ST_SetSRID(ST_MakePoint(19.7690, 47.3223), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (296, 'Tápiószőlős', 6, ST_SetSRID(ST_MakePoint(19.8411, 47.2926), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (297, 'Tard', 13, ST_SetSRID(ST_MakePoint(20.6041, 47.8730), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (298, 'Tard', 13, ST_SetSRID(ST_MakePoint(20.6041, 47.8730), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (299, 'Tarhos', 8, ST_SetSRID(ST_MakePoint(21.2127, 46.8121), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (300, 'Tengelic', 1, ST_SetSRID(ST_MakePoint(18.7108, 46.5319), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (301, 'Tényő', 19, ST_SetSRID(ST_MakePoint(17.6456, 47.5407), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (302, 'Tevel', 1, ST_SetSRID(ST_MakePoint(18.4556, 46.4125), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (303, 'Tihany', 20, ST_SetSRID(ST_MakePoint(17.8882, 46.9133), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (304, 'Tiszakécske', 2, ST_SetSRID(ST_MakePoint(20.1045, 46.9315), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (305, 'Tiszakürt', 9, ST_SetSRID(ST_MakePoint(20.1236, 46.8849), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (306, 'Tiszapüspöki', 9, ST_SetSRID(ST_MakePoint(20.3173, 47.2145), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (307, 'Tóalmás', 6, ST_SetSRID(ST_MakePoint(19.6637, 47.5096), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (308, 'Tolcsva', 13, ST_SetSRID(ST_MakePoint(21.4491, 48.2828), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (309, 'Törtel', 6, ST_SetSRID(ST_MakePoint(19.9351, 47.1208), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (310, 'Tótkomlós', 8, ST_SetSRID(ST_MakePoint(20.7366, 46.4115), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (311, 'Tótszerdahely', 17, ST_SetSRID(ST_MakePoint(16.7969, 46.4009), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (312, 'Tura', 6, ST_SetSRID(ST_MakePoint(19.5949, 47.6093), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (313, 'Túrkeve', 9, ST_SetSRID(ST_MakePoint(20.7421, 47.1051), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (314, 'Úrhida', 3, ST_SetSRID(ST_MakePoint(18.3346, 47.1327), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (315, 'Úrkút', 20, ST_SetSRID(ST_MakePoint(17.6437, 47.0825), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (316, 'Vanyarc', 12, ST_SetSRID(ST_MakePoint(19.4514, 47.8247), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (317, 'Varsány', 12, ST_SetSRID(ST_MakePoint(19.4908, 48.0411), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (318, 'Varsány', 12, ST_SetSRID(ST_MakePoint(19.4908, 48.0411), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (319, 'Vecsés', 6, ST_SetSRID(ST_MakePoint(19.2643, 47.4069), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (320, 'Velem', 15, ST_SetSRID(ST_MakePoint(16.4938, 47.3455), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (321, 'Verőce', 6, ST_SetSRID(ST_MakePoint(19.0340, 47.8231), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (322, 'Verpelét', 10, ST_SetSRID(ST_MakePoint(20.2279, 47.8490), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (323, 'Vitnyéd', 19, ST_SetSRID(ST_MakePoint(16.9800, 47.5871), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (324, 'Zákányszék', 7, ST_SetSRID(ST_MakePoint(19.8885, 46.2741), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (325, 'Zalaegerszeg', 17, ST_SetSRID(ST_MakePoint(16.8456, 46.8416), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (326, 'Zalamerenye', 17, ST_SetSRID(ST_MakePoint(17.0961, 46.5746), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (327, 'Zánka', 20, ST_SetSRID(ST_MakePoint(17.6834, 46.8729), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (328, 'Zebegény', 6, ST_SetSRID(ST_MakePoint(18.9102, 47.8000), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (329, 'Zengővárkony', 16, ST_SetSRID(ST_MakePoint(18.4318, 46.1706), 4326));
-INSERT INTO public."Settlement" (id, name, regionid, geom) VALUES (330, 'Zsáka', 11, ST_SetSRID(ST_MakePoint(21.4360, 47.1343), 4326));
\ No newline at end of file
+BEGIN;
+CREATE TEMP TABLE settlement_stage (LIKE public."Settlement" INCLUDING DEFAULTS) ON COMMIT DROP;
+
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (783588880, 'Abasár', 10, ST_SetSRID(ST_MakePoint(20.0063, 47.7956), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1436157644, 'Ajak', 14, ST_SetSRID(ST_MakePoint(22.0522, 48.1779), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1471261403, 'Aldebrő', 10, ST_SetSRID(ST_MakePoint(20.2284, 47.7892), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1708053048, 'Algyő', 7, ST_SetSRID(ST_MakePoint(20.2084, 46.3354), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1655250452, 'Almásfüzitő', 4, ST_SetSRID(ST_MakePoint(18.2620, 47.7272), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1560605904, 'Álmosd', 11, ST_SetSRID(ST_MakePoint(21.9838, 47.4154), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (909497424, 'Alsógalla', 4, ST_SetSRID(ST_MakePoint(18.4157, 47.5681), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (115883792, 'Alsómocsolád', 16, ST_SetSRID(ST_MakePoint(18.2450, 46.3131), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1019993617, 'Andocs', 18, ST_SetSRID(ST_MakePoint(17.9243, 46.6488), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (187226361, 'Apátfalva', 7, ST_SetSRID(ST_MakePoint(20.5746, 46.1768), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (665196086, 'Ásotthalom', 7, ST_SetSRID(ST_MakePoint(19.7841, 46.2001), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (376108473, 'Átány', 10, ST_SetSRID(ST_MakePoint(20.3620, 47.6175), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (416979504, 'Badacsonytomaj', 20, ST_SetSRID(ST_MakePoint(17.5147, 46.8058), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (571332236, 'Bajna', 4, ST_SetSRID(ST_MakePoint(18.5986, 47.6553), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (2101177472, 'Bakonynána', 20, ST_SetSRID(ST_MakePoint(17.9692, 47.2820), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (510051502, 'Balatonakali', 20, ST_SetSRID(ST_MakePoint(17.7527, 46.8837), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (2052338428, 'Balatonberény', 18, ST_SetSRID(ST_MakePoint(17.3193, 46.7108), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1840580837, 'Balatonboglár', 18, ST_SetSRID(ST_MakePoint(17.6553, 46.7785), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1686868285, 'Balatonendréd', 18, ST_SetSRID(ST_MakePoint(17.9766, 46.8362), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (250306466, 'Balatonkiliti', 18, ST_SetSRID(ST_MakePoint(18.0703, 46.8791), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (601040624, 'Balatonlelle', 18, ST_SetSRID(ST_MakePoint(17.6965, 46.7868), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1341733618, 'Balatonudvari', 20, ST_SetSRID(ST_MakePoint(17.8048, 46.9054), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (2043973636, 'Bálványos', 18, ST_SetSRID(ST_MakePoint(17.9521, 46.7817), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1437532675, 'Bár', 16, ST_SetSRID(ST_MakePoint(18.7172, 46.0518), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1072287623, 'Bárdudvarnok', 18, ST_SetSRID(ST_MakePoint(17.6851, 46.3268), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (448653404, 'Báta', 1, ST_SetSRID(ST_MakePoint(18.7749, 46.1287), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (44548528, 'Bátor', 10, ST_SetSRID(ST_MakePoint(20.2657, 47.9918), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (388588118, 'Bátya', 2, ST_SetSRID(ST_MakePoint(18.9545, 46.4874), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1812599001, 'Békésszentandrás', 8, ST_SetSRID(ST_MakePoint(20.4851, 46.8717), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1939024971, 'Bercel', 12, ST_SetSRID(ST_MakePoint(19.4035, 47.8698), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1732082303, 'Berente', 13, ST_SetSRID(ST_MakePoint(20.6645, 48.2319), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (989905862, 'Berettyóújfalu', 11, ST_SetSRID(ST_MakePoint(21.5355, 47.2247), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (2084765283, 'Bezenye', 19, ST_SetSRID(ST_MakePoint(17.2162, 47.9621), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (804818457, 'Bölcske', 1, ST_SetSRID(ST_MakePoint(18.9695, 46.7403), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (2019632166, 'Boldog', 10, ST_SetSRID(ST_MakePoint(19.6954, 47.6012), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1342898960, 'Bucsuta', 17, ST_SetSRID(ST_MakePoint(16.8341, 46.5645), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1376465909, 'Budajenő', 6, ST_SetSRID(ST_MakePoint(18.8039, 47.5555), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1532655717, 'Bugyi', 6, ST_SetSRID(ST_MakePoint(19.1490, 47.2220), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (252524757, 'Buzsák', 18, ST_SetSRID(ST_MakePoint(17.5775, 46.6487), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1219909527, 'Ceglédbercel', 6, ST_SetSRID(ST_MakePoint(19.6786, 47.2150), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (282700859, 'Csajág', 20, ST_SetSRID(ST_MakePoint(18.1859, 47.0447), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (54877308, 'Csákvár', 3, ST_SetSRID(ST_MakePoint(18.4641, 47.3918), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (2129729890, 'Csanádpalota', 7, ST_SetSRID(ST_MakePoint(20.7234, 46.2440), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (568266835, 'Császártöltés', 2, ST_SetSRID(ST_MakePoint(19.1785, 46.4230), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (656799524, 'Csemő', 6, ST_SetSRID(ST_MakePoint(19.6977, 47.1184), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (496227509, 'Cserépfalu', 13, ST_SetSRID(ST_MakePoint(20.5360, 47.9430), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (865246838, 'Csernely', 13, ST_SetSRID(ST_MakePoint(20.3421, 48.1443), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (82291142, 'Csókakő', 3, ST_SetSRID(ST_MakePoint(18.2758, 47.3564), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (552593873, 'Csolnok', 4, ST_SetSRID(ST_MakePoint(18.7176, 47.6946), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1928077595, 'Csólyospálos', 2, ST_SetSRID(ST_MakePoint(19.8388, 46.4186), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1947625420, 'Csömör', 6, ST_SetSRID(ST_MakePoint(19.2242, 47.5489), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (888402400, 'Csór', 3, ST_SetSRID(ST_MakePoint(18.2569, 47.2050), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1793271969, 'Csurgó', 18, ST_SetSRID(ST_MakePoint(17.0951, 46.2643), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (428169077, 'Dánszentmiklós', 6, ST_SetSRID(ST_MakePoint(19.5561, 47.2077), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1059660987, 'Darnózseli', 19, ST_SetSRID(ST_MakePoint(17.4269, 47.8505), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1767069167, 'Deszk', 7, ST_SetSRID(ST_MakePoint(20.2389, 46.2179), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (978023696, 'Domoszló', 10, ST_SetSRID(ST_MakePoint(20.1163, 47.8263), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1649709125, 'Dozmat', 15, ST_SetSRID(ST_MakePoint(16.5144, 47.2338), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (170218711, 'Drávaszabolcs', 16, ST_SetSRID(ST_MakePoint(18.2129, 45.8046), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1252536121, 'Dunabogdány', 6, ST_SetSRID(ST_MakePoint(19.0352, 47.7938), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (520244403, 'Dunaegyháza', 2, ST_SetSRID(ST_MakePoint(18.9565, 46.8399), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1679321917, 'Dunakömlőd', 1, ST_SetSRID(ST_MakePoint(18.8807, 46.6686), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (655909102, 'Dunavecse', 2, ST_SetSRID(ST_MakePoint(18.9717, 46.9164), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (567476479, 'Dusnok', 2, ST_SetSRID(ST_MakePoint(18.9590, 46.3900), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (18891814, 'Ecseny', 18, ST_SetSRID(ST_MakePoint(17.8524, 46.5511), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1323273372, 'Egerszalók', 10, ST_SetSRID(ST_MakePoint(20.3238, 47.8702), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (722273543, 'Egervár', 17, ST_SetSRID(ST_MakePoint(16.8522, 46.9336), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (643800050, 'Erdőtarcsa', 12, ST_SetSRID(ST_MakePoint(19.5428, 47.7618), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1148055804, 'Érsekcsanád', 2, ST_SetSRID(ST_MakePoint(18.9823, 46.2520), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (755253131, 'Erzsébet', 16, ST_SetSRID(ST_MakePoint(18.4586, 46.1007), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (433882290, 'Farkasdomb', 6, ST_SetSRID(ST_MakePoint(18.9523, 47.2385), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1093432721, 'Farmos', 6, ST_SetSRID(ST_MakePoint(19.8490, 47.3616), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1853943863, 'Fegyvernek', 9, ST_SetSRID(ST_MakePoint(20.5259, 47.2527), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1449950479, 'Fehérvárcsurgó', 3, ST_SetSRID(ST_MakePoint(18.2658, 47.2906), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1015754504, 'Feked', 16, ST_SetSRID(ST_MakePoint(18.5599, 46.1610), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1562420129, 'Felsőnyék', 1, ST_SetSRID(ST_MakePoint(18.2915, 46.7892), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (454449674, 'Foktő', 2, ST_SetSRID(ST_MakePoint(18.9193, 46.5290), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (2141402977, 'Füle', 3, ST_SetSRID(ST_MakePoint(18.2459, 47.0527), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1273142507, 'Fülöp', 11, ST_SetSRID(ST_MakePoint(22.0563, 47.5991), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1250249715, 'Galgahévíz', 6, ST_SetSRID(ST_MakePoint(19.5558, 47.6223), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1268927798, 'Gara', 2, ST_SetSRID(ST_MakePoint(19.0387, 46.0342), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (366012147, 'Gátér', 2, ST_SetSRID(ST_MakePoint(19.9577, 46.6835), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (134055764, 'Gávavencsellő', 14, ST_SetSRID(ST_MakePoint(21.5934, 48.1610), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (395101862, 'Geresdlak', 16, ST_SetSRID(ST_MakePoint(18.5270, 46.1083), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (238744773, 'Gesztely-Újharangod', NULL, NULL);
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (795333219, 'Gölle', 18, ST_SetSRID(ST_MakePoint(18.0122, 46.4388), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (578626171, 'Gomba', 6, ST_SetSRID(ST_MakePoint(19.5312, 47.3704), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1735735864, 'Görgeteg', 18, ST_SetSRID(ST_MakePoint(17.4364, 46.1466), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1564921340, 'Gyenesdiás', 17, ST_SetSRID(ST_MakePoint(17.2860, 46.7725), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1778874022, 'Gyomaendrőd', 8, ST_SetSRID(ST_MakePoint(20.8261, 46.9358), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1955366806, 'Gyöngyöspata', 10, ST_SetSRID(ST_MakePoint(19.7903, 47.8147), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (430152457, 'Gyöngyössolymos', 10, ST_SetSRID(ST_MakePoint(19.9332, 47.8169), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1774482770, 'Gyöngyöstarján', 10, ST_SetSRID(ST_MakePoint(19.8668, 47.8117), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1941571903, 'Györköny', 1, ST_SetSRID(ST_MakePoint(18.6946, 46.6345), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (2114750140, 'Győrújfalu', 19, ST_SetSRID(ST_MakePoint(17.6082, 47.7212), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1934343510, 'Győrzámoly', 19, ST_SetSRID(ST_MakePoint(17.5788, 47.7404), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (839203829, 'Gyulafirátót', 20, ST_SetSRID(ST_MakePoint(17.9490, 47.1444), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (213014990, 'Hajdúhadház', 11, ST_SetSRID(ST_MakePoint(21.6692, 47.6845), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (237391970, 'Hajós', 2, ST_SetSRID(ST_MakePoint(19.1172, 46.3983), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (575138333, 'Halimba', 20, ST_SetSRID(ST_MakePoint(17.5356, 47.0333), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (850974546, 'Háromfa', 18, ST_SetSRID(ST_MakePoint(17.3295, 46.1046), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (534307500, 'Harta', 2, ST_SetSRID(ST_MakePoint(19.0277, 46.6947), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (647236467, 'Hedrehely', 18, ST_SetSRID(ST_MakePoint(17.6522, 46.1962), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1807124461, 'Hegykő', 19, ST_SetSRID(ST_MakePoint(16.7941, 47.6217), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (381207409, 'Herencsény', 12, ST_SetSRID(ST_MakePoint(19.4726, 47.9746), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (235037215, 'Herend', 20, ST_SetSRID(ST_MakePoint(17.7523, 47.1328), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1842204891, 'Hévíz', 17, ST_SetSRID(ST_MakePoint(17.1834, 46.7906), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (683692790, 'Hidas', 16, ST_SetSRID(ST_MakePoint(18.4977, 46.2595), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1539654939, 'Homokmégy', 2, ST_SetSRID(ST_MakePoint(19.0737, 46.4880), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (45125014, 'Hosszúhetény', 16, ST_SetSRID(ST_MakePoint(18.3528, 46.1613), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1798531821, 'Igal', 18, ST_SetSRID(ST_MakePoint(17.9387, 46.5345), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1919023079, 'Iharosberény', 18, ST_SetSRID(ST_MakePoint(17.1114, 46.3635), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1688788333, 'Iszkaszentgyörgy', 3, ST_SetSRID(ST_MakePoint(18.2950, 47.2382), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (197645565, 'Jakabszállás', 2, ST_SetSRID(ST_MakePoint(19.6008, 46.7615), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (545020103, 'Jenő', 3, ST_SetSRID(ST_MakePoint(18.2499, 47.1058), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (534517710, 'Kács', 13, ST_SetSRID(ST_MakePoint(20.6086, 47.9586), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1183111920, 'Kadarkút', 18, ST_SetSRID(ST_MakePoint(17.6179, 46.2286), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (620802230, 'Kakasd', 1, ST_SetSRID(ST_MakePoint(18.5927, 46.3463), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (179659753, 'Kakucs', 6, ST_SetSRID(ST_MakePoint(19.3667, 47.2416), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1030749403, 'Kalaznó', 1, ST_SetSRID(ST_MakePoint(18.4745, 46.5015), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (311768231, 'Kállósemjén', 14, ST_SetSRID(ST_MakePoint(21.9249, 47.8603), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1987456571, 'Kaposújlak', 18, ST_SetSRID(ST_MakePoint(17.7259, 46.3668), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1095207113, 'Karád', 18, ST_SetSRID(ST_MakePoint(17.8386, 46.6935), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1151299864, 'Karancslapujtő', 12, ST_SetSRID(ST_MakePoint(19.7361, 48.1527), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (2134384153, 'Karcag', 9, ST_SetSRID(ST_MakePoint(20.9241, 47.3146), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1111673953, 'Kátoly', 16, ST_SetSRID(ST_MakePoint(18.4510, 46.0611), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1585203262, 'Káva', 6, ST_SetSRID(ST_MakePoint(19.5879, 47.3557), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (2038605406, 'Kávás', 17, ST_SetSRID(ST_MakePoint(16.7087, 46.8620), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1196302400, 'Kékesd', 16, ST_SetSRID(ST_MakePoint(18.4727, 46.1010), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1512333237, 'Kelebia', 2, ST_SetSRID(ST_MakePoint(19.6072, 46.1971), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1849391494, 'Kerekegyháza', 2, ST_SetSRID(ST_MakePoint(19.4825, 46.9359), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1471928596, 'Kesztölc', 4, ST_SetSRID(ST_MakePoint(18.7971, 47.7131), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (440021815, 'Kétbodony', 12, ST_SetSRID(ST_MakePoint(19.2849, 47.9354), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1902395242, 'Kéthely', 18, ST_SetSRID(ST_MakePoint(17.3933, 46.6469), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (399369208, 'Kisapáti', 20, ST_SetSRID(ST_MakePoint(17.4672, 46.8426), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1412755614, 'Kisbajom', 18, ST_SetSRID(ST_MakePoint(17.4866, 46.3053), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (235956084, 'Kisgyalán', 18, ST_SetSRID(ST_MakePoint(17.9762, 46.4235), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1391547792, 'Kisgyőr', 13, ST_SetSRID(ST_MakePoint(20.6887, 48.0103), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1527125915, 'Kiskunfélegyháza', 2, ST_SetSRID(ST_MakePoint(19.8502, 46.7114), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1786434712, 'Kiskunhalas', 2, ST_SetSRID(ST_MakePoint(19.4833, 46.4278), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1157371373, 'Kisnána', 10, ST_SetSRID(ST_MakePoint(20.1461, 47.8531), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1983473060, 'Kisszékely', 1, ST_SetSRID(ST_MakePoint(18.5390, 46.6794), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (956825135, 'Kocs', 4, ST_SetSRID(ST_MakePoint(18.2132, 47.6055), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1703473173, 'Kóka', 6, ST_SetSRID(ST_MakePoint(19.5806, 47.4892), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1224439209, 'Kölesd-Borjád', 1, ST_SetSRID(ST_MakePoint(18.5903, 46.5576), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (443155414, 'Komlóska', 13, ST_SetSRID(ST_MakePoint(21.4629, 48.3408), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (279201906, 'Kőröshegy', 18, ST_SetSRID(ST_MakePoint(17.9005, 46.8313), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1604437648, 'Körösszakál', 11, ST_SetSRID(ST_MakePoint(21.5873, 47.0211), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (395540503, 'Kőszegszerdahely', 15, ST_SetSRID(ST_MakePoint(16.5157, 47.3406), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (203309184, 'Kunfehértó', 2, ST_SetSRID(ST_MakePoint(19.4133, 46.3624), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1209845273, 'Kunhegyes', 9, ST_SetSRID(ST_MakePoint(20.6318, 47.3699), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1598789894, 'Kustánszeg', 17, ST_SetSRID(ST_MakePoint(16.6799, 46.7853), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1756116022, 'Lajoskomárom', 3, ST_SetSRID(ST_MakePoint(18.3372, 46.8418), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1416728300, 'Látrány', 18, ST_SetSRID(ST_MakePoint(17.7446, 46.7485), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (2137051296, 'Legénd', 12, ST_SetSRID(ST_MakePoint(19.3110, 47.8780), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (58106990, 'Lenti', 17, ST_SetSRID(ST_MakePoint(16.5367, 46.6246), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1662409666, 'Létavértes', 11, ST_SetSRID(ST_MakePoint(21.8764, 47.3853), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1255038050, 'Lipót', 19, ST_SetSRID(ST_MakePoint(17.4616, 47.8613), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (513563012, 'Liptód', 16, ST_SetSRID(ST_MakePoint(18.5157, 46.0462), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (812658955, 'Lónya', 14, ST_SetSRID(ST_MakePoint(22.2704, 48.3182), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (2139335071, 'Lovasberény', 3, ST_SetSRID(ST_MakePoint(18.5527, 47.3100), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (463674326, 'Lulla', 18, ST_SetSRID(ST_MakePoint(18.0238, 46.7893), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (470318737, 'Madocsa', 1, ST_SetSRID(ST_MakePoint(18.9567, 46.6881), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (278179668, 'Maglód', 6, ST_SetSRID(ST_MakePoint(19.3593, 47.4450), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (72409432, 'Mágocs', 16, ST_SetSRID(ST_MakePoint(18.2286, 46.3498), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (945442265, 'Magyaregregy', 16, ST_SetSRID(ST_MakePoint(18.3083, 46.2510), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1852343189, 'Magyarpolány', 20, ST_SetSRID(ST_MakePoint(17.5501, 47.1685), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1764743711, 'Magyarszék', 16, ST_SetSRID(ST_MakePoint(18.1964, 46.1957), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1235985403, 'Mátraderecske', 10, ST_SetSRID(ST_MakePoint(20.0828, 47.9497), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1294347461, 'Mátranovák', 12, ST_SetSRID(ST_MakePoint(19.9814, 48.0388), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (404554595, 'Mecseknádasd', 16, ST_SetSRID(ST_MakePoint(18.4645, 46.2244), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (433834797, 'Medina', 1, ST_SetSRID(ST_MakePoint(18.6434, 46.4739), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (274636458, 'Méhkerék', 8, ST_SetSRID(ST_MakePoint(21.4492, 46.7748), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1179217779, 'Mencshely', 20, ST_SetSRID(ST_MakePoint(17.6999, 46.9455), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (825916917, 'Mesztegnyő', 18, ST_SetSRID(ST_MakePoint(17.4239, 46.5045), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1387698168, 'Mezőberény', 8, ST_SetSRID(ST_MakePoint(21.0291, 46.8240), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1458124480, 'Mezőfalva', 3, ST_SetSRID(ST_MakePoint(18.7790, 46.9325), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1297690817, 'Mezőkomárom', 3, ST_SetSRID(ST_MakePoint(18.2898, 46.8288), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (276508530, 'Mezőkovácsháza', 8, ST_SetSRID(ST_MakePoint(20.9236, 46.4073), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (621478766, 'Mezőszentgyörgy', 3, ST_SetSRID(ST_MakePoint(18.2738, 46.9940), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1390752953, 'Mezőszilas', 3, ST_SetSRID(ST_MakePoint(18.4750, 46.8158), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (180955997, 'Mezőtárkány', 10, ST_SetSRID(ST_MakePoint(20.4761, 47.7219), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (327356110, 'Miklósi', 18, ST_SetSRID(ST_MakePoint(17.9963, 46.6473), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1938698730, 'Mikóháza', 13, ST_SetSRID(ST_MakePoint(21.5933, 48.4635), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (481235288, 'Milota', 14, ST_SetSRID(ST_MakePoint(22.7803, 48.1036), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1834657139, 'Miske', 2, ST_SetSRID(ST_MakePoint(19.0321, 46.4424), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1657219289, 'Monostorapáti', 20, ST_SetSRID(ST_MakePoint(17.5554, 46.9250), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (512590275, 'Mosdós', 18, ST_SetSRID(ST_MakePoint(17.9869, 46.3535), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1842841289, 'Mözs', 1, ST_SetSRID(ST_MakePoint(18.7554, 46.4105), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1857895818, 'Nádasd', 15, ST_SetSRID(ST_MakePoint(16.6129, 46.9651), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (674954581, 'Nagybajom', 18, ST_SetSRID(ST_MakePoint(17.5119, 46.3937), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (259111434, 'Nagybörzsöny', 6, ST_SetSRID(ST_MakePoint(18.8244, 47.9360), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1759408193, 'Nagydobos', 14, ST_SetSRID(ST_MakePoint(22.3034, 48.0536), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (224536622, 'Nagydorog', 1, ST_SetSRID(ST_MakePoint(18.6579, 46.6231), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1705992594, 'Nagyhajmás', 16, ST_SetSRID(ST_MakePoint(18.2892, 46.3743), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1714049695, 'Nagyhegyes', 11, ST_SetSRID(ST_MakePoint(21.3466, 47.5385), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1991281094, 'Nagykörű', 9, ST_SetSRID(ST_MakePoint(20.4484, 47.2743), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1321209821, 'Nagymágocs', 7, ST_SetSRID(ST_MakePoint(20.4812, 46.5835), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1526040115, 'Nagymányok', 1, ST_SetSRID(ST_MakePoint(18.4592, 46.2825), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1852764387, 'Nagyrábé', 11, ST_SetSRID(ST_MakePoint(21.3192, 47.2046), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1050552179, 'Nagyrada', 17, ST_SetSRID(ST_MakePoint(17.1183, 46.6195), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (933196233, 'Nagyrécse', 17, ST_SetSRID(ST_MakePoint(17.0516, 46.4887), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (796959157, 'Nagyszakácsi', 18, ST_SetSRID(ST_MakePoint(17.3216, 46.4875), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1183803953, 'Nagytevel', 20, ST_SetSRID(ST_MakePoint(17.5655, 47.2964), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (998442932, 'Nagyvázsony', 20, ST_SetSRID(ST_MakePoint(17.6985, 46.9835), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1677122594, 'Nekézseny', 13, ST_SetSRID(ST_MakePoint(20.4295, 48.1675), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1293083333, 'Nemescsó', 15, ST_SetSRID(ST_MakePoint(16.6166, 47.3506), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1374135022, 'Nemesnádudvar', 2, ST_SetSRID(ST_MakePoint(19.0522, 46.3392), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (259717253, 'Németkér', 1, ST_SetSRID(ST_MakePoint(18.7644, 46.7175), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (546780328, 'Nézsa', 12, ST_SetSRID(ST_MakePoint(19.2976, 47.8449), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1927901238, 'Nikla', 18, ST_SetSRID(ST_MakePoint(17.5173, 46.5783), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (908640486, 'Noszvaj', 10, ST_SetSRID(ST_MakePoint(20.4754, 47.9370), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (464840842, 'Nyárlőrinc', 2, ST_SetSRID(ST_MakePoint(19.8741, 46.8605), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (775712266, 'Nyíregyháza', 14, ST_SetSRID(ST_MakePoint(21.7168, 47.9558), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (611207685, 'Nyírmártonfalva', 11, ST_SetSRID(ST_MakePoint(21.8984, 47.5849), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1830396155, 'Óbánya', 16, ST_SetSRID(ST_MakePoint(18.4114, 46.2205), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (619291239, 'Ócsa', 6, ST_SetSRID(ST_MakePoint(19.2314, 47.3012), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (934487569, 'Őcsény', 1, ST_SetSRID(ST_MakePoint(18.7589, 46.3119), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (807139414, 'Olaszfalu', 20, ST_SetSRID(ST_MakePoint(17.9079, 47.2437), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (395575858, 'Orfű', 16, ST_SetSRID(ST_MakePoint(18.1552, 46.1381), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (978438032, 'Örményes', 9, ST_SetSRID(ST_MakePoint(20.5676, 47.1909), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (213256188, 'Őrség', 15, ST_SetSRID(ST_MakePoint(16.4060, 46.8327), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (874598010, 'Öskü', 20, ST_SetSRID(ST_MakePoint(18.0731, 47.1601), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1309635226, 'Ostffyasszonyfa', 15, ST_SetSRID(ST_MakePoint(17.0428, 47.3275), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1088932854, 'Oszkó', 15, ST_SetSRID(ST_MakePoint(16.8745, 47.0465), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1139857308, 'Öttömös', 7, ST_SetSRID(ST_MakePoint(19.6799, 46.2842), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (778452523, 'Ozora', 1, ST_SetSRID(ST_MakePoint(18.3997, 46.7527), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1634519131, 'Palotabozsok', 16, ST_SetSRID(ST_MakePoint(18.6410, 46.1288), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (24383415, 'Pánd', 6, ST_SetSRID(ST_MakePoint(19.6327, 47.3507), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1253417565, 'Pátka', 3, ST_SetSRID(ST_MakePoint(18.4871, 47.2771), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1648338903, 'Páty', 6, ST_SetSRID(ST_MakePoint(18.8272, 47.5155), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1014710954, 'Pázmánd', 3, ST_SetSRID(ST_MakePoint(18.6566, 47.2836), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (83310865, 'Penyige', 14, ST_SetSRID(ST_MakePoint(22.5685, 47.9974), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1302747170, 'Péteri', 6, ST_SetSRID(ST_MakePoint(19.4108, 47.3881), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (706618608, 'Petőmihályfa', 15, ST_SetSRID(ST_MakePoint(16.7864, 46.9808), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (885626458, 'Pincehely', 1, ST_SetSRID(ST_MakePoint(18.4398, 46.6820), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1430953082, 'Pócsmegyer', 6, ST_SetSRID(ST_MakePoint(19.0956, 47.7158), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (392040728, 'Porrogszentkirály', 18, ST_SetSRID(ST_MakePoint(17.0407, 46.2728), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1364437674, 'Porva', 20, ST_SetSRID(ST_MakePoint(17.8126, 47.3069), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1225060708, 'Pusztamérges', 7, ST_SetSRID(ST_MakePoint(19.6857, 46.3284), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (391155618, 'Pusztavám', 3, ST_SetSRID(ST_MakePoint(18.2280, 47.4293), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1382544284, 'Rácalmás', 3, ST_SetSRID(ST_MakePoint(18.9393, 47.0259), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1029014341, 'Rátka', 13, ST_SetSRID(ST_MakePoint(21.2264, 48.2135), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (759445390, 'Regöly', 1, ST_SetSRID(ST_MakePoint(18.3905, 46.5787), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (60788102, 'Révfülöp', 20, ST_SetSRID(ST_MakePoint(17.6304, 46.8283), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1672332289, 'Rezi', 17, ST_SetSRID(ST_MakePoint(17.2196, 46.8418), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1179684255, 'Rimóc', 12, ST_SetSRID(ST_MakePoint(19.5304, 48.0374), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (818738443, 'Ságvár', 18, ST_SetSRID(ST_MakePoint(18.1020, 46.8373), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (158164861, 'Sándorfalva', 7, ST_SetSRID(ST_MakePoint(20.1042, 46.3657), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1457562535, 'Sáregres', 3, ST_SetSRID(ST_MakePoint(18.5970, 46.7813), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1236468682, 'Sárpilis', 1, ST_SetSRID(ST_MakePoint(18.7372, 46.2471), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (868694292, 'Sárszentlőrinc', 1, ST_SetSRID(ST_MakePoint(18.6066, 46.6261), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (997925494, 'Seregélyes', 3, ST_SetSRID(ST_MakePoint(18.5786, 47.1116), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1887269575, 'Siklós', 16, ST_SetSRID(ST_MakePoint(18.2984, 45.8521), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (827679718, 'Simontornya', 1, ST_SetSRID(ST_MakePoint(18.5435, 46.7570), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1252883101, 'Sióagárd', 1, ST_SetSRID(ST_MakePoint(18.6536, 46.3908), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1253398430, 'Siófok', 18, ST_SetSRID(ST_MakePoint(18.0542, 46.9072), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1314984649, 'Siójut', 18, ST_SetSRID(ST_MakePoint(18.1388, 46.8794), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (2039517687, 'Soltvadkert', 2, ST_SetSRID(ST_MakePoint(19.3943, 46.5820), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1968813246, 'Somberek', 16, ST_SetSRID(ST_MakePoint(18.6605, 46.0810), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1060039527, 'Somodor', 18, ST_SetSRID(ST_MakePoint(17.8418, 46.4763), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1224716164, 'Somogyszentpál', 18, ST_SetSRID(ST_MakePoint(17.4739, 46.6416), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1084590588, 'Somogyszob', 18, ST_SetSRID(ST_MakePoint(17.2968, 46.2930), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (173539472, 'Somogytúr', 18, ST_SetSRID(ST_MakePoint(17.7654, 46.7072), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (846768180, 'Somogyvár', 18, ST_SetSRID(ST_MakePoint(17.6510, 46.5812), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1191730978, 'Sülysáp', 6, ST_SetSRID(ST_MakePoint(19.5215, 47.4543), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (545106045, 'Súr', 4, ST_SetSRID(ST_MakePoint(18.0297, 47.3724), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1117096260, 'Szalafő', 15, ST_SetSRID(ST_MakePoint(16.3636, 46.8655), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (453015349, 'Szany', 19, ST_SetSRID(ST_MakePoint(17.3048, 47.4618), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (792615444, 'Szászvár', 16, ST_SetSRID(ST_MakePoint(18.3783, 46.2744), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (2055396800, 'Szatmárcseke', 14, ST_SetSRID(ST_MakePoint(22.6297, 48.0852), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (70764917, 'Szatta', 15, ST_SetSRID(ST_MakePoint(16.4804, 46.7989), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1793625880, 'Szenna', 18, ST_SetSRID(ST_MakePoint(17.7319, 46.3084), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1025793269, 'Szentendre', 6, ST_SetSRID(ST_MakePoint(19.0760, 47.6678), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1931938208, 'Szentgál', 20, ST_SetSRID(ST_MakePoint(17.7351, 47.1126), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1481089513, 'Szentkirály', 2, ST_SetSRID(ST_MakePoint(19.9181, 46.9188), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (577978827, 'Szepetnek', 17, ST_SetSRID(ST_MakePoint(16.8995, 46.4335), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (880520974, 'Szigetbecse', 6, ST_SetSRID(ST_MakePoint(18.9492, 47.1306), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1340767579, 'Szigliget', 20, ST_SetSRID(ST_MakePoint(17.4332, 46.8014), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1120587202, 'Sződliget', 6, ST_SetSRID(ST_MakePoint(19.1473, 47.7300), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (690910368, 'Szólád', 18, ST_SetSRID(ST_MakePoint(17.8395, 46.7865), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (676969511, 'Szomolya', 13, ST_SetSRID(ST_MakePoint(20.4939, 47.8923), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1588845578, 'Szulok', 18, ST_SetSRID(ST_MakePoint(17.5508, 46.0505), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1724451460, 'Szurdokpüspöki', 12, ST_SetSRID(ST_MakePoint(19.6956, 47.8525), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (385512965, 'Táborfalva', 6, ST_SetSRID(ST_MakePoint(19.4829, 47.1043), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1067726433, 'Tác', 3, ST_SetSRID(ST_MakePoint(18.4058, 47.0830), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (289767743, 'Taktaszada', 13, ST_SetSRID(ST_MakePoint(21.1760, 48.1108), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1287627927, 'Tápióbicske', 6, ST_SetSRID(ST_MakePoint(19.6867, 47.3622), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (687944026, 'Tápióság', 6, ST_SetSRID(ST_MakePoint(19.6303, 47.3992), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1869797662, 'Tápiószentmárton', 6, ST_SetSRID(ST_MakePoint(19.7690, 47.3223), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (894258626, 'Tápiószőlős', 6, ST_SetSRID(ST_MakePoint(19.8411, 47.2926), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (58430509, 'Tard', 13, ST_SetSRID(ST_MakePoint(20.6041, 47.8730), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (21541402, 'Tarhos', 8, ST_SetSRID(ST_MakePoint(21.2127, 46.8121), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (844780135, 'Tengelic', 1, ST_SetSRID(ST_MakePoint(18.7108, 46.5319), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (2131633856, 'Tényő', 19, ST_SetSRID(ST_MakePoint(17.6456, 47.5407), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (515282494, 'Tevel', 1, ST_SetSRID(ST_MakePoint(18.4556, 46.4125), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (996844238, 'Tihany', 20, ST_SetSRID(ST_MakePoint(17.8882, 46.9133), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1650672842, 'Tiszakécske', 2, ST_SetSRID(ST_MakePoint(20.1045, 46.9315), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (931943878, 'Tiszakürt', 9, ST_SetSRID(ST_MakePoint(20.1236, 46.8849), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (696533113, 'Tiszapüspöki', 9, ST_SetSRID(ST_MakePoint(20.3173, 47.2145), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1060892732, 'Tóalmás', 6, ST_SetSRID(ST_MakePoint(19.6637, 47.5096), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (277642478, 'Tolcsva', 13, ST_SetSRID(ST_MakePoint(21.4491, 48.2828), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1186345426, 'Törtel', 6, ST_SetSRID(ST_MakePoint(19.9351, 47.1208), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (754358533, 'Tótkomlós', 8, ST_SetSRID(ST_MakePoint(20.7366, 46.4115), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1512000221, 'Tótszerdahely', 17, ST_SetSRID(ST_MakePoint(16.7969, 46.4009), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1493605596, 'Tura', 6, ST_SetSRID(ST_MakePoint(19.5949, 47.6093), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (996672802, 'Túrkeve', 9, ST_SetSRID(ST_MakePoint(20.7421, 47.1051), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1827336620, 'Úrhida', 3, ST_SetSRID(ST_MakePoint(18.3346, 47.1327), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1739491222, 'Úrkút', 20, ST_SetSRID(ST_MakePoint(17.6437, 47.0825), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (721893954, 'Vanyarc', 12, ST_SetSRID(ST_MakePoint(19.4514, 47.8247), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (215885074, 'Varsány', 12, ST_SetSRID(ST_MakePoint(19.4908, 48.0411), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (644696062, 'Vecsés', 6, ST_SetSRID(ST_MakePoint(19.2643, 47.4069), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1498562019, 'Velem', 15, ST_SetSRID(ST_MakePoint(16.4938, 47.3455), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1661883546, 'Verőce', 6, ST_SetSRID(ST_MakePoint(19.0340, 47.8231), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1524550283, 'Verpelét', 10, ST_SetSRID(ST_MakePoint(20.2279, 47.8490), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (38040351, 'Vitnyéd', 19, ST_SetSRID(ST_MakePoint(16.9800, 47.5871), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (973680301, 'Zákányszék', 7, ST_SetSRID(ST_MakePoint(19.8885, 46.2741), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (689068514, 'Zalaegerszeg', 17, ST_SetSRID(ST_MakePoint(16.8456, 46.8416), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (814328543, 'Zalamerenye', 17, ST_SetSRID(ST_MakePoint(17.0961, 46.5746), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (1505385968, 'Zánka', 20, ST_SetSRID(ST_MakePoint(17.6834, 46.8729), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (2087325267, 'Zebegény', 6, ST_SetSRID(ST_MakePoint(18.9102, 47.8000), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (806082045, 'Zengővárkony', 16, ST_SetSRID(ST_MakePoint(18.4318, 46.1706), 4326));
+INSERT INTO settlement_stage (id, name, regionid, geom) VALUES (560782542, 'Zsáka', 11, ST_SetSRID(ST_MakePoint(21.4360, 47.1343), 4326));
+
+CREATE TEMP TABLE settlement_id_map ON COMMIT DROP AS
+SELECT s.id AS old_id, st.id AS new_id
+FROM public."Settlement" s JOIN settlement_stage st ON lower(st.name) = lower(s.name)
+WHERE s.id <> st.id;
+DO $$
+DECLARE clash text;
+BEGIN
+    SELECT string_agg(format('%s: %s / %s', st.id, s.name, st.name), '; ') INTO clash
+    FROM settlement_stage st JOIN public."Settlement" s ON s.id = st.id
+    WHERE lower(s.name) <> lower(st.name);
+    IF clash IS NOT NULL THEN
+        RAISE EXCEPTION 'settlement id already used by another settlement: %', clash;
+    END IF;
+END $$;
+INSERT INTO public."Settlement" (id, name, regionid, geom)
+SELECT DISTINCT ON (st.id) st.id, st.name, coalesce(st.regionid, s.regionid), coalesce(st.geom, s.geom)
+FROM settlement_stage st
+JOIN settlement_id_map m ON m.new_id = st.id
+JOIN public."Settlement" s ON s.id = m.old_id
+ORDER BY st.id, s.id
+ON CONFLICT (id) DO NOTHING;
+UPDATE public."Recipe" r SET settlement_id = m.new_id
+FROM settlement_id_map m WHERE r.settlement_id = m.old_id;
+DELETE FROM public."Settlement" s USING settlement_id_map m WHERE s.id = m.old_id;
+INSERT INTO public."Settlement" (id, name, regionid, geom)
+SELECT id, name, regionid, geom FROM settlement_stage
+ON CONFLICT (id) DO UPDATE SET
+    name = EXCLUDED.name,
+    regionid = coalesce(EXCLUDED.regionid, "Settlement".regionid),
+    geom = coalesce(EXCLUDED.geom, "Settlement".geom)
+WHERE ("Settlement".name, "Settlement".regionid, "Settlement".geom)
+      IS DISTINCT FROM (EXCLUDED.name, coalesce(EXCLUDED.regionid, "Settlement".regionid), coalesce(EXCLUDED.geom, "Settlement".geom));
+COMMIT;
@@ -0,0 +1,211 @@
+"""
+Tömeges, idempotens Settlement betöltés soronkénti INSERT szöveg helyett.
+
+Az id a normalizált (ékezet- és kisbetű-független) névből származik, így a
+lista átrendezése vagy bővítése nem tolja el a meglévő települések id-jét.
+A kimenet COPY-kompatibilis CSV vagy TSV (a geometria EWKT szövegként, amit
+a PostGIS COPY-val közvetlenül beolvas), vagy INSERT parancsok; mindhárom egy
+átmeneti táblán át egyetlen INSERT ... ON CONFLICT utasítással olvad be a
+Settlement táblába.
+
+A beolvasztás előtt ugyanabban a tranzakcióban lefut az átszámozás: a
+korábbi (sorszám szerinti, 1..N) id-jű, azonos nevű településsorok az új id
+alá kerülnek, a Recipe.settlement_id hivatkozások átíródnak, a régi sorok
+törlődnek. Így a régi adatbázisok és a korábbi settlement_inserts.sql-lel
+töltöttek sem kapnak duplikált településeket. (A SettlementGeometryLevel
+származtatott sorai a régi id-vel együtt törlődnek; a geometry_levels.py
+--write-pg újraépíti őket.)
+
+Használat (példa):
+    python telepules_insertek.py --format csv --out settlements.csv
+    psql ... -f settlements_merge.sql                        # a fájl mellé írt merge szkript
+    python telepules_insertek.py --copy-dsn postgresql://...    # közvetlen COPY stream
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from geocode_cache import cache_key
+
+COLUMNS = ("id", "name", "regionid", "geom")
+
+STAGE_TABLE = "settlement_stage"
+
+MAP_TABLE = "settlement_id_map"
+
+# Régi id -> új id az azonos (kisbetűsítve egyező) nevű sorokra; a meglévő duplikátumok is ide kerülnek
+RENUMBER_SQL = [
+    f"""
+CREATE TEMP TABLE {MAP_TABLE} ON COMMIT DROP AS
+SELECT s.id AS old_id, st.id AS new_id
+FROM public."Settlement" s JOIN {STAGE_TABLE} st ON lower(st.name) = lower(s.name)
+WHERE s.id <> st.id
+""",
+    f"""
+DO $$
+DECLARE clash text;
+BEGIN
+    SELECT string_agg(format('%s: %s / %s', st.id, s.name, st.name), '; ') INTO clash
+    FROM {STAGE_TABLE} st JOIN public."Settlement" s ON s.id = st.id
+    WHERE lower(s.name) <> lower(st.name);
+    IF clash IS NOT NULL THEN
+        RAISE EXCEPTION 'settlement id already used by another settlement: %', clash;
+    END IF;
+END $$
+""",
+    f"""
+INSERT INTO public."Settlement" (id, name, regionid, geom)
+SELECT DISTINCT ON (st.id) st.id, st.name, coalesce(st.regionid, s.regionid), coalesce(st.geom, s.geom)
+FROM {STAGE_TABLE} st
+JOIN {MAP_TABLE} m ON m.new_id = st.id
+JOIN public."Settlement" s ON s.id = m.old_id
+ORDER BY st.id, s.id
+ON CONFLICT (id) DO NOTHING
+""",
+    f"""
+UPDATE public."Recipe" r SET settlement_id = m.new_id
+FROM {MAP_TABLE} m WHERE r.settlement_id = m.old_id
+""",
+    f"""
+DELETE FROM public."Settlement" s USING {MAP_TABLE} m WHERE s.id = m.old_id
+""",
+]
+
+MERGE_SQL = f"""
+INSERT INTO public."Settlement" (id, name, regionid, geom)
+SELECT id, name, regionid, geom FROM {STAGE_TABLE}
+ON CONFLICT (id) DO UPDATE SET
+    name = EXCLUDED.name,
+    regionid = coalesce(EXCLUDED.regionid, "Settlement".regionid),
+    geom = coalesce(EXCLUDED.geom, "Settlement".geom)
+WHERE ("Settlement".name, "Settlement".regionid, "Settlement".geom)
+      IS DISTINCT FROM (EXCLUDED.name, coalesce(EXCLUDED.regionid, "Settlement".regionid), coalesce(EXCLUDED.geom, "Settlement".geom))
+"""
+
+
+@dataclass
+class SettlementRow:
+    id: int
+    name: str
+    regionid: Optional[int]
+    lon: Optional[float]
+    lat: Optional[float]
+
+    @property
+    def ewkt(self) -> Optional[str]:
+        if self.lon is None or self.lat is None:
+            return None
+        return f"SRID=4326;POINT({self.lon:.4f} {self.lat:.4f})"
+
+
+def stable_settlement_id(name: str) -> int:
+    """Positive 31-bit id from the accent-folded name (fits the integer id column)."""
+    digest = hashlib.blake2b(cache_key(name).encode("utf-8"), digest_size=4).digest()
+    return int.from_bytes(digest, "big") & 0x7FFFFFFF or 1
+
+
+def assign_ids(names: Sequence[str]) -> List[int]:
+    """Stable ids for already deduplicated names; a hash collision is an error, not a silent merge."""
+    ids = [stable_settlement_id(n) for n in names]
+    seen: Dict[int, str] = {}
+    for sid, name in zip(ids, names):
+        if sid in seen and cache_key(seen[sid]) != cache_key(name):
+            raise ValueError(f"settlement id collision: {seen[sid]!r} and {name!r} both hash to {sid}")
+        seen[sid] = name
+    return ids
+
+
+def _text_field(v: Optional[object]) -> str:
+    # COPY text formátum: \N a NULL, a \, tab és sortörés escape-elve
+    if v is None:
+        return "\\N"
+    return str(v).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def write_copy(f, rows: Iterable[SettlementRow], fmt: str = "csv") -> int:
+    """Write rows in COPY format ('csv' with header, or 'tsv' = COPY text format); returns row count."""
+    n = 0
+    if fmt == "csv":
+        w = csv.writer(f, lineterminator="\n")
+        w.writerow(COLUMNS)
+        for r in rows:
+            w.writerow([r.id, r.name, "" if r.regionid is None else r.regionid, r.ewkt or ""])
+            n += 1
+    elif fmt == "tsv":
+        for r in rows:
+            f.write("\t".join(_text_field(v) for v in (r.id, r.name, r.regionid, r.ewkt)) + "\n")
+            n += 1
+    else:
+        raise ValueError(f"unknown COPY format: {fmt}")
+    return n
+
+
+def copy_options(fmt: str) -> str:
+    return "(FORMAT csv, HEADER true)" if fmt == "csv" else "(FORMAT text)"
+
+
+def merge_statements() -> List[str]:
+    """Renumbering migration + merge, to run after the stage table is filled (one transaction)."""
+    return [sql.strip() for sql in RENUMBER_SQL] + [MERGE_SQL.strip()]
+
+
+def stage_table_sql() -> str:
+    return f'CREATE TEMP TABLE {STAGE_TABLE} (LIKE public."Settlement" INCLUDING DEFAULTS) ON COMMIT DROP'
+
+
+def insert_sql(row: SettlementRow) -> str:
+    """INSERT of one row into the stage table (the settlement_inserts.sql line format)."""
+    region_sql = row.regionid if row.regionid is not None else "NULL"
+    geom_sql = f"ST_SetSRID(ST_MakePoint({row.lon:.4f}, {row.lat:.4f}), 4326)" if row.lat is not None and row.lon is not None else "NULL"
+    name_sql = row.name.replace("'", "''")
+    return f"INSERT INTO {STAGE_TABLE} (id, name, regionid, geom) VALUES ({row.id}, '{name_sql}', {region_sql}, {geom_sql});"
+
+
+def write_insert_script(f, rows: Iterable[SettlementRow], header: str = "") -> int:
+    """psql script: stage table, one INSERT per row, then renumber + merge; returns row count."""
+    f.write(header)
+    f.write("BEGIN;\n")
+    f.write(stage_table_sql() + ";\n\n")
+    n = 0
+    for r in rows:
+        f.write(insert_sql(r) + "\n")
+        n += 1
+    f.write("\n")
+    for sql in merge_statements():
+        f.write(sql + ";\n")
+    f.write("COMMIT;\n")
+    return n
+
+
+def write_merge_script(path: str, data_path: str, fmt: str = "csv") -> None:
+    """psql script: stage the file with \\copy, then renumber + merge it."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("-- Settlement betöltés: COPY egy átmeneti táblába, átszámozás, majd egyetlen upsert\n")
+        f.write("BEGIN;\n")
+        f.write(stage_table_sql() + ";\n")
+        f.write(f"\\copy {STAGE_TABLE} ({', '.join(COLUMNS)}) FROM '{data_path}' WITH {copy_options(fmt)}\n")
+        for sql in merge_statements():
+            f.write(sql + ";\n")
+        f.write("COMMIT;\n")
+
+
+def copy_into_pg(conn, rows: Sequence[SettlementRow]) -> int:
+    """Stream the rows with COPY into a temp table, renumber old ids and upsert into Settlement; returns rows changed."""
+    buf = io.StringIO()
+    write_copy(buf, rows, "tsv")
+    buf.seek(0)
+    with conn.cursor() as cur:
+        cur.execute(stage_table_sql())
+        cur.copy_expert(f"COPY {STAGE_TABLE} ({', '.join(COLUMNS)}) FROM STDIN WITH {copy_options('tsv')}", buf)
+        *renumber, merge = merge_statements()
+        for sql in renumber:
+            cur.execute(sql)
+        cur.execute(merge)
+        changed = cur.rowcount
+    conn.commit()
+    return changed
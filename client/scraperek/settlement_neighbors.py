@@ -0,0 +1,420 @@
+"""
+Szomszédsági index a települések fölött ("receptek a közelben").
+
+A település-koordináták eddig csak a térképes markerekhez kellettek; egy
+"közeli települések / receptek" funkcióhoz minden kérésnél PostGIS
+távolság-szkennelés kellene. Ez a modul a településeket egységgömbi 3D
+vektorokként egy KD-fába (scipy cKDTree) teszi: a húrtávolság a
+főkörtávolság szigorúan monoton függvénye, így a legközelebbi szomszéd és a
+sugár-lekérdezés haversine-helyes, a keresés mégis euklideszi fán fut.
+
+Előre kiszámolva, tömör numpy tömbökben (npz):
+    knn        minden településhez a k legközelebbi másik település és távolsága (km)
+    radius     minden településhez a --radius-km sugáron belüli települések (CSR)
+    recipes    településenként a receptazonosítók (CSR), a "receptek R km-en
+               belül" válasz ezekből egyetlen vektoros gyűjtéssel áll össze
+
+Használat (példa):
+    python settlement_neighbors.py build --snapshot snapshot.sqlite --out neighbors.npz
+    python settlement_neighbors.py build --jsonl receptek.jsonl --out neighbors.npz
+    python settlement_neighbors.py query --index neighbors.npz --lon 19.04 --lat 47.50 --radius-km 20
+    python settlement_neighbors.py bench --jsonl receptek.jsonl --synthetic 3000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+
+DEFAULT_K = 10
+DEFAULT_RADIUS_KM = 25.0
+
+
+def unit_xyz(lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
+    lon_r, lat_r = np.radians(lon), np.radians(lat)
+    c = np.cos(lat_r)
+    return np.column_stack([c * np.cos(lon_r), c * np.sin(lon_r), np.sin(lat_r)])
+
+
+def chord_for_km(km: float) -> float:
+    return 2.0 * math.sin(min(km / EARTH_RADIUS_KM, math.pi) / 2.0)
+
+
+def km_for_chord(chord: np.ndarray) -> np.ndarray:
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2.0, 0.0, 1.0))
+
+
+def haversine_km(lon1, lat1, lon2, lat2) -> np.ndarray:
+    lon1, lat1, lon2, lat2 = map(np.radians, (lon1, lat1, lon2, lat2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def _csr(groups: Sequence[np.ndarray], dtype) -> Tuple[np.ndarray, np.ndarray]:
+    offsets = np.zeros(len(groups) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(g) for g in groups])
+    values = np.concatenate(groups).astype(dtype) if len(groups) else np.zeros(0, dtype=dtype)
+    return offsets, values
+
+
+def _gather(offsets: np.ndarray, values: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Concatenate the CSR rows `rows` without a Python loop."""
+    starts = offsets[rows]
+    lens = offsets[rows + 1] - starts
+    total = int(lens.sum())
+    if total == 0:
+        return values[:0]
+    # Minden kimeneti pozícióhoz: a saját sor kezdete + helyi sorszám
+    shift = np.repeat(starts - (np.cumsum(lens) - lens), lens)
+    return values[shift + np.arange(total)]
+
+
+@dataclass
+class NeighborIndex:
+    ids: np.ndarray             # settlement id, int64 (n,)
+    lon: np.ndarray
+    lat: np.ndarray
+    knn_idx: np.ndarray         # int32 (n, k), row positions
+    knn_km: np.ndarray          # float32 (n, k)
+    radius_km: float
+    rad_offsets: np.ndarray     # int64 (n + 1,)
+    rad_idx: np.ndarray         # int32, sorted by distance within a row
+    rad_km: np.ndarray          # float32
+    rec_offsets: np.ndarray     # int64 (n + 1,)
+    recipe_ids: np.ndarray      # int64
+    tree: object = field(default=None, repr=False)
+    row_of: Dict[int, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        from scipy.spatial import cKDTree
+
+        self.tree = cKDTree(unit_xyz(self.lon, self.lat))
+        self.row_of = {int(s): i for i, s in enumerate(self.ids.tolist())}
+
+    # -- lekérdezések tetszőleges pontra (KD-fa) --
+
+    def nearest(self, lon: float, lat: float, k: int = DEFAULT_K) -> List[Tuple[int, float]]:
+        """(settlement id, km) of the k settlements closest to the point."""
+        k = min(k, len(self.ids))
+        chord, rows = self.tree.query(unit_xyz(np.array([lon]), np.array([lat]))[0], k=k)
+        rows, chord = np.atleast_1d(rows), np.atleast_1d(chord)
+        return list(zip(self.ids[rows].tolist(), km_for_chord(chord).tolist()))
+
+    def within_rows(self, lon: float, lat: float, radius_km: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Row positions and distances (km) of the settlements within the radius, nearest first."""
+        p = unit_xyz(np.array([lon]), np.array([lat]))[0]
+        rows = np.asarray(self.tree.query_ball_point(p, chord_for_km(radius_km), return_sorted=False), dtype=np.int64)
+        if not len(rows):
+            return rows, np.zeros(0)
+        km = km_for_chord(np.linalg.norm(self.tree.data[rows] - p, axis=1))
+        order = np.argsort(km, kind="stable")
+        return rows[order], km[order]
+
+    def within(self, lon: float, lat: float, radius_km: float) -> List[Tuple[int, float]]:
+        rows, km = self.within_rows(lon, lat, radius_km)
+        return list(zip(self.ids[rows].tolist(), km.tolist()))
+
+    def recipes_within(self, lon: float, lat: float, radius_km: float) -> np.ndarray:
+        """Recipe ids of every settlement within `radius_km` of the point (nearest settlements first)."""
+        rows, _ = self.within_rows(lon, lat, radius_km)
+        return _gather(self.rec_offsets, self.recipe_ids, rows)
+
+    def recipe_count_within(self, lon: float, lat: float, radius_km: float) -> int:
+        rows, _ = self.within_rows(lon, lat, radius_km)
+        return int((self.rec_offsets[rows + 1] - self.rec_offsets[rows]).sum())
+
+    # -- lekérdezések településre (előre kiszámolt táblák, fa nélkül) --
+
+    def neighbors_of(self, settlement_id: int) -> List[Tuple[int, float]]:
+        """Precomputed k nearest other settlements."""
+        i = self.row_of[settlement_id]
+        return list(zip(self.ids[self.knn_idx[i]].tolist(), self.knn_km[i].tolist()))
+
+    def radius_of(self, settlement_id: int) -> List[Tuple[int, float]]:
+        """Precomputed settlements within the build radius (the settlement itself first)."""
+        i = self.row_of[settlement_id]
+        a, b = self.rad_offsets[i], self.rad_offsets[i + 1]
+        return list(zip(self.ids[self.rad_idx[a:b]].tolist(), self.rad_km[a:b].tolist()))
+
+    def recipes_near_settlement(self, settlement_id: int) -> np.ndarray:
+        i = self.row_of[settlement_id]
+        rows = self.rad_idx[self.rad_offsets[i]:self.rad_offsets[i + 1]].astype(np.int64)
+        return _gather(self.rec_offsets, self.recipe_ids, rows)
+
+    # -- mentés / betöltés --
+
+    _ARRAYS = ("ids", "lon", "lat", "knn_idx", "knn_km", "rad_offsets", "rad_idx", "rad_km", "rec_offsets", "recipe_ids")
+
+    def save(self, path: str) -> None:
+        np.savez_compressed(path, radius_km=np.float64(self.radius_km), **{a: getattr(self, a) for a in self._ARRAYS})
+
+    @classmethod
+    def load(cls, path: str) -> "NeighborIndex":
+        with np.load(path) as z:
+            return cls(radius_km=float(z["radius_km"]), **{a: z[a] for a in cls._ARRAYS})
+
+
+def build_index(
+    ids: np.ndarray,
+    lon: np.ndarray,
+    lat: np.ndarray,
+    recipes: Dict[int, List[int]],
+    k: int = DEFAULT_K,
+    radius_km: float = DEFAULT_RADIUS_KM,
+) -> NeighborIndex:
+    """Build the tree and the precomputed kNN / radius / recipe tables; `recipes` maps settlement id -> recipe ids."""
+    from scipy.spatial import cKDTree
+
+    ids = np.asarray(ids, dtype=np.int64)
+    lon = np.asarray(lon, dtype=np.float64)
+    lat = np.asarray(lat, dtype=np.float64)
+    xyz = unit_xyz(lon, lat)
+    tree = cKDTree(xyz)
+    n = len(ids)
+
+    # k + 1, mert minden pont első találata önmaga
+    kk = min(k + 1, n)
+    chord, rows = tree.query(xyz, k=kk)
+    rows, chord = rows.reshape(n, kk), chord.reshape(n, kk)
+    knn_idx = np.empty((n, kk - 1), dtype=np.int32)
+    knn_km = np.empty((n, kk - 1), dtype=np.float32)
+    for i in range(n):
+        keep = rows[i] != i
+        knn_idx[i] = rows[i][keep][: kk - 1]
+        knn_km[i] = km_for_chord(chord[i][keep][: kk - 1])
+
+    groups, dists = [], []
+    for i, hits in enumerate(tree.query_ball_point(xyz, chord_for_km(radius_km), return_sorted=False)):
+        hits = np.asarray(hits, dtype=np.int64)
+        km = km_for_chord(np.linalg.norm(xyz[hits] - xyz[i], axis=1))
+        order = np.argsort(km, kind="stable")
+        groups.append(hits[order])
+        dists.append(km[order])
+    rad_offsets, rad_idx = _csr(groups, np.int32)
+    _, rad_km = _csr(dists, np.float32)
+
+    rec_offsets, recipe_ids = _csr([np.asarray(sorted(recipes.get(int(s), ())), dtype=np.int64) for s in ids], np.int64)
+    return NeighborIndex(ids, lon, lat, knn_idx, knn_km, radius_km, rad_offsets, rad_idx, rad_km, rec_offsets, recipe_ids)
+
+
+# -----------------------------
+# Bemenet
+# -----------------------------
+
+Source = Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[int, List[int]]]
+
+
+def _source(settlements: Sequence[tuple], recipe_rows: Sequence[tuple]) -> Source:
+    a = np.array(settlements, dtype=np.float64).reshape(-1, 3)
+    recipes: Dict[int, List[int]] = defaultdict(list)
+    for settlement_id, recipe_id in recipe_rows:
+        recipes[int(settlement_id)].append(int(recipe_id))
+    return a[:, 0].astype(np.int64), a[:, 1], a[:, 2], recipes
+
+
+def load_source_snapshot(path: str) -> Source:
+    from snapshot import Snapshot
+
+    with Snapshot(path) as snap:
+        settlements = [(r["id"], r["lon"], r["lat"]) for r in snap.sql("SELECT id, lon, lat FROM settlement WHERE lon IS NOT NULL ORDER BY id")]
+        recipe_rows = [(r["settlement_id"], r["id"]) for r in snap.sql("SELECT settlement_id, id FROM recipe WHERE settlement_id IS NOT NULL")]
+    return _source(settlements, recipe_rows)
+
+
+def load_source_pg(cur) -> Source:
+    cur.execute('SELECT id, ST_X(geom), ST_Y(geom) FROM public."Settlement" WHERE geom IS NOT NULL ORDER BY id')
+    settlements = cur.fetchall()
+    cur.execute('SELECT settlement_id, id FROM public."Recipe" WHERE settlement_id IS NOT NULL')
+    return _source(settlements, cur.fetchall())
+
+
+def load_source_jsonl(jsonl_path: str, settlements_sql: str) -> Source:
+    """Offline input; settlement ids as written in settlement_inserts.sql, recipe ids are 1-based JSONL line numbers."""
+    from geocode_cache import cache_key, parse_settlement_rows
+    from jsonl_io import iter_jsonl_records
+
+    settlements, by_name = [], {}
+    for sid, name, _, lon, lat in parse_settlement_rows(settlements_sql):
+        by_name[cache_key(name)] = sid
+        if lon is not None:
+            settlements.append((sid, lon, lat))
+    recipe_rows = []
+    for line_no, obj in enumerate(iter_jsonl_records(jsonl_path), start=1):
+        sid = by_name.get(cache_key(obj.get("settlement") or ""))
+        if sid is not None:
+            recipe_rows.append((sid, line_no))
+    return _source(settlements, recipe_rows)
+
+
+def synthetic_settlements(src: Source, extra: int, seed: int = 0) -> Source:
+    """Add `extra` jittered copies of real settlements (ids above the real ones) to approach nationwide density."""
+    ids, lon, lat, recipes = src
+    if extra <= 0:
+        return src
+    rng = np.random.default_rng(seed)
+    pick = rng.integers(0, len(ids), size=extra)
+    new_ids = np.arange(int(ids.max()) + 1, int(ids.max()) + 1 + extra, dtype=np.int64)
+    recipe_id = max((r for rs in recipes.values() for r in rs), default=0) + 1
+    out = dict(recipes)
+    for sid in new_ids.tolist():
+        n = int(rng.poisson(3))
+        out[sid] = list(range(recipe_id, recipe_id + n))
+        recipe_id += n
+    return (
+        np.concatenate([ids, new_ids]),
+        np.concatenate([lon, lon[pick] + rng.normal(0, 0.15, extra)]),
+        np.concatenate([lat, lat[pick] + rng.normal(0, 0.10, extra)]),
+        out,
+    )
+
+
+# -----------------------------
+# Benchmark
+# -----------------------------
+
+HU_BOUNDS = (16.1, 45.75, 22.9, 48.58)
+
+
+def bench(index: NeighborIndex, queries: int, radii: Sequence[float], seed: int = 0) -> List[Dict[str, object]]:
+    """KD-tree vs brute-force haversine for "recipes within R km"; results are checked to be identical."""
+    rng = np.random.default_rng(seed)
+    west, south, east, north = HU_BOUNDS
+    qlon = rng.uniform(west, east, queries)
+    qlat = rng.uniform(south, north, queries)
+    sample = index.ids[rng.integers(0, len(index.ids), size=queries)].tolist()
+
+    def brute(lon: float, lat: float, r: float) -> np.ndarray:
+        km = haversine_km(index.lon, index.lat, lon, lat)
+        rows = np.flatnonzero(km <= r)
+        return _gather(index.rec_offsets, index.recipe_ids, rows[np.argsort(km[rows], kind="stable")])
+
+    results = []
+    for r in radii:
+        t0 = time.perf_counter()
+        tree_out = [index.recipes_within(x, y, r) for x, y in zip(qlon, qlat)]
+        tree_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        brute_out = [brute(x, y, r) for x, y in zip(qlon, qlat)]
+        brute_s = time.perf_counter() - t0
+        mismatches = sum(1 for a, b in zip(tree_out, brute_out) if not np.array_equal(np.sort(a), np.sort(b)))
+        results.append({
+            "radius_km": r,
+            "queries": queries,
+            "avg_recipes": round(float(np.mean([len(a) for a in tree_out])), 1),
+            "kdtree_us": round(tree_s / queries * 1e6, 1),
+            "brute_us": round(brute_s / queries * 1e6, 1),
+            "mismatches": mismatches,
+        })
+
+    t0 = time.perf_counter()
+    for sid in sample:
+        index.recipes_near_settlement(sid)
+    table_us = (time.perf_counter() - t0) / queries * 1e6
+    t0 = time.perf_counter()
+    for x, y in zip(qlon, qlat):
+        index.nearest(x, y, index.knn_idx.shape[1])
+    knn_us = (time.perf_counter() - t0) / queries * 1e6
+    results.append({"radius_km": index.radius_km, "queries": queries, "precomputed_table_us": round(table_us, 1), "knn_query_us": round(knn_us, 1)})
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    here = os.path.dirname(__file__)
+    p = argparse.ArgumentParser(description="Haversine-correct nearest-neighbour index over settlements")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    def add_source(sp: argparse.ArgumentParser) -> None:
+        src = sp.add_mutually_exclusive_group(required=True)
+        src.add_argument("--snapshot", type=str, help="Offline SQLite snapshot (snapshot.py)")
+        src.add_argument("--dsn", type=str, help="Postgres DSN string")
+        src.add_argument("--jsonl", type=str, help="Scraped recipes; settlements from --settlements-sql")
+        sp.add_argument("--settlements-sql", type=str, default=os.path.join(here, "settlement_inserts.sql"))
+        sp.add_argument("--k", type=int, default=DEFAULT_K, help="Nearest settlements to precompute")
+        sp.add_argument("--radius-km", type=float, default=DEFAULT_RADIUS_KM, help="Neighbourhood radius to precompute")
+
+    pb = sub.add_parser("build", help="Build and save the neighbour tables")
+    add_source(pb)
+    pb.add_argument("--out", type=str, default="neighbors.npz")
+    pq = sub.add_parser("query", help="Nearest settlements and recipes within R km of a point")
+    pq.add_argument("--index", type=str, default="neighbors.npz")
+    pq.add_argument("--lon", type=float, required=True)
+    pq.add_argument("--lat", type=float, required=True)
+    pq.add_argument("--radius-km", type=float, default=10.0)
+    pq.add_argument("--k", type=int, default=5)
+    pbe = sub.add_parser("bench", help="KD-tree vs brute-force haversine query latency")
+    add_source(pbe)
+    pbe.add_argument("--synthetic", type=int, default=0, help="Add this many jittered synthetic settlements")
+    pbe.add_argument("--queries", type=int, default=2000)
+    pbe.add_argument("--radii", type=float, nargs="+", default=[5.0, 10.0, 25.0, 50.0])
+    pbe.add_argument("--json", type=str, default=None, help="Write the results as JSON")
+    args = p.parse_args(argv)
+
+    if args.cmd == "query":
+        index = NeighborIndex.load(args.index)
+        t0 = time.perf_counter()
+        recipes = index.recipes_within(args.lon, args.lat, args.radius_km)
+        took_us = (time.perf_counter() - t0) * 1e6
+        for sid, km in index.nearest(args.lon, args.lat, args.k):
+            print(f"  település {sid}: {km:.2f} km")
+        print(f"{len(recipes)} recept {args.radius_km} km-en belül ({took_us:.0f} µs)")
+        return 0
+
+    t0 = time.perf_counter()
+    if args.snapshot:
+        src = load_source_snapshot(args.snapshot)
+    elif args.jsonl:
+        src = load_source_jsonl(args.jsonl, args.settlements_sql)
+    else:
+        from insert_recipes import connect_pg
+
+        conn = connect_pg(args.dsn, None, None, None, None, None)
+        try:
+            with conn.cursor() as cur:
+                src = load_source_pg(cur)
+        finally:
+            conn.close()
+    if args.cmd == "bench":
+        src = synthetic_settlements(src, args.synthetic)
+    load_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    index = build_index(*src, k=args.k, radius_km=args.radius_km)
+    build_s = time.perf_counter() - t0
+    n = len(index.ids)
+    print(
+        f"{n} település, {len(index.recipe_ids)} recept; betöltés {load_s:.2f} s, építés {build_s * 1000:.1f} ms "
+        f"(k={index.knn_idx.shape[1]}, {args.radius_km} km: átlag {len(index.rad_idx) / max(n, 1):.1f} szomszéd)"
+    )
+
+    if args.cmd == "build":
+        index.save(args.out)
+        print(f"  -> {args.out} ({os.path.getsize(args.out):,} B)")
+        return 0
+
+    results = bench(index, args.queries, args.radii)
+    for r in results:
+        if "kdtree_us" in r:
+            print(
+                f"  R={r['radius_km']:>5} km  átlag {r['avg_recipes']:>7} recept  KD-fa {r['kdtree_us']:>7} µs  "
+                f"brute-force {r['brute_us']:>7} µs  eltérés {r['mismatches']}"
+            )
+        else:
+            print(f"  előre kiszámolt {r['radius_km']} km-es tábla {r['precomputed_table_us']} µs, kNN pontra {r['knn_query_us']} µs")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
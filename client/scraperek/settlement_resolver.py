@@ -0,0 +1,265 @@
+"""
+Elírás-tűrő településnév-feloldás (symmetric delete index).
+
+A településnevek három forrásból érkeznek (telepulesek_lista.txt, a
+receptoldalak szövege, a Settlement tábla), és nem mindig egyeznek betűre.
+Az index az ékezet- és kisbetű-független neveket, valamint azok legfeljebb
+k törléssel kapott változatait tárolja; egy lekérdezés a saját törléses
+változatain át jut a jelöltekhez, amelyeket valódi (Damerau-)Levenshtein
+távolsággal ellenőrzünk. Rövid neveknél kisebb a megengedett távolság,
+hogy a "Tard" ne illeszkedjen minden négybetűs szóra.
+
+A találat bizalma 1 - távolság / hosszabb név hossza, döntetlen (több
+azonos távolságú jelölt) esetén a jelöltek számával osztva.
+
+Használat (példa):
+    python settlement_resolver.py resolve --names telepulesek_lista.txt Kisgyör Mezöbereny "Abasar"
+    python settlement_resolver.py bench --names telepulesek_lista.txt --synthetic 3000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from textnorm import normalize_text
+
+
+def fold(name: str) -> str:
+    """Accent-folded, lower-case name with hyphens/whitespace collapsed to single spaces."""
+    return re.sub(r"[\s\-–]+", " ", normalize_text(name)).strip()
+
+
+def max_distance_for(length: int, k: int) -> int:
+    if length <= 3:
+        return 0
+    if length <= 7:
+        return min(1, k)
+    return k
+
+
+def _deletes(word: str, k: int) -> Set[str]:
+    out = {word}
+    frontier = {word}
+    for _ in range(k):
+        nxt = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        out |= nxt
+        frontier = nxt
+    return out
+
+
+def osa_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance (transposition counts as one edit), capped at limit + 1."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    # Közös elő- és utótag levágása: az elírás jellemzően egy helyen van, a mátrix így kicsi
+    lo = 0
+    while lo < len(a) and lo < len(b) and a[lo] == b[lo]:
+        lo += 1
+    hi = 0
+    while hi < len(a) - lo and hi < len(b) - lo and a[-1 - hi] == b[-1 - hi]:
+        hi += 1
+    a, b = a[lo:len(a) - hi], b[lo:len(b) - hi]
+    if not a or not b:
+        return len(a) + len(b)
+    prev2: List[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        row_min = cur[0]
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            v = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                v = min(v, prev2[j - 2] + 1)
+            cur[j] = v
+            row_min = min(row_min, v)
+        if row_min > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return prev[len(b)]
+
+
+@dataclass
+class Match:
+    name: str           # kanonikus név (ahogy az indexbe került)
+    query: str
+    distance: int
+    confidence: float
+    candidates: int     # azonos távolságú jelöltek száma (1 = egyértelmű)
+
+    @property
+    def exact(self) -> bool:
+        return self.distance == 0
+
+
+class SettlementResolver:
+    def __init__(self, names: Iterable[str], max_distance: int = 2) -> None:
+        self.k = max_distance
+        self.names: Dict[str, str] = {}
+        for n in names:
+            if n:
+                self.names.setdefault(fold(n), n)
+        self.index: Dict[str, List[str]] = defaultdict(list)
+        for key in self.names:
+            for d in _deletes(key, max_distance_for(len(key), self.k)):
+                self.index[d].append(key)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def resolve(self, name: Optional[str], min_confidence: float = 0.0) -> Optional[Match]:
+        if not name:
+            return None
+        q = fold(name)
+        if q in self.names:
+            return Match(self.names[q], name, 0, 1.0, 1)
+        k = max_distance_for(len(q), self.k)
+        if k == 0:
+            return None
+        best_d = k + 1
+        best: List[str] = []
+        seen: Set[str] = set()
+        for d in _deletes(q, k):
+            for key in self.index.get(d, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                # A jelölt saját hosszához tartozó korlát is számít (rövid névhez nem engedünk 2 hibát)
+                limit = min(k, max_distance_for(len(key), self.k))
+                dist = osa_distance(q, key, limit)
+                if dist > limit:
+                    continue
+                if dist < best_d:
+                    best_d, best = dist, [key]
+                elif dist == best_d:
+                    best.append(key)
+        if not best:
+            return None
+        best.sort()
+        key = best[0]
+        confidence = (1.0 - best_d / max(len(q), len(key))) / len(best)
+        if confidence < min_confidence:
+            return None
+        return Match(self.names[key], name, best_d, round(confidence, 4), len(best))
+
+    def find_in_text(self, text: str, min_confidence: float = 0.8, max_words: int = 3) -> Optional[Match]:
+        """Best fuzzy match among capitalized word runs (proper-noun candidates) of a raw text."""
+        words = re.findall(r"[^\W\d_][\w\-]*", text)
+        best: Optional[Match] = None
+        for i, w in enumerate(words):
+            if not w[0].isupper():
+                continue
+            for n in range(1, max_words + 1):
+                if i + n > len(words):
+                    break
+                m = self.resolve(" ".join(words[i:i + n]), min_confidence)
+                if m is not None and (best is None or m.confidence > best.confidence):
+                    best = m
+                    if m.exact:
+                        return m
+        return best
+
+
+def read_names(path: str) -> List[str]:
+    from geocode_cache import parse_settlement_inserts
+
+    if path.endswith(".sql"):
+        return [n for n, *_ in parse_settlement_inserts(path)]
+    with open(path, "r", encoding="utf-8") as f:
+        return [re.sub(r"\s+[–-]\s+.*$", "", line.strip()) for line in f if line.strip()]
+
+
+_PREFIXES = ("Kis", "Nagy", "Alsó", "Felső", "Közép", "Új", "Ó", "Hegy", "Mező", "Tisza", "Duna", "Balaton", "Szent")
+_SUFFIXES = ("", "falva", "háza", "telek", "szeg", "hegy", "völgy", "egyháza", "kér", "vár", "szállás", "lak")
+
+
+def synthetic_names(base: Sequence[str], n: int, seed: int = 7) -> List[str]:
+    """Plausible Hungarian-looking place names built from real ones, for benchmarking."""
+    rng = random.Random(seed)
+    roots = sorted({re.sub(r"^(Kis|Nagy|Alsó|Felső)", "", b).strip() for b in base if len(b) > 3})
+    out: Dict[str, str] = {fold(b): b for b in base}
+    while len(out) < n:
+        root = rng.choice(roots)
+        name = rng.choice(_PREFIXES) + root.lower() + rng.choice(_SUFFIXES)
+        out.setdefault(fold(name), name)
+    return list(out.values())
+
+
+def corrupt(name: str, edits: int, rng: random.Random) -> str:
+    letters = "aábcdeéfghiíjklmnoóöőprstuúüűvz"
+    s = list(name)
+    for _ in range(edits):
+        op = rng.randrange(4)
+        i = rng.randrange(len(s))
+        if op == 0 and len(s) > 4:
+            del s[i]
+        elif op == 1:
+            s.insert(i, rng.choice(letters))
+        elif op == 2:
+            s[i] = rng.choice(letters)
+        elif i + 1 < len(s):
+            s[i], s[i + 1] = s[i + 1], s[i]
+    return "".join(s)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Fuzzy settlement-name resolver (symmetric delete)")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    pr = sub.add_parser("resolve", help="Resolve names against a settlement list")
+    pr.add_argument("queries", nargs="+")
+    pb = sub.add_parser("bench", help="Lookups/s and accuracy on corrupted names")
+    pb.add_argument("--synthetic", type=int, default=3000, help="Pad the name list to this many names")
+    pb.add_argument("--queries", type=int, default=20000)
+    pb.add_argument("--brute-sample", type=int, default=500, help="Queries timed against a brute-force scan")
+    for sp_ in (pr, pb):
+        sp_.add_argument("--names", type=str, default="telepulesek_lista.txt", help="Name list (one per line) or settlement_inserts.sql")
+        sp_.add_argument("--max-distance", type=int, default=2)
+    args = p.parse_args(argv)
+
+    base = read_names(args.names)
+    if args.cmd == "resolve":
+        r = SettlementResolver(base, args.max_distance)
+        for q in args.queries:
+            m = r.resolve(q)
+            print(f"  {q!r}: " + (f"{m.name!r} (távolság {m.distance}, bizalom {m.confidence:.2f}, jelöltek {m.candidates})" if m else "nincs találat"))
+        return 0
+
+    names = synthetic_names(base, args.synthetic)
+    t0 = time.perf_counter()
+    r = SettlementResolver(names, args.max_distance)
+    build_s = time.perf_counter() - t0
+    rng = random.Random(1)
+    cases: List[Tuple[str, str, int]] = []
+    for _ in range(args.queries):
+        target = rng.choice(names)
+        edits = rng.choice((0, 1, 1, 2)) if len(fold(target)) > 7 else rng.choice((0, 1))
+        cases.append((corrupt(target, edits, rng) if edits else target, target, edits))
+
+    t0 = time.perf_counter()
+    results = [r.resolve(q) for q, _, _ in cases]
+    dt = time.perf_counter() - t0
+    correct = sum(1 for m, (_, t, _) in zip(results, cases) if m is not None and fold(m.name) == fold(t))
+    wrong = sum(1 for m, (_, t, _) in zip(results, cases) if m is not None and fold(m.name) != fold(t))
+    print(f"{len(r)} név, index: {len(r.index)} kulcs ({build_s:.2f} s)")
+    print(f"  {len(cases)} lekérdezés: {len(cases) / dt:,.0f} lekérdezés/s ({dt / len(cases) * 1e6:.1f} µs/lekérdezés)")
+    print(f"  helyes: {correct / len(cases):.1%}, más névre: {wrong / len(cases):.1%}, nincs találat: {(len(cases) - correct - wrong) / len(cases):.1%}")
+
+    keys = list(r.names)
+    sample = cases[: args.brute_sample]
+    t0 = time.perf_counter()
+    for q, _, _ in sample:
+        fq = fold(q)
+        min(keys, key=lambda k_: osa_distance(fq, k_, 2))
+    bdt = time.perf_counter() - t0
+    print(f"  brute force (OSA minden névre): {len(sample) / bdt:,.0f} lekérdezés/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,456 @@
+"""
+Offline elemzési pillanatkép (SQLite) a Recipe, Settlement és Region táblákról.
+
+Az elemzők és a dashboard prototípus-diagramjai így nem az éles Postgrest
+terhelik: a pillanatkép egyetlen, előre indexelt fájl, amit bárki helyben,
+szerver nélkül lekérdezhet. Tartalma:
+
+    region             id, name, geom (WKB, EPSG:4326), befoglaló téglalap
+    settlement         id, name, region_id, lon, lat, geom (WKB)
+    category           id, name
+    recipe             a Recipe oszlopai + region_id (a településből, denormalizálva)
+    ingredient         az Ingredient szótár
+    recipe_ingredient  a feldolgozott hozzávalólisták (RecipeIngredient)
+    snapshot_meta      létrehozás / utolsó frissítés ideje
+
+A teljes export egy ideiglenes fájlba ír, az indexeket a tömeges beszúrás
+után építi, majd atomikusan a helyére cseréli a fájlt. A frissítés az
+insert_recipes változáskészletéből (--changes-out) csak az érintett
+recepteket és településeket olvassa újra; a kicsi szótártáblák (régió,
+kategória, hozzávaló) mindig teljesen frissülnek.
+
+Használat (példa):
+    python snapshot.py export --dsn postgresql://... --out snapshot.sqlite
+    python snapshot.py refresh --dsn postgresql://... --out snapshot.sqlite --changes changes.json
+    python snapshot.py bench --out snapshot.sqlite
+    python insert_recipes.py --jsonl receptek.jsonl --snapshot snapshot.sqlite
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from changeset import ChangeSet
+from textnorm import normalize_text
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS region (
+    id    INTEGER PRIMARY KEY,
+    name  TEXT,
+    geom  BLOB,
+    minx  REAL, miny REAL, maxx REAL, maxy REAL
+);
+CREATE TABLE IF NOT EXISTS settlement (
+    id         INTEGER PRIMARY KEY,
+    name       TEXT,
+    region_id  INTEGER,
+    lon        REAL,
+    lat        REAL,
+    geom       BLOB
+);
+CREATE TABLE IF NOT EXISTS category (
+    id    INTEGER PRIMARY KEY,
+    name  TEXT
+);
+CREATE TABLE IF NOT EXISTS recipe (
+    id                INTEGER PRIMARY KEY,
+    url               TEXT NOT NULL,
+    title             TEXT NOT NULL,
+    year              INTEGER,
+    settlement_id     INTEGER,
+    settlement_name   TEXT,
+    category_id       INTEGER,
+    region_id         INTEGER,
+    ingredients_text  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ingredient (
+    id         INTEGER PRIMARY KEY,
+    name       TEXT NOT NULL,
+    name_norm  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS recipe_ingredient (
+    recipe_id      INTEGER NOT NULL,
+    position       INTEGER NOT NULL,
+    ingredient_id  INTEGER NOT NULL,
+    qty            REAL,
+    unit           TEXT,
+    raw            TEXT NOT NULL,
+    PRIMARY KEY (recipe_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS snapshot_meta (
+    key    TEXT PRIMARY KEY,
+    value  TEXT
+);
+"""
+
+# A diagramlekérdezések szűrői (év, település, kategória, régió, hozzávaló) mind indexet kapnak
+INDEXES = """
+CREATE INDEX IF NOT EXISTS recipe_year_idx ON recipe(year, category_id);
+CREATE INDEX IF NOT EXISTS recipe_region_idx ON recipe(region_id, year, category_id);
+CREATE INDEX IF NOT EXISTS recipe_settlement_idx ON recipe(settlement_id);
+CREATE INDEX IF NOT EXISTS recipe_category_idx ON recipe(category_id);
+CREATE INDEX IF NOT EXISTS settlement_region_idx ON settlement(region_id);
+CREATE UNIQUE INDEX IF NOT EXISTS ingredient_name_norm_idx ON ingredient(name_norm);
+CREATE INDEX IF NOT EXISTS recipe_ingredient_ingredient_idx ON recipe_ingredient(ingredient_id, recipe_id);
+"""
+
+_GEOM_4326 = "CASE WHEN ST_SRID(geom) IN (0, 4326) THEN geom ELSE ST_Transform(geom, 4326) END"
+
+SOURCE_QUERIES = {
+    "region": (
+        f"SELECT id, name, ST_AsBinary(g), ST_XMin(g), ST_YMin(g), ST_XMax(g), ST_YMax(g) "
+        f'FROM (SELECT id, name, {_GEOM_4326} AS g FROM public."Region") x',
+        "id",
+    ),
+    "settlement": (
+        f"SELECT id, name, regionid, ST_X(g), ST_Y(g), ST_AsBinary(g) "
+        f'FROM (SELECT id, name, regionid, {_GEOM_4326} AS g FROM public."Settlement") x',
+        "id",
+    ),
+    "category": ('SELECT id, name FROM public."Category"', "id"),
+    "recipe": (
+        "SELECT id, url, title, year, settlement_id, settlement_name, category_id, NULL, ingredients_text "
+        'FROM public."Recipe" x',
+        "id",
+    ),
+    "ingredient": ('SELECT id, name, name_norm FROM public."Ingredient"', "id"),
+    "recipe_ingredient": (
+        'SELECT recipe_id, position, ingredient_id, qty, unit, raw FROM public."RecipeIngredient" x',
+        "recipe_id",
+    ),
+}
+
+# Kis táblák: frissítéskor is teljes csere
+DICTIONARY_TABLES = ("region", "category", "ingredient")
+
+_FILL_RECIPE_REGION = (
+    "UPDATE recipe SET region_id = (SELECT s.region_id FROM settlement s WHERE s.id = recipe.settlement_id)"
+)
+
+
+def _columns(db: sqlite3.Connection, table: str) -> int:
+    return len(db.execute(f"PRAGMA table_info({table})").fetchall())
+
+
+def _pg_rows(conn, table: str, ids: Optional[Sequence[int]] = None, itersize: int = 5000) -> Iterator[tuple]:
+    """Stream a source table (optionally only the given ids) through a server-side cursor."""
+    sql, key = SOURCE_QUERIES[table]
+    params: tuple = ()
+    if ids is not None:
+        sql += f" WHERE x.{key} = ANY(%s)"
+        params = (list(ids),)
+    with conn.cursor(name=f"snapshot_{table}") as cur:
+        cur.itersize = itersize
+        cur.execute(sql, params)
+        for row in cur:
+            yield tuple(bytes(v) if isinstance(v, memoryview) else v for v in row)
+
+
+@contextmanager
+def _consistent_read(conn) -> Iterator[None]:
+    """One REPEATABLE READ, read-only transaction around all source reads.
+
+    At READ COMMITTED every named cursor would see its own snapshot, so during a concurrent
+    (e.g. streaming) load recipe_ingredient could disagree with recipe.
+    """
+    from psycopg2.extensions import ISOLATION_LEVEL_REPEATABLE_READ
+
+    old_isolation, old_readonly = conn.isolation_level, conn.readonly
+    conn.set_session(isolation_level=ISOLATION_LEVEL_REPEATABLE_READ, readonly=True)
+    try:
+        yield
+    finally:
+        conn.rollback()
+        conn.set_session(
+            isolation_level="DEFAULT" if old_isolation is None else old_isolation,
+            readonly="DEFAULT" if old_readonly is None else old_readonly,
+        )
+
+
+def _insert(db: sqlite3.Connection, table: str, rows: Iterable[tuple], chunk: int = 5000) -> int:
+    sql = f"INSERT OR REPLACE INTO {table} VALUES ({', '.join('?' * _columns(db, table))})"
+    n = 0
+    buf: List[tuple] = []
+    for row in rows:
+        buf.append(row)
+        if len(buf) >= chunk:
+            db.executemany(sql, buf)
+            n += len(buf)
+            buf = []
+    if buf:
+        db.executemany(sql, buf)
+        n += len(buf)
+    return n
+
+
+def _set_meta(db: sqlite3.Connection, **values: object) -> None:
+    db.executemany(
+        "INSERT OR REPLACE INTO snapshot_meta (key, value) VALUES (?, ?)", [(k, str(v)) for k, v in values.items()]
+    )
+
+
+def export_snapshot(conn, path: str) -> Dict[str, object]:
+    """Full snapshot of the Postgres tables into a new SQLite file, swapped in atomically."""
+    t0 = time.perf_counter()
+    tmp = path + ".tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    db = sqlite3.connect(tmp)
+    try:
+        db.execute("PRAGMA journal_mode = OFF")
+        db.execute("PRAGMA synchronous = OFF")
+        db.executescript(SCHEMA)
+        with _consistent_read(conn):
+            counts = {table: _insert(db, table, _pg_rows(conn, table)) for table in SOURCE_QUERIES}
+        db.execute(_FILL_RECIPE_REGION)
+        t1 = time.perf_counter()
+        # Indexek a tömeges beszúrás után: egyszeri rendezés soronkénti karbantartás helyett
+        db.executescript(INDEXES)
+        db.execute("ANALYZE")
+        now = time.strftime("%Y-%m-%dT%H:%M:%S")
+        _set_meta(db, created_at=now, refreshed_at=now)
+        db.commit()
+        db.execute("PRAGMA journal_mode = WAL")
+    finally:
+        db.close()
+    os.replace(tmp, path)
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    return {"rows": counts, "copy_s": round(t1 - t0, 3), "seconds": round(time.perf_counter() - t0, 3), "bytes": os.path.getsize(path)}
+
+
+def refresh_snapshot(conn, path: str, changes: ChangeSet) -> Dict[str, object]:
+    """Re-read only the recipes and settlements in the change set; rows gone from Postgres are dropped."""
+    t0 = time.perf_counter()
+    recipe_ids = sorted(changes.recipe_ids)
+    settlement_ids = sorted(s for s in changes.settlement_ids if s is not None)
+    db = sqlite3.connect(path)
+    try:
+        db.execute("PRAGMA journal_mode = WAL")
+        with db, _consistent_read(conn):
+            counts: Dict[str, int] = {}
+            for table in DICTIONARY_TABLES:
+                db.execute(f"DELETE FROM {table}")
+                counts[table] = _insert(db, table, _pg_rows(conn, table))
+            if settlement_ids:
+                db.executemany("DELETE FROM settlement WHERE id = ?", [(s,) for s in settlement_ids])
+                counts["settlement"] = _insert(db, "settlement", _pg_rows(conn, "settlement", settlement_ids))
+            if recipe_ids:
+                db.executemany("DELETE FROM recipe WHERE id = ?", [(r,) for r in recipe_ids])
+                db.executemany("DELETE FROM recipe_ingredient WHERE recipe_id = ?", [(r,) for r in recipe_ids])
+                counts["recipe"] = _insert(db, "recipe", _pg_rows(conn, "recipe", recipe_ids))
+                counts["recipe_ingredient"] = _insert(db, "recipe_ingredient", _pg_rows(conn, "recipe_ingredient", recipe_ids))
+            # Új/áthelyezett recept és régiót váltó település: a denormalizált region_id újraszámolása
+            touched = [(r,) for r in recipe_ids]
+            db.executemany(_FILL_RECIPE_REGION + " WHERE id = ?", touched)
+            db.executemany(_FILL_RECIPE_REGION + " WHERE settlement_id = ?", [(s,) for s in settlement_ids])
+            _set_meta(db, refreshed_at=time.strftime("%Y-%m-%dT%H:%M:%S"))
+    finally:
+        db.close()
+    return {
+        "recipes": len(recipe_ids),
+        "settlements": len(settlement_ids),
+        "rows": counts,
+        "seconds": round(time.perf_counter() - t0, 3),
+    }
+
+
+def update_snapshot(conn, path: str, changes: Optional[ChangeSet] = None) -> Dict[str, object]:
+    """Incremental refresh if the snapshot exists and a change set is given, full export otherwise."""
+    if changes is not None and os.path.exists(path):
+        return refresh_snapshot(conn, path, changes)
+    return export_snapshot(conn, path)
+
+
+# -----------------------------
+# Lekérdezési réteg
+# -----------------------------
+
+DIMENSIONS = ("region_id", "settlement_id", "year", "category_id")
+
+
+class Snapshot:
+    """Read-only query layer over a snapshot file; filters mirror GET /api/recipes."""
+
+    def __init__(self, path: str) -> None:
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        self.path = path
+        self.db = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        self.db.row_factory = sqlite3.Row
+
+    def close(self) -> None:
+        self.db.close()
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def meta(self) -> Dict[str, str]:
+        return {k: v for k, v in self.db.execute("SELECT key, value FROM snapshot_meta")}
+
+    def _where(
+        self,
+        years: Sequence[int] = (),
+        settlement_ids: Sequence[int] = (),
+        category_ids: Sequence[int] = (),
+        region_ids: Sequence[int] = (),
+        ingredients: Sequence[str] = (),
+        reverse: bool = False,
+    ) -> Tuple[str, List[object]]:
+        clauses: List[str] = []
+        params: List[object] = []
+        for column, values in (("year", years), ("settlement_id", settlement_ids), ("category_id", category_ids), ("region_id", region_ids)):
+            if values:
+                clauses.append(f"r.{column} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+        # Hozzávaló-szűrés a szótáron át, ahogy az API: ékezetfüggetlen részszöveg a name_norm-ban
+        for term in (normalize_text(t) for t in ingredients):
+            if term:
+                clauses.append(
+                    f"r.id {'NOT IN' if reverse else 'IN'} (SELECT ri.recipe_id FROM recipe_ingredient ri "
+                    "JOIN ingredient i ON i.id = ri.ingredient_id WHERE i.name_norm LIKE ?)"
+                )
+                params.append(f"%{term}%")
+        return (" AND ".join(clauses) or "1 = 1"), params
+
+    def recipes(self, limit: Optional[int] = None, **filters) -> List[Dict[str, object]]:
+        where, params = self._where(**filters)
+        sql = (
+            "SELECT r.id, r.url, r.title, r.year, r.settlement_id, r.category_id, r.region_id "
+            f"FROM recipe r WHERE {where} ORDER BY r.id"
+        )
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return [dict(row) for row in self.db.execute(sql, params)]
+
+    def count(self, **filters) -> int:
+        where, params = self._where(**filters)
+        return self.db.execute(f"SELECT count(*) FROM recipe r WHERE {where}", params).fetchone()[0]
+
+    def counts_by(self, dims: Sequence[str] = ("region_id",), **filters) -> List[Dict[str, object]]:
+        """Recipe counts grouped by any of region_id / settlement_id / year / category_id."""
+        bad = [d for d in dims if d not in DIMENSIONS]
+        if bad or not dims:
+            raise ValueError(f"unknown dimension(s): {bad or dims}; choose from {DIMENSIONS}")
+        where, params = self._where(**filters)
+        cols = ", ".join(f"r.{d}" for d in dims)
+        sql = f"SELECT {cols}, count(*) AS recipe_count FROM recipe r WHERE {where} GROUP BY {cols} ORDER BY {cols}"
+        return [dict(row) for row in self.db.execute(sql, params)]
+
+    def region_counts(self, **filters) -> Dict[int, int]:
+        """Same shape as the API's region_counts (recipes without a region are left out)."""
+        return {row["region_id"]: row["recipe_count"] for row in self.counts_by(("region_id",), **filters) if row["region_id"] is not None}
+
+    def top_ingredients(self, limit: int = 20, **filters) -> List[Dict[str, object]]:
+        where, params = self._where(**filters)
+        scope = f"WHERE ri.recipe_id IN (SELECT r.id FROM recipe r WHERE {where}) " if params else ""
+        sql = (
+            "SELECT i.id, i.name, count(DISTINCT ri.recipe_id) AS recipe_count "
+            f"FROM recipe_ingredient ri JOIN ingredient i ON i.id = ri.ingredient_id {scope}"
+            "GROUP BY i.id ORDER BY recipe_count DESC, i.name LIMIT ?"
+        )
+        return [dict(row) for row in self.db.execute(sql, params + [limit])]
+
+    def ingredients_of(self, recipe_id: int) -> List[Dict[str, object]]:
+        sql = (
+            "SELECT ri.position, i.name, ri.qty, ri.unit, ri.raw FROM recipe_ingredient ri "
+            "JOIN ingredient i ON i.id = ri.ingredient_id WHERE ri.recipe_id = ? ORDER BY ri.position"
+        )
+        return [dict(row) for row in self.db.execute(sql, (recipe_id,))]
+
+    def regions(self, with_geometry: bool = False) -> List[Dict[str, object]]:
+        """Regions with their bounding box; geometry as WKB bytes (shapely.from_wkb) on request."""
+        cols = "id, name, minx, miny, maxx, maxy" + (", geom" if with_geometry else "")
+        return [dict(row) for row in self.db.execute(f"SELECT {cols} FROM region ORDER BY id")]
+
+    def settlements(self, region_ids: Sequence[int] = ()) -> List[Dict[str, object]]:
+        where = f"WHERE region_id IN ({', '.join('?' * len(region_ids))})" if region_ids else ""
+        return [dict(row) for row in self.db.execute(f"SELECT id, name, region_id, lon, lat FROM settlement {where} ORDER BY id", list(region_ids))]
+
+    def sql(self, query: str, params: Sequence[object] = ()) -> List[Dict[str, object]]:
+        return [dict(row) for row in self.db.execute(query, params)]
+
+
+def bench_queries(snap: Snapshot, repeat: int = 20) -> Dict[str, float]:
+    """Median milliseconds of typical dashboard chart queries."""
+    years = [r["year"] for r in snap.sql("SELECT DISTINCT year FROM recipe WHERE year IS NOT NULL ORDER BY year")]
+    regions = [r["id"] for r in snap.regions()]
+    top = snap.top_ingredients(limit=1)
+    queries = {
+        "count(all)": lambda: snap.count(),
+        "region_counts": lambda: snap.region_counts(),
+        "region x year x category": lambda: snap.counts_by(("region_id", "year", "category_id")),
+        "region_counts(year)": lambda: snap.region_counts(years=years[len(years) // 2:][:1]),
+        "recipes(region, limit 100)": lambda: snap.recipes(limit=100, region_ids=regions[:1]),
+        "top_ingredients(20)": lambda: snap.top_ingredients(20),
+        "top_ingredients(region)": lambda: snap.top_ingredients(20, region_ids=regions[:1]),
+        "region_counts(ingredient)": lambda: snap.region_counts(ingredients=[top[0]["name"]] if top else []),
+    }
+    out: Dict[str, float] = {}
+    for name, fn in queries.items():
+        times = []
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - t0)
+        out[name] = round(sorted(times)[len(times) // 2] * 1000, 3)
+    return out
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Offline SQLite analytics snapshot (export / refresh / bench)")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    pe = sub.add_parser("export", help="Full snapshot from Postgres")
+    pr = sub.add_parser("refresh", help="Incremental refresh from an insert_recipes change set")
+    pr.add_argument("--changes", type=str, required=True, help="Change set JSON from insert_recipes --changes-out")
+    pb = sub.add_parser("bench", help="Time typical chart queries on a snapshot")
+    pb.add_argument("--repeat", type=int, default=20)
+    for sp_ in (pe, pr):
+        sp_.add_argument("--dsn", type=str, default=None, help="Postgres DSN string")
+        sp_.add_argument("--host", type=str, default=None)
+        sp_.add_argument("--port", type=int, default=None)
+        sp_.add_argument("--db", type=str, default=None)
+        sp_.add_argument("--user", type=str, default=None)
+        sp_.add_argument("--password", type=str, default=None)
+    for sp_ in (pe, pr, pb):
+        sp_.add_argument("--out", type=str, default="snapshot.sqlite", help="Snapshot file")
+    args = p.parse_args(argv)
+
+    if args.cmd == "bench":
+        with Snapshot(args.out) as snap:
+            print(f"{args.out}: {snap.count()} recept, frissítve {snap.meta().get('refreshed_at')}")
+            for name, ms in bench_queries(snap, args.repeat).items():
+                print(f"  {name:<28} {ms:8.3f} ms")
+        return 0
+
+    from insert_recipes import connect_pg
+
+    conn = connect_pg(args.dsn, args.host, args.port, args.db, args.user, args.password)
+    try:
+        if args.cmd == "export":
+            result = export_snapshot(conn, args.out)
+            print(f"Pillanatkép kész: {args.out} ({result['bytes'] / 1e6:.1f} MB, {result['seconds']} s)")
+        else:
+            result = update_snapshot(conn, args.out, ChangeSet.load(args.changes))
+            if "recipes" in result:
+                print(f"Pillanatkép frissítve: {result['recipes']} recept, {result['settlements']} település ({result['seconds']} s)")
+            else:
+                print(f"Nem volt pillanatkép, teljes export: {args.out} ({result['seconds']} s)")
+        for table, n in result["rows"].items():  # type: ignore[union-attr]
+            print(f"  {table}: {n} sor")
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
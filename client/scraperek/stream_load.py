@@ -0,0 +1,211 @@
+"""
+Közvetlen scrape -> adatbázis betöltés, fájl kerülőút nélkül.
+
+A scraper a feldolgozott Recipe objektumokat egy korlátos sorba teszi; egy
+háttérszál kötegekben (write_batch: receptek, hozzávalók, embeddingek)
+írja és commitolja őket. A köteg akkor is lezárul, ha --stream-max-wait
+másodperce vár, így az új recept pár másodpercen belül megjelenik a
+Postgresben. Ha a betöltő (DB vagy modell) lemarad, a sor megtelik, és a
+scraper put() hívása blokkol: ez a visszanyomás (backpressure) lassítja a
+crawlert. A JSONL mellékkimenetet a scraper közben is írja.
+
+Használat (példa):
+    python receptek_scraper.py --stream-dsn postgresql://... --stream-embed onnx
+    python receptek_scraper.py --refresh-counts telepules_counts.json --stream-dsn postgresql://...
+    python receptek_scraper.py --stream-dsn postgresql://... --stream-changes-out changes.json \
+        --stream-refresh-aggregates --stream-snapshot snapshot.sqlite
+"""
+
+from __future__ import annotations
+
+import argparse
+import queue
+import threading
+import time
+from dataclasses import asdict, is_dataclass
+from typing import Dict, List, Optional, Set
+
+from changeset import ChangeSet
+from insert_recipes import (
+    DEFAULT_ONNX_DIR,
+    DEFAULT_ST_MODEL,
+    RecipeRow,
+    connect_pg,
+    embedding_model_name,
+    load_embedder,
+    load_settlement_ids,
+    resolve_deferred_settlements,
+    row_from_record,
+    write_batch,
+)
+from load_stats import LoadStats
+
+_STOP = object()
+
+
+class StreamLoader:
+    def __init__(
+        self,
+        conn,
+        st_model=None,
+        model_name: Optional[str] = None,
+        batch_size: int = 50,
+        max_wait: float = 2.0,
+        queue_size: int = 200,
+        vector_storage: str = "vector",
+        stats: Optional[LoadStats] = None,
+    ) -> None:
+        self.conn = conn
+        self.st_model = st_model
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.vector_storage = vector_storage
+        self.stats = stats or LoadStats(report_every=0, label="stream")
+        self.queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self.thread = threading.Thread(target=self._run, name="stream-loader", daemon=True)
+        self.error: Optional[BaseException] = None
+        self.total = 0
+        self.recipe_ids: Set[int] = set()
+        self.batches = 0
+        self.unresolved: Set[str] = set()
+        self.changes = ChangeSet()
+        self.backpressure_s = 0.0
+        self.lag_max_s = 0.0
+        self._lag_sum_s = 0.0
+
+    def start(self) -> "StreamLoader":
+        self.thread.start()
+        return self
+
+    def _enqueue(self, item) -> None:
+        t0 = time.perf_counter()
+        while True:
+            if self.error is not None:
+                raise RuntimeError("stream loader stopped") from self.error
+            try:
+                self.queue.put(item, timeout=0.5)
+                break
+            except queue.Full:
+                continue
+        self.backpressure_s += time.perf_counter() - t0
+
+    def put(self, recipe) -> None:
+        """Queue one scraped recipe (Recipe dataclass or dict); blocks while the loader is behind."""
+        obj = asdict(recipe) if is_dataclass(recipe) else recipe
+        self._enqueue((time.monotonic(), row_from_record(obj)))
+
+    def close(self) -> None:
+        """Flush the last partial batch and wait for the loader thread."""
+        if self.thread.is_alive():
+            self._enqueue(_STOP)
+            self.thread.join()
+        if self.error is not None:
+            raise RuntimeError("stream loader failed") from self.error
+
+    def _flush(self, cur, batch: List[RecipeRow], queued_at: List[float], settlement_ids: Dict[str, int]) -> None:
+        self.unresolved |= write_batch(
+            cur, batch, settlement_ids, self.st_model, self.model_name, self.stats, self.vector_storage, self.changes,
+            self.recipe_ids,
+        )
+        with self.stats.statement("commit"):
+            self.conn.commit()
+        now = time.monotonic()
+        for t in queued_at:
+            self._lag_sum_s += now - t
+            self.lag_max_s = max(self.lag_max_s, now - t)
+        self.total += len(batch)
+        self.batches += 1
+        self.stats.add_rows(len(batch))
+
+    def _run(self) -> None:
+        try:
+            with self.conn.cursor() as cur:
+                settlement_ids = load_settlement_ids(cur)
+                batch: List[RecipeRow] = []
+                queued_at: List[float] = []
+                deadline: Optional[float] = None
+                done = False
+                while not done:
+                    timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                    try:
+                        item = self.queue.get(timeout=timeout)
+                    except queue.Empty:
+                        item = None
+                    if item is _STOP:
+                        done = True
+                    elif item is not None:
+                        queued_at.append(item[0])
+                        batch.append(item[1])
+                        if deadline is None:
+                            deadline = time.monotonic() + self.max_wait
+                    # Teli köteg, lejárt várakozás vagy leállás: commit
+                    if batch and (done or len(batch) >= self.batch_size or time.monotonic() >= (deadline or 0.0)):
+                        self._flush(cur, batch, queued_at, settlement_ids)
+                        batch, queued_at, deadline = [], [], None
+        except BaseException as e:  # a producer a következő put()-nál kapja meg
+            self.error = e
+            self.conn.rollback()
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "rows": self.total,
+            "recipes": len(self.recipe_ids),
+            "batches": self.batches,
+            "backpressure_s": round(self.backpressure_s, 3),
+            "lag_avg_s": round(self._lag_sum_s / self.total, 3) if self.total else 0.0,
+            "lag_max_s": round(self.lag_max_s, 3),
+        }
+
+
+def open_stream_loader(args: argparse.Namespace) -> StreamLoader:
+    """Connection + embedding model from the scraper's --stream-* options; the loader thread is started."""
+    model_args = argparse.Namespace(
+        embed=args.stream_embed, st_model=DEFAULT_ST_MODEL, onnx_dir=DEFAULT_ONNX_DIR, onnx_quantized=False
+    )
+    st_model = load_embedder(model_args)
+    conn = connect_pg(args.stream_dsn, None, None, None, None, None)
+    conn.autocommit = False
+    loader = StreamLoader(
+        conn,
+        st_model,
+        embedding_model_name(model_args),
+        batch_size=args.stream_batch_size,
+        max_wait=args.stream_max_wait,
+        queue_size=args.stream_queue,
+        stats=LoadStats(report_every=10.0, label="stream"),
+    )
+    return loader.start()
+
+
+def finish_stream_loader(
+    loader: StreamLoader, args: Optional[argparse.Namespace] = None, post_load: bool = True
+) -> Dict[str, object]:
+    """Drain the queue (the last partial batch is committed) and close the connection.
+
+    With post_load (a clean crawl) deferred settlement names are resolved, and the scraper's
+    --stream-refresh-aggregates / --stream-snapshot options refresh the aggregates and the
+    snapshot from the run's change set. --stream-changes-out is written in every case, also
+    after an aborted crawl or a failed load, for a later aggregates.py / snapshot.py refresh.
+    """
+    changes_out = getattr(args, "stream_changes_out", None)
+    out: Dict[str, object] = {}
+    try:
+        loader.close()
+        if post_load:
+            updated, missing, fuzzy = resolve_deferred_settlements(loader.conn, loader.unresolved, loader.changes)
+            out.update({"settlements_resolved_later": updated, "unresolved_settlements": missing, "fuzzy_settlements": fuzzy})
+            if getattr(args, "stream_refresh_aggregates", False):
+                from aggregates import refresh_aggregates
+
+                out["aggregates"] = refresh_aggregates(loader.conn, loader.changes)
+            if getattr(args, "stream_snapshot", None):
+                from snapshot import update_snapshot
+
+                out["snapshot"] = update_snapshot(loader.conn, args.stream_snapshot, loader.changes)
+    finally:
+        if changes_out:
+            loader.changes.save(changes_out)
+        loader.conn.close()
+    out.update(loader.summary())
+    return out
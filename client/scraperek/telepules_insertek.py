@@ -1,7 +1,11 @@
+import argparse
+import os
 import time
 import re
-from geopy.geocoders import Nominatim
-from geopy.exc import GeocoderTimedOut, GeocoderServiceError
+
+from geocode_cache import GeocodeCache, cache_key
+from geocoders import build_geocoder
+from settlement_load import SettlementRow, assign_ids, insert_sql, write_insert_script
 
 # --- 1. Adatok és Konfiguráció ---
 
@@ -363,47 +367,22 @@ REGION_MAPPING = {
     "Veszprém vármegye": 20,
 }
 
-# Geokódoló inicializálása
-geolocator = Nominatim(user_agent="izorzok_settlement_scraper_v1")
-
 # --- 2. Segédfüggvények ---
 
 def get_region_id(county_name):
     """Visszaadja a vármegye ID-t a nevéből, ellenőrizve az alternatív neveket is."""
-    # A Nominatim néha "Megye"-ként, néha "Vármegye"-ként adja vissza.
+    # A Nominatim néha "Megye"-ként, néha "Vármegye"-ként adja vissza, a gazetteer néha utótag nélkül.
     county_name = county_name.replace(" megye", " vármegye")
+    if county_name not in REGION_MAPPING and not county_name.endswith(" vármegye"):
+        county_name += " vármegye"
     return REGION_MAPPING.get(county_name, 'NULL')
 
-def geocode_settlement(settlement_name, country="Hungary"):
-    """Megkeresi a település koordinátáit és vármegye nevét."""
-    query = f"{settlement_name}, {country}"
-    
-    try:
-        location = geolocator.geocode(query, addressdetails=True, timeout=10)
-        
-        if location:
-            lat = location.latitude
-            lon = location.longitude
-            
-            # Próbáljuk meg kinyerni a vármegye nevét a Nominatim válaszból
-            county_name = None
-            if location.raw and 'address' in location.raw:
-                address = location.raw['address']
-                
-                # Lehetséges mezők a vármegye nevére
-                if 'county' in address:
-                    county_name = address['county']
-                elif 'state' in address:
-                    county_name = address['state']
-            
-            return lat, lon, county_name
-        
-    except GeocoderTimedOut:
-        print(f"  ❌ Hiba: Időtúllépés a(z) {settlement_name} geokódolásánál.")
-    except GeocoderServiceError as e:
-        print(f"  ❌ Hiba: Szolgáltatási hiba a(z) {settlement_name} geokódolásánál: {e}")
-    
-    return None, None, None
+def geocode_settlement(geocoder, settlement_name, country="Hungary"):
+    """Megkeresi a település koordinátáit és vármegye nevét a megadott geokódolóval."""
+    result = geocoder.geocode(settlement_name, country)
+    if result is None:
+        return None, None, None, None
+    return result.lat, result.lon, result.county, result.source
 
 def clean_settlement_name(raw_name):
     """Kitisztítja a településnevet a szokatlan részekből."""
@@ -413,64 +392,180 @@ def clean_settlement_name(raw_name):
     name = re.sub(r' - .*$', '', name).strip()
     return name
 
+def unique_settlement_names(raw_data):
+    """Tisztított nevek, első előfordulás sorrendjében, ékezet/kisbetű szerint egyszer."""
+    seen = set()
+    names = []
+    for line in raw_data.strip().split('\n'):
+        if not line.strip():
+            continue
+        name = clean_settlement_name(line)
+        key = cache_key(name)
+        if key not in seen:
+            seen.add(key)
+            names.append(name)
+    return names
+
+def cached_geocode(cache, geocoder, settlement_name, country="Hungary", retry_misses=False):
+    """(lat, lon, county, region_id, source) – a geokódoló csak gyorsítótár-hiánynál fut."""
+    query = f"{settlement_name}, {country}"
+    hit = cache.get(query) if cache is not None else None
+    if hit is not None and (hit.found or not retry_misses):
+        return hit.lat, hit.lon, hit.county, hit.region_id, "cache"
+
+    lat, lon, county_name, source = geocode_settlement(geocoder, settlement_name, country)
+    region_id = get_region_id(county_name) if county_name else 'NULL'
+    region_id = None if region_id == 'NULL' else region_id
+    # Offline találat nélküli nevet nem jegyzünk meg: egy későbbi online futás még megtalálhatja
+    if cache is not None and (lat is not None or geocoder.network):
+        cache.put(query, lat, lon, county_name, region_id, source=source or geocoder.name)
+    return lat, lon, county_name, region_id, source or geocoder.name
+
 # --- 3. Fő Logika ---
 
-def generate_sql_inserts(raw_data):
+def assign_regions(points, region_index):
+    """Vármegye ID minden geokódolt ponthoz egyetlen vektorizált point-in-polygon lekérdezéssel."""
+    from region_assign import NO_REGION
+
+    found = [i for i, p in enumerate(points) if p[0] is not None]
+    assignment = region_index.assign([points[i][1] for i in found], [points[i][0] for i in found])
+    region_ids = [None] * len(points)
+    for i, rid in zip(found, assignment.region_ids.tolist()):
+        region_ids[i] = None if rid == NO_REGION else rid
+    print(f"Régió-hozzárendelés (point-in-polygon): {len(found)} pont, {assignment.seconds * 1000:.2f} ms")
+    return region_ids, [found[j] for j in assignment.outside.tolist()]
+
+def generate_settlement_rows(raw_data, cache=None, retry_misses=False, region_index=None, geocoder=None):
     """
-    Feldolgozza a nyers listát, geokódolja a településeket, 
-    és létrehozza a PostGIS INSERT parancsokat.
+    Feldolgozza a nyers listát és geokódolja a településeket.
+    Az id a normalizált névből származik (stabil átrendezésre és bővítésre).
+    Ha region_index adott, a vármegye ID a Region poligonokból jön, nem a Nominatim címből.
     """
-    cleaned_names = [clean_settlement_name(n) for n in raw_data.strip().split('\n') if n.strip()]
-    sql_statements = []
+    cleaned_names = unique_settlement_names(raw_data)
+    geocoder = geocoder or build_geocoder()
+    sources = {}
     
-    print(f"Indítás: {len(cleaned_names)} település feldolgozása.\n")
+    print(f"Indítás: {len(cleaned_names)} település feldolgozása ({geocoder.name}).\n")
     
+    # 1. Geokódolás (gyorsítótárból, ha lehet; a Nominatim a saját 1 kérés/s korlátját tartja)
+    points = []
     for i, original_name in enumerate(cleaned_names):
-        print(f"[{i+1}/{len(cleaned_names)}] Feldolgozás: {original_name}...")
-        
-        # 1. Geokódolás
-        lat, lon, county_name = geocode_settlement(original_name)
+        lat, lon, county_name, region_id, source = cached_geocode(cache, geocoder, original_name, retry_misses=retry_misses)
+        points.append((lat, lon, region_id))
+        sources[source] = sources.get(source, 0) + 1
         
         if lat is None:
-            print(f"  ❌ Kihagyva: Nincs találat vagy hiba a(z) {original_name} esetén.")
-            region_id = 'NULL'
-            geom_value = 'NULL'
-        else:
-            # 2. Vármegye ID lekérése
-            region_id = get_region_id(county_name) if county_name else 'NULL'
-            
-            # 3. PostGIS geometria (POINT) létrehozása
-            geom_value = f"ST_SetSRID(ST_MakePoint({lon:.4f}, {lat:.4f}), 4326)"
-            
-            print(f"  ✅ Találat: Lat/Lon: {lat:.4f}/{lon:.4f}, Vármegye: {county_name} (ID: {region_id})")
-
-        # 4. SQL INSERT parancs összeállítása
-        # Biztosítjuk, hogy a name oszlopba a tisztított név kerüljön
-        sql = f"INSERT INTO public.\"Settlement\" (id, name, regionid, geom) VALUES ({i+1}, '{original_name.replace("'", "''")}', {region_id}, {geom_value});"
-        sql_statements.append(sql)
+            print(f"[{i+1}/{len(cleaned_names)}] ❌ Kihagyva: Nincs találat vagy hiba a(z) {original_name} esetén.")
+        elif source == "nominatim":
+            print(f"[{i+1}/{len(cleaned_names)}] ✅ {original_name}: Lat/Lon: {lat:.4f}/{lon:.4f}, Vármegye: {county_name} (ID: {region_id})")
         
-        # Késleltetés a Nominatim szabályainak betartása érdekében
-        time.sleep(1.0)
-        
-    return sql_statements
+    print("Geokódolás: " + ", ".join(f"{n} {src}" for src, n in sorted(sources.items())))
+
+    # 2. Vármegye ID: poligonokból, vagy a Nominatim vármegyenévből / előtöltött gyorsítótárból
+    if region_index is not None:
+        region_ids, outside = assign_regions(points, region_index)
+        for i in outside:
+            print(f"  ⚠️ {cleaned_names[i]} ({points[i][1]:.4f}, {points[i][0]:.4f}) egyik vármegye poligonjába sem esik.")
+    else:
+        region_ids = [p[2] for p in points]
+
+    ids = assign_ids(cleaned_names)
+    return [
+        SettlementRow(ids[i], name, region_ids[i] if points[i][0] is not None else None, points[i][1], points[i][0])
+        for i, name in enumerate(cleaned_names)
+    ]
+
+def settlement_insert_sql(row):
+    """INSERT parancs egy geokódolt településhez az átmeneti táblába (lásd settlement_load.write_insert_script)."""
+    return insert_sql(row)
+
+def generate_sql_inserts(raw_data, cache=None, retry_misses=False, region_index=None, geocoder=None):
+    """
+    Feldolgozza a nyers listát, geokódolja a településeket, 
+    és létrehozza a PostGIS INSERT parancsokat.
+    """
+    return [settlement_insert_sql(row) for row in generate_settlement_rows(raw_data, cache, retry_misses, region_index, geocoder)]
 
 # --- 4. Futtatás és Fájlba Mentés ---
 
 if __name__ == '__main__':
-    SQL_FILE = "settlement_inserts.sql"
+    parser = argparse.ArgumentParser(description="Settlement adatok generálása geokódolással (SQLite gyorsítótárral)")
+    parser.add_argument("--format", choices=["sql", "csv", "tsv"], default="sql", help="sql: INSERT parancsok; csv/tsv: COPY-kompatibilis fájl + merge szkript")
+    parser.add_argument("--out", default=None, help="Kimeneti fájl (alapértelmezés: settlement_inserts.sql / settlements.csv / settlements.tsv)")
+    parser.add_argument("--copy-dsn", default=None, help="Közvetlen COPY + upsert a Settlement táblába (Postgres DSN)")
+    parser.add_argument("--cache", default="geocode_cache.sqlite", help="SQLite geokódolási gyorsítótár")
+    parser.add_argument("--seed-from", default=None, help="Gyorsítótár előtöltése egy korábbi settlement_inserts.sql-ből")
+    parser.add_argument("--retry-misses", action="store_true", help="A korábban találat nélküli neveket újra lekérdezi")
+    parser.add_argument("--gazetteer", default=None, help="Offline gazetteer (GeoNames dump vagy name/lat/lon TSV); a Nominatim csak a hiányzókra")
+    parser.add_argument("--offline", action="store_true", help="Csak a gazetteer, Nominatim nélkül")
+    parser.add_argument("--regions-geojson", default=None, help="Vármegye poligonok (GeoJSON) a point-in-polygon régió-hozzárendeléshez")
+    parser.add_argument("--regions-dsn", default=None, help="Vármegye poligonok a Region táblából (Postgres DSN)")
+    args = parser.parse_args()
+    OUT_FILE = args.out or {"sql": "settlement_inserts.sql", "csv": "settlements.csv", "tsv": "settlements.tsv"}[args.format]
     
-    # 1. SQL parancsok generálása
-    sql_results = generate_sql_inserts(RAW_TELEPULESEK)
+    t0 = time.perf_counter()
+    cache = GeocodeCache(args.cache)
+    if args.seed_from:
+        print(f"Gyorsítótár előtöltve: {cache.seed_from_sql(args.seed_from)} új sor ({args.seed_from})")
+
+    region_index = None
+    if args.regions_geojson or args.regions_dsn:
+        from region_assign import RegionIndex, load_regions_geojson, load_regions_pg
 
-    # 2. Fájlba mentés
+        if args.regions_geojson:
+            region_index = RegionIndex(*load_regions_geojson(args.regions_geojson))
+        else:
+            from insert_recipes import connect_pg
+
+            conn = connect_pg(args.regions_dsn, None, None, None, None, None)
+            try:
+                with conn.cursor() as cur:
+                    region_index = RegionIndex(*load_regions_pg(cur))
+            finally:
+                conn.close()
+
+    # 1. Települések geokódolása
     try:
-        with open(SQL_FILE, 'w', encoding='utf-8') as f:
-            f.write("--- Ízőrzők települések adatai (generálva Python szkripttel) ---\n\n")
-            f.write("--- MEGJEGYZÉS: Ellenőrizze a regionid oszlopokat (NULL értékek) és a vármegyeneveket!\n\n")
-            f.write('\n'.join(sql_results))
+        geocoder = build_geocoder(args.gazetteer, offline=args.offline)
+        rows = generate_settlement_rows(RAW_TELEPULESEK, cache, retry_misses=args.retry_misses, region_index=region_index, geocoder=geocoder)
+    finally:
+        cache.close()
+
+    # 2. Közvetlen betöltés COPY streammel
+    if args.copy_dsn:
+        from insert_recipes import connect_pg
+        from settlement_load import copy_into_pg
+
+        conn = connect_pg(args.copy_dsn, None, None, None, None, None)
+        try:
+            changed = copy_into_pg(conn, rows)
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        print(f"✅ COPY + upsert kész: {len(rows)} település, {changed} sor beszúrva/frissítve.")
+
+    # 3. Fájlba mentés
+    try:
+        if args.format == "sql":
+            with open(OUT_FILE, 'w', encoding='utf-8') as f:
+                write_insert_script(f, rows, header=(
+                    "--- Ízőrzők települések adatai (generálva Python szkripttel) ---\n\n"
+                    "--- MEGJEGYZÉS: Ellenőrizze a regionid oszlopokat (NULL értékek) és a vármegyeneveket!\n"
+                    "--- Futtatás: psql -f settlement_inserts.sql (átmeneti tábla, régi id-k átszámozása, upsert)\n\n"
+                ))
+        else:
+            from settlement_load import write_copy, write_merge_script
+
+            with open(OUT_FILE, 'w', encoding='utf-8', newline='') as f:
+                write_copy(f, rows, args.format)
+            merge_file = os.path.splitext(OUT_FILE)[0] + "_merge.sql"
+            write_merge_script(merge_file, os.path.basename(OUT_FILE), args.format)
+            print(f"Merge szkript: psql -f {merge_file} (a {OUT_FILE} mellől futtatva)")
         
-        print(f"\n\n✅ Sikeresen generálva és elmentve a(z) '{SQL_FILE}' fájlba.")
-        print(f"A futtatás előtt ellenőrizze az SQL fájlt, főleg a NULL regionid értékeket!")
+        print(f"\n\n✅ Sikeresen generálva és elmentve a(z) '{OUT_FILE}' fájlba ({time.perf_counter() - t0:.2f} s).")
+        print("A futtatás előtt ellenőrizze a fájlt, főleg a NULL regionid értékeket!")
         
     except IOError as e:
-        print(f"Hiba a fájlba írás során: {e}")
\ No newline at end of file
+        print(f"Hiba a fájlba írás során: {e}")
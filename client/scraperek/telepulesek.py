@@ -1,15 +1,40 @@
 import requests
 from bs4 import BeautifulSoup
+import json
 import re
 import os
+import time
 
-def scrape_telepulesek(url):
+from textnorm import normalize_text
+
+# Az előző futás településenkénti számai (változásfigyeléshez)
+COUNTS_FILE = "telepules_counts.json"
+
+BASE_URL = "https://www.izorzok.hu"
+HELYSZINEK_URL = BASE_URL + "/helyszinek/"
+# Ha az option value nem URL, hanem slug, ebből lesz a település archívum oldala
+ARCHIVE_URL_TEMPLATE = BASE_URL + "/helyszin/{slug}/"
+
+def archive_url(value, name):
+    """A település archívum URL-je az option value-ból (URL, relatív útvonal vagy slug)."""
+    value = (value or '').strip()
+    if value.startswith('http'):
+        return value
+    if value.startswith('/'):
+        return BASE_URL + value
+    if value and not value.isdigit() and value != '-1':
+        return ARCHIVE_URL_TEMPLATE.format(slug=value)
+    slug = re.sub(r'[^a-z0-9]+', '-', normalize_text(name)).strip('-')
+    return ARCHIVE_URL_TEMPLATE.format(slug=slug)
+
+def scrape_telepules_counts(url, session=None):
     """
-    Lescrapeli a településneveket (epizódszám nélkül) az Ízőrzők weboldalról.
+    Lescrapeli a településeket az epizód/recept számukkal és archívum URL-jükkel.
+    Visszatérés: {név: {"count": szám, "url": archívum URL}} (dropdown sorrendben).
     """
     try:
         # Az oldal tartalmának letöltése
-        response = requests.get(url)
+        response = (session or requests).get(url, timeout=20)
         response.raise_for_status() # Hiba esetén kivételt dob
 
         # A HTML elemzése
@@ -20,9 +45,9 @@ def scrape_telepulesek(url):
         
         if not select_element:
             print("Nem található SELECT elem az oldalon.")
-            return []
+            return {}
 
-        telepulesek_nevei = []
+        telepulesek = {}
         
         # Iterálás az 'option' tageken belül
         for option in select_element.find_all('option'):
@@ -32,21 +57,54 @@ def scrape_telepulesek(url):
             if telepules_text == "Települések" or not telepules_text:
                 continue
 
-            # A szöveg tisztítása: elvágjuk az elemet a zárójel előtt.
-            # Példa: "Abasár (6)" -> "Abasár"
-            telepules_nev_tiszta = re.sub(r'\s*\(\d+\)$', '', telepules_text).strip()
+            # Példa: "Abasár (6)" -> ("Abasár", 6)
+            m = re.search(r'\s*\((\d+)\)$', telepules_text)
+            telepules_nev_tiszta = telepules_text[:m.start()].strip() if m else telepules_text
             
             if telepules_nev_tiszta:
-                telepulesek_nevei.append(telepules_nev_tiszta)
+                telepulesek[telepules_nev_tiszta] = {
+                    "count": int(m.group(1)) if m else None,
+                    "url": archive_url(option.get('value'), telepules_nev_tiszta),
+                }
 
-        return telepulesek_nevei
+        return telepulesek
 
     except requests.exceptions.RequestException as e:
         print(f"Hiba történt a weboldal letöltése során: {e}")
-        return []
+        return {}
     except Exception as e:
         print(f"Ismeretlen hiba: {e}")
-        return []
+        return {}
+
+def scrape_telepulesek(url):
+    """
+    Lescrapeli a településneveket (epizódszám nélkül) az Ízőrzők weboldalról.
+    """
+    return list(scrape_telepules_counts(url))
+
+def load_counts(filename=COUNTS_FILE):
+    """Az előző futás településenkénti számai ({} ha még nincs állapotfájl)."""
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            return json.load(f).get("settlements", {})
+    except FileNotFoundError:
+        return {}
+
+def save_counts(counts, filename=COUNTS_FILE):
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump({"fetched_at": int(time.time()), "settlements": counts}, f, ensure_ascii=False, indent=1)
+
+def changed_settlements(old, new):
+    """
+    Azok a települések, amelyek száma változott (vagy újak).
+    Visszatérés: [(név, régi szám vagy None, új szám, archívum URL)].
+    """
+    changed = []
+    for name, info in new.items():
+        prev = old.get(name, {}).get("count")
+        if prev is None or info.get("count") is None or info["count"] != prev:
+            changed.append((name, prev, info.get("count"), info["url"]))
+    return changed
 
 def save_to_file(data_list, filename="telepulesek_lista.txt"):
     """
@@ -64,10 +122,11 @@ def save_to_file(data_list, filename="telepulesek_lista.txt"):
         print(f"\nHiba a fájlba írás során: {e}")
 
 if __name__ == '__main__':
-    URL = "https://www.izorzok.hu/helyszinek/"
+    URL = HELYSZINEK_URL
     
-    # 1. Scrapelés
-    telepulesek = scrape_telepulesek(URL)
+    # 1. Scrapelés (a számokat is megtartjuk a változásfigyeléshez)
+    counts = scrape_telepules_counts(URL)
+    telepulesek = list(counts)
 
     if telepulesek:
         print(f"Sikeresen lescrapelt {len(telepulesek)} települést (epizódszám nélkül):\n")
@@ -80,5 +139,8 @@ if __name__ == '__main__':
         
         # 2. Fájlba mentés
         save_to_file(telepulesek)
+        # Az állapotfájlt a receptek_scraper írja: a teljes scrape (--counts-out) és a --refresh-counts, a receptek letöltése után
+        changed = changed_settlements(load_counts(), counts)
+        print(f"{len(changed)} település száma változott a(z) '{COUNTS_FILE}' óta.")
     else:
         print("Nem sikerült adatot kinyerni.")
\ No newline at end of file
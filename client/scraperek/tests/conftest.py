@@ -0,0 +1,5 @@
+import os
+import sys
+
+# A scraper modulok síkban, csomag nélkül élnek a scraperek könyvtárban
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,103 @@
+import os
+
+import pytest
+
+from geocode_cache import GeocodeCache
+from geocoders import ChainGeocoder, GazetteerGeocoder, GeocodeResult, Geocoder, build_geocoder
+from telepules_insertek import cached_geocode
+
+GAZETTEER = os.path.join(os.path.dirname(__file__), "fixtures", "gazetteer_hu.txt")
+
+
+class FakeGeocoder(Geocoder):
+    name = "fake"
+    network = True
+
+    def __init__(self, result=None):
+        self.result = result
+        self.calls = []
+
+    def geocode(self, settlement_name, country="Hungary"):
+        self.calls.append(settlement_name)
+        return self.result
+
+
+@pytest.fixture(scope="module")
+def gazetteer():
+    return GazetteerGeocoder(GAZETTEER)
+
+
+def test_geocoder_is_abstract():
+    with pytest.raises(TypeError):
+        Geocoder()
+
+
+def test_exact_lookup_ignores_accents_and_case(gazetteer):
+    r = gazetteer.geocode("abasar")
+    assert r.name == "Abasár"
+    assert (round(r.lat, 3), round(r.lon, 3)) == (47.797, 20.004)
+    assert r.source == "gazetteer"
+
+
+def test_only_populated_places_are_loaded(gazetteer):
+    assert gazetteer.geocode("Balaton") is None
+    assert gazetteer.geocode("Plattensee") is None
+
+
+def test_alternate_names(gazetteer):
+    assert gazetteer.geocode("Szegedin").name == "Szeged"
+    assert gazetteer.geocode("Egerszeg").name == "Zalaegerszeg"
+
+
+def test_duplicate_name_keeps_most_populous(gazetteer):
+    assert round(gazetteer.geocode("Szentendre").lat, 2) == 47.67
+
+
+def test_county_from_admin1(gazetteer):
+    assert gazetteer.geocode("Zánka").county == "Veszprém vármegye"
+    assert gazetteer.geocode("Szeged").county == "Csongrád-Csanád vármegye"
+    assert gazetteer.geocode("Budapest").county == "Budapest"
+
+
+def test_prefix(gazetteer):
+    assert [p.name for p in gazetteer.prefix("zala")] == ["Zalaegerszeg", "Zalakaros"]
+    assert [p.name for p in gazetteer.prefix("zala", limit=1)] == ["Zalaegerszeg"]
+    assert gazetteer.prefix("xyz") == []
+
+
+def test_chain_stops_at_first_hit(gazetteer):
+    online = FakeGeocoder(GeocodeResult(1.0, 2.0, "Zala megye", "fake"))
+    chain = ChainGeocoder([gazetteer, online])
+    assert chain.name == "gazetteer+fake"
+    assert chain.network
+    assert chain.geocode("Kisgyőr").source == "gazetteer"
+    assert online.calls == []
+    assert chain.geocode("Nemlétező").source == "fake"
+    assert online.calls == ["Nemlétező"]
+
+
+def test_build_geocoder_offline():
+    g = build_geocoder(GAZETTEER, offline=True)
+    assert isinstance(g, GazetteerGeocoder)
+    assert not g.network
+    with pytest.raises(ValueError):
+        build_geocoder(None, offline=True)
+
+
+def test_build_geocoder_online_falls_back_to_nominatim():
+    g = build_geocoder(GAZETTEER)
+    assert isinstance(g, ChainGeocoder)
+    assert [c.name for c in g.geocoders] == ["gazetteer", "nominatim"]
+
+
+def test_cached_geocode_offline_sets_region(tmp_path, gazetteer):
+    cache = GeocodeCache(str(tmp_path / "geocode.sqlite"))
+    lat, lon, county, region_id, source = cached_geocode(cache, gazetteer, "Kisgyőr")
+    assert (county, region_id, source) == ("Borsod-Abaúj-Zemplén vármegye", 13, "gazetteer")
+    hit = cache.get("Kisgyőr, Hungary")
+    assert hit.region_id == 13
+    assert cached_geocode(cache, gazetteer, "Kisgyőr")[3:] == (13, "cache")
+    # Offline tévedést nem jegyzünk meg
+    assert cached_geocode(cache, gazetteer, "Nemlétező")[0] is None
+    assert cache.get("Nemlétező, Hungary") is None
+    cache.close()
@@ -0,0 +1,59 @@
+import pytest
+
+from ingredients import parse_ingredient, parse_ingredients
+
+
+@pytest.mark.parametrize(
+    "raw, qty, unit, name",
+    [
+        ("5 dkg élesztő", 5.0, "dkg", "élesztő"),
+        ("1 nagy fej vöröshagyma", 1.0, "fej", "vöröshagyma"),
+        ("csipetnyi só", None, "csipet", "só"),
+        # Elöl álló címke: csak a címke megy le
+        ("A tálaláshoz tejföl.", None, None, "tejföl"),
+        ("A sütéshez sertészsír", None, None, "sertészsír"),
+        ("ízlés szerint só", None, None, "só"),
+        ("Tálaláshoz 2 dl tejföl.", 2.0, "dl", "tejföl"),
+        ("a tálaláshoz ízlés szerint porcukor.", None, None, "porcukor"),
+        ("A díszítéshez 3 szem eper", 3.0, None, "szem eper"),
+        # Záró megjegyzés: a hozzávaló marad
+        ("étolaj a sütéshez", None, None, "étolaj"),
+        ("20 babszem a díszítéshez", 20.0, None, "babszem"),
+        # Törtek: egykarakteres (½, ⅓), U+2044 törtvonal és vegyes szám
+        ("½ fej vöröshagyma", 0.5, "fej", "vöröshagyma"),
+        ("¾ liter tej", 0.75, "l", "tej"),
+        ("1⁄2 kg liszt", 0.5, "kg", "liszt"),
+        ("1/2 kg liszt", 0.5, "kg", "liszt"),
+        ("2 ½ dl tej", 2.5, "dl", "tej"),
+        ("2½ dl tej", 2.5, "dl", "tej"),
+        ("1 1/2 kg liszt", 1.5, "kg", "liszt"),
+        ("1 ⅓ bögre cukor", 1 + 1 / 3, "bögre", "cukor"),
+        ("2,5 dl tej", 2.5, "dl", "tej"),
+    ],
+)
+def test_parse_ingredient(raw, qty, unit, name):
+    parsed = parse_ingredient(raw)
+    assert (parsed.qty, parsed.unit, parsed.name) == (qty, unit, name)
+
+
+@pytest.mark.parametrize("raw", ["A tálaláshoz:", "ízlés szerint", "2", "(1 nagy"])
+def test_parse_ingredient_without_name(raw):
+    assert parse_ingredient(raw) is None
+
+
+@pytest.mark.parametrize(
+    "raw, names",
+    [
+        ("só, bors", ["só", "bors"]),
+        ("só, bors ízlés szerint", ["só", "bors"]),
+        ("só és bors ízlés szerint", ["só", "bors"]),
+        ("Tejföl és paprika a tálaláshoz.", ["tejföl", "paprika"]),
+        ("3 tojás és egy tojás sárgája", ["tojás", "tojás sárgája"]),
+        # Nem felsorolás: tizedesvessző, zárójeles megjegyzés, kötőjeles összetétel
+        ("2,5 dl tej", ["tej"]),
+        ("paprika (piros, sárga)", ["paprika"]),
+        ("kis csokor kapor- és petrezselyem zöld", ["kapor- és petrezselyem zöld"]),
+    ],
+)
+def test_parse_ingredients_splits_lists(raw, names):
+    assert [p.name for p in parse_ingredients([raw])] == names
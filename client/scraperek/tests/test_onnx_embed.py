@@ -0,0 +1,27 @@
+import os
+
+import pytest
+
+pytest.importorskip("onnxruntime")
+pytest.importorskip("tokenizers")
+pytest.importorskip("sentence_transformers")
+pytest.importorskip("psycopg2")  # insert_recipes (load_st_model, read_jsonl)
+
+from onnx_embed import (
+    DEFAULT_MODEL,
+    DEFAULT_ONNX_DIR,
+    MIN_COS_FP32,
+    MIN_COS_INT8,
+    MODEL_FILE,
+    QUANTIZED_MODEL_FILE,
+    parity,
+)
+
+RECEPTEK = os.path.join(os.path.dirname(os.path.dirname(__file__)), "receptek.jsonl")
+
+
+@pytest.mark.parametrize("quantized, model_file, min_cos", [(False, MODEL_FILE, MIN_COS_FP32), (True, QUANTIZED_MODEL_FILE, MIN_COS_INT8)])
+def test_onnx_matches_sentence_transformers(quantized, model_file, min_cos):
+    if not os.path.exists(os.path.join(DEFAULT_ONNX_DIR, model_file)):
+        pytest.skip(f"no exported model; run: python onnx_embed.py export{' --quantize' if quantized else ''}")
+    assert parity(DEFAULT_MODEL, DEFAULT_ONNX_DIR, quantized, RECEPTEK, 64, min_cos)
@@ -0,0 +1,58 @@
+import itertools
+import json
+import os
+
+import pytest
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("psycopg2")  # insert_recipes.read_jsonl
+
+from insert_recipes import read_jsonl
+from recipe_parquet import count_rows, parquet_shards, read_parquet, save_parquet
+
+RECEPTEK = os.path.join(os.path.dirname(os.path.dirname(__file__)), "receptek.jsonl")
+
+
+@pytest.fixture(scope="module")
+def records():
+    with open(RECEPTEK, "r", encoding="utf-8") as f:
+        out = [json.loads(line) for line in itertools.islice(f, 250)]
+    # A normalizálás szélső esetei: NBSP, tabulátor, hiányzó hozzávalók és település
+    out.append({"url": " https://x/1\t", "title": "Bab  leves ", "year": 1950, "settlement": " Zánka ", "ingredients": [" 2  dl tej", "só"], "category_id": 3})
+    out.append({"url": "https://x/2", "title": "Üres", "year": None, "settlement": None, "ingredients": [], "category_id": None})
+    return out
+
+
+def write_jsonl(path, records):
+    with open(path, "w", encoding="utf-8") as f:
+        for obj in records:
+            f.write(json.dumps(obj, ensure_ascii=False) + "\n")
+    return path
+
+
+def test_parquet_matches_jsonl_loader(tmp_path, records):
+    jsonl = write_jsonl(tmp_path / "r.jsonl", records)
+    parquet = str(tmp_path / "r.parquet")
+    assert save_parquet(parquet, records, row_group_size=100) == len(records)
+    assert list(read_parquet(parquet)) == list(read_jsonl(str(jsonl)))
+    # Sorcsoport-tartományok együtt a teljes fájlt adják
+    shards = parquet_shards(parquet, 2)
+    assert list(itertools.chain.from_iterable(read_parquet(parquet, a, b) for a, b in shards)) == list(read_parquet(parquet))
+
+
+def test_empty_file(tmp_path):
+    parquet = str(tmp_path / "empty.parquet")
+    assert save_parquet(parquet, []) == 0
+    assert count_rows(parquet) == 0
+    assert list(read_parquet(parquet)) == []
+    assert all(list(read_parquet(parquet, a, b)) == [] for a, b in parquet_shards(parquet, 4))
+
+
+def test_append(tmp_path, records):
+    parquet = str(tmp_path / "a.parquet")
+    save_parquet(parquet, [])
+    save_parquet(parquet, records[:10], append=True)
+    assert save_parquet(parquet, records[10:20], append=True) == 20
+    save_parquet(parquet, [], append=True)
+    jsonl = write_jsonl(tmp_path / "a.jsonl", records[:20])
+    assert list(read_parquet(parquet)) == list(read_jsonl(str(jsonl)))
@@ -0,0 +1,51 @@
+import sqlite3
+
+import pytest
+
+from snapshot import INDEXES, SCHEMA, Snapshot
+
+
+@pytest.fixture
+def snap(tmp_path):
+    path = str(tmp_path / "snapshot.sqlite")
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    db.executemany(
+        "INSERT INTO recipe VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (1, "u1", "Gulyás", 1950, 10, "Zánka", 1, 20, "hagyma | paprika"),
+            (2, "u2", "Lángos", 1960, 11, "Abasár", 1, 10, "liszt | Tejföl"),  # nincs RecipeIngredient sora
+            (3, "u3", "Pogácsa", 1960, 11, "Abasár", 2, 10, "liszt | tejföl"),
+        ],
+    )
+    db.executemany("INSERT INTO ingredient VALUES (?, ?, ?)", [(1, "hagyma", "hagyma"), (2, "paprika", "paprika"), (3, "liszt", "liszt")])
+    db.executemany(
+        "INSERT INTO recipe_ingredient VALUES (?, ?, ?, NULL, NULL, ?)",
+        [(1, 0, 1, "hagyma"), (1, 1, 2, "paprika"), (3, 0, 3, "liszt")],
+    )
+    db.executescript(INDEXES)
+    db.commit()
+    db.close()
+    with Snapshot(path) as s:
+        yield s
+
+
+def ids(snap, **filters):
+    return [r["id"] for r in snap.recipes(**filters)]
+
+
+def test_ingredient_filter_uses_dictionary(snap):
+    assert ids(snap, ingredients=["Hagyma"]) == [1]
+    assert ids(snap, ingredients=["liszt"]) == [3]
+    assert snap.region_counts(ingredients=["liszt"]) == {10: 1}
+
+
+def test_ingredient_filter_ignores_ingredients_text(snap):
+    # Mint az API: csak a szótár számít, az ingredients_text nem
+    assert ids(snap, ingredients=["tejfol"]) == []
+    assert ids(snap, ingredients=["tejföl"], reverse=True) == [1, 2, 3]
+
+
+def test_reverse_excludes_dictionary_matches(snap):
+    assert ids(snap, ingredients=["hagyma"], reverse=True) == [2, 3]
+    assert ids(snap, ingredients=["liszt"], reverse=True) == [1, 2]
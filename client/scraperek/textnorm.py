@@ -0,0 +1,19 @@
+"""
+Közös szövegnormalizálás (ékezet-eltávolítás, kisbetűsítés) a scraper, a
+betöltő és a feldolgozó lépések számára, hogy mindenhol ugyanaz a kulcs
+készüljön egy névből.
+"""
+
+import unicodedata
+
+
+def strip_accents(s: str) -> str:
+    """Remove accents for accent-insensitive matching."""
+    if not s:
+        return s
+    nfkd_form = unicodedata.normalize("NFKD", s)
+    return "".join([c for c in nfkd_form if not unicodedata.combining(c)])
+
+
+def normalize_text(s: str) -> str:
+    return strip_accents(s or "").lower().strip()
@@ -0,0 +1,143 @@
+"""
+ANN index hangoló: recall@k és késleltetés a keresési paraméter függvényében.
+
+A RecipeEmbedding táblából mintavételezett, félretett lekérdezésvektorokkal
+(a saját sorukat kizárva) lefuttatja a keresést az aktuális ANN indexszel,
+végigpásztázza az `ivfflat.probes` vagy `hnsw.ef_search` értékeket, és a
+pontos (index nélküli, brute force) eredményhez méri a recall@k-t, p50/p99
+késleltetést és QPS-t.
+
+Használat (példa):
+    python tune_ann.py --dsn postgresql://... --column embedding --queries 300 --k 10
+    python tune_ann.py --sweep 1 2 4 8 16 32 --json out/tune.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ann_index import existing_ann_indexes
+from eval_vector_storage import recall_at_k, run_queries
+from insert_recipes import connect_pg
+
+
+CASTS = {"embedding": "vector", "embedding_half": "halfvec"}
+DEFAULT_SWEEP = {
+    "ivfflat": [1, 2, 4, 8, 16, 32, 64],
+    "hnsw": [10, 20, 40, 80, 160, 320],
+}
+SEARCH_PARAM = {"ivfflat": "ivfflat.probes", "hnsw": "hnsw.ef_search"}
+
+
+def knn_sql(column: str) -> str:
+    cast = CASTS[column]
+    return (
+        f'SELECT recipe_id FROM public."RecipeEmbedding" '
+        f"WHERE recipe_id <> %(id)s AND {column} IS NOT NULL "
+        f"ORDER BY {column} <-> %(q)s::{cast} LIMIT %(k)s"
+    )
+
+
+def sample_queries(cur, column: str, n: int, seed: int) -> List[dict]:
+    cur.execute(f'SELECT recipe_id, {column}::text FROM public."RecipeEmbedding" WHERE {column} IS NOT NULL')
+    rows = cur.fetchall()
+    rng = random.Random(seed)
+    return [{"id": int(rid), "q": vec} for rid, vec in rng.sample(rows, min(n, len(rows)))]
+
+
+def brute_force(cur, sql: str, params: List[dict]) -> List[List[int]]:
+    """Exact neighbours: the same query with index scans disabled (sequential scan + sort)."""
+    cur.execute("SET LOCAL enable_indexscan = off")
+    cur.execute("SET LOCAL enable_bitmapscan = off")
+    truth, _ = run_queries(cur, sql, params)
+    cur.execute("SET LOCAL enable_indexscan = on")
+    cur.execute("SET LOCAL enable_bitmapscan = on")
+    return truth
+
+
+def sweep(cur, sql: str, params: List[dict], truth: List[List[int]], method: str, values: List[int], k: int) -> List[dict]:
+    results: List[dict] = []
+    for v in values:
+        cur.execute(f"SET LOCAL {SEARCH_PARAM[method]} = {int(v)}")
+        run_queries(cur, sql, params[:5])  # bemelegítés
+        got, lat = run_queries(cur, sql, params)
+        total_s = sum(lat) / 1000.0
+        results.append({
+            SEARCH_PARAM[method]: v,
+            "recall_at_k": round(recall_at_k(truth, got, k), 4),
+            "p50_ms": round(float(np.percentile(lat, 50)), 3),
+            "p99_ms": round(float(np.percentile(lat, 99)), 3),
+            "qps": round(len(lat) / total_s, 1) if total_s > 0 else None,
+        })
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Sweep ivfflat.probes / hnsw.ef_search and report recall@k and latency")
+    p.add_argument("--dsn", type=str, default=None, help="Postgres DSN string")
+    p.add_argument("--host", type=str, default=None)
+    p.add_argument("--port", type=int, default=None)
+    p.add_argument("--db", type=str, default=None)
+    p.add_argument("--user", type=str, default=None)
+    p.add_argument("--password", type=str, default=None)
+    p.add_argument("--column", choices=sorted(CASTS), default="embedding")
+    p.add_argument("--queries", type=int, default=300, help="Held-out query vectors sampled from the table")
+    p.add_argument("--k", type=int, default=10)
+    p.add_argument("--sweep", type=int, nargs="+", default=None, help="Values of probes / ef_search to try")
+    p.add_argument("--seed", type=int, default=42)
+    p.add_argument("--json", type=str, default=None, help="Write the results as JSON")
+    args = p.parse_args(argv)
+
+    conn = connect_pg(args.dsn, args.host, args.port, args.db, args.user, args.password)
+    conn.autocommit = False
+    try:
+        with conn.cursor() as cur:
+            indexes = [(name, method) for name, column, method in existing_ann_indexes(cur) if column == args.column]
+            if not indexes:
+                print(f"Nincs ANN index a(z) {args.column} oszlopon; futtasd az insert_recipes-t (alapból ivfflat-ot épít, vagy --ann-index hnsw).")
+                return 1
+            index_name, method = indexes[0]
+            values = args.sweep or DEFAULT_SWEEP[method]
+            sql = knn_sql(args.column)
+            params = [dict(prm, k=args.k) for prm in sample_queries(cur, args.column, args.queries, args.seed)]
+
+            t0 = time.perf_counter()
+            truth = brute_force(cur, sql, params)
+            brute_ms = (time.perf_counter() - t0) * 1000.0 / max(1, len(params))
+
+            results = sweep(cur, sql, params, truth, method, values, args.k)
+            conn.rollback()
+    finally:
+        conn.close()
+
+    param = SEARCH_PARAM[method]
+    print(f"Index: {index_name} ({method}), oszlop: {args.column}, lekérdezések: {len(params)}, k={args.k}")
+    print(f"Brute force: {brute_ms:.3f} ms/lekérdezés")
+    print(f"{param:>16} {'recall@k':>9} {'p50 ms':>9} {'p99 ms':>9} {'QPS':>9}")
+    for r in results:
+        print(f"{r[param]:>16} {r['recall_at_k']:>9.4f} {r['p50_ms']:>9} {r['p99_ms']:>9} {r['qps']:>9}")
+
+    if args.json:
+        report: Dict[str, object] = {
+            "index": index_name,
+            "method": method,
+            "column": args.column,
+            "queries": len(params),
+            "k": args.k,
+            "brute_force_ms": round(brute_ms, 3),
+            "results": results,
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"JSON mentve: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,251 @@
+"""
+Helyi, memóriába leképezett hasonlósági keresés az exportált recept-embeddingeken.
+
+Export: a RecipeEmbedding vektorai egy float32 `.npy` fájlba kerülnek
+(memmap-pel olvasható), mellé egy id és egy metaadat (év, kategória,
+település) sidecar. Keresés: kötegelt brute-force top-k NumPy
+mátrixszorzással, év/kategória/település szűrőkkel előre kiszámolt
+bitmapek alapján. Pontos, ezért ANN recall méréshez is „ground truth”.
+
+Használat (példa):
+    python vector_search.py export --dsn postgresql://... --out out/vectors
+    python vector_search.py query --index out/vectors --id 123 --k 10 --year 2019 --category 5
+    python vector_search.py bench --index out/vectors --queries 5000 --k 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DIM = 384
+VECTORS_FILE = "embeddings.npy"
+IDS_FILE = "ids.npy"
+META_FILE = "meta.npz"
+# NULL év / kategória / település
+MISSING = -1
+
+
+# -----------------------------
+# Export
+# -----------------------------
+
+
+def export_embeddings(conn, out_dir: str, fetch_size: int = 5000) -> int:
+    """Stream every RecipeEmbedding row into a memmapped .npy plus id/metadata sidecars."""
+    os.makedirs(out_dir, exist_ok=True)
+    with conn.cursor() as cur:
+        cur.execute('SELECT count(*) FROM public."RecipeEmbedding"')
+        n = int(cur.fetchone()[0])
+
+    vectors = np.lib.format.open_memmap(os.path.join(out_dir, VECTORS_FILE), mode="w+", dtype=np.float32, shape=(n, DIM))
+    ids = np.empty(n, dtype=np.int64)
+    years = np.full(n, MISSING, dtype=np.int32)
+    categories = np.full(n, MISSING, dtype=np.int32)
+    settlements = np.full(n, MISSING, dtype=np.int32)
+
+    # Szerver oldali kurzor: nem tölti be egyszerre az összes sort
+    with conn.cursor(name="vector_export") as cur:
+        cur.itersize = fetch_size
+        cur.execute(
+            'SELECT e.recipe_id, coalesce(e.embedding::text, e.embedding_half::text), r.year, r.category_id, r.settlement_id '
+            'FROM public."RecipeEmbedding" e JOIN public."Recipe" r ON r.id = e.recipe_id '
+            'ORDER BY e.recipe_id'
+        )
+        i = 0
+        for rid, vec, year, cat, sid in cur:
+            if i >= n:
+                break
+            vectors[i] = np.asarray(json.loads(vec), dtype=np.float32)
+            ids[i] = rid
+            years[i] = MISSING if year is None else year
+            categories[i] = MISSING if cat is None else cat
+            settlements[i] = MISSING if sid is None else sid
+            i += 1
+    vectors.flush()
+    del vectors
+    if i < n:
+        # Közben törölt sorok: a fájlt a ténylegesen írt méretre vágjuk
+        trimmed = np.load(os.path.join(out_dir, VECTORS_FILE), mmap_mode="r")[:i].copy()
+        np.save(os.path.join(out_dir, VECTORS_FILE), trimmed)
+    np.save(os.path.join(out_dir, IDS_FILE), ids[:i])
+    np.savez(os.path.join(out_dir, META_FILE), year=years[:i], category_id=categories[:i], settlement_id=settlements[:i])
+    return i
+
+
+# -----------------------------
+# Keresés
+# -----------------------------
+
+
+class VectorIndex:
+    """Exact top-k cosine search over normalized embeddings (inner product)."""
+
+    def __init__(self, index_dir: str, mmap: bool = True) -> None:
+        self.vectors: np.ndarray = np.load(os.path.join(index_dir, VECTORS_FILE), mmap_mode="r" if mmap else None)
+        self.ids: np.ndarray = np.load(os.path.join(index_dir, IDS_FILE))
+        meta = np.load(os.path.join(index_dir, META_FILE))
+        self.columns: Dict[str, np.ndarray] = {k: meta[k] for k in ("year", "category_id", "settlement_id")}
+        self.row_of_id: Dict[int, int] = {int(rid): i for i, rid in enumerate(self.ids)}
+        # Előre kiszámolt bitmapek: oszlop -> érték -> bool maszk
+        self.bitmaps: Dict[str, Dict[int, np.ndarray]] = {}
+        for col, values in self.columns.items():
+            self.bitmaps[col] = {int(v): values == v for v in np.unique(values) if v != MISSING}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def mask(
+        self,
+        years: Optional[Iterable[int]] = None,
+        categories: Optional[Iterable[int]] = None,
+        settlements: Optional[Iterable[int]] = None,
+    ) -> Optional[np.ndarray]:
+        """AND across filters, OR within one filter's values. None = no filtering."""
+        result: Optional[np.ndarray] = None
+        for col, wanted in (("year", years), ("category_id", categories), ("settlement_id", settlements)):
+            if wanted is None:
+                continue
+            m = np.zeros(len(self.ids), dtype=bool)
+            for v in wanted:
+                bm = self.bitmaps[col].get(int(v))
+                if bm is not None:
+                    m |= bm
+            result = m if result is None else (result & m)
+        return result
+
+    def search(
+        self,
+        queries: np.ndarray,
+        k: int = 10,
+        mask: Optional[np.ndarray] = None,
+        exclude_rows: Optional[Sequence[int]] = None,
+        query_batch: int = 1024,
+        row_block: int = 65536,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Top-k recipe ids and scores per query row (ids are -1 where fewer than k candidates)."""
+        queries = np.ascontiguousarray(np.atleast_2d(queries), dtype=np.float32)
+        rows = np.flatnonzero(mask) if mask is not None else None
+        n_cand = len(rows) if rows is not None else len(self.ids)
+        out_ids = np.full((len(queries), k), -1, dtype=np.int64)
+        out_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        if n_cand == 0 or k <= 0:
+            return out_ids, out_scores
+        # Szűrt esetben a kiválasztott sorokat egyszer másoljuk ki
+        matrix = self.vectors[rows] if rows is not None else self.vectors
+
+        for qs in range(0, len(queries), query_batch):
+            q = queries[qs:qs + query_batch]
+            best_s = np.full((len(q), 0), -np.inf, dtype=np.float32)
+            best_r = np.empty((len(q), 0), dtype=np.int64)
+            for rs in range(0, n_cand, row_block):
+                block = np.asarray(matrix[rs:rs + row_block])
+                scores = q @ block.T
+                local = np.arange(rs, rs + len(block))
+                if exclude_rows is not None:
+                    for qi, row in enumerate(exclude_rows[qs:qs + query_batch]):
+                        pos = row if rows is None else np.searchsorted(rows, row)
+                        if rs <= pos < rs + len(block) and (rows is None or rows[pos] == row):
+                            scores[qi, pos - rs] = -np.inf
+                kk = min(k, scores.shape[1])
+                part = np.argpartition(-scores, kk - 1, axis=1)[:, :kk]
+                cand_s = np.concatenate([best_s, np.take_along_axis(scores, part, axis=1)], axis=1)
+                cand_r = np.concatenate([best_r, local[part]], axis=1)
+                keep = np.argsort(-cand_s, axis=1)[:, :k]
+                best_s = np.take_along_axis(cand_s, keep, axis=1)
+                best_r = np.take_along_axis(cand_r, keep, axis=1)
+            abs_rows = rows[best_r] if rows is not None else best_r
+            valid = np.isfinite(best_s)
+            out_ids[qs:qs + len(q), :best_s.shape[1]] = np.where(valid, self.ids[abs_rows], -1)
+            out_scores[qs:qs + len(q), :best_s.shape[1]] = best_s
+        return out_ids, out_scores
+
+    def search_ids(self, recipe_ids: Sequence[int], k: int = 10, mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Neighbours of recipes already in the index, excluding the recipe itself (ANN recall oracle)."""
+        rows = [self.row_of_id[int(r)] for r in recipe_ids]
+        return self.search(np.asarray(self.vectors[rows]), k=k, mask=mask, exclude_rows=rows)
+
+
+# -----------------------------
+# CLI
+# -----------------------------
+
+
+def _add_filter_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--year", type=int, nargs="+", default=None)
+    p.add_argument("--category", type=int, nargs="+", default=None)
+    p.add_argument("--settlement", type=int, nargs="+", default=None)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Local memory-mapped recipe embedding search")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    pe = sub.add_parser("export", help="Export RecipeEmbedding to .npy + sidecars")
+    pe.add_argument("--out", type=str, required=True)
+    pe.add_argument("--dsn", type=str, default=None, help="Postgres DSN string")
+    pe.add_argument("--host", type=str, default=None)
+    pe.add_argument("--port", type=int, default=None)
+    pe.add_argument("--db", type=str, default=None)
+    pe.add_argument("--user", type=str, default=None)
+    pe.add_argument("--password", type=str, default=None)
+
+    pq = sub.add_parser("query", help="Nearest recipes to one or more recipe ids")
+    pq.add_argument("--index", type=str, required=True)
+    pq.add_argument("--id", type=int, nargs="+", required=True)
+    pq.add_argument("--k", type=int, default=10)
+    _add_filter_args(pq)
+
+    pb = sub.add_parser("bench", help="Queries/second with random in-index query vectors")
+    pb.add_argument("--index", type=str, required=True)
+    pb.add_argument("--queries", type=int, default=5000)
+    pb.add_argument("--k", type=int, default=10)
+    pb.add_argument("--no-mmap", action="store_true", help="Load the matrix into RAM instead of memmapping")
+    pb.add_argument("--seed", type=int, default=42)
+    _add_filter_args(pb)
+    args = p.parse_args(argv)
+
+    if args.cmd == "export":
+        from insert_recipes import connect_pg
+
+        conn = connect_pg(args.dsn, args.host, args.port, args.db, args.user, args.password)
+        try:
+            t0 = time.perf_counter()
+            n = export_embeddings(conn, args.out)
+            conn.rollback()
+        finally:
+            conn.close()
+        print(f"{n} vektor exportálva ide: {args.out} ({time.perf_counter() - t0:.2f} s)")
+        return 0
+
+    index = VectorIndex(args.index, mmap=not getattr(args, "no_mmap", False))
+    mask = index.mask(args.year, args.category, args.settlement)
+
+    if args.cmd == "query":
+        ids, scores = index.search_ids(args.id, k=args.k, mask=mask)
+        for qid, row_ids, row_scores in zip(args.id, ids, scores):
+            print(f"Recept {qid}:")
+            for rid, s in zip(row_ids, row_scores):
+                if rid >= 0:
+                    print(f"  {rid:>8}  {s:.4f}")
+        return 0
+
+    rng = np.random.default_rng(args.seed)
+    rows = rng.integers(0, len(index), size=args.queries)
+    queries = np.asarray(index.vectors[np.sort(rows)])
+    index.search(queries[:64], k=args.k, mask=mask)  # bemelegítés
+    t0 = time.perf_counter()
+    index.search(queries, k=args.k, mask=mask)
+    dt = time.perf_counter() - t0
+    n_cand = len(index) if mask is None else int(mask.sum())
+    print(f"{args.queries} lekérdezés, {n_cand} jelölt, k={args.k}: {dt:.3f} s, {args.queries / dt:.0f} lekérdezés/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
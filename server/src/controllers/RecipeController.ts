@@ -49,6 +49,16 @@ RecipeController.get('/', async (req, res) => {
         ? reverseRaw[0]
         : undefined;
     const isReverseIngredientsFilter = !!reverse && ['1', 'true', 'yes', 'on'].includes(reverse.toLowerCase());
+    // Ingredient terms are matched against the small Ingredient dictionary (accent-folded, like
+    // textnorm.normalize_text in the loader), then joined to recipes via RecipeIngredient's index.
+    // Recipes loaded before the parser get their rows from the loader's --init-schema backfill.
+    const foldText = (s: string) => s.normalize('NFKD').replace(/[\u0300-\u036f]/g, '').toLowerCase().trim();
+    const ingredientTerms = ingredients.map(foldText).filter((s) => s.length > 0);
+    const ingredientCondition = (key: string) =>
+      `r.id ${isReverseIngredientsFilter ? 'NOT IN' : 'IN'} (` +
+      'SELECT ri.recipe_id FROM public."RecipeIngredient" ri ' +
+      'JOIN public."Ingredient" i ON i.id = ri.ingredient_id ' +
+      `WHERE i.name_norm LIKE :${key})`;
     const hadExplicitSettlementFilter = settlementIds.length > 0;
     let appliedRegionExpansion = false;
 
@@ -94,14 +104,10 @@ RecipeController.get('/', async (req, res) => {
       qb.andWhere('r.category_id IN (:...categoryIds)', { categoryIds });
     }
 
-    if (ingredients.length > 0) {
-      ingredients.forEach((term, idx) => {
+    if (ingredientTerms.length > 0) {
+      ingredientTerms.forEach((term, idx) => {
         const key = `ing${idx}`;
-        if (isReverseIngredientsFilter) {
-          qb.andWhere(`r.ingredients_text NOT ILIKE :${key}`, { [key]: `%${term}%` });
-        } else {
-          qb.andWhere(`r.ingredients_text ILIKE :${key}`, { [key]: `%${term}%` });
-        }
+        qb.andWhere(ingredientCondition(key), { [key]: `%${term}%` });
       });
     }
 
@@ -121,14 +127,10 @@ RecipeController.get('/', async (req, res) => {
     if (categoryIds.length > 0) {
       countQb.andWhere('r.category_id IN (:...categoryIds)', { categoryIds });
     }
-    if (ingredients.length > 0) {
-      ingredients.forEach((term, idx) => {
+    if (ingredientTerms.length > 0) {
+      ingredientTerms.forEach((term, idx) => {
         const key = `ing${idx}`;
-        if (isReverseIngredientsFilter) {
-          countQb.andWhere(`r.ingredients_text NOT ILIKE :${key}`, { [key]: `%${term}%` });
-        } else {
-          countQb.andWhere(`r.ingredients_text ILIKE :${key}`, { [key]: `%${term}%` });
-        }
+        countQb.andWhere(ingredientCondition(key), { [key]: `%${term}%` });
       });
     }
 
@@ -17,8 +17,9 @@ export class RecipeEmbedding {
   // The database column uses a custom type (e.g. pgvector "vector").
   // TypeORM 0.3.x does not support it out of the box during metadata init.
   // Map it to a supported type to avoid initialization errors (we don't mutate it here).
-  @Column("text", { name: "embedding" })
-  embedding: string;
+  // Nullable: with --vector-storage halfvec only embedding_half / embedding_bin are filled.
+  @Column("text", { name: "embedding", nullable: true })
+  embedding: string | null;
 
   @OneToOne(() => Recipe, (recipe) => recipe.recipeEmbedding, {
     onDelete: "CASCADE",